@@ -14,10 +14,15 @@ from .locations import LOCATION_DESCRIPTIONS, LOCATION_DEFINITIONS, EVENT_DEFINI
 from .options import ToontownOptions, TPSanity
 from .regions import REGION_DEFINITIONS, ToontownRegionName
 from .ruledefs import test_location, test_entrance, test_item_location
+from .rulecompiler import RuleCompiler
 from .fish import FishProgression, FishChecks
 
 DEBUG_MODE = False
 
+# When enabled, every location and entrance gets its rules compiled into a single function once per world.
+# Disable to evaluate the rules in ruledefs.py directly, the resulting seed should be identical either way.
+COMPILE_RULES = True
+
 
 class ToontownWeb(WebWorld):
     tutorials = [Tutorial(
@@ -55,6 +60,10 @@ class ToontownWorld(World):
         self.created_locations: list[ToontownLocationDefinition] = []
 
     def set_rules(self):
+        if COMPILE_RULES:
+            self.set_compiled_rules()
+            return
+
         # Add location rules.
         for i, location_data in enumerate(self.created_locations):
             location: Location = self.multiworld.get_location(location_data.name.value, self.player)
@@ -71,6 +80,22 @@ class ToontownWorld(World):
                 entrance.access_rule = lambda state, i=i, o=o: test_entrance(
                     REGION_DEFINITIONS[i].connects_to[o], state, self.multiworld, self.player, self.options)
 
+    def set_compiled_rules(self):
+        compiler = RuleCompiler(self.multiworld, self.player, self.options)
+
+        # Add location rules.
+        for location_data in self.created_locations:
+            location: Location = self.multiworld.get_location(location_data.name.value, self.player)
+            location.access_rule = compiler.compile_location(location_data)
+            location.item_rule = compiler.compile_item_location(location_data)
+
+        # Add entrance rules.
+        for region_data in REGION_DEFINITIONS:
+            for entrance_data in region_data.connects_to:
+                entrance_name = f"{region_data.name.value} -> {entrance_data.connects_to.value}"
+                entrance = self.multiworld.get_entrance(entrance_name, self.player)
+                entrance.access_rule = compiler.compile_entrance(entrance_data)
+
     def create_item(self, name: str) -> ToontownItem:
         item_id: int = self.item_name_to_id[name]
         item_def: ToontownItemDefinition = get_item_def_from_id(item_id)
@@ -383,12 +383,10 @@ def get_catchable_fish(zone: FishZone, rodId: int, location: FishLocation) -> Se
     if location == FishLocation.Playgrounds:
         zone = get_playground_fish_zone(zone)
 
-    # Check cache.
+    # Check cache. An empty set is a valid result, so check for the key rather than the value.
     __catchable_fish_cache.setdefault(zone, {})
     __catchable_fish_cache[zone].setdefault(rodId, {})
-    __catchable_fish_cache[zone][rodId].setdefault(location, set())
-    __cached_result = __catchable_fish_cache[zone][rodId][location]
-    if __cached_result:
+    if location in __catchable_fish_cache[zone][rodId]:
         return __catchable_fish_cache[zone][rodId][location]
 
     # A set containg tuples of (FishGenus, SpeciesIndex, Rarity)
@@ -434,12 +432,10 @@ def get_catchable_fish_no_rarity(zone: FishZone, rodId: int, location: FishLocat
     if location == FishLocation.Playgrounds:
         zone = get_playground_fish_zone(zone)
 
-    # Check cache.
+    # Check cache. An empty set is a valid result, so check for the key rather than the value.
     __catchable_fish_cache_no_rarity.setdefault(zone, {})
     __catchable_fish_cache_no_rarity[zone].setdefault(rodId, {})
-    __catchable_fish_cache_no_rarity[zone][rodId].setdefault(location, set())
-    __cached_result = __catchable_fish_cache_no_rarity[zone][rodId][location]
-    if __cached_result:
+    if location in __catchable_fish_cache_no_rarity[zone][rodId]:
         return __catchable_fish_cache_no_rarity[zone][rodId][location]
 
     # A set containg tuples of (FishGenus, SpeciesIndex)
@@ -0,0 +1,400 @@
+# Turns the rules defined in ruledefs.py into a single closure per location and entrance.
+#
+# Every rule in ruledefs.py is evaluated from scratch each time the fill asks for it, going through the rule registry
+# and re-deriving everything that only depends on the options (item thresholds, which fish can be caught where, ...).
+# The compilers below do all of that once per world and return a function that only has to look at the state.
+# A compiler returns None when its rule always passes for this world, so it can be left out entirely.
+# Any rule without a compiler falls back to calling its rule function, so it keeps working as before.
+from typing import Dict, Callable, Optional, Tuple, Union, List
+
+from BaseClasses import CollectionState, MultiWorld
+from .consts import XP_RATIO_FOR_GAG_LEVEL, CAP_RATIO_FOR_GAG_LEVEL, ToontownItem
+from .fish import LOCATION_TO_GENUS_SPECIES, FISH_DICT, FishProgression, FishLocation, get_catchable_fish, \
+    LOCATION_TO_GENUS, FISH_ZONE_TO_LICENSE, FishZone, FISH_ZONE_TO_REGION, PlaygroundFishZoneGroups
+from .items import ToontownItemName
+from .options import ToontownOptions, TPSanity
+from .locations import ToontownLocationDefinition, ToontownLocationName, FISH_LOCATIONS, get_location_def_from_name
+from .regions import ToontownEntranceDefinition, ToontownRegionName
+from .rules import Rule, ItemRule
+from .ruledefs import LocEntrDef, rules_to_func, rules_to_definition, MAX_GAG_CAPACITY, REGION_TO_TP_ITEM, \
+    DISGUISE_ITEM_IDS, AlwaysTrueRule, HasItemRule, TunnelCanBeUsed, HasTeleportAccess, FishCatch, FishGenus, \
+    FishGallery, GagTraining, ReachLocationRule, PlaygroundCountRule, TierThreeCogs, TierFiveCogs, ReachPastDD, \
+    TierEightCogs, HasOffensiveLevel, CanFightBoss, AllBossesDefeated, RestrictDisguises
+
+CompiledRule = Callable[[Union[CollectionState, ToontownItem]], bool]
+rules_to_compiler: Dict[Callable, Callable] = {}
+
+
+def compiles(rule_func: Callable):
+    def decorator(f):
+        rules_to_compiler[rule_func.rule_func] = f
+        return f
+    return decorator
+
+
+def always_true(state_or_item: Union[CollectionState, ToontownItem]) -> bool:
+    return True
+
+
+def always_false(state_or_item: Union[CollectionState, ToontownItem]) -> bool:
+    return False
+
+
+def all_of(compiled: List[Optional[CompiledRule]]) -> Optional[CompiledRule]:
+    compiled = [c for c in compiled if c is not None]
+    if not compiled:
+        return None
+    if len(compiled) == 1:
+        return compiled[0]
+    return lambda state: all(c(state) for c in compiled)
+
+
+def any_of(compiled: List[Optional[CompiledRule]]) -> Optional[CompiledRule]:
+    if any(c is None for c in compiled):
+        return None
+    if len(compiled) == 1:
+        return compiled[0]
+    return lambda state: any(c(state) for c in compiled)
+
+
+class RuleCompiler:
+
+    def __init__(self, world: MultiWorld, player: int, options: ToontownOptions):
+        self.world = world
+        self.player = player
+        self.options = options
+        # Rules are compiled once per location/entrance, some (like fish catches) are shared by many others
+        self._compiled: Dict[Tuple[Union[Rule, ItemRule], int], Optional[CompiledRule]] = {}
+        self._gag_level_thresholds: Dict[int, Tuple[float, float]] = {}
+
+    def compile_rule(self, rule: Union[Rule, ItemRule], locentr: LocEntrDef) -> Optional[CompiledRule]:
+        key = (rule, id(locentr))
+        if key in self._compiled:
+            return self._compiled[key]
+
+        rule_func, argument = rules_to_definition[rule]
+        compiler = rules_to_compiler.get(rule_func)
+        if compiler is not None:
+            compiled = compiler(self, rule, locentr, argument)
+        else:
+            compiled = self.compile_fallback(rule, locentr)
+
+        self._compiled[key] = compiled
+        return compiled
+
+    # Same as compile_rule, but always returns something that can be called
+    def get_rule(self, rule: Union[Rule, ItemRule], locentr: LocEntrDef) -> CompiledRule:
+        return self.compile_rule(rule, locentr) or always_true
+
+    def compile_fallback(self, rule: Union[Rule, ItemRule], locentr: LocEntrDef) -> CompiledRule:
+        func, world, player, options = rules_to_func[rule], self.world, self.player, self.options
+        return lambda state_or_item: func(state_or_item, locentr, world, player, options)
+
+    def compile_location(self, location_def: ToontownLocationDefinition) -> CompiledRule:
+        compiled = [self.compile_rule(r, location_def) for r in location_def.rules]
+        if not compiled:
+            return always_true
+        return (any_of if location_def.rule_logic_or else all_of)(compiled) or always_true
+
+    def compile_item_location(self, location_def: ToontownLocationDefinition) -> CompiledRule:
+        return all_of([self.compile_rule(r, location_def) for r in location_def.item_rules]) or always_true
+
+    def compile_entrance(self, entrance_def: ToontownEntranceDefinition) -> CompiledRule:
+        return all_of([self.compile_rule(r, entrance_def) for r in entrance_def.rules]) or always_true
+
+    # Returns the lowest amount of XP and capacity points needed for a gag level.
+    # These are found with the same comparisons has_collected_items_for_gag_level makes, so they always agree.
+    def get_gag_level_thresholds(self, level: int) -> Tuple[float, float]:
+        if level in self._gag_level_thresholds:
+            return self._gag_level_thresholds[level]
+
+        max_xp = self.options.max_global_gag_xp.value
+        min_xp = 0
+        if max_xp > 2:
+            xp_ratio = XP_RATIO_FOR_GAG_LEVEL.get(level)
+            min_xp = next((xp for xp in range(max_xp + 1) if xp_ratio <= (xp / max_xp)), float('inf'))
+
+        cap_ratio = CAP_RATIO_FOR_GAG_LEVEL.get(level)
+        min_cap = next((cap for cap in range(MAX_GAG_CAPACITY + 1) if cap_ratio <= (cap / MAX_GAG_CAPACITY)), float('inf'))
+
+        self._gag_level_thresholds[level] = (min_xp, min_cap)
+        return min_xp, min_cap
+
+    def compile_gag_level(self, level: int) -> Optional[CompiledRule]:
+        min_xp, min_cap = self.get_gag_level_thresholds(level)
+        if not min_xp and not min_cap:
+            return None
+
+        player = self.player
+        multiplier_1 = ToontownItemName.GAG_MULTIPLIER_1.value
+        multiplier_2 = ToontownItemName.GAG_MULTIPLIER_2.value
+        capacity_5 = ToontownItemName.GAG_CAPACITY_5.value
+        capacity_10 = ToontownItemName.GAG_CAPACITY_10.value
+        capacity_15 = ToontownItemName.GAG_CAPACITY_15.value
+
+        def has_gag_level(state: CollectionState) -> bool:
+            if min_xp and state.count(multiplier_1, player) + (2 * state.count(multiplier_2, player)) < min_xp:
+                return False
+            return state.count(capacity_5, player) + (2 * state.count(capacity_10, player)) \
+                + (2 * state.count(capacity_15, player)) >= min_cap
+
+        return has_gag_level
+
+    def compile_reach_any(self, regions: List[ToontownRegionName]) -> CompiledRule:
+        if not regions:
+            return always_false
+
+        player = self.player
+        region_names = [region.value for region in regions]
+        return lambda state: any(state.can_reach(region, None, player) for region in region_names)
+
+
+@compiles(AlwaysTrueRule)
+def compile_always_true(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    return None
+
+
+@compiles(HasItemRule)
+def compile_has_item(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    item, player = argument[0].value, compiler.player
+    count = argument[1] if len(argument) == 2 else 1
+    return lambda state: state.has(item, player, count)
+
+
+@compiles(TunnelCanBeUsed)
+def compile_tunnel_can_be_used(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    if compiler.options.tpsanity.value == TPSanity.option_keys:
+        return compiler.compile_rule(Rule.HasTeleportAccess, locentr)
+    return None
+
+
+@compiles(HasTeleportAccess)
+def compile_has_teleport_access(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    tp_item = REGION_TO_TP_ITEM.get(locentr.connects_to)
+    if tp_item is None:
+        return compiler.compile_fallback(rule, locentr)
+
+    item, player = tp_item.value, compiler.player
+    return lambda state: state.has(item, player)
+
+
+@compiles(FishCatch)
+def compile_fish_catch(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    fishGenus, speciesIndex = LOCATION_TO_GENUS_SPECIES[locentr.name]
+    fishDef = FISH_DICT[fishGenus][speciesIndex]
+    fishLocation = FishLocation(compiler.options.fish_locations.value)
+    fishProgression = FishProgression(compiler.options.fish_progression.value)
+    hasMaxRod = fishProgression not in (FishProgression.Rods, FishProgression.LicensesAndRods)
+    needsLicense = fishProgression in (FishProgression.Licenses, FishProgression.LicensesAndRods)
+    player = compiler.player
+    rod_item = ToontownItemName.FISHING_ROD_UPGRADE.value
+
+    # Figure out the zones we must scan, along with what we need to fish in them.
+    feasible_areas = set(fz for fz in fishDef.zone_list if fz != FishZone.Anywhere)
+    if FishZone.Anywhere in fishDef.zone_list:
+        for fz in PlaygroundFishZoneGroups.keys():
+            feasible_areas.add(fz)
+
+    areas = []
+    for zone in feasible_areas:
+        # Estate fishing is disabled.
+        if zone == FishZone.MyEstate:
+            continue
+
+        license = FISH_ZONE_TO_LICENSE.get(zone) if needsLicense else None
+        region = FISH_ZONE_TO_REGION.get(zone)
+        areas.append((zone, license.value if license else None, region.value if region else None))
+
+    # The areas this fish can be caught in only depend on the rod tier, work them out the first time each is seen.
+    areas_per_rod_tier: Dict[int, List[Tuple[Optional[str], Optional[str]]]] = {}
+
+    def get_areas(rodTier: int) -> List[Tuple[Optional[str], Optional[str]]]:
+        if rodTier not in areas_per_rod_tier:
+            areas_per_rod_tier[rodTier] = [
+                (license, region) for zone, license, region in areas
+                if any(_genus == fishGenus and _species == speciesIndex
+                       for _genus, _species, _rarity in get_catchable_fish(zone, rodTier, fishLocation))
+            ]
+        return areas_per_rod_tier[rodTier]
+
+    def can_catch(state: CollectionState) -> bool:
+        rodTier = 4 if hasMaxRod else state.count(rod_item, player)
+        for license, region in get_areas(rodTier):
+            if license and not state.has(license, player):
+                continue
+            if region and not state.can_reach(region, None, player):
+                continue
+            return True
+
+        # We cannot catch this fish anywhere.
+        return False
+
+    return can_catch
+
+
+@compiles(FishGenus)
+def compile_fish_genus(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    checkGenus = LOCATION_TO_GENUS[locentr.name]
+    return any_of([
+        compiler.compile_rule(Rule.FishCatch, get_location_def_from_name(locationName))
+        for locationName, fishData in LOCATION_TO_GENUS_SPECIES.items()
+        if fishData[0] == checkGenus
+    ])
+
+
+@compiles(FishGallery)
+def compile_fish_gallery(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    fishRequired = {
+        ToontownLocationName.FISHING_10_SPECIES: 10,
+        ToontownLocationName.FISHING_20_SPECIES: 20,
+        ToontownLocationName.FISHING_30_SPECIES: 30,
+        ToontownLocationName.FISHING_40_SPECIES: 40,
+        ToontownLocationName.FISHING_50_SPECIES: 50,
+        ToontownLocationName.FISHING_60_SPECIES: 60,
+        ToontownLocationName.FISHING_COMPLETE_ALBUM: 70,
+    }[locentr.name]
+    catches = [compiler.get_rule(Rule.FishCatch, get_location_def_from_name(locationName)) for locationName in FISH_LOCATIONS]
+    if fishRequired > len(catches):
+        return always_false
+
+    def has_enough_fish(state: CollectionState) -> bool:
+        fishCount = 0
+        for catch in catches:
+            if catch(state):
+                fishCount += 1
+                if fishCount >= fishRequired:
+                    return True
+        return False
+
+    return has_enough_fish
+
+
+@compiles(GagTraining)
+def compile_gag_training(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    frame, level, player = argument[0].value, argument[1], compiler.player
+    has_frames = lambda state: state.has(frame, player, level)
+    return all_of([has_frames, compiler.compile_gag_level(level)])
+
+
+@compiles(ReachLocationRule)
+def compile_reach_location(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    if type(argument[0]) is ToontownLocationName:
+        name, resolution_hint = argument[0].value, "Location"
+    elif type(argument[0]) is ToontownRegionName:
+        name, resolution_hint = argument[0].value, None
+    else:
+        raise NotImplementedError("ReachLocationRule does not know how to interpret %s" % repr(argument[0]))
+
+    player = compiler.player
+    return lambda state: state.can_reach(name, resolution_hint, player)
+
+
+@compiles(PlaygroundCountRule)
+def compile_playground_count(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    pgs = [
+        ToontownRegionName.TTC.value,
+        ToontownRegionName.DD.value,
+        ToontownRegionName.DG.value,
+        ToontownRegionName.MML.value,
+        ToontownRegionName.TB.value,
+        ToontownRegionName.DDL.value,
+        ToontownRegionName.AA.value,
+    ]
+    required, player = argument[0], compiler.player
+    if required <= 0:
+        return None
+
+    def has_playgrounds(state: CollectionState) -> bool:
+        reachable = 0
+        for pg in pgs:
+            if state.can_reach(pg, None, player):
+                reachable += 1
+                if reachable >= required:
+                    return True
+        return False
+
+    return has_playgrounds
+
+
+@compiles(TierThreeCogs)
+def compile_tier_three_cogs(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    return compiler.compile_rule(Rule.HasLevelTwoOffenseGag, locentr)
+
+
+@compiles(TierFiveCogs)
+def compile_tier_five_cogs(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    pgs = [
+        ToontownRegionName.DD,
+        ToontownRegionName.DG,
+        ToontownRegionName.MML,
+        ToontownRegionName.TB,
+        ToontownRegionName.DDL,
+    ]
+    return all_of([compiler.compile_reach_any(pgs), compiler.compile_rule(Rule.HasLevelThreeOffenseGag, locentr)])
+
+
+@compiles(ReachPastDD)
+def compile_reach_past_dd(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    pgs = [
+        ToontownRegionName.DG,
+        ToontownRegionName.MML,
+        ToontownRegionName.TB,
+        ToontownRegionName.DDL,
+    ]
+    return all_of([compiler.compile_reach_any(pgs), compiler.compile_rule(Rule.HasLevelFourOffenseGag, locentr)])
+
+
+@compiles(TierEightCogs)
+def compile_tier_eight_cogs(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    pgs = [argument[0]] if argument else []
+    return all_of([compiler.compile_reach_any(pgs), compiler.compile_rule(Rule.HasLevelFourOffenseGag, locentr)])
+
+
+@compiles(HasOffensiveLevel)
+def compile_has_offensive_level(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    LEVEL = argument[0]
+    OVERLEVEL = min(argument[0] + 1, 7)
+    UNDERLEVEL = max(0, argument[0] - 1)
+    player = compiler.player
+    throw = ToontownItemName.THROW_FRAME.value
+    squirt = ToontownItemName.SQUIRT_FRAME.value
+    lure = ToontownItemName.LURE_FRAME.value
+    drop = ToontownItemName.DROP_FRAME.value
+    trap = ToontownItemName.TRAP_FRAME.value
+    sound = ToontownItemName.SOUND_FRAME.value
+    toonup = ToontownItemName.TOONUP_FRAME.value
+    has_gag_level = compiler.compile_gag_level(LEVEL) or always_true
+
+    def has_offensive_level(state: CollectionState) -> bool:
+        # See HasOffensiveLevel in ruledefs.py for what each of these mean
+        has_lure = state.has(lure, player, LEVEL)
+        can_kill = (has_lure and (state.has(throw, player, LEVEL) or state.has(squirt, player, LEVEL))) \
+            or state.has(sound, player, OVERLEVEL) \
+            or (has_lure and state.has(trap, player, OVERLEVEL)) \
+            or state.has(drop, player, OVERLEVEL)
+        return can_kill and state.has(toonup, player, UNDERLEVEL) and has_gag_level(state)
+
+    return has_offensive_level
+
+
+@compiles(CanFightBoss)
+def compile_can_fight_boss(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    return all_of([compiler.compile_rule(required_rule, locentr) for required_rule in argument])
+
+
+@compiles(AllBossesDefeated)
+def compile_all_bosses_defeated(compiler: RuleCompiler, rule: Rule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    boss_rules = [
+        compiler.get_rule(Rule.CanFightVP, locentr),
+        compiler.get_rule(Rule.CanFightCFO, locentr),
+        compiler.get_rule(Rule.CanFightCJ, locentr),
+        compiler.get_rule(Rule.CanFightCEO, locentr),
+    ]
+    required = compiler.options.cog_bosses_required.value
+    can_reach_ttc = compiler.get_rule(Rule.CanReachTTC, locentr)
+    return lambda state: sum(boss_rule(state) for boss_rule in boss_rules) >= required and can_reach_ttc(state)
+
+
+@compiles(RestrictDisguises)
+def compile_restrict_disguises(compiler: RuleCompiler, rule: ItemRule, locentr: LocEntrDef, argument: Tuple) -> Optional[CompiledRule]:
+    return lambda item: item.code not in DISGUISE_ITEM_IDS
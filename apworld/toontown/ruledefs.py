@@ -13,6 +13,11 @@ from .rules import Rule, ItemRule
 
 LocEntrDef = Union[ToontownLocationDefinition, ToontownEntranceDefinition]
 rules_to_func: Dict[Union[Rule, ItemRule], Callable] = {}
+# The undecorated rule function and the argument each rule is called with, used by the rule compiler
+rules_to_definition: Dict[Union[Rule, ItemRule], Tuple[Callable, Tuple]] = {}
+
+# TODO - have this be dynamic to gag capacity items in pool
+MAX_GAG_CAPACITY = 12 + (2 * 2)
 
 
 def rule(rule: Union[Rule, ItemRule], *argument: Any):
@@ -20,7 +25,11 @@ def rule(rule: Union[Rule, ItemRule], *argument: Any):
         def wrapper(*args, **kwargs):
             kwargs['argument'] = kwargs.get('argument') or argument
             return f(*args, **kwargs)
+        # Stacked decorators pass their argument down, the innermost rule function receives the first one that is set
+        wrapper.rule_func = getattr(f, 'rule_func', f)
+        wrapper.rule_argument = argument or getattr(f, 'rule_argument', argument)
         rules_to_func[rule] = wrapper
+        rules_to_definition[rule] = (wrapper.rule_func, wrapper.rule_argument)
         return wrapper
     return decorator
 
@@ -36,7 +45,7 @@ def has_collected_items_for_gag_level(state: CollectionState, player: int, optio
     cap = state.count(ToontownItemName.GAG_CAPACITY_5.value, player) + (
                 2 * state.count(ToontownItemName.GAG_CAPACITY_10.value, player)) + (
                       2 * state.count(ToontownItemName.GAG_CAPACITY_15.value, player))
-    max_cap = 12 + (2 * 2)  # TODO - have this be dynamic to gag capacity items in pool
+    max_cap = MAX_GAG_CAPACITY
     sufficient_cap = CAP_RATIO_FOR_GAG_LEVEL.get(level) <= (cap / max_cap)
 
     # Return TRUE if we have enough xp and cap.
@@ -102,23 +111,25 @@ def TunnelCanBeUsed(state: CollectionState, locentr: LocEntrDef, world: MultiWor
     return True
 
 
+REGION_TO_TP_ITEM = {
+    ToontownRegionName.TTC: ToontownItemName.TTC_TELEPORT,
+    ToontownRegionName.DD: ToontownItemName.DD_TELEPORT,
+    ToontownRegionName.DG: ToontownItemName.DG_TELEPORT,
+    ToontownRegionName.MML: ToontownItemName.MML_TELEPORT,
+    ToontownRegionName.TB: ToontownItemName.TB_TELEPORT,
+    ToontownRegionName.DDL: ToontownItemName.DDL_TELEPORT,
+    ToontownRegionName.GS: ToontownItemName.GS_TELEPORT,
+    ToontownRegionName.AA: ToontownItemName.AA_TELEPORT,
+    ToontownRegionName.SBHQ: ToontownItemName.SBHQ_TELEPORT,
+    ToontownRegionName.CBHQ: ToontownItemName.CBHQ_TELEPORT,
+    ToontownRegionName.LBHQ: ToontownItemName.LBHQ_TELEPORT,
+    ToontownRegionName.BBHQ: ToontownItemName.BBHQ_TELEPORT,
+}
+
+
 @rule(Rule.HasTeleportAccess)
 def HasTeleportAccess(state: CollectionState, locentr: LocEntrDef, world: MultiWorld, player: int, options: ToontownOptions, argument: Tuple = None):
-    region_to_tp_item = {
-        ToontownRegionName.TTC: ToontownItemName.TTC_TELEPORT,
-        ToontownRegionName.DD: ToontownItemName.DD_TELEPORT,
-        ToontownRegionName.DG: ToontownItemName.DG_TELEPORT,
-        ToontownRegionName.MML: ToontownItemName.MML_TELEPORT,
-        ToontownRegionName.TB: ToontownItemName.TB_TELEPORT,
-        ToontownRegionName.DDL: ToontownItemName.DDL_TELEPORT,
-        ToontownRegionName.GS: ToontownItemName.GS_TELEPORT,
-        ToontownRegionName.AA: ToontownItemName.AA_TELEPORT,
-        ToontownRegionName.SBHQ: ToontownItemName.SBHQ_TELEPORT,
-        ToontownRegionName.CBHQ: ToontownItemName.CBHQ_TELEPORT,
-        ToontownRegionName.LBHQ: ToontownItemName.LBHQ_TELEPORT,
-        ToontownRegionName.BBHQ: ToontownItemName.BBHQ_TELEPORT,
-    }
-    return state.has(region_to_tp_item[locentr.connects_to].value, player)
+    return state.has(REGION_TO_TP_ITEM[locentr.connects_to].value, player)
 
 
 @rule(Rule.FishCatch)
@@ -402,32 +413,13 @@ def HasOffensiveLevel(state: CollectionState, locentr: LocEntrDef, world: MultiW
             and sufficient_healing and can_obtain_exp_required
 
 
-@rule(Rule.CanFightVP)
-def CanFightVP(state: CollectionState, locentr: LocEntrDef, world: MultiWorld, player: int, options: ToontownOptions, argument: Tuple = None):
-    args = (state, locentr, world, player, options)
-    return passes_rule(Rule.CanReachSBHQ, *args) and passes_rule(Rule.SellbotDisguise, *args) \
-            and passes_rule(Rule.HasLevelFiveOffenseGag, *args)
-
-
-@rule(Rule.CanFightCFO)
-def CanFightCFO(state: CollectionState, locentr: LocEntrDef, world: MultiWorld, player: int, options: ToontownOptions, argument: Tuple = None):
-    args = (state, locentr, world, player, options)
-    return passes_rule(Rule.CanReachCBHQ, *args) and passes_rule(Rule.CashbotDisguise, *args) \
-            and passes_rule(Rule.HasLevelSixOffenseGag, *args)
-
-
-@rule(Rule.CanFightCJ)
-def CanFightCJ(state: CollectionState, locentr: LocEntrDef, world: MultiWorld, player: int, options: ToontownOptions, argument: Tuple = None):
-    args = (state, locentr, world, player, options)
-    return passes_rule(Rule.CanReachLBHQ, *args) and passes_rule(Rule.LawbotDisguise, *args) \
-            and passes_rule(Rule.HasLevelSevenOffenseGag, *args)
-
-
-@rule(Rule.CanFightCEO)
-def CanFightCEO(state: CollectionState, locentr: LocEntrDef, world: MultiWorld, player: int, options: ToontownOptions, argument: Tuple = None):
+@rule(Rule.CanFightVP,  Rule.CanReachSBHQ, Rule.SellbotDisguise, Rule.HasLevelFiveOffenseGag)
+@rule(Rule.CanFightCFO, Rule.CanReachCBHQ, Rule.CashbotDisguise, Rule.HasLevelSixOffenseGag)
+@rule(Rule.CanFightCJ,  Rule.CanReachLBHQ, Rule.LawbotDisguise,  Rule.HasLevelSevenOffenseGag)
+@rule(Rule.CanFightCEO, Rule.CanReachBBHQ, Rule.BossbotDisguise, Rule.HasLevelEightOffenseGag)
+def CanFightBoss(state: CollectionState, locentr: LocEntrDef, world: MultiWorld, player: int, options: ToontownOptions, argument: Tuple = None):
     args = (state, locentr, world, player, options)
-    return passes_rule(Rule.CanReachBBHQ, *args) and passes_rule(Rule.BossbotDisguise, *args) \
-            and passes_rule(Rule.HasLevelEightOffenseGag, *args)
+    return all(passes_rule(required_rule, *args) for required_rule in argument)
 
 
 @rule(Rule.AllBossesDefeated)
@@ -443,17 +435,19 @@ def AllBossesDefeated(state: CollectionState, locentr: LocEntrDef, world: MultiW
     return bosses_defeated >= options.cog_bosses_required.value and passes_rule(Rule.CanReachTTC, *args)  # TECHNICALLY TRUE!
 
 
+DISGUISE_ITEM_IDS = list(map(
+    lambda name: LOCATION_NAME_TO_ID.get(name),
+    [
+        ToontownItemName.SELLBOT_DISGUISE.value,
+        ToontownItemName.CASHBOT_DISGUISE.value,
+        ToontownItemName.LAWBOT_DISGUISE.value,
+        ToontownItemName.BOSSBOT_DISGUISE.value,
+    ]
+))
+
+
 @rule(ItemRule.RestrictDisguises)
 def RestrictDisguises(item: ToontownItem, locentr: LocEntrDef, world: MultiWorld, player: int, options: ToontownOptions, argument: Tuple = None):
-    DISGUISE_ITEM_IDS = list(map(
-        lambda name: LOCATION_NAME_TO_ID.get(name),
-        [
-            ToontownItemName.SELLBOT_DISGUISE.value,
-            ToontownItemName.CASHBOT_DISGUISE.value,
-            ToontownItemName.LAWBOT_DISGUISE.value,
-            ToontownItemName.BOSSBOT_DISGUISE.value,
-        ]
-    ))
     return item.code not in DISGUISE_ITEM_IDS
 
 
@@ -0,0 +1,48 @@
+from BaseClasses import CollectionState
+from . import ToontownTestBase
+from ..locations import LOCATION_DEFINITIONS, EVENT_DEFINITIONS
+from ..regions import REGION_DEFINITIONS
+from ..rulecompiler import RuleCompiler
+from ..ruledefs import test_location, test_entrance, test_item_location
+
+
+class ToontownTestRuleCompiler(ToontownTestBase):
+    options = {
+        'tpsanity': 'keys',
+        'fish_locations': 'playgrounds',
+        'fish_checks': 'all_species',
+        'fish_progression': 'licenses_and_rods',
+    }
+
+    # How many items to collect between each comparison
+    STEP = 15
+
+    def test_compiled_rules_match_ruledefs(self):
+        options = self.multiworld.worlds[self.player].options
+        compiler = RuleCompiler(self.multiworld, self.player, options)
+        location_defs = LOCATION_DEFINITIONS + EVENT_DEFINITIONS
+        entrance_defs = [entrance_def for region_def in REGION_DEFINITIONS for entrance_def in region_def.connects_to]
+        compiled_locations = [compiler.compile_location(location_def) for location_def in location_defs]
+        compiled_item_rules = [compiler.compile_item_location(location_def) for location_def in location_defs]
+        compiled_entrances = [compiler.compile_entrance(entrance_def) for entrance_def in entrance_defs]
+
+        # Every item rule has to agree for every item in the pool
+        for location_def, item_rule in zip(location_defs, compiled_item_rules):
+            for item in self.multiworld.itempool:
+                with self.subTest(location=location_def.name.value, item=item.name):
+                    self.assertEqual(item_rule(item), test_item_location(location_def, item, self.multiworld, self.player, options))
+
+        # Collect the item pool bit by bit and make sure both agree the whole way through
+        state = CollectionState(self.multiworld)
+        items = self.multiworld.itempool
+        for collected in range(0, len(items) + self.STEP, self.STEP):
+            for item in items[max(0, collected - self.STEP):collected]:
+                state.collect(item)
+
+            for location_def, access_rule in zip(location_defs, compiled_locations):
+                with self.subTest(location=location_def.name.value, collected=collected):
+                    self.assertEqual(access_rule(state), test_location(location_def, state, self.multiworld, self.player, options))
+
+            for entrance_def, access_rule in zip(entrance_defs, compiled_entrances):
+                with self.subTest(entrance=entrance_def.connects_to.value, collected=collected):
+                    self.assertEqual(access_rule(state), test_entrance(entrance_def, state, self.multiworld, self.player, options))
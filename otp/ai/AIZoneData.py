@@ -4,7 +4,9 @@ from direct.directnotify.DirectNotifyGlobal import directNotify
 from direct.task import Task
 from direct.showbase import LeakDetectors
 from otp.otpbase import OTPGlobals
+import heapq
 import random
+import time
 
 class AIZoneData:
     notify = directNotify.newCategory('AIZoneData')
@@ -30,12 +32,19 @@ class AIZoneDataObj:
     notify = directNotify.newCategory('AIZoneDataObj')
     DefaultCTravName = 'default'
 
-    def __init__(self, parentId, zoneId):
+    def __init__(self, parentId, zoneId, store = None):
         self._parentId = parentId
         self._zoneId = zoneId
+        self._store = store
         self._refCount = 0
         self._collTravs = {}
-        self._collTravsStarted = set()
+        # cTravName -> seconds between traversals, for the traversers that were started
+        self._collTravsStarted = {}
+        # nodePath -> (seconds between traversals, grounded), for the colliders of the default traverser
+        self._colliders = {}
+        self._nextCollTravTime = None
+        # Number of traversals, total and longest time they took
+        self._collTravStats = [0, 0.0, 0.0]
 
     def __str__(self):
         output = str(self._collTravs)
@@ -59,10 +68,12 @@ class AIZoneDataObj:
         return self._refCount
 
     def destroy(self):
-        for name in self._collTravsStarted:
+        for name in list(self._collTravsStarted):
             self.stopCollTrav(cTravName=name)
 
+        self._nextCollTravTime = None
         del self._collTravsStarted
+        del self._colliders
         del self._collTravs
         if hasattr(self, '_nonCollidableParent'):
             self._nonCollidableParent.removeNode()
@@ -78,6 +89,7 @@ class AIZoneDataObj:
             del self._parentMgr
         del self._zoneId
         del self._parentId
+        del self._store
 
     def getLocation(self):
         return (self._parentId, self._zoneId)
@@ -120,11 +132,6 @@ class AIZoneDataObj:
         if name in self._collTravs:
             del self._collTravs[name]
 
-    def _getCTravTaskName(self, name = None):
-        if name is None:
-            name = AIZoneDataObj.DefaultCTravName
-        return 'collTrav-%s-%s-%s' % (name, self._parentId, self._zoneId)
-
     def _doCollisions(self, task = None, topNode = None, cTravName = None):
         render = self.getRender()
         curTime = globalClock.getFrameTime()
@@ -146,13 +153,14 @@ class AIZoneDataObj:
         self.getCollTrav(cTravName)
         self._doCollisions(topNode=topNode, cTravName=cTravName)
 
-    def startCollTrav(self, respectPrevTransform = 1, cTravName = None):
+    def startCollTrav(self, respectPrevTransform = 1, cTravName = None, period = 0):
+        # The traverser is traversed by the zone data store along with the rest of this zone,
+        # every period seconds, or every frame if period is 0
         if cTravName is None:
             cTravName = AIZoneDataObj.DefaultCTravName
-        if cTravName not in self._collTravsStarted:
-            self.getCollTrav(name=cTravName)
-            taskMgr.add(self._doCollisions, self._getCTravTaskName(name=cTravName), priority=OTPGlobals.AICollisionPriority, extraArgs=[self._zoneId])
-            self._collTravsStarted.add(cTravName)
+        self.getCollTrav(name=cTravName)
+        self._collTravsStarted[cTravName] = period
+        self._scheduleCollTrav()
         self.setRespectPrevTransform(respectPrevTransform, cTravName=cTravName)
         return
 
@@ -162,10 +170,49 @@ class AIZoneDataObj:
         self.notify.debug('stopCollTrav(%s, %s, %s)' % (cTravName, self._parentId, self._zoneId))
         if cTravName in self._collTravsStarted:
             self.notify.info('removing %s collision traversal for (%s, %s)' % (cTravName, self._parentId, self._zoneId))
-            taskMgr.remove(self._getCTravTaskName(name=cTravName))
-            self._collTravsStarted.remove(cTravName)
+            del self._collTravsStarted[cTravName]
         return
 
+    def addCollider(self, nodePath, handler, period = 0, grounded = False):
+        # Adds a collider to the default traverser, which the zone data store traverses at least
+        # every period seconds, or every frame if period is 0. Grounded colliders are moved down
+        # to the ground right before each traversal, wherever their parent is.
+        self.getCollTrav().addCollider(nodePath, handler)
+        self._colliders[nodePath] = (period, grounded)
+        self._scheduleCollTrav()
+
+    def removeCollider(self, nodePath):
+        if nodePath in self._colliders:
+            del self._colliders[nodePath]
+            self.getCollTrav().removeCollider(nodePath)
+
+    def getNumColliders(self):
+        return len(self._colliders)
+
+    def _getCollTravPeriod(self):
+        # The zone is traversed as often as its most demanding traverser or collider asks for
+        periods = list(self._collTravsStarted.values())
+        periods.extend(period for period, grounded in self._colliders.values())
+        if not periods:
+            return None
+        return min(periods)
+
+    def _scheduleCollTrav(self):
+        if self._store is not None:
+            self._store._scheduleCollTrav(self)
+
+    def _doCollTravs(self):
+        render = self.getRender()
+        for nodePath, (period, grounded) in self._colliders.items():
+            if grounded:
+                nodePath.setZ(render, 0)
+
+        cTravNames = set(self._collTravsStarted)
+        if self._colliders:
+            cTravNames.add(AIZoneDataObj.DefaultCTravName)
+        for cTravName in sorted(cTravNames):
+            self._doCollisions(cTravName=cTravName)
+
     def setRespectPrevTransform(self, flag, cTravName = None):
         if cTravName is None:
             cTravName = AIZoneDataObj.DefaultCTravName
@@ -181,14 +228,20 @@ class AIZoneDataObj:
 class AIZoneDataStore:
     notify = directNotify.newCategory('AIZoneDataStore')
 
+    CollTravTaskName = 'zoneDataCollTrav'
+
     def __init__(self):
         self._zone2data = {}
+        # (next traversal time, location), for every zone that has something to traverse
+        self._collTravQueue = []
 
     def destroy(self):
+        taskMgr.remove(self.CollTravTaskName)
         for zone, data in self._zone2data.items():
             data.destroy()
 
         del self._zone2data
+        del self._collTravQueue
 
     def hasDataForZone(self, parentId, zoneId):
         key = (parentId, zoneId)
@@ -197,7 +250,7 @@ class AIZoneDataStore:
     def getDataForZone(self, parentId, zoneId):
         key = (parentId, zoneId)
         if key not in self._zone2data:
-            self._zone2data[key] = AIZoneDataObj(parentId, zoneId)
+            self._zone2data[key] = AIZoneDataObj(parentId, zoneId, self)
             self.printStats()
         data = self._zone2data[key]
         data._incRefCount()
@@ -213,5 +266,58 @@ class AIZoneDataStore:
             data.destroy()
             self.printStats()
 
-    def printStats(self):
+    def _scheduleCollTrav(self, data):
+        # Makes sure the zone is traversed within its period from now
+        period = data._getCollTravPeriod()
+        if period is None:
+            return
+        now = globalClock.getFrameTime()
+        if data._nextCollTravTime is not None and data._nextCollTravTime <= now + period:
+            return
+        data._nextCollTravTime = now
+        heapq.heappush(self._collTravQueue, (now, data.getLocation()))
+        if not taskMgr.hasTaskNamed(self.CollTravTaskName):
+            taskMgr.add(self._doCollTravs, self.CollTravTaskName, priority=OTPGlobals.AICollisionPriority)
+
+    def _doCollTravs(self, task):
+        # Traverses every zone that is due, once, in order. The collision events they throw are
+        # all dispatched together afterwards, by the event manager.
+        now = globalClock.getFrameTime()
+        due = []
+        while self._collTravQueue and self._collTravQueue[0][0] <= now:
+            traverseTime, location = heapq.heappop(self._collTravQueue)
+            data = self._zone2data.get(location)
+            if data is not None and data._nextCollTravTime == traverseTime:
+                due.append((traverseTime, data))
+
+        for traverseTime, data in due:
+            if data._nextCollTravTime != traverseTime:
+                # Released by something listening to a zone traversed before it
+                continue
+            start = time.perf_counter()
+            data._doCollTravs()
+            elapsed = time.perf_counter() - start
+            stats = data._collTravStats
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            period = data._getCollTravPeriod()
+            if period is None:
+                data._nextCollTravTime = None
+                continue
+            data._nextCollTravTime = max(traverseTime + period, now)
+            heapq.heappush(self._collTravQueue, (data._nextCollTravTime, data.getLocation()))
+
+        if not self._collTravQueue:
+            return Task.done
+        return Task.cont
+
+    def getCollTravStats(self):
+        # location -> (number of traversals, total seconds, longest seconds)
+        return dict(((location, tuple(data._collTravStats)) for location, data in self._zone2data.items() if data._collTravStats[0]))
+
+    def printStats(self, collTravTimes = False):
         self.notify.debug('%s zones have zone data allocated' % len(self._zone2data))
+        if collTravTimes:
+            for location, (numTraversals, totalTime, maxTime) in sorted(self.getCollTravStats().items()):
+                self.notify.info('%s: %s colliders, %s traversals, %.3f ms average, %.3f ms longest' % (location, self._zone2data[location].getNumColliders(), numTraversals, totalTime / numTraversals * 1000, maxTime * 1000))
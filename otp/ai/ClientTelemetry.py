@@ -0,0 +1,184 @@
+import bisect
+from collections import OrderedDict
+
+# Upper bounds of the frame rate histogram buckets. Anything at or above the last bound goes into one more bucket.
+FrameRateBuckets = (5, 10, 15, 20, 30, 45, 60, 90, 120, 144)
+
+# Upper bounds of the process memory histogram buckets, in MB.
+MemoryBuckets = (128, 256, 512, 1024, 2048, 4096, 8192)
+
+# The kinds of telemetry a client sends us, each one rate limited separately.
+FrameRateReport = 0
+CpuInfoReport = 1
+GarbageLeakReport = 2
+
+
+class Histogram:
+    """
+    Counts values into a fixed set of buckets.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+
+    def add(self, value):
+        self.counts[bisect.bisect_right(self.bounds, value)] += 1
+
+    def getCounts(self):
+        counts = {}
+        lower = 0
+        for bound, count in zip(self.bounds, self.counts):
+            if count:
+                counts['%s-%s' % (lower, bound)] = count
+            lower = bound
+
+        if self.counts[-1]:
+            counts['%s+' % lower] = self.counts[-1]
+        return counts
+
+
+class StringCounter:
+    """
+    Counts how often each string comes up, for at most maxStrings different strings.
+    Once it is full, any string it hasn't seen yet is counted as 'other'.
+    """
+
+    def __init__(self, maxStrings):
+        self.maxStrings = maxStrings
+        self.counts = {}
+        self.other = 0
+
+    def add(self, string):
+        if string in self.counts:
+            self.counts[string] += 1
+        elif len(self.counts) < self.maxStrings:
+            self.counts[string] = 1
+        else:
+            self.other += 1
+
+    def getCounts(self):
+        counts = dict(sorted(self.counts.items(), key=lambda item: item[1], reverse=True))
+        if self.other:
+            counts['other'] = self.other
+        return counts
+
+
+class TelemetryStats:
+    """
+    Everything clients in a single zone or hood have told us since the last summary.
+    """
+
+    def __init__(self, maxStrings):
+        self.samples = 0
+        self.frameRates = Histogram(FrameRateBuckets)
+        self.memory = Histogram(MemoryBuckets)
+        self.gpus = StringCounter(maxStrings)
+        self.cpus = StringCounter(maxStrings)
+        self.garbageLeaks = 0
+
+    def getSummary(self):
+        return {
+            'samples': self.samples,
+            'fps': self.frameRates.getCounts(),
+            'memory': self.memory.getCounts(),
+            'gpus': self.gpus.getCounts(),
+            'cpus': self.cpus.getCounts(),
+            'garbageLeaks': self.garbageLeaks,
+        }
+
+
+class ClientTelemetry:
+    """
+    Aggregates the frame rate, CPU and garbage leak reports clients send to the
+    TimeManager into per zone and per hood histograms.
+
+    Memory use is bounded: at most maxZones zones and maxZones hoods are kept, the
+    ones that were reported on least recently being dropped first, and every string
+    counter holds at most maxStrings strings. Each avatar may only send one report
+    of each kind every minReportInterval seconds, anything more is dropped.
+    """
+
+    def __init__(self, maxZones=256, maxStrings=16, maxAvatars=8192, minReportInterval=30.0):
+        self.maxZones = maxZones
+        self.maxStrings = maxStrings
+        self.maxAvatars = maxAvatars
+        self.minReportInterval = minReportInterval
+        self.zones = OrderedDict()
+        self.hoods = OrderedDict()
+        # Maps (avId, report kind) to when we last accepted that report, oldest first.
+        self.lastReports = OrderedDict()
+        self.droppedReports = 0
+
+    def allowReport(self, avId, kind, now):
+        key = (avId, kind)
+        lastReport = self.lastReports.get(key)
+        if lastReport is not None and now - lastReport < self.minReportInterval:
+            self.droppedReports += 1
+            return False
+
+        self.lastReports[key] = now
+        self.lastReports.move_to_end(key)
+        # The oldest entries are the ones whose interval has been over the longest, so they can go first.
+        while len(self.lastReports) > self.maxAvatars:
+            self.lastReports.popitem(last=False)
+
+        return True
+
+    def __getStats(self, statsDict, key):
+        stats = statsDict.get(key)
+        if stats is None:
+            stats = TelemetryStats(self.maxStrings)
+            statsDict[key] = stats
+            if len(statsDict) > self.maxZones:
+                statsDict.popitem(last=False)
+        else:
+            statsDict.move_to_end(key)
+
+        return stats
+
+    def __getAllStats(self, zoneId, hoodId):
+        return self.__getStats(self.zones, zoneId), self.__getStats(self.hoods, hoodId)
+
+    def addFrameRate(self, avId, zoneId, hoodId, now, fps, processMemory, gpu):
+        if not self.allowReport(avId, FrameRateReport, now):
+            return False
+
+        for stats in self.__getAllStats(zoneId, hoodId):
+            stats.samples += 1
+            stats.frameRates.add(fps)
+            stats.memory.add(processMemory)
+            stats.gpus.add(gpu)
+
+        return True
+
+    def addCpuInfo(self, avId, zoneId, hoodId, now, cpu):
+        if not self.allowReport(avId, CpuInfoReport, now):
+            return False
+
+        for stats in self.__getAllStats(zoneId, hoodId):
+            stats.cpus.add(cpu)
+
+        return True
+
+    def addGarbageLeak(self, avId, zoneId, hoodId, now, numLeaks):
+        if not self.allowReport(avId, GarbageLeakReport, now):
+            return False
+
+        for stats in self.__getAllStats(zoneId, hoodId):
+            stats.garbageLeaks += numLeaks
+
+        return True
+
+    def getZoneStats(self, zoneId):
+        return self.zones.get(zoneId)
+
+    def getHoodStats(self, hoodId):
+        return self.hoods.get(hoodId)
+
+    def popHoodSummaries(self):
+        # Returns the summary of every hood, and starts over for the next one.
+        summaries = [(hoodId, stats.getSummary()) for hoodId, stats in self.hoods.items()]
+        self.zones.clear()
+        self.hoods.clear()
+        return summaries
@@ -1,10 +1,13 @@
+import json
 import time
 
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.ClockDelta import globalClockDelta
 from direct.distributed.DistributedObjectAI import DistributedObjectAI
 
+from otp.ai.ClientTelemetry import ClientTelemetry
 from otp.otpbase import OTPGlobals
+from toontown.hood import ZoneUtil
 
 
 class TimeManagerAI(DistributedObjectAI):
@@ -14,6 +17,20 @@ class TimeManagerAI(DistributedObjectAI):
         DistributedObjectAI.__init__(self, air)
         self.avId2disconnectcode = {}
         self.avId2exceptioninfo = {}
+        self.telemetry = ClientTelemetry(
+            maxZones=simbase.config.GetInt('client-telemetry-max-zones', 256),
+            maxStrings=simbase.config.GetInt('client-telemetry-max-strings', 16),
+            maxAvatars=simbase.config.GetInt('client-telemetry-max-avatars', 8192),
+            minReportInterval=simbase.config.GetFloat('client-telemetry-min-interval', 30.0))
+        self.telemetryReportInterval = simbase.config.GetFloat('client-telemetry-report-interval', 600.0)
+
+    def announceGenerate(self):
+        DistributedObjectAI.announceGenerate(self)
+        taskMgr.doMethodLater(self.telemetryReportInterval, self.__reportTelemetry, self.uniqueName('reportTelemetry'))
+
+    def delete(self):
+        taskMgr.remove(self.uniqueName('reportTelemetry'))
+        DistributedObjectAI.delete(self)
 
     def requestServerTime(self, context):
         avId = self.air.getAvatarIdFromSender()
@@ -43,18 +60,58 @@ class TimeManagerAI(DistributedObjectAI):
     def setSignature(self, todo0, todo1, todo2):
         pass
 
-    def setFrameRate(self, todo0, todo1, todo2, todo3, todo4, todo5, todo6, todo7, todo8, todo9, todo10, todo11, todo12,
-                     todo13, todo14, todo15, todo16, todo17):
-        pass
+    def __getSenderZone(self):
+        # Returns the sender's avatar id, and the zone and hood they are in.
+        avId = self.air.getAvatarIdFromSender()
+        av = self.air.doId2do.get(avId)
+        if not av:
+            return avId, None, None
 
-    def setCpuInfo(self, todo0, todo1):
-        pass
+        return avId, av.zoneId, ZoneUtil.getCanonicalHoodId(av.zoneId)
+
+    def setFrameRate(self, fps, deviation, numAvs, locationCode, timeInLocation, timeInGame, gameOptionsCode, vendorId,
+                     deviceId, processMemory, pageFileUsage, physicalMemory, pageFaultCount, osInfo, cpuSpeed, numCpuCores,
+                     numLogicalCpus, apiName):
+        avId, zoneId, hoodId = self.__getSenderZone()
+        if zoneId is None:
+            return
+
+        gpu = '%s 0x%04x:0x%04x' % (apiName, vendorId, deviceId)
+        self.telemetry.addFrameRate(avId, zoneId, hoodId, globalClock.getRealTime(), fps, processMemory, gpu)
+
+    def setCpuInfo(self, info, cacheStatus):
+        avId, zoneId, hoodId = self.__getSenderZone()
+        if zoneId is None:
+            return
+
+        # The info is vendor|brand|version|brand index|speeds|cores, the brand is what we want to know about.
+        fields = info.split('|')
+        cpu = fields[1].strip() if len(fields) > 1 else info
+        self.telemetry.addCpuInfo(avId, zoneId, hoodId, globalClock.getRealTime(), cpu[:64])
 
     def checkForGarbageLeaks(self, todo0):
         pass
 
-    def setClientGarbageLeak(self, todo0, todo1):
-        pass
+    def setClientGarbageLeak(self, num, description):
+        avId, zoneId, hoodId = self.__getSenderZone()
+        if zoneId is None:
+            return
+
+        if self.telemetry.addGarbageLeak(avId, zoneId, hoodId, globalClock.getRealTime(), num):
+            self.air.writeServerEvent('client-garbage-leak', avId=avId, num=num, description=description)
+
+    def __reportTelemetry(self, task):
+        for hoodId, summary in self.telemetry.popHoodSummaries():
+            self.air.writeServerEvent('client-telemetry', hoodId=hoodId, samples=summary['samples'],
+                                      fps=json.dumps(summary['fps']), memory=json.dumps(summary['memory']),
+                                      gpus=json.dumps(summary['gpus']), cpus=json.dumps(summary['cpus']),
+                                      garbageLeaks=summary['garbageLeaks'])
+
+        if self.telemetry.droppedReports:
+            self.air.writeServerEvent('client-telemetry-dropped', reports=self.telemetry.droppedReports)
+            self.telemetry.droppedReports = 0
+
+        return task.again
 
     def checkAvOnDistrict(self, todo0, todo1):
         pass
@@ -40,6 +40,7 @@ from otp.uberdog import OtpAvatarManager
 from otp.distributed import OtpDoGlobals
 from otp.distributed.TelemetryLimiter import TelemetryLimiter
 from otp.ai.GarbageLeakServerEventAggregator import GarbageLeakServerEventAggregator
+from toontown.util.astron.AstronFieldBatch import AstronFieldBatch
 
 class OTPClientRepository(ClientRepositoryBase):
     notify = directNotify.newCategory('OTPClientRepository')
@@ -1836,6 +1837,17 @@ class OTPClientRepository(ClientRepositoryBase):
         if msgType == 65535:
             self.lostConnection()
             return
+        if msgType == CLIENT_OBJECT_SET_FIELDS:
+            # Batched updates from AstronFieldBatch. Every state knows how to handle one field at a time.
+            for dg in AstronFieldBatch.splitClientUpdate(self.getDcFile(), di):
+                fieldDi = PyDatagramIterator(dg)
+                fieldDi.getUint16()
+                if self.handler == None:
+                    self.handleMessageType(CLIENT_OBJECT_SET_FIELD, fieldDi)
+                else:
+                    self.handler(CLIENT_OBJECT_SET_FIELD, fieldDi)
+            self.considerHeartbeat()
+            return
         if self.handler == None:
             self.handleMessageType(msgType, di)
         else:
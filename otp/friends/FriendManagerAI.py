@@ -1,7 +1,10 @@
 import datetime
+import heapq
 import json
 import os
 import random
+import sys
+import time
 
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.DistributedObjectAI import DistributedObjectAI
@@ -17,15 +20,31 @@ from direct.distributed.MsgTypes import *
 class FriendManagerAI(DistributedObjectAI):
     notify = DirectNotifyGlobal.directNotify.newCategory('FriendManagerAI')
     serverDataFolder = simbase.config.GetString('server-data-folder', '')
+    # True Friend codes last until midnight at the start of the second day after they were made.
+    tfCodeLifetimeDays = 2
+    # Codes are written behind, at most once every tfCodeSaveDelay seconds.
+    tfCodeSaveDelay = simbase.config.GetFloat('tf-code-save-delay', 5.0)
 
-    def __init__(self, air):
+    def __init__(self, air, clock=time.time):
         DistributedObjectAI.__init__(self, air)
         self.currentContext = 0
         self.requests = {}
         self.shard = str(air.districtId)
         self.filename = self.getFilename()
-        self.tfCodes = self.loadTrueFriendCodes()
-        taskMgr.add(self.__trueFriendCodesTask, 'tf-codes-clear-task')
+        self.clock = clock
+        # Maps codes to (avId, expiry timestamp).
+        self.tfCodes = {}
+        # Heap of (expiry timestamp, code). Codes that were used up stay in here until they would have expired.
+        self.tfCodeExpiries = []
+        self.nextExpiry = None
+        self.saveTask = None
+        for tfCode, (avId, expiry) in self.loadTrueFriendCodes().items():
+            self.addTrueFriendCode(tfCode, avId, expiry)
+
+    def delete(self):
+        taskMgr.remove('tf-codes-clear-task')
+        self.flushTrueFriendCodesFile()
+        DistributedObjectAI.delete(self)
 
     def friendQuery(self, inviteeId):
         avId = self.air.getAvatarIdFromSender()
@@ -165,10 +184,9 @@ class FriendManagerAI(DistributedObjectAI):
         if len(av.getFriendsList()) >= OTPGlobals.MaxFriends:
             self.d_requestSecretResponse(avId, 0, '')
         else:
-            day = datetime.datetime.now().day
             tfCode = self.generateTrueFriendCode()
-            self.tfCodes[tfCode] = (avId, day)
-            self.updateTrueFriendCodesFile()
+            self.addTrueFriendCode(tfCode, avId, self.getTrueFriendCodeExpiry(self.clock()))
+            self.saveTrueFriendCodesLater()
             self.d_requestSecretResponse(avId, 1, tfCode)
             self.air.writeServerEvent('tf-code-requested', avId=avId, tfCode=tfCode)
 
@@ -195,7 +213,7 @@ class FriendManagerAI(DistributedObjectAI):
             return
 
         secretInfo = self.tfCodes.get(secret)
-        if not secretInfo:
+        if not secretInfo or secretInfo[1] <= self.clock():
             self.d_submitSecretResponse(avId, 0, 0)
             return
 
@@ -269,7 +287,16 @@ class FriendManagerAI(DistributedObjectAI):
     def removeSecret(self, secret):
         if secret in self.tfCodes:
             del self.tfCodes[secret]
-            self.updateTrueFriendCodesFile()
+            self.saveTrueFriendCodesLater()
+
+    def addTrueFriendCode(self, tfCode, avId, expiry):
+        self.tfCodes[tfCode] = (avId, expiry)
+        heapq.heappush(self.tfCodeExpiries, (expiry, tfCode))
+        self.__scheduleExpiryTask()
+
+    def getTrueFriendCodeExpiry(self, now):
+        expiryDate = datetime.date.fromtimestamp(now) + datetime.timedelta(days=self.tfCodeLifetimeDays)
+        return time.mktime(expiryDate.timetuple())
 
     def getFilename(self):
         return '%s%s%s%s.json' % (self.serverDataFolder, 'trueFriendCodes/', 'trueFriendCodes_', self.shard)
@@ -278,29 +305,87 @@ class FriendManagerAI(DistributedObjectAI):
         try:
             tfCodesFile = open(self.filename, 'r')
             tfCodesData = json.load(tfCodesFile)
-            return tfCodesData
         except:
             return {}
 
+        tfCodes = {}
+        now = self.clock()
+        for tfCode, (avId, expiry) in tfCodesData.items():
+            if 1 <= expiry <= 31:
+                # Codes used to be stored with the day of the month they were made on.
+                # They were made on the last day with that number, up to today.
+                madeOn = datetime.date.fromtimestamp(now)
+                while madeOn.day != expiry:
+                    madeOn -= datetime.timedelta(days=1)
+
+                expiry = self.getTrueFriendCodeExpiry(time.mktime(madeOn.timetuple()))
+
+            if expiry > now:
+                tfCodes[tfCode] = (avId, expiry)
+
+        return tfCodes
+
+    def saveTrueFriendCodesLater(self):
+        if not self.saveTask:
+            self.saveTask = taskMgr.doMethodLater(self.tfCodeSaveDelay, self.__saveTrueFriendCodesTask,
+                                                  'tf-codes-save-task')
+
+    def __saveTrueFriendCodesTask(self, task):
+        self.saveTask = None
+        self.updateTrueFriendCodesFile()
+        return task.done
+
+    def flushTrueFriendCodesFile(self):
+        # Write any pending changes right away. The AI repository calls this when it shuts down.
+        if self.saveTask:
+            taskMgr.remove(self.saveTask)
+            self.saveTask = None
+            self.updateTrueFriendCodesFile()
+
     def updateTrueFriendCodesFile(self):
         try:
             if not os.path.exists(os.path.dirname(self.filename)):
                 os.makedirs(os.path.dirname(self.filename))
 
-            tfCodesFile = open(self.filename, 'w')
-            tfCodesFile.seek(0)
-            json.dump(self.tfCodes, tfCodesFile)
-            tfCodesFile.close()
-        except:
-            pass
+            # Write to a temporary file and swap it in, so a crash mid-write never leaves a truncated file behind.
+            tempFilename = self.filename + '.tmp'
+            with open(tempFilename, 'w') as tfCodesFile:
+                json.dump(self.tfCodes, tfCodesFile, separators=(',', ':'))
+            os.replace(tempFilename, self.filename)
+        except EnvironmentError:
+            self.notify.warning(str(sys.exc_info()[1]))
+
+    def __scheduleExpiryTask(self):
+        # The task sleeps until the next code expires, and is woken up earlier when a code that expires sooner is added.
+        if not self.tfCodeExpiries:
+            return
+
+        expiry = self.tfCodeExpiries[0][0]
+        if self.nextExpiry is not None and self.nextExpiry <= expiry:
+            return
+
+        taskMgr.remove('tf-codes-clear-task')
+        self.nextExpiry = expiry
+        taskMgr.doMethodLater(max(0.0, expiry - self.clock()), self.__trueFriendCodesTask, 'tf-codes-clear-task')
 
     def __trueFriendCodesTask(self, task):
-        for tfCode in list(self.tfCodes.keys()):
-            tfCodeInfo = self.tfCodes[tfCode]
-            tfCodeDay = tfCodeInfo[1]
-            today = datetime.datetime.now().day
-            if tfCodeDay + 2 == today:
-                self.notify.info('Removing 2-day-old True Friend code: %s' % tfCode)
-                self.removeSecret(tfCode)
-
-        return task.again
+        self.nextExpiry = None
+        now = self.clock()
+        numRemoved = 0
+        while self.tfCodeExpiries and self.tfCodeExpiries[0][0] <= now:
+            expiry, tfCode = heapq.heappop(self.tfCodeExpiries)
+            tfCodeInfo = self.tfCodes.get(tfCode)
+
+            # Skip codes that were used up, or were made again since
+            if tfCodeInfo is None or tfCodeInfo[1] != expiry:
+                continue
+
+            del self.tfCodes[tfCode]
+            numRemoved += 1
+
+        if numRemoved:
+            self.notify.info('Removed %d expired True Friend codes.' % numRemoved)
+            self.saveTrueFriendCodesLater()
+
+        self.__scheduleExpiryTask()
+        return task.done
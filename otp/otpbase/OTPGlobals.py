@@ -21,6 +21,8 @@ DefaultCameraFar = 400.0
 DefaultCameraNear = 1.0
 AICollisionPriority = 10
 AICollMovePriority = 8
+# Runs after everything else in the AI's frame, but before it sleeps.
+AISendBufferPriority = 54
 MaxFriends = 50
 MaxPlayerFriends = 300
 MaxBackCatalog = 48
@@ -551,7 +551,9 @@ class LoadAvatarOperation(AvatarOperation):
         # Tell the friends manager that an avatar is coming online.
         name = self.avatar['setName'][0]
         dna = self.avatar['setDNAString'][0].decode('utf-8')
-        self.gameServicesManager.air.onlinePlayerManager.comingOnline(self.avId, name, dna)
+        friendIds = [friendId for friendId, _ in self.avatar['setFriendsList'][0]]
+        districtId = self.avatar['setDefaultShard'][0]
+        self.gameServicesManager.air.onlinePlayerManager.comingOnline(self.avId, name, dna, friendIds, districtId)
 
         # Now we'll assign a POST_REMOVE that will tell the friends manager
         # that an avatar has gone offline, in the event that they disconnect
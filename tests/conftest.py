@@ -0,0 +1,12 @@
+# The tests run the game's code the way the scripts in tools/ do: without a server, on a clock that only
+# moves when it is told to, with fakes from tools/harness.py standing in for the AI repository.
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'tools'))
+
+import harness
+
+os.chdir(harness.RepositoryRoot)
+harness.setupGame(headless=True)
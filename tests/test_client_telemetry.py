@@ -0,0 +1,54 @@
+# The client telemetry aggregator in TimeManagerAI must stay within its limits however many clients report.
+
+import builtins
+import tracemalloc
+
+import pytest
+
+from bench_client_telemetry import TelemetryFeed
+
+NumAvatars = 1000
+NumRounds = 10
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    feed = TelemetryFeed(NumAvatars, 0)
+    monkeypatch.setattr(builtins, 'globalClock', feed.clock)
+    tracemalloc.start()
+    assert feed.fillUp(), 'The aggregator was not full after %d rounds' % feed.numRounds
+    yield feed
+    tracemalloc.stop()
+
+
+def testLimitsHold(feed):
+    telemetry = feed.telemetry
+    growth = feed.measureGrowth(NumRounds)
+    assert growth <= 16384, 'The aggregator grew by %d bytes once full' % growth
+    assert len(telemetry.zones) <= telemetry.maxZones
+    assert len(telemetry.hoods) <= telemetry.maxZones
+    assert len(telemetry.lastReports) <= telemetry.maxAvatars
+    for stats in list(telemetry.zones.values()) + list(telemetry.hoods.values()):
+        assert len(stats.gpus.counts) <= telemetry.maxStrings
+        assert len(stats.cpus.counts) <= telemetry.maxStrings
+
+
+def testSpamIsDropped(feed):
+    feed.measureGrowth(NumRounds)
+    # The spammers get one report of each kind per interval, everything else is dropped
+    spammers = len([avatar for avatar in feed.avatars if avatar.doId % 50 == 0])
+    assert feed.telemetry.droppedReports == spammers * 9 * 3 * feed.numRounds
+
+    leakEvents = [event for event in feed.air.serverEvents if event[0] == 'client-garbage-leak']
+    assert len(leakEvents) == NumAvatars * feed.numRounds
+
+
+def testSummariesResetTheAggregator(feed):
+
+    class Task:
+        again = 'again'
+
+    feed.timeManager._TimeManagerAI__reportTelemetry(Task())
+    assert [event for event in feed.air.serverEvents if event[0] == 'client-telemetry']
+    assert not feed.telemetry.zones
+    assert not feed.telemetry.hoods
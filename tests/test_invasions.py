@@ -0,0 +1,64 @@
+# SuitInvasionManagerAI must end an invasion the moment its last cog is defeated, share its cogs between the
+# streets by their weight, and roll the planners over one at a time once it ended.
+
+import pytest
+
+from simulate_invasions import District, loadPlannerClass
+
+NumCogs = 200
+Frame = 0.25
+
+
+@pytest.fixture(scope='module')
+def invasion():
+    from toontown.suit.SuitInvasionManagerAI import SuitInvasionManagerAI
+
+    district = District(SuitInvasionManagerAI, loadPlannerClass(), 0)
+    try:
+        startTime, endTime, quotas = district.run(NumCogs, Frame, district.air.suitInvasionManager.rolloverTime)
+        yield district, startTime, endTime, quotas
+    finally:
+        district.destroy()
+
+
+def testEndsWithLastDefeat(invasion):
+    from toontown.toonbase import ToontownGlobals
+
+    district, startTime, endTime, quotas = invasion
+    assert district.statuses == [(startTime, ToontownGlobals.SuitInvasionBegin),
+                                 (endTime, ToontownGlobals.SuitInvasionEnd)]
+    # Neither timed out before every cog was defeated, nor went on after
+    assert len(district.invasionDefeatTimes) == NumCogs
+    assert abs(district.invasionDefeatTimes[-1] - endTime) <= Frame / 2
+
+
+def testStreetsGetTheirShare(invasion):
+    district, startTime, endTime, quotas = invasion
+    planners = district.air.suitPlanners
+    assert sum(quotas.values()) == NumCogs
+
+    totalWeight = sum(planner.getInvasionWeight() for planner in planners.values())
+    for zoneId, planner in planners.items():
+        assert abs(quotas[zoneId] - NumCogs * planner.getInvasionWeight() / totalWeight) < 1, zoneId
+        if not planner.numToons:
+            # Streets nobody fights on don't fill up with invasion cogs, or have any defeated
+            assert district.mostInvaders[zoneId] <= quotas[zoneId], zoneId
+            assert not district.defeats[zoneId], zoneId
+
+        if not planner.currDesired:
+            assert not quotas[zoneId] and not district.spawns[zoneId], zoneId
+
+
+def testProgressIsCountedPerStreet(invasion):
+    district, startTime, endTime, quotas = invasion
+    for zoneId in district.air.suitPlanners:
+        assert district.progress.get(zoneId, (0, 0)) == (district.spawns[zoneId], district.defeats[zoneId]), zoneId
+
+
+def testPlannersRollOver(invasion):
+    district, startTime, endTime, quotas = invasion
+    # No invasion cog is flown away while it goes on, spawned after it or left walking after the rollover
+    assert not district.invadersFlown
+    assert not district.lateSpawns
+    assert not district.countInvaders()
+    assert max(len(zoneIds) for zoneIds in district.flights.values()) == 1
@@ -0,0 +1,78 @@
+# OnlinePlayerManagerUD must tell every client who is online among the toons declared to it, declare the toons
+# that have something to do with each other, and send a number of datagrams that grows linearly with the crowd.
+
+import random
+
+import pytest
+
+from bench_online_presence import Logins, ToonsPerDistrict, areRelated, makeToons, readDCFile
+
+NumToons = 200
+NumFrames = 5
+
+
+@pytest.fixture(scope='module')
+def dcFile():
+    return readDCFile()
+
+
+def checkClients(logins, settled):
+    # Presence changes are sent at the end of the frame they happen in
+    assert not taskMgr.hasTaskNamed(logins.mgr.uniqueName('flush-presence'))
+
+    onlineToons = logins.onlineToons
+    for toon in onlineToons.values():
+        client = logins.getClient(toon)
+        # Told about themselves and every online toon declared to them, so they never whisper a toon their
+        # client agent would boot them for
+        assert client.onlineToons == {toon.avId} | (client.declaredToons & set(onlineToons)), toon.avId
+        if not settled:
+            continue
+
+        for other in onlineToons.values():
+            if other is not toon and areRelated(toon, other):
+                assert other.avId in client.declaredToons, (toon.avId, other.avId)
+
+
+def makeLogins(dcFile, numToons, toonsPerDistrict, onFrame=checkClients):
+    from toontown.friends.OnlinePlayerManagerUD import OnlinePlayerManagerUD
+
+    rng = random.Random(0)
+    return Logins(OnlinePlayerManagerUD, dcFile, makeToons(numToons, toonsPerDistrict, rng), NumFrames, rng,
+                  onFrame=onFrame)
+
+
+@pytest.mark.parametrize('toonsPerDistrict', [ToonsPerDistrict, NumToons])
+def testClientsAreToldWhoIsOnline(dcFile, toonsPerDistrict):
+    logins = makeLogins(dcFile, NumToons, toonsPerDistrict)
+    logins.logIn()
+    logins.makeFriends()
+    logins.lookUpDistricts()
+    logins.logOut()
+
+    # Everyone is gone, so nobody should still have anyone declared to them
+    for toon in logins.toons:
+        assert not logins.getClient(toon).declaredToons, toon.avId
+
+
+def testOtherDistrictsAreNotDeclared(dcFile):
+    logins = makeLogins(dcFile, NumToons, ToonsPerDistrict)
+    logins.logIn()
+    pairs = logins.lookUpOtherDistricts()
+    assert pairs
+    for toon, other in pairs:
+        assert other.avId not in logins.getClient(toon).declaredToons, (toon.avId, other.avId)
+
+    logins.logOut()
+
+
+@pytest.mark.parametrize('toonsPerDistrict', [ToonsPerDistrict, None])
+def testDatagramsGrowLinearly(dcFile, toonsPerDistrict):
+    # Nothing caps how many toons a district holds, so everyone logging into the same one must be linear too
+    datagrams = []
+    for numToons in (NumToons, NumToons * 2):
+        logins = makeLogins(dcFile, numToons, toonsPerDistrict or numToons, None)
+        logins.run()
+        datagrams.append(len(logins.messageDirector.datagrams))
+
+    assert datagrams[1] / datagrams[0] <= 2.5, datagrams
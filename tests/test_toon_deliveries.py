@@ -0,0 +1,131 @@
+# DeliverySchedulerAI must deliver every catalog, purchase, gift and award in the minute it is due.
+
+import builtins
+
+import pytest
+
+from bench_toon_deliveries import (Crowd, FakeAIRepository, FirstToonId, SimulatedClock, StartTime, addOrders,
+                                   makeOrder)
+
+StartMinute = int(StartTime // 60)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimulatedClock()
+    # Toons need a repository of their own to be created with
+    monkeypatch.setattr(builtins.simbase, 'air', FakeAIRepository(clock), raising=False)
+    yield clock
+    builtins.simbase.air.deliveryScheduler.delete()
+
+
+@pytest.fixture
+def air(clock):
+    air = FakeAIRepository(clock)
+    yield air
+    air.deliveryScheduler.delete()
+
+
+def runMinutes(clock, firstMinute, lastMinute):
+    # Look at every minute a second after it starts
+    for minute in range(firstMinute, lastMinute + 1):
+        clock.advanceTo(minute * 60 + 1)
+
+
+def testDueTogetherInOrder(clock, air):
+    # Deliveries that are due together are made in order of toon, then catalog, purchases and gifts, then awards
+    a, b, c = (air.addToon(FirstToonId + i) for i in range(3))
+    m = StartMinute + 5
+    # Set up in the opposite order to the one they must be delivered in
+    addOrders(c, purchases=[(301, m)], awards=[(302, m + 2)])
+    addOrders(b, gifts=[(201, m + 1)], awards=[(202, m)])
+    b.b_setCatalogSchedule(1, m + 3)
+    addOrders(a, purchases=[(101, m + 2)], gifts=[(102, m + 1)], awards=[(103, m + 1)])
+    a.b_setCatalogSchedule(1, m + 1)
+    runMinutes(clock, StartMinute, m + 4)
+    assert air.deliveries == [
+        (m, b.doId, 'award', (202,)),
+        (m, c.doId, 'mailbox', (301,)),
+        (m + 1, a.doId, 'catalog', ()),
+        (m + 1, a.doId, 'mailbox', (102,)),
+        (m + 1, a.doId, 'award', (103,)),
+        (m + 1, b.doId, 'mailbox', (201,)),
+        (m + 2, a.doId, 'mailbox', (101,)),
+        (m + 2, c.doId, 'award', (302,)),
+        (m + 3, b.doId, 'catalog', ()),
+    ]
+
+
+def testRescheduledDeliveries(clock, air):
+    from toontown.catalog.DeliverySchedulerAI import DeliverySchedulerAI
+
+    scheduler = air.deliveryScheduler
+    now = int(clock() // 60)
+    m = now + 5
+    gifted, moved, cancelled, deleted, overdue = (air.addToon(FirstToonId + i) for i in range(5))
+
+    # A gift that comes later doesn't put off a purchase, one that comes sooner brings everything forward
+    addOrders(gifted, purchases=[(101, m + 2)])
+    addOrders(gifted, gifts=[(102, m + 4)])
+    assert scheduler.getDueTime(gifted.doId, DeliverySchedulerAI.Purchase) == (m + 2) * 60
+    addOrders(gifted, gifts=[(103, m)])
+    assert scheduler.getDueTime(gifted.doId, DeliverySchedulerAI.Purchase) == m * 60
+
+    # Awards that are moved are delivered when they are moved to, cancelled awards and deleted toons get nothing
+    addOrders(moved, awards=[(201, m)])
+    moved.b_setAwardSchedule(makeOrder([(201, m + 3)]))
+    addOrders(cancelled, awards=[(301, m + 1)])
+    cancelled.b_setAwardSchedule(makeOrder([]))
+    addOrders(deleted, purchases=[(401, m)], gifts=[(402, m)], awards=[(403, m)])
+    deleted.b_setCatalogSchedule(1, m)
+    # What DistributedToonAI.delete() does for its deliveries
+    scheduler.cancel(deleted.doId)
+
+    # Orders that are already overdue are delivered 10 seconds later
+    addOrders(overdue, purchases=[(501, now - 60)])
+    clock.advanceTo(now * 60 + 9)
+    assert not air.deliveries
+
+    clock.advanceTo(now * 60 + 11)
+    runMinutes(clock, now + 1, m + 5)
+    assert air.deliveries == [
+        (now, overdue.doId, 'mailbox', (501,)),
+        (m, gifted.doId, 'mailbox', (103,)),
+        (m + 2, gifted.doId, 'mailbox', (101,)),
+        (m + 3, moved.doId, 'award', (201,)),
+        (m + 4, gifted.doId, 'mailbox', (102,)),
+    ]
+    assert not scheduler.getNumDeliveries()
+
+
+def testCrowdIsDeliveredOnTime(clock):
+    from toontown.catalog.DeliverySchedulerAI import DeliverySchedulerAI
+
+    numToons = 500
+    crowd = Crowd(clock, numToons, 0)
+    try:
+        crowd.run()
+        assert crowd.getDelivered() == crowd.expected
+        # A single task delivers everything, from a queue that only holds what is still due
+        assert crowd.maxTasks == 1
+        assert crowd.maxQueue <= 2 * numToons * len(DeliverySchedulerAI.Kinds) + 64
+    finally:
+        crowd.delete()
+
+
+def testKeepEarlier(clock, air):
+    from toontown.catalog.DeliverySchedulerAI import DeliverySchedulerAI
+
+    scheduler = air.deliveryScheduler
+    due = (int(clock() // 60) + 5) * 60
+    calls = []
+    scheduler.schedule(FirstToonId, DeliverySchedulerAI.Purchase, due, lambda: calls.append('sooner'))
+    scheduler.schedule(FirstToonId, DeliverySchedulerAI.Purchase, due + 60, lambda: calls.append('later'),
+                       keepEarlier=True)
+    assert scheduler.getDueTime(FirstToonId, DeliverySchedulerAI.Purchase) == due
+
+    # Without keepEarlier, the new time replaces the old one whichever is sooner
+    scheduler.schedule(FirstToonId, DeliverySchedulerAI.Award, due, lambda: calls.append('award'))
+    scheduler.schedule(FirstToonId, DeliverySchedulerAI.Award, due + 120, lambda: calls.append('moved'))
+    clock.advanceTo(due + 180)
+    assert calls == ['sooner', 'moved']
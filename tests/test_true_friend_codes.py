@@ -0,0 +1,93 @@
+# FriendManagerAI must expire True Friend codes at midnight at the start of the second day after they were made,
+# and write its code file behind, once per batch of changes.
+
+import datetime
+import json
+import os
+
+import pytest
+
+from bench_true_friend_codes import (ExpiryDates, SimulatedClock, StartingDistrictId, deleteFriendManager,
+                                     handOutCodes, makeFriendManager, requestCode, submitCode)
+
+
+@pytest.fixture
+def clock(monkeypatch, tmp_path):
+    from otp.friends.FriendManagerAI import FriendManagerAI
+
+    # The code files go in here
+    monkeypatch.setattr(FriendManagerAI, 'serverDataFolder', os.path.join(str(tmp_path), ''))
+    return SimulatedClock()
+
+
+@pytest.fixture
+def friendManagers():
+    # Every manager made by a test is deleted after it, whether it passed or not
+    friendManagers = []
+    yield friendManagers
+    for friendManager in friendManagers:
+        deleteFriendManager(friendManager)
+
+
+@pytest.mark.parametrize('madeOn, expiresOn', [
+    (datetime.datetime(2026, 1, 30, 23, 30), datetime.datetime(2026, 2, 1)),
+    (datetime.datetime(2026, 4, 30, 0, 0, 1), datetime.datetime(2026, 5, 2)),
+    (datetime.datetime(2027, 2, 27, 18, 0), datetime.datetime(2027, 3, 1)),
+    (datetime.datetime(2028, 2, 28, 9, 0), datetime.datetime(2028, 3, 1)),
+    (datetime.datetime(2026, 12, 30, 12, 0), datetime.datetime(2027, 1, 1)),
+    (datetime.datetime(2026, 12, 31, 23, 59, 59), datetime.datetime(2027, 1, 2)),
+])
+def testCodesExpireOnTime(clock, friendManagers, madeOn, expiresOn):
+    clock.setDate(madeOn)
+    friendManager = makeFriendManager(StartingDistrictId, clock)
+    friendManagers.append(friendManager)
+    tfCode = requestCode(friendManager, 100000000)
+    unusedCode = requestCode(friendManager, 100000000)
+    assert tfCode and unusedCode
+
+    clock.advanceTo(expiresOn - datetime.timedelta(seconds=1))
+    assert tfCode in friendManager.tfCodes
+
+    # Using one up must not stop the other one from expiring
+    assert submitCode(friendManager, 100000001, tfCode) == 1
+
+    clock.advanceTo(expiresOn)
+    assert unusedCode not in friendManager.tfCodes
+    assert submitCode(friendManager, 100000001, unusedCode) == 0
+
+
+def testLegacyFileIsConverted(clock, friendManagers):
+    # Made on December 31st and 30th, read back on January 1st
+    friendManager = makeFriendManager(StartingDistrictId, clock)
+    deleteFriendManager(friendManager)
+    os.makedirs(os.path.dirname(friendManager.filename))
+    with open(friendManager.filename, 'w') as file:
+        json.dump({'abc def': [100000000, 31], 'ghi jkl': [100000000, 30]}, file)
+
+    clock.setDate(datetime.datetime(2027, 1, 1, 10, 0))
+    friendManager = makeFriendManager(StartingDistrictId, clock)
+    friendManagers.append(friendManager)
+    assert list(friendManager.tfCodes) == ['abc def']
+
+    clock.advanceTo(datetime.datetime(2027, 1, 2))
+    assert not friendManager.tfCodes
+
+
+def testBatchesAreWrittenOnce(clock, friendManagers):
+    friendManager = handOutCodes(clock, 10000, 20)
+    friendManagers.append(friendManager)
+    friendManager.flushTrueFriendCodesFile()
+    assert friendManager.loadTrueFriendCodes() == friendManager.tfCodes
+
+    # Each batch must be written in one go once the save delay is over
+    for expiresOn in ExpiryDates:
+        writes = friendManager.numWrites
+        clock.advanceTo(expiresOn)
+        clock.advanceTo(expiresOn + datetime.timedelta(seconds=friendManager.tfCodeSaveDelay + 1))
+        assert friendManager.numWrites == writes + 1
+        assert all(expiry > clock() for avId, expiry in friendManager.tfCodes.values())
+
+    assert not friendManager.tfCodes
+    assert not friendManager.tfCodeExpiries
+    with open(friendManager.filename) as file:
+        assert not json.load(file)
@@ -0,0 +1,210 @@
+# Bake the table of mint layouts, and check every facility layout the game can pick.
+#
+# Every floor of every mint gets --layouts different layouts, each one generated by
+# MintLayout from its own seed, mixed from the mint, the floor and the layout number.
+# They are written to toontown/coghq/MintLayoutTable.py, which the AI loads when it
+# starts, so no mint ever has to search for a layout while the game is running. Each
+# mint instance then picks one of its floor's layouts with its own seed.
+#
+# Stage and country club layouts are laid out by hand, so they are only checked. No
+# layout may have a room twice, mint layouts must have the right number of battles and
+# rooms, and every layout of a stage or country club as many battles as the others.
+#
+# Usage (from the repository root):
+#     python tools/bake_facility_layouts.py [--layouts 16]    Bake the mint table, then check everything
+#     python tools/bake_facility_layouts.py --check           Only check the layouts that are there
+
+import argparse
+import os
+import random
+import sys
+
+import harness
+
+TableFilename = 'toontown/coghq/MintLayoutTable.py'
+
+# How many seeds to try for a layout that isn't already on its floor
+MaxAttempts = 100
+
+
+def bakeMintLayouts(layoutsPerFloor):
+    from toontown.coghq import MintLayout
+    from toontown.coghq.FacilityLayoutGlobals import mixLayoutSeed
+    from toontown.toonbase import ToontownGlobals
+
+    table = {}
+    for mintId in (ToontownGlobals.CashbotMintIntA, ToontownGlobals.CashbotMintIntB, ToontownGlobals.CashbotMintIntC):
+        table[mintId] = {}
+        for floorNum in range(ToontownGlobals.MintNumFloors[mintId]):
+            layout = MintLayout.MintLayout(mintId, floorNum)
+            floorLayouts = []
+            attempt = 0
+            while len(floorLayouts) < layoutsPerFloor and attempt < layoutsPerFloor * MaxAttempts:
+                rng = random.Random(mixLayoutSeed(mintId, floorNum, attempt))
+                roomIds = tuple(layout._genFloorLayout(rng))
+                if roomIds not in floorLayouts:
+                    floorLayouts.append(roomIds)
+                attempt += 1
+
+            table[mintId][floorNum] = floorLayouts
+
+    return table
+
+
+def writeMintLayouts(table, layoutsPerFloor):
+    lines = ['# Generated by tools/bake_facility_layouts.py, do not edit by hand.',
+             '# Maps mint ids to floor numbers to the room ids of every layout that floor can have.',
+             '',
+             'LayoutsPerFloor = %d' % layoutsPerFloor,
+             '',
+             'MintFloorLayouts = {']
+    for mintId, floors in table.items():
+        lines.append('    %d: {' % mintId)
+        for floorNum, floorLayouts in floors.items():
+            lines.append('        %d: (' % floorNum)
+            for roomIds in floorLayouts:
+                lines.append('            %s,' % (roomIds,))
+            lines.append('        ),')
+        lines.append('    },')
+    lines.append('}')
+
+    with open(TableFilename, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+def checkLayout(description, roomIds, roomId2numBattles, numBattles, numRooms):
+    # Returns what is wrong with a layout, if anything.
+    problems = []
+    if len(set(roomIds)) != len(roomIds):
+        problems.append('has a room more than once')
+
+    unknownRooms = [roomId for roomId in roomIds if roomId not in roomId2numBattles]
+    if unknownRooms:
+        problems.append('has rooms that do not exist: %s' % unknownRooms)
+    elif numBattles is not None and sum(roomId2numBattles[roomId] for roomId in roomIds) != numBattles:
+        problems.append('has %d battles instead of %d' % (sum(roomId2numBattles[roomId] for roomId in roomIds), numBattles))
+
+    if numRooms is not None and len(roomIds) != numRooms:
+        problems.append('has %d rooms instead of %d' % (len(roomIds), numRooms))
+
+    return ['%s %s: %s' % (description, roomIds, problem) for problem in problems]
+
+
+def checkMintLayouts(layoutsPerFloor):
+    from toontown.coghq import MintLayout, MintRoomSpecs
+    from toontown.toonbase import ToontownGlobals
+
+    problems = []
+    numLayouts = 0
+    for mintId, numFloors in ToontownGlobals.MintNumFloors.items():
+        for floorNum in range(numFloors):
+            floorLayouts = MintLayout.getFloorLayouts(mintId, floorNum)
+            if not floorLayouts:
+                problems.append('Mint %d floor %d has no layouts' % (mintId, floorNum))
+                continue
+
+            if len(floorLayouts) < layoutsPerFloor or len(set(floorLayouts)) != len(floorLayouts):
+                problems.append('Mint %d floor %d has %d different layouts instead of %d' % (
+                    mintId, floorNum, len(set(floorLayouts)), layoutsPerFloor))
+
+            for roomIds in floorLayouts:
+                numLayouts += 1
+                problems.extend(checkLayout('Mint %d floor %d' % (mintId, floorNum), roomIds,
+                                            MintRoomSpecs.roomId2numBattles, ToontownGlobals.MintNumBattles[mintId],
+                                            1 + ToontownGlobals.MintNumRooms[mintId][floorNum]))
+                if roomIds[0] not in MintRoomSpecs.CashbotMintEntranceIDs or \
+                        roomIds[-1] not in MintRoomSpecs.CashbotMintFinalRoomIDs:
+                    problems.append('Mint %d floor %d %s does not start at an entrance and end at a final room' % (
+                        mintId, floorNum, roomIds))
+
+    return problems, numLayouts
+
+
+def checkStageLayouts():
+    from toontown.coghq import StageLayout, StageRoomSpecs
+
+    # Stages don't have a set number of battles, but every layout of a stage must have as many as the others
+    problems = []
+    numLayouts = 0
+    for stageId, layoutIndices in StageLayout.StageId2Layouts.items():
+        numBattles = None
+        for layoutIndex in layoutIndices:
+            layoutBattles = 0
+            for floorNum in range(StageLayout.getNumFloors(layoutIndex)):
+                roomIds = StageLayout.StageLayout(stageId, floorNum, layoutIndex).getRoomIds()
+                numLayouts += 1
+                problems.extend(checkLayout('Stage %d layout %d floor %d' % (stageId, layoutIndex, floorNum),
+                                            roomIds, StageRoomSpecs.roomId2numBattles, None, None))
+                layoutBattles += sum(StageRoomSpecs.roomId2numBattles.get(roomId, 0) for roomId in roomIds)
+
+            if numBattles is None:
+                numBattles = layoutBattles
+            elif layoutBattles != numBattles:
+                problems.append('Stage %d layout %d has %d battles, the others have %d' % (
+                    stageId, layoutIndex, layoutBattles, numBattles))
+
+    return problems, numLayouts
+
+
+def checkCountryClubLayouts():
+    from toontown.coghq import CountryClubLayout, CountryClubRoomSpecs
+
+    # CountryClubNumBattles is only for generated layouts, so these are checked like the stages are
+    problems = []
+    numLayouts = 0
+    for countryClubId, layoutIndices in CountryClubLayout.CountryClubId2Layouts.items():
+        numBattles = None
+        for layoutIndex in layoutIndices:
+            layoutBattles = []
+            for floorNum in range(len(CountryClubLayout.countryClubLayouts[layoutIndex])):
+                roomIds = CountryClubLayout.CountryClubLayout(countryClubId, floorNum, layoutIndex).getRoomIds()
+                numLayouts += 1
+                problems.extend(checkLayout('Country club %d layout %d floor %d' % (countryClubId, layoutIndex, floorNum),
+                                            roomIds, CountryClubRoomSpecs.roomId2numBattles, None, None))
+                layoutBattles.append(sum(CountryClubRoomSpecs.roomId2numBattles.get(roomId, 0) for roomId in roomIds))
+
+            if numBattles is None:
+                numBattles = layoutBattles
+            elif layoutBattles != numBattles:
+                problems.append('Country club %d layout %d has %s battles on its floors, the others have %s' % (
+                    countryClubId, layoutIndex, layoutBattles, numBattles))
+
+    return problems, numLayouts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bake the mint layout table and check every facility layout.')
+    parser.add_argument('--layouts', type=int, default=16, help='Number of layouts to bake for each mint floor.')
+    parser.add_argument('--check', action='store_true', help='Only check the layouts, without baking anything.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame()
+
+    if args.check:
+        from toontown.coghq import MintLayoutTable
+        layoutsPerFloor = MintLayoutTable.LayoutsPerFloor
+    else:
+        layoutsPerFloor = args.layouts
+        writeMintLayouts(bakeMintLayouts(layoutsPerFloor), layoutsPerFloor)
+
+        # Check what was just written, not what was there before
+        import importlib
+        from toontown.coghq import MintLayoutTable
+        importlib.reload(MintLayoutTable)
+        print('Wrote %s.' % TableFilename)
+
+    problems = []
+    for name, check in (('mint', lambda: checkMintLayouts(layoutsPerFloor)), ('stage', checkStageLayouts),
+                        ('country club', checkCountryClubLayouts)):
+        facilityProblems, numLayouts = check()
+        print('Checked %d %s floor layouts, %d problems.' % (numLayouts, name, len(facilityProblems)))
+        problems.extend(facilityProblems)
+
+    if problems:
+        raise SystemExit('\n'.join(problems))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+# Measure how often a district writes its building files during cog takeovers, and check they survive a crash.
+#
+# Every street of a district has a DistributedBuildingMgrAI, and each takeover used to rewrite
+# that street's file right away. Now takeovers call requestSave, which writes the street at
+# most once every building-save-delay seconds. Here --streets streets of --blocks buildings
+# each take --rate takeovers a minute between them, on random streets, for --minutes
+# minutes of a slaved clock. The manager's own requestSave, save and cleanup are used. The
+# buildings and the DNA behind them need the game's Panda3D fork, so the manager class is
+# taken from its source and given stand-in buildings that carry real JSON data.
+#
+# Once the district shuts down (cleanup), every file must hold the last state of every
+# building. The number of writes, the time spent writing, and the most takeovers that were
+# not on disk yet at any one time (what a crash would lose) are printed. With --baseline, the
+# same takeovers are also run with DistributedBuildingMgrAI at that revision, which saved on
+# every takeover.
+#
+# A street with takeovers not on disk yet is then shut down the way ToontownAIRepository.shutdown
+# does it, with flushSave and no cleanup. The file must hold every takeover, in one write, and
+# nothing may be written again after that.
+#
+# Then a save is killed halfway through, in a child process, with the write from save() and
+# with the backup scheme older servers used. In both cases load() must return the last
+# complete save, and a save made after recovering must be what is loaded next.
+#
+# Usage (from the repository root):
+#     python tools/bench_building_saves.py [--streets 17] [--blocks 40] [--rate 200] [--minutes 10] [--baseline <rev>]
+
+import argparse
+import ast
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import types
+
+import harness
+
+FrameTime = 1.0 / 30
+DistrictId = 200000000
+FirstBranchId = 1100
+MgrPath = 'toontown/building/DistributedBuildingMgrAI.py'
+
+
+class FakeBuilding:
+    # Stands in for a DistributedBuildingAI, with the same JSON data.
+
+    def __init__(self, block, rng):
+        self.block = block
+        self.state = 'toon'
+        self.track = 'c'
+        self.difficulty = 0
+        self.numFloors = 1
+        self.savedBy = [[100000000 + rng.randrange(10000), 'Toon %d' % i, [rng.randrange(256) for j in range(26)], 0]
+                        for i in range(4)]
+        self.becameSuitTime = 0.0
+
+    def takeOver(self, rng):
+        if self.state == 'toon':
+            self.state = 'suit'
+            self.track = rng.choice('cslm')
+            self.difficulty = rng.randrange(20)
+            self.numFloors = rng.randint(1, 5)
+            self.becameSuitTime = globalClock.getFrameTime()
+        else:
+            self.state = 'toon'
+
+    def getJsonData(self):
+        return {
+            'state': self.state,
+            'block': self.block,
+            'track': self.track,
+            'difficulty': self.difficulty,
+            'numFloors': self.numFloors,
+            'savedBy': self.savedBy,
+            'becameSuitTime': self.becameSuitTime,
+        }
+
+    def cleanup(self):
+        pass
+
+
+def loadMgrClass(source, name):
+    # Only the class itself is run. The module's imports need the game's Panda3D fork, and the methods
+    # used here only need the names below.
+    from direct.directnotify import DirectNotifyGlobal
+    from direct.task.Task import Task
+    from toontown.hood import ZoneUtil
+
+    classDef = next(node for node in ast.parse(source).body if isinstance(node, ast.ClassDef))
+    namespace = {
+        '__name__': 'toontown.building.%s' % name,
+        'os': os, 'sys': sys, 'json': json, 'time': time, 'random': random, 'Task': Task,
+        'DirectNotifyGlobal': DirectNotifyGlobal, 'ZoneUtil': ZoneUtil,
+        'HQBuildingAI': types.SimpleNamespace(HQBuildingAI=type('HQBuildingAI', (), {})),
+        'DistributedBuildingAI': types.SimpleNamespace(DistributedBuildingAI=type('DistributedBuildingAI', (), {})),
+    }
+    exec(compile(ast.Module(body=[classDef], type_ignores=[]), name, 'exec'), namespace)
+    return namespace[classDef.name]
+
+
+def makeStreetClass(mgrClass):
+
+    class StreetBuildingMgr(mgrClass):
+        # A street of stand-in buildings, keeping count of its writes.
+
+        def __init__(self, branchId, numBlocks, rng):
+            self.numBlocks = numBlocks
+            self.rng = rng
+            self.numSaves = 0
+            self.saveTime = 0.0
+            self.numUnsaved = 0
+            mgrClass.__init__(self, types.SimpleNamespace(districtId=DistrictId), branchId, None, None)
+
+        def findAllLandmarkBuildings(self):
+            buildings = self._DistributedBuildingMgrAI__buildings
+            for block in range(1, self.numBlocks + 1):
+                buildings[block] = FakeBuilding(block, self.rng)
+
+        def getBuildings(self):
+            return list(self._DistributedBuildingMgrAI__buildings.values())
+
+        def save(self):
+            start = time.perf_counter()
+            mgrClass.save(self)
+            self.saveTime += time.perf_counter() - start
+            self.numSaves += 1
+            self.numUnsaved = 0
+
+        def takeOver(self):
+            # What DistributedBuildingAI does when a building changes hands
+            self.rng.choice(self.getBuildings()).takeOver(self.rng)
+            self.numUnsaved += 1
+            if hasattr(self, 'requestSave'):
+                self.requestSave()
+            else:
+                self.save()
+
+    return StreetBuildingMgr
+
+
+def runDistrict(mgrClass, args):
+    rng = random.Random(args.seed)
+    streetClass = makeStreetClass(mgrClass)
+    streets = [streetClass(FirstBranchId + i * 100, args.blocks, rng) for i in range(args.streets)]
+    start = globalClock.getFrameTime()
+    numFrames = int(args.minutes * 60 / FrameTime)
+    takeoverTimes = sorted(rng.uniform(0, args.minutes * 60) for i in range(int(args.rate * args.minutes)))
+    mostUnsaved = 0
+    for frame in range(numFrames):
+        now = (frame + 1) * FrameTime
+        while takeoverTimes and takeoverTimes[0] <= now:
+            takeoverTimes.pop(0)
+            rng.choice(streets).takeOver()
+
+        globalClock.setFrameTime(start + now)
+        taskMgr.step()
+        mostUnsaved = max(mostUnsaved, sum(street.numUnsaved for street in streets))
+
+    lastStates = {street.branchID: {str(building.block): building.getJsonData() for building in street.getBuildings()}
+                  for street in streets}
+    # The district shutting down
+    for street in streets:
+        street.cleanup()
+
+    for street in streets:
+        with open(street.getFileName()) as file:
+            if json.load(file) != lastStates[street.branchID]:
+                raise SystemExit('Street %d was not saved with the last state of its buildings!' % street.branchID)
+
+    return {
+        'saves': sum(street.numSaves for street in streets),
+        'saveTime': sum(street.saveTime for street in streets),
+        'mostUnsaved': mostUnsaved,
+        'bytes': sum(os.path.getsize(street.getFileName()) for street in streets),
+    }
+
+
+class CrashingFile:
+    # A file being written that the process dies in the middle of, once half of what would be written is on disk.
+
+    def __init__(self, file, crashAfter):
+        self.file = file
+        self.crashAfter = crashAfter
+
+    def write(self, data):
+        if len(data) < self.crashAfter:
+            self.crashAfter -= len(data)
+            return self.file.write(data)
+
+        self.file.write(data[:self.crashAfter])
+        self.file.flush()
+        os._exit(1)
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def crashWhileSaving(street):
+    # Saves the street in a child process that dies halfway through writing it
+    from io import StringIO
+
+    data = StringIO()
+    street.saveTo(data)
+    pid = os.fork()
+    if not pid:
+        def crashingOpen(fileName, mode='r'):
+            return CrashingFile(open(fileName, mode), len(data.getvalue()) // 2)
+
+        # The manager's methods look open up in the globals its class was made with
+        mgrClass = type(street).__bases__[0]
+        mgrClass.save.__globals__['open'] = crashingOpen
+        street.save()
+        os._exit(0)
+
+    pid, status = os.waitpid(pid, 0)
+    if os.WEXITSTATUS(status) != 1:
+        raise SystemExit('The save did not get to the crash!')
+
+
+def checkCleanShutdown(mgrClass, args):
+    rng = random.Random(args.seed)
+    street = makeStreetClass(mgrClass)(FirstBranchId, args.blocks, rng)
+    for i in range(args.blocks):
+        street.takeOver()
+
+    if street.numSaves or not street.doLaterTask:
+        raise SystemExit('The takeovers were not left to be saved later!')
+
+    states = {str(building.block): building.getJsonData() for building in street.getBuildings()}
+    # What ToontownAIRepository.shutdown does for every street
+    street.flushSave()
+    if street.load() != states or street.numSaves != 1:
+        raise SystemExit('After a clean shutdown, the file did not hold every takeover!')
+
+    if taskMgr.hasTaskNamed(str(street.branchID) + '_delayed_save-timer'):
+        raise SystemExit('The delayed save was still waiting after a clean shutdown!')
+
+    street.flushSave()
+    street.cleanup()
+    if street.numSaves != 1:
+        raise SystemExit('The street was saved again after a clean shutdown, with nothing new to save!')
+
+
+def checkCrashRecovery(mgrClass, baselineClass, args):
+    rng = random.Random(args.seed)
+    street = makeStreetClass(mgrClass)(FirstBranchId, args.blocks, rng)
+    backup = street.getFileName() + street.backupExtension
+
+    def takeOverAll():
+        for building in street.getBuildings():
+            building.takeOver(rng)
+
+        return {str(building.block): building.getJsonData() for building in street.getBuildings()}
+
+    savers = [('save()', street)]
+    if baselineClass is not None:
+        oldStreet = makeStreetClass(baselineClass)(FirstBranchId, args.blocks, rng)
+        oldStreet._DistributedBuildingMgrAI__buildings = street._DistributedBuildingMgrAI__buildings
+        savers.append(('save() from older servers', oldStreet))
+
+    for name, saver in savers:
+        saved = takeOverAll()
+        street.save()
+        takeOverAll()
+        crashWhileSaving(saver)
+        if street.load() != saved:
+            raise SystemExit('With %s killed mid-write, load() did not give back the last complete save!' % name)
+
+        # Whatever is saved after recovering is what must be loaded from now on
+        saved = takeOverAll()
+        street.save()
+        if street.load() != saved or os.path.exists(backup):
+            raise SystemExit('After %s was killed mid-write, a later save was not what load() gave back!' % name)
+
+    return [name for name, saver in savers]
+
+
+def printReport(name, results, minutes):
+    print('%-9s %5d writes (%.1f a minute), %.1f ms writing, %d KB on disk, at most %d takeovers not on disk yet' % (
+        name, results['saves'], results['saves'] / minutes, results['saveTime'] * 1000, results['bytes'] // 1024,
+        results['mostUnsaved']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count building file writes during takeovers, and check crash recovery.')
+    parser.add_argument('--streets', type=int, default=17, help='Number of streets in the district.')
+    parser.add_argument('--blocks', type=int, default=40, help='Number of buildings on every street.')
+    parser.add_argument('--rate', type=float, default=200, help='Takeovers a minute across the district.')
+    parser.add_argument('--minutes', type=float, default=10, help='How long to run the district for.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', help='Also run the takeovers with DistributedBuildingMgrAI at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    dataFolder = tempfile.mkdtemp(prefix='bench_building_saves')
+    try:
+        # The building files go in here
+        harness.setupGame('server-data-folder %s' % os.path.join(dataFolder, ''), headless=True)
+        with open(MgrPath) as file:
+            mgrClass = loadMgrClass(file.read(), 'DistributedBuildingMgrAI')
+
+        baselineClass = None
+        if args.baseline:
+            source = subprocess.run(['git', 'show', '%s:%s' % (args.baseline, MgrPath)], capture_output=True, text=True,
+                                    check=True).stdout
+            baselineClass = loadMgrClass(source, 'BaselineDistributedBuildingMgrAI')
+
+        print('%d streets of %d buildings, %g takeovers a minute for %g minutes, saving at most every %g s.' % (
+            args.streets, args.blocks, args.rate, args.minutes, mgrClass.saveDelay))
+        printReport('Current', runDistrict(mgrClass, args), args.minutes)
+        if baselineClass is not None:
+            printReport(args.baseline, runDistrict(baselineClass, args), args.minutes)
+
+        checkCleanShutdown(mgrClass, args)
+        print('Every takeover was on disk after a clean shutdown.')
+        for name in checkCrashRecovery(mgrClass, baselineClass, args):
+            print('Recovered the last complete save after %s was killed mid-write.' % name)
+    finally:
+        shutil.rmtree(dataFolder)
+
+
+if __name__ == '__main__':
+    main()
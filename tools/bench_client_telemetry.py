@@ -0,0 +1,145 @@
+# Feed synthetic client telemetry to TimeManagerAI, and measure what the aggregator costs.
+#
+# 1000 fake avatars wander between zones all over the game and send frame rate, CPU
+# and garbage leak reports, some of them far more often than they are allowed to.
+# Rounds are sent until the aggregator is full, however many that takes for the number of
+# avatars. After that, the memory the aggregator allocates over --rounds more rounds is
+# traced, and then --rounds more are timed. tests/test_client_telemetry.py checks that
+# every limit holds.
+#
+# Usage (from the repository root):
+#     python tools/bench_client_telemetry.py [--avatars 1000] [--rounds 50]
+
+import argparse
+import builtins
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+import harness
+
+MaxWarmUpRounds = 1000
+
+
+class FakeAvatar:
+
+    def __init__(self, doId, zoneId):
+        self.doId = doId
+        self.zoneId = zoneId
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.realTime = 0.0
+
+    def getRealTime(self):
+        return self.realTime
+
+
+class TelemetryFeed:
+    # Avatars sending reports to a TimeManagerAI, from far more zones and hardware than the limits allow.
+    # The TimeManagerAI reads the time from globalClock, which must be self.clock while reports are sent.
+
+    def __init__(self, numAvatars, seed):
+        from otp.ai.TimeManagerAI import TimeManagerAI
+
+        self.air = harness.FakeAIRepository()
+        builtins.simbase.air = self.air
+        self.timeManager = TimeManagerAI(self.air)
+        self.telemetry = self.timeManager.telemetry
+        self.clock = FakeClock()
+        self.rng = random.Random(seed)
+        self.avatars = [FakeAvatar(100000000 + i, 2000) for i in range(numAvatars)]
+        for avatar in self.avatars:
+            self.air.doId2do[avatar.doId] = avatar
+
+        self.zoneIds = [hoodId + zone for hoodId in range(1000, 30000, 1000) for zone in range(0, 800, 7)]
+        self.gpus = [(self.rng.randrange(0x10000), self.rng.randrange(0x10000)) for _ in range(500)]
+        self.cpus = ['CPU model %d' % i for i in range(500)]
+        self.numRounds = 0
+
+    def isFull(self):
+        # Every zone the aggregator may keep is taken, and every hood has seen as many GPUs and CPUs as it counts
+        telemetry = self.telemetry
+        if len(telemetry.zones) < telemetry.maxZones:
+            return False
+
+        return all(len(stats.gpus.counts) == telemetry.maxStrings and len(stats.cpus.counts) == telemetry.maxStrings
+                   for stats in telemetry.hoods.values())
+
+    def sendRound(self):
+        self.clock.realTime += self.telemetry.minReportInterval
+        self.numRounds += 1
+        rng = self.rng
+        for avatar in self.avatars:
+            avatar.zoneId = rng.choice(self.zoneIds)
+            self.air.senderAvId = avatar.doId
+            # A few clients spam their reports instead of sending them every so often
+            for _ in range(10 if avatar.doId % 50 == 0 else 1):
+                self.timeManager.setFrameRate(rng.uniform(1, 200), 0.5, 10, '', 0, 0, '', rng.choice(self.gpus)[0],
+                                              rng.choice(self.gpus)[1], rng.uniform(50, 9000), 0, 0, 0,
+                                              ('nt', 2, 10, 0), (3.0, 2.5), 4, 8,
+                                              rng.choice(('OpenGL', 'DirectX9')))
+                self.timeManager.setCpuInfo('GenuineIntel|%s|1|0|3.000,2.500|4,8 cpus' % rng.choice(self.cpus), '')
+                self.timeManager.setClientGarbageLeak(rng.randint(0, 3), 'leak')
+
+    def fillUp(self):
+        # Returns False if the aggregator still isn't full after MaxWarmUpRounds
+        while not self.isFull():
+            if self.numRounds == MaxWarmUpRounds:
+                return False
+
+            self.sendRound()
+
+        return True
+
+    def measureGrowth(self, numRounds):
+        # Bytes allocated by the aggregator over numRounds. The counts themselves still get bigger once it is full,
+        # so a little growth is expected from those. tracemalloc must be tracing from before the aggregator was
+        # filled up, or what it frees from back then can't make up for what it allocates now.
+        before = tracemalloc.take_snapshot()
+        for _ in range(numRounds):
+            self.sendRound()
+
+        after = tracemalloc.take_snapshot()
+        return sum(stat.size_diff for stat in after.compare_to(before, 'filename')
+                   if stat.traceback[0].filename.endswith('ClientTelemetry.py'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the client telemetry aggregator.')
+    parser.add_argument('--avatars', type=int, default=1000, help='Number of fake avatars.')
+    parser.add_argument('--rounds', type=int, default=50, help='Number of rounds once the aggregator is full.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame()
+
+    feed = TelemetryFeed(args.avatars, args.seed)
+    builtins.globalClock = feed.clock
+    tracemalloc.start()
+    if not feed.fillUp():
+        raise SystemExit('The aggregator was not full after %d rounds, try more avatars!' % feed.numRounds)
+
+    warmUpRounds = feed.numRounds
+    growth = feed.measureGrowth(args.rounds)
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        feed.sendRound()
+
+    elapsed = time.perf_counter() - start
+    telemetry = feed.telemetry
+    print('%d avatars over %d rounds (%d to fill up): %d zones and %d hoods kept, %d reports dropped, '
+          '%d bytes of growth, %.1f us per avatar per round once full.' % (
+              args.avatars, feed.numRounds, warmUpRounds, len(telemetry.zones), len(telemetry.hoods),
+              telemetry.droppedReports, growth, elapsed / (args.avatars * args.rounds) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+# Log a crowd of toons in and out of OnlinePlayerManagerUD, and count what it sends to the message director.
+#
+# After a restart everyone logs back in at once: the toons come online over a few frames,
+# get to their district and connect to their Archipelago room, and later all log out again.
+# Every datagram the manager sends goes to a fake message director, which keeps track of
+# what each client was told. While everyone is online, some toons make friends in other
+# districts and rooms, every toon looks up the details of a toon in its district, and some
+# look up toons in other districts.
+#
+# The toons are logged in spread over districts of ToonsPerDistrict, and then all into a
+# single district, since nothing caps how many toons a district holds. Each is done with
+# --toons toons and half as many, to show how the datagrams sent grow with the crowd.
+# With --baseline, the same logins are also sent through the manager at that revision.
+# tests/test_online_presence.py checks what every client was told along the way.
+#
+# Usage (from the repository root):
+#     python tools/bench_online_presence.py [--toons 500] [--frames 10] [--baseline <rev>]
+
+import argparse
+import os
+import random
+import sys
+
+import harness
+
+ToonsPerDistrict = 50
+ToonsPerRoom = 4
+FriendsPerToon = 3
+
+
+class FakeClient:
+    # What a client was told about who is online, and which toons were declared to it.
+
+    def __init__(self):
+        self.onlineToons = set()
+        self.declaredToons = set()
+
+    def setOnlineToons(self, toons):
+        self.onlineToons = {toon[0] for toon in toons}
+
+    def updateOnlineToons(self, cameOnline, wentOffline):
+        self.onlineToons.difference_update(wentOffline)
+        self.onlineToons.update(toon[0] for toon in cameOnline)
+
+    def toonCameOnline(self, toon):
+        self.onlineToons.add(toon[0])
+
+    def toonWentOffline(self, avId):
+        self.onlineToons.discard(avId)
+
+
+class FakeMessageDirector(harness.FakeMessageDirector):
+    # Hands what is in the datagrams sent to it to the client they are for.
+
+    def __init__(self):
+        harness.FakeMessageDirector.__init__(self)
+        self.numUpdates = 0
+        self.numDeclares = 0
+        self.clients = {}  # Puppet or account channel -> FakeClient
+
+    def sendDatagram(self, datagram):
+        from direct.distributed.MsgTypes import CLIENTAGENT_DECLARE_OBJECT, CLIENTAGENT_UNDECLARE_OBJECT
+        from direct.distributed.PyDatagramIterator import PyDatagramIterator
+
+        harness.FakeMessageDirector.sendDatagram(self, datagram)
+        dgi = PyDatagramIterator(datagram)
+        dgi.getUint8()
+        channel = dgi.getUint64()
+        dgi.getUint64()
+        msgType = dgi.getUint16()
+        if msgType in (CLIENTAGENT_DECLARE_OBJECT, CLIENTAGENT_UNDECLARE_OBJECT):
+            self.numDeclares += 1
+            client = self.clients.setdefault(channel, FakeClient())
+            if msgType == CLIENTAGENT_DECLARE_OBJECT:
+                client.declaredToons.add(dgi.getUint32())
+            else:
+                client.declaredToons.discard(dgi.getUint32())
+
+    def sendUpdate(self, channel, fieldName, args):
+        self.numUpdates += 1
+        getattr(self.clients.setdefault(channel, FakeClient()), fieldName)(*args)
+
+
+class FakeDatabaseInterface:
+    # Nothing is looked up in the database, only whether the toons get declared to each other.
+
+    def queryObject(self, dbId, doId, callback):
+        pass
+
+
+class FakeUberRepository(harness.FakeAIRepository):
+    # Sends datagrams the same way the UberDOG does, to a FakeMessageDirector.
+
+    def __init__(self, messageDirector, dcFile):
+        harness.FakeAIRepository.__init__(self, messageDirector)
+        self.ourChannel = 4665
+        self.dbId = 4003
+        self.dbInterface = FakeDatabaseInterface()
+        self.dclassesByName = {'DistributedToonUD': dcFile.getClassByName('DistributedToon'),
+                               'OnlinePlayerManagerUD': dcFile.getClassByName('OnlinePlayerManager')}
+
+    def sendUpdateToChannel(self, do, channelId, fieldName, args):
+        harness.FakeAIRepository.sendUpdateToChannel(self, do, channelId, fieldName, args)
+        self.messageDirector.sendUpdate(channelId, fieldName, args)
+
+
+class Toon:
+
+    def __init__(self, avId, districtId, roomKey):
+        self.avId = avId
+        self.accountId = avId - 100000000 + 1000
+        self.districtId = districtId
+        self.roomKey = roomKey
+        self.friendIds = []
+        self.lookedUpIds = []
+
+
+def makeToons(numToons, toonsPerDistrict, rng):
+    toons = []
+    for i in range(numToons):
+        toons.append(Toon(100000000 + i, 200000000 + i // toonsPerDistrict, 'seed-%d-0' % (i // ToonsPerRoom)))
+
+    # Friend lists don't have to be mutual
+    for toon in toons:
+        toon.friendIds = [friend.avId for friend in rng.sample(toons, FriendsPerToon) if friend is not toon]
+
+    rng.shuffle(toons)
+    return toons
+
+
+def areRelated(toon, other):
+    # Whether the two toons must have been declared to each other
+    return (other.avId in toon.friendIds or toon.avId in other.friendIds or toon.roomKey == other.roomKey
+            or other.avId in toon.lookedUpIds or toon.avId in other.lookedUpIds)
+
+
+class Logins:
+    # A crowd of toons logging in and out of a manager, a few frames at a time. After every frame,
+    # onFrame is called with whether every toon that is online has got to its district and room.
+
+    def __init__(self, managerClass, dcFile, toons, numFrames, rng, baseline=False, onFrame=None):
+        from otp.distributed.OtpDoGlobals import OTP_DO_ID_ONLINE_PLAYER_MANAGER
+
+        self.toons = toons
+        self.numFrames = numFrames
+        self.perFrame = -(-len(toons) // numFrames)
+        self.rng = rng
+        self.baseline = baseline
+        self.onFrame = onFrame
+        self.messageDirector = FakeMessageDirector()
+        self.air = FakeUberRepository(self.messageDirector, dcFile)
+        self.mgr = managerClass(self.air)
+        self.mgr.doId = OTP_DO_ID_ONLINE_PLAYER_MANAGER
+        self.onlineToons = {}
+        self.loginDatagrams = 0
+
+        # Each client can be reached through both its account and its avatar's channel
+        for toon in toons:
+            client = FakeClient()
+            self.messageDirector.clients[self.mgr.GetPuppetConnectionChannel(toon.avId)] = client
+            self.messageDirector.clients[self.mgr.GetAccountConnectionChannel(toon.accountId)] = client
+
+    def getClient(self, toon):
+        return self.messageDirector.clients.get(self.mgr.GetPuppetConnectionChannel(toon.avId))
+
+    def step(self, settled=True):
+        # Changes made during a frame are sent by a task that is woken up by the next one
+        taskMgr.step()
+        taskMgr.step()
+        if self.onFrame:
+            self.onFrame(self, settled)
+
+    def run(self):
+        self.logIn()
+        if not self.baseline:
+            self.makeFriends()
+            self.lookUpDistricts()
+            self.lookUpOtherDistricts()
+
+        self.loginDatagrams = len(self.messageDirector.datagrams)
+        self.logOut()
+
+    def logIn(self):
+        # Everyone logs in, then gets to their district and room on the frame after
+        arriving = []
+        for frame in range(self.numFrames + 1):
+            for toon in arriving:
+                if not self.baseline:
+                    self.mgr.setToonLocation(toon.avId, toon.districtId, toon.roomKey)
+
+            arriving = self.toons[frame * self.perFrame:(frame + 1) * self.perFrame]
+            for toon in arriving:
+                if self.baseline:
+                    self.mgr.comingOnline(toon.avId, 'Toon %d' % toon.avId, '')
+                else:
+                    self.mgr.comingOnline(toon.avId, 'Toon %d' % toon.avId, '', toon.friendIds, toon.districtId)
+                self.onlineToons[toon.avId] = toon
+
+            self.step(not arriving)
+
+    def makeFriends(self):
+        # Friends made now, with a true friend code or a magic word, can be anywhere
+        for toon, friend in zip(self.toons[::7], self.toons[3::7]):
+            if not areRelated(toon, friend):
+                toon.friendIds.append(friend.avId)
+                self.mgr.setToonFriends(toon.avId, toon.friendIds)
+
+        self.step()
+
+    def lookUp(self, toon, other):
+        self.air.senderAvId = toon.avId
+        self.mgr.getAvatarDetails(other.avId)
+        self.air.senderAvId = 0
+
+    def lookUpDistricts(self):
+        # Everyone looks up someone in their district, as they would before whispering them
+        toonsByDistrict = {}
+        for toon in self.toons:
+            toonsByDistrict.setdefault(toon.districtId, []).append(toon)
+
+        for toon in self.toons:
+            other = self.rng.choice(toonsByDistrict[toon.districtId])
+            if other is not toon:
+                toon.lookedUpIds.append(other.avId)
+                self.lookUp(toon, other)
+
+        self.step()
+
+    def lookUpOtherDistricts(self):
+        # Returns the (toon, other) pairs where the toon looked up someone in another district
+        pairs = []
+        for toon, other in zip(self.toons, self.toons[1:]):
+            if toon.districtId != other.districtId and not areRelated(toon, other):
+                self.lookUp(toon, other)
+                pairs.append((toon, other))
+
+        self.step()
+        return pairs
+
+    def logOut(self):
+        for frame in range(self.numFrames):
+            for toon in self.toons[frame * self.perFrame:(frame + 1) * self.perFrame]:
+                self.mgr.goingOffline(toon.avId, toon.accountId)
+                del self.onlineToons[toon.avId]
+
+            self.step(False)
+
+
+def printReport(name, logins):
+    messageDirector = logins.messageDirector
+    print('%-9s %4d toons: %8d datagrams (%7d logging in), %9d bytes, %7d updates, %7d declares' % (
+        name, len(logins.toons), len(messageDirector.datagrams), logins.loginDatagrams,
+        messageDirector.getNumBytes(), messageDirector.numUpdates, messageDirector.numDeclares))
+
+
+def readDCFile():
+    from panda3d.core import Filename
+    from panda3d.direct import DCFile
+
+    dcFile = DCFile()
+    if not dcFile.read(Filename('astron/dclass/tto.dc')):
+        raise SystemExit('Could not read astron/dclass/tto.dc')
+
+    return dcFile
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count the datagrams OnlinePlayerManagerUD sends for a mass login.')
+    parser.add_argument('--toons', type=int, default=500, help='Number of toons that log in.')
+    parser.add_argument('--frames', type=int, default=10, help='Number of frames the logins are spread over.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', help='Also log the toons in with the manager at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(headless=True)
+    from toontown.friends.OnlinePlayerManagerUD import OnlinePlayerManagerUD
+
+    dcFile = readDCFile()
+    managers = [('Current', OnlinePlayerManagerUD, False)]
+    if args.baseline:
+        module = harness.loadBaseline(args.baseline, 'toontown/friends/OnlinePlayerManagerUD.py')
+        managers.append((args.baseline, module.OnlinePlayerManagerUD, True))
+
+    for layout, toonsPerDistrict in (('Spread over districts', ToonsPerDistrict), ('In one district', args.toons)):
+        print('%s:' % layout)
+        for name, managerClass, baseline in managers:
+            datagrams = []
+            for numToons in (args.toons // 2, args.toons):
+                rng = random.Random(args.seed)
+                logins = Logins(managerClass, dcFile, makeToons(numToons, toonsPerDistrict, rng), args.frames, rng,
+                                baseline)
+                logins.run()
+                printReport(name, logins)
+                datagrams.append(len(logins.messageDirector.datagrams))
+
+            print('%-9s twice the toons sent %.2fx the datagrams.' % (name, datagrams[1] / datagrams[0]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+# Count the tasks and datagrams it takes to passively heal a playground full of toons.
+#
+# --toons real DistributedToonAIs stand around in Toontown Central. A third of them arrive
+# together in the first frame, like a group coming back from a fight, and the rest over the
+# first 20 seconds. Some start tooned up, the others anywhere below. Every few seconds a few
+# toons leave for a battle and come back later with less laff. Their healing is started and
+# stopped the way SafeZoneManagerAI does it, and the task manager runs on a slaved clock for
+# --seconds seconds at 30 frames a second.
+#
+# Every heal a toon gets must come a full heal period after it arrived or after its last heal
+# (plus at most the ticker's stagger), and no toon that is already tooned up may be sent
+# anything.
+#
+# With --baseline, the same playground is also run with DistributedToonAI at that revision,
+# where every toon had a heal task of its own.
+#
+# Usage (from the repository root):
+#     python tools/bench_safezone_heal.py [--toons 300] [--seconds 120] [--baseline <rev>]
+
+import argparse
+import builtins
+import collections
+import os
+import random
+import sys
+import time
+
+import harness
+
+FrameTime = 1.0 / 30
+ZoneId = 2000
+FirstToonId = 100000000
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+    # Just enough of an AI repository for toons to heal. Every update sent is counted, and every heal
+    # written down in self.heals as (time, avId, hp before the heal).
+
+    def __init__(self):
+        harness.FakeAIRepository.__init__(self)
+        from toontown.safezone.SafeZoneManagerAI import SafeZoneManagerAI
+
+        self.safeZoneManager = SafeZoneManagerAI(self)
+        self.numUpdates = 0
+        self.frameUpdates = 0
+        self.heals = []
+
+    def sendUpdate(self, do, fieldName, args):
+        self.numUpdates += 1
+        self.frameUpdates += 1
+        if fieldName == 'toonUp':
+            self.heals.append((globalClock.getFrameTime(), do.doId, do.hp))
+
+
+class Playground:
+    # Toons coming and going in a playground, healed by the given DistributedToonAI class.
+
+    def __init__(self, toonClass, numToons, seed):
+        self.air = FakeAIRepository()
+        builtins.simbase.air = self.air
+        self.rng = random.Random(seed)
+        self.toons = []
+        self.arrivals = []
+        self.away = {}
+        self.joinTimes = collections.defaultdict(list)
+        for i in range(numToons):
+            toon = toonClass(self.air)
+            toon.doId = FirstToonId + i
+            toon.zoneId = ZoneId
+            toon.maxHp = self.rng.randint(15, 137)
+            toon.hp = toon.maxHp if self.rng.random() < 0.2 else self.rng.randint(1, toon.maxHp - 1)
+            self.air.doId2do[toon.doId] = toon
+            self.toons.append(toon)
+            self.arrivals.append((0.0 if i < numToons // 3 else self.rng.uniform(0, 20), toon))
+
+        self.arrivals.sort(key=lambda arrival: arrival[0])
+
+    def enter(self, toon):
+        # What SafeZoneManagerAI.enterSafeZone does
+        self.joinTimes[toon.doId].append(globalClock.getFrameTime())
+        if not toon.isToonedUp():
+            from toontown.toonbase import ToontownGlobals
+            toon.startToonUp(ToontownGlobals.PassiveHealFrequency)
+
+    def countHealTasks(self):
+        return len([task for task in taskMgr.getAllTasks() if 'safeZoneToonUp' in task.name or
+                    task.name.startswith('healTicker')])
+
+    def run(self, seconds):
+        start = globalClock.getFrameTime()
+        numFrames = int(seconds / FrameTime)
+        frameTime = 0.0
+        healTasks = []
+        mostFrameUpdates = 0
+        updatesBefore = self.air.numUpdates
+        for frame in range(numFrames):
+            now = start + frame * FrameTime
+            while self.arrivals and self.arrivals[0][0] <= now - start:
+                self.enter(self.arrivals.pop(0)[1])
+
+            # Now and then a toon goes off to fight, and comes back a little later with less laff
+            if frame % 60 == 0 and now - start > 20:
+                for toon in self.rng.sample(self.toons, 3):
+                    if toon.doId not in self.away:
+                        toon.stopToonUp()
+                        self.away[toon.doId] = (now + self.rng.uniform(5, 30), toon)
+
+            for avId, (returnTime, toon) in list(self.away.items()):
+                if returnTime <= now:
+                    del self.away[avId]
+                    toon.hp = max(1, toon.hp - self.rng.randint(1, toon.maxHp))
+                    self.enter(toon)
+
+            globalClock.setFrameTime(now + FrameTime)
+            self.air.frameUpdates = 0
+            frameStart = time.perf_counter()
+            taskMgr.step()
+            frameTime += time.perf_counter() - frameStart
+            mostFrameUpdates = max(mostFrameUpdates, self.air.frameUpdates)
+            healTasks.append(self.countHealTasks())
+
+        return {
+            'frameTime': frameTime / numFrames,
+            'healTasks': sum(healTasks) / len(healTasks),
+            'mostHealTasks': max(healTasks),
+            'updatesPerSecond': (self.air.numUpdates - updatesBefore) / seconds,
+            'mostFrameUpdates': mostFrameUpdates,
+            'heals': len(self.air.heals),
+            'fullHeals': len([avId for healTime, avId, hp in self.air.heals if hp >= self.air.doId2do[avId].maxHp]),
+        }
+
+    def checkHeals(self):
+        from toontown.safezone.HealTickerAI import HealTickerAI
+        from toontown.toonbase import ToontownGlobals
+
+        period = ToontownGlobals.PassiveHealFrequency
+        slotTime = period / HealTickerAI.NumSlots
+        # A toon joins one of the next few slots, and the ticks land on frames
+        latest = period + HealTickerAI.SlotWindow * slotTime + 2 * FrameTime
+        lastTimes = {}
+        for healTime, avId, hp in self.air.heals:
+            toon = self.air.doId2do[avId]
+            if hp >= toon.maxHp:
+                raise SystemExit('Toon %d was healed while it was already tooned up!' % avId)
+
+            joinTime = max(joinTime for joinTime in self.joinTimes[avId] if joinTime < healTime)
+            lastTime = lastTimes.get(avId)
+            if lastTime is None or lastTime < joinTime:
+                since = healTime - joinTime
+                if not period <= since <= latest:
+                    raise SystemExit('Toon %d was first healed %.2f s after it arrived!' % (avId, since))
+            elif abs(healTime - lastTime - period) > 2 * FrameTime:
+                raise SystemExit('Toon %d was healed %.2f s after its last heal!' % (avId, healTime - lastTime))
+
+            lastTimes[avId] = healTime
+
+    def destroy(self):
+        for toon in self.toons:
+            toon.stopToonUp()
+
+        self.air.safeZoneManager.delete()
+
+
+def printReport(name, results):
+    print('%-9s %.1f heal tasks (%d at most), %.1f datagrams a second, %d at most in one frame, %d heals '
+          '(%d of them to tooned up toons), %.3f ms per frame' % (
+              name, results['healTasks'], results['mostHealTasks'], results['updatesPerSecond'],
+              results['mostFrameUpdates'], results['heals'], results['fullHeals'], results['frameTime'] * 1000))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count the tasks and datagrams of passive healing in a playground.')
+    parser.add_argument('--toons', type=int, default=300, help='Number of toons in the playground.')
+    parser.add_argument('--seconds', type=float, default=120.0, help='How long to run the playground for.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', help='Also run the playground with DistributedToonAI at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(headless=True)
+    from toontown.toon.DistributedToonAI import DistributedToonAI
+    DistributedToonAI.notify.setInfo(0)
+
+    playground = Playground(DistributedToonAI, args.toons, args.seed)
+    results = playground.run(args.seconds)
+    playground.checkHeals()
+    printReport('Current', results)
+    playground.destroy()
+
+    if args.baseline:
+        module = harness.loadBaseline(args.baseline, 'toontown/toon/DistributedToonAI.py')
+        module.DistributedToonAI.notify.setInfo(0)
+        playground = Playground(module.DistributedToonAI, args.toons, args.seed)
+        printReport(args.baseline, playground.run(args.seconds))
+        playground.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+# Time ServerEventLog.log() at a steady rate of server events, and check what gets written.
+#
+# Events like the ones the AI logs (karting records, buildings, minigames, suspicious
+# activity) are logged --rate times a second for --seconds, while the background thread
+# flushes them to rotating files in a temporary folder. Every call is timed on its own,
+# and the mean must stay under --max-mean microseconds. Then every event must be in the
+# files exactly once and in order, spread over the backups the way the rotation wants.
+#
+# The UDP sink is checked against a socket listening on localhost, and the limits by
+# logging a burst of events that are sampled and capped.
+#
+# ToontownInternalRepository needs the Astron repository, so this uses ServerEventLog on its own.
+#
+# Usage (from the repository root):
+#     python tools/bench_server_events.py [--rate 10000] [--seconds 3] [--max-mean 5]
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+import harness
+
+
+def makeEvents():
+    # One of each, with fields like the real ones
+    return [
+        ('kartingRecord', {'avId': 100000001, 'period': 1, 'trackId': 21, 'time': 91.25}),
+        ('buildingDefeated', {'avId': 100000002, 'track': 's', 'numFloors': 3, 'zoneId': 2100,
+                              'victors': [100000002, 100000003, 0, 0]}),
+        ('minigame_joined', {'avId': 100000004, 'minigameId': 2, 'trolleyZone': 2000}),
+        ('suspicious', {'avId': 100000005, 'message': 'toon has invalid money -5, forcing to zero'}),
+    ]
+
+
+def benchLog(folder, rate, seconds):
+    from toontown.distributed.ServerEventLog import RotatingFileSink, ServerEventLog
+
+    sink = RotatingFileSink(os.path.join(folder, 'bench.ndjson'), maxBytes=256 * 1024, backups=1000)
+    eventLog = ServerEventLog('AIR:401000000', sink, flushInterval=0.1)
+    eventLog.start()
+    events = makeEvents()
+    numEvents = int(rate * seconds)
+    callTimes = []
+    start = time.perf_counter()
+    for i in range(numEvents):
+        # Wait for this event's turn, so that the thread flushes while events keep coming
+        due = start + i / rate
+        while time.perf_counter() < due:
+            pass
+
+        name, fields = events[i % len(events)]
+        fields = dict(fields, seq=i)
+        callStart = time.perf_counter()
+        eventLog.log(name, fields)
+        callTimes.append(time.perf_counter() - callStart)
+
+    elapsed = time.perf_counter() - start
+    eventLog.close()
+    if eventLog.numOverwritten or eventLog.numFailed:
+        raise SystemExit('%d events were overwritten and %d failed to be written!' % (
+            eventLog.numOverwritten, eventLog.numFailed))
+
+    return callTimes, elapsed, numEvents
+
+
+def readEvents(path):
+    # The newest file is path, then path.1 and so on, so read them oldest first
+    paths = [path]
+    index = 1
+    while os.path.exists('%s.%d' % (path, index)):
+        paths.append('%s.%d' % (path, index))
+        index += 1
+
+    events = []
+    for eventPath in reversed(paths):
+        with open(eventPath, encoding='utf-8') as file:
+            events.extend(json.loads(line) for line in file)
+
+    return events, len(paths)
+
+
+def checkFiles(folder, numEvents):
+    events, numFiles = readEvents(os.path.join(folder, 'bench.ndjson'))
+    if [event.get('seq') for event in events] != list(range(numEvents)):
+        raise SystemExit('The files have %d events instead of the %d that were logged, in order!' % (
+            len(events), numEvents))
+
+    expected = makeEvents()
+    for event in events:
+        name, fields = expected[event['seq'] % len(expected)]
+        if event['type'] != name or event['sender'] != 'AIR:401000000' or \
+                any(event[key] != value for key, value in fields.items()):
+            raise SystemExit('Event %d was written as %s!' % (event['seq'], event))
+
+    for index in range(1, numFiles):
+        if os.path.getsize(os.path.join(folder, 'bench.ndjson.%d' % index)) > 256 * 1024:
+            raise SystemExit('bench.ndjson.%d is bigger than the rotation allows!' % index)
+
+    return numFiles
+
+
+def checkRotation(folder):
+    # Only the newest backups are kept
+    from toontown.distributed.ServerEventLog import RotatingFileSink
+
+    path = os.path.join(folder, 'rotate.ndjson')
+    sink = RotatingFileSink(path, maxBytes=100, backups=2)
+    sink.write(['%08d' % i + 'x' * 40 for i in range(10)])
+    sink.close()
+    if os.path.exists(path + '.3'):
+        raise SystemExit('More backups were kept than asked for!')
+
+    lines = []
+    for eventPath in (path + '.2', path + '.1', path):
+        with open(eventPath, encoding='utf-8') as file:
+            lines.extend(line[:8] for line in file)
+
+    if lines != ['%08d' % i for i in range(4, 10)]:
+        raise SystemExit('The rotated files have lines %s instead of the 6 newest!' % lines)
+
+
+def checkUdp():
+    from toontown.distributed.ServerEventLog import ServerEventLog, UDPSink
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    listener.bind(('127.0.0.1', 0))
+    listener.settimeout(1.0)
+    eventLog = ServerEventLog('UD:4002', UDPSink(*listener.getsockname(), maxDatagramSize=512))
+    for i in range(50):
+        eventLog.log('kartingRecord', {'avId': 100000001, 'trackId': 21, 'seq': i})
+
+    eventLog.close()
+    events = []
+    numDatagrams = 0
+    while len(events) < 50:
+        try:
+            datagram = listener.recv(65536)
+        except socket.timeout:
+            break
+
+        numDatagrams += 1
+        events.extend(json.loads(line) for line in datagram.decode('utf-8').splitlines())
+
+    listener.close()
+    if [event['seq'] for event in events] != list(range(50)) or numDatagrams < 2:
+        raise SystemExit('The UDP listener got %d events in %d datagrams instead of 50 in a few!' % (
+            len(events), numDatagrams))
+
+
+def checkLimits():
+    from toontown.distributed.ServerEventLog import ServerEventLog
+
+    class ListSink:
+        def __init__(self):
+            self.lines = []
+
+        def write(self, lines):
+            self.lines.extend(lines)
+
+        def close(self):
+            pass
+
+    sink = ListSink()
+    eventLog = ServerEventLog('AIR:401000000', sink)
+    eventLog.setLimit('sampled', sampleRate=0.25)
+    eventLog.setLimit('capped', maxPerSecond=100)
+    for i in range(4000):
+        eventLog.log('sampled', {})
+        eventLog.log('capped', {})
+        eventLog.log('unlimited', {})
+
+    eventLog.close()
+    counts = {}
+    for line in sink.lines:
+        name = json.loads(line)['type']
+        counts[name] = counts.get(name, 0) + 1
+
+    # All of this happens within a second or two, so the cap lets 100 through in each of them
+    if not 800 <= counts.get('sampled', 0) <= 1200 or not 100 <= counts.get('capped', 0) <= 200 or \
+            counts.get('unlimited', 0) != 4000:
+        raise SystemExit('The limits let %s through!' % counts)
+
+    if eventLog.getNumDropped() != 8000 - counts['sampled'] - counts['capped']:
+        raise SystemExit('The limits dropped %d events, not %d!' % (
+            eventLog.getNumDropped(), 8000 - counts['sampled'] - counts['capped']))
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time ServerEventLog.log() and check what it writes.')
+    parser.add_argument('--rate', type=int, default=10000, help='Events to log every second.')
+    parser.add_argument('--seconds', type=float, default=3.0, help='How long to keep logging them.')
+    parser.add_argument('--max-mean', type=float, default=5.0, help='Most microseconds a call may take on average.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame()
+
+    with tempfile.TemporaryDirectory() as folder:
+        callTimes, elapsed, numEvents = benchLog(folder, args.rate, args.seconds)
+        numFiles = checkFiles(folder, numEvents)
+        callTimes.sort()
+        mean = sum(callTimes) / len(callTimes) * 1e6
+        print('Logged %d events in %.2f s: %.2f us per call on average, %.2f us at the 99th percentile, '
+              '%.2f us longest. Written to %d files.' % (
+                  numEvents, elapsed, mean, callTimes[len(callTimes) * 99 // 100] * 1e6, callTimes[-1] * 1e6,
+                  numFiles))
+        checkRotation(folder)
+
+    checkUdp()
+    counts = checkLimits()
+    print('Rotation and UDP are fine, the limits let %d of 4000 sampled and %d of 4000 capped events through.' % (
+        counts['sampled'], counts['capped']))
+    if mean > args.max_mean:
+        raise SystemExit('A call takes %.2f us on average, more than %.2f!' % (mean, args.max_mean))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,221 @@
+# Time how DeliverySchedulerAI gets a crowd of toons their catalogs, purchases, gifts and awards.
+#
+# Real DistributedToonAIs are given orders on a fake AI repository, whose DeliverySchedulerAI
+# runs on a simulated wall clock that moves with the task manager's. --toons toons each get
+# orders due over the next few hours, and some of them get new gifts every minute. The clock
+# is moved a minute at a time, with a few frames in between where nothing is due. This times
+# ordering a gift and the frames where nothing is due, and reports how big the delivery queue
+# got. tests/test_toon_deliveries.py checks that everything is delivered in the minute it is due.
+#
+# Usage (from the repository root):
+#     python tools/bench_toon_deliveries.py [--toons 5000] [--seed 0]
+
+import argparse
+import builtins
+import collections
+import datetime
+import os
+import random
+import sys
+import time
+
+import harness
+
+FirstToonId = 100000000
+
+# Monday the 5th of January 2026 at noon, on the minute
+StartTime = datetime.datetime(2026, 1, 5, 12, 0, tzinfo=datetime.timezone.utc).timestamp()
+
+
+class SimulatedClock:
+    # Wall clock time that moves with the task manager's clock, starting at StartTime.
+
+    def __init__(self):
+        self.start = StartTime - globalClock.getFrameTime()
+
+    def __call__(self):
+        return self.start + globalClock.getFrameTime()
+
+    def advanceTo(self, timestamp):
+        # Sleeping tasks are woken up by the frame after the one they are due in
+        globalClock.setFrameTime(timestamp - self.start)
+        taskMgr.step()
+        taskMgr.step()
+
+
+class FakeCatalogManager:
+    # Hands out catalogs a week apart, and writes down when.
+
+    def __init__(self, air):
+        self.air = air
+
+    def deliverCatalogFor(self, av):
+        now = self.air.deliveryScheduler.getTime()
+        self.air.deliveries.append((int(now // 60), av.doId, 'catalog', ()))
+        currentWeek, nextTime = av.getCatalogSchedule()
+        av.b_setCatalogSchedule(currentWeek + 1, int(now // 60) + 7 * 24 * 60)
+
+
+class FakeDeliveryManager:
+
+    def sendDeliverGifts(self, avId, now):
+        pass
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+    # Just enough of an AI repository for toons to get their deliveries. Every delivery is written down in
+    # self.deliveries as (minute, avId, what, bean amounts of the items delivered).
+
+    def __init__(self, clock):
+        harness.FakeAIRepository.__init__(self)
+        from toontown.catalog.DeliverySchedulerAI import DeliverySchedulerAI
+
+        self.doLiveUpdates = True
+        self.deliveryScheduler = DeliverySchedulerAI(self, clock)
+        self.catalogManager = FakeCatalogManager(self)
+        self.deliveryManager = FakeDeliveryManager()
+        self.deliveries = []
+        self.mailboxSizes = collections.defaultdict(lambda: [0, 0])
+
+    def sendUpdate(self, do, fieldName, args):
+        if fieldName not in ('setMailboxContents', 'setAwardMailboxContents'):
+            return
+
+        # Items are delivered by appending them to the end of the mailbox
+        index = 0 if fieldName == 'setMailboxContents' else 1
+        contents = do.mailboxContents if index == 0 else do.awardMailboxContents
+        delivered = contents[self.mailboxSizes[do.doId][index]:]
+        self.mailboxSizes[do.doId][index] = len(contents)
+        if delivered:
+            minute = int(self.deliveryScheduler.getTime() // 60)
+            self.deliveries.append((minute, do.doId, 'mailbox' if index == 0 else 'award',
+                                    tuple(sorted(item.beanAmount for item in delivered))))
+
+    def addToon(self, doId):
+        from toontown.toon.DistributedToonAI import DistributedToonAI
+
+        toon = DistributedToonAI(self)
+        toon.doId = doId
+        toon.setName('Toon %d' % doId)
+        self.doId2do[doId] = toon
+        return toon
+
+
+def makeOrder(items):
+    # items are (bean amount, minute it is due)
+    from toontown.catalog import CatalogItem, CatalogItemList
+    from toontown.catalog.CatalogBeanItem import CatalogBeanItem
+
+    order = []
+    for beanAmount, minute in items:
+        item = CatalogBeanItem(beanAmount)
+        item.deliveryDate = minute
+        order.append(item)
+
+    return CatalogItemList.CatalogItemList(order, store=CatalogItem.Customization | CatalogItem.DeliveryDate)
+
+
+def addOrders(toon, purchases=(), gifts=(), awards=()):
+    # Adds to what the toon has on order, like the phone, the delivery manager and awards do
+    if purchases:
+        toon.b_setDeliverySchedule(toon.onOrder + makeOrder(purchases))
+    if gifts:
+        toon.setGiftSchedule(toon.onGiftOrder + makeOrder(gifts))
+    if awards:
+        toon.b_setAwardSchedule(toon.onAwardOrder + makeOrder(awards))
+
+
+class Crowd:
+    # numToons toons with orders due over the next NumMinutes, some of whom get new gifts every minute. What is
+    # expected to be delivered is counted by (minute, avId, 'mailbox' or 'award').
+
+    NumMinutes = 180
+
+    def __init__(self, clock, numToons, seed):
+        self.clock = clock
+        self.rng = random.Random(seed)
+        self.air = FakeAIRepository(clock)
+        self.scheduler = self.air.deliveryScheduler
+        self.now = int(clock() // 60)
+        self.toons = [self.air.addToon(FirstToonId + i) for i in range(numToons)]
+        self.expected = collections.Counter()
+        self.beanAmount = 0
+        self.orderTime = 0.0
+        self.numGifts = 0
+        self.quietFrames = []
+        self.maxQueue = 0
+        self.maxTasks = 0
+        for toon in self.toons:
+            purchases = [self.order() for i in range(self.rng.randint(0, 3))]
+            gifts = [self.order() for i in range(self.rng.randint(0, 2))]
+            awards = [self.order() for i in range(self.rng.randint(0, 2))]
+            addOrders(toon, purchases, gifts, awards)
+            for amount, minute in purchases + gifts:
+                self.expected[(minute, toon.doId, 'mailbox')] += 1
+            for amount, minute in awards:
+                self.expected[(minute, toon.doId, 'award')] += 1
+
+    def order(self, firstMinute=None):
+        self.beanAmount += 1
+        return self.beanAmount, self.rng.randint(firstMinute or self.now + 1, self.now + self.NumMinutes)
+
+    def run(self):
+        for minute in range(self.now + 1, self.now + self.NumMinutes + 1):
+            # Some toons get gifts every minute, which reschedules their deliveries
+            start = time.perf_counter()
+            for toon in self.rng.sample(self.toons, max(1, len(self.toons) // 100)):
+                gift = self.order(minute)
+                addOrders(toon, gifts=[gift])
+                self.expected[(gift[1], toon.doId, 'mailbox')] += 1
+                self.numGifts += 1
+
+            self.orderTime += time.perf_counter() - start
+            self.maxQueue = max(self.maxQueue, len(self.scheduler.queue))
+            self.clock.advanceTo(minute * 60 + 1)
+
+            # Then a few frames where nothing is due
+            for frame in range(3):
+                start = time.perf_counter()
+                self.clock.advanceTo(minute * 60 + 2 + frame)
+                self.quietFrames.append(time.perf_counter() - start)
+
+            self.maxTasks = max(self.maxTasks, len(taskMgr.getTasksNamed(self.scheduler.taskName)))
+
+    def getDelivered(self):
+        delivered = collections.Counter()
+        for minute, avId, what, amounts in self.air.deliveries:
+            delivered[(minute, avId, what)] += len(amounts)
+
+        return delivered
+
+    def delete(self):
+        self.scheduler.delete()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the deliveries of a crowd of toons.')
+    parser.add_argument('--toons', type=int, default=5000, help='Number of toons with orders.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(headless=True)
+    from toontown.toon.DistributedToonAI import DistributedToonAI
+    DistributedToonAI.notify.setInfo(0)
+
+    clock = SimulatedClock()
+    # Toons need a repository of their own to be created with
+    builtins.simbase.air = FakeAIRepository(clock)
+    crowd = Crowd(clock, args.toons, args.seed)
+    crowd.run()
+    quietFrames = sorted(crowd.quietFrames)
+    print('%d toons got %d deliveries over %d minutes. Ordering took %.1f us a gift, a frame with nothing due '
+          '%.1f us (%.1f us at most). The queue never had more than %d entries.' % (
+              args.toons, len(crowd.air.deliveries), crowd.NumMinutes, crowd.orderTime / crowd.numGifts * 1e6,
+              quietFrames[len(quietFrames) // 2] * 1e6, quietFrames[-1] * 1e6, crowd.maxQueue))
+    crowd.delete()
+
+
+if __name__ == '__main__':
+    main()
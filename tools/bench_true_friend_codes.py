@@ -0,0 +1,208 @@
+# Hand out a crowd of True Friend codes from FriendManagerAI, with a clock we control, and time it.
+#
+# 100000 codes are handed out over a few hours across the end of a month, and then left
+# to expire in two batches. This times the expiry task in the frames where nothing
+# expires, and counts how often the code file is written. With --baseline, the expiry task
+# at that revision, which looked at every code every frame, is timed with as many codes.
+# tests/test_true_friend_codes.py checks that codes expire exactly when they should.
+#
+# Usage (from the repository root):
+#     python tools/bench_true_friend_codes.py [--codes 100000] [--frames 100] [--baseline <rev>]
+
+import argparse
+import collections
+import datetime
+import os
+import sys
+import tempfile
+import time
+
+import harness
+
+StartingDistrictId = 200000000
+# When the codes handed out by handOutCodes expire
+ExpiryDates = (datetime.datetime(2026, 4, 2), datetime.datetime(2026, 4, 3))
+
+
+class SimulatedClock:
+    # Wall clock time that moves with the task manager's clock, starting at the given date.
+
+    def __init__(self):
+        self.start = 0.0
+
+    def __call__(self):
+        return self.start + globalClock.getFrameTime()
+
+    def setDate(self, date):
+        self.start = date.timestamp()
+        globalClock.setFrameTime(0)
+
+    def advanceTo(self, date):
+        # Sleeping tasks are woken up by the frame after the one they are due in
+        globalClock.setFrameTime(date.timestamp() - self.start)
+        taskMgr.step()
+        taskMgr.step()
+
+
+class FakeDClass:
+
+    def getNumber(self):
+        return 0
+
+
+class FakeAvatar:
+
+    def __init__(self, doId):
+        self.doId = doId
+        self.friendsList = []
+
+    def getName(self):
+        return 'Toon %d' % self.doId
+
+    def getFriendsList(self):
+        return self.friendsList
+
+    def extendFriendsList(self, friendId, friendCode):
+        self.friendsList.append((friendId, friendCode))
+
+    def d_setFriendsList(self, friendsList):
+        pass
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+    # Just enough of an AI repository for the FriendManagerAI. Responses to the avatars are kept.
+
+    def __init__(self, districtId):
+        harness.FakeAIRepository.__init__(self)
+        self.districtId = districtId
+        self.dclassesByName = collections.defaultdict(FakeDClass)
+        self.responses = []
+
+    def sendUpdateToChannel(self, do, channelId, fieldName, args):
+        self.responses.append((fieldName, args))
+
+
+def makeFriendManager(districtId, clock):
+    from otp.friends.FriendManagerAI import FriendManagerAI
+
+    air = FakeAIRepository(districtId)
+    for doId in (100000000, 100000001):
+        air.doId2do[doId] = FakeAvatar(doId)
+
+    friendManager = FriendManagerAI(air, clock=clock)
+    # Count the times the code file is written
+    friendManager.numWrites = 0
+    updateTrueFriendCodesFile = friendManager.updateTrueFriendCodesFile
+
+    def countWrite():
+        friendManager.numWrites += 1
+        updateTrueFriendCodesFile()
+
+    friendManager.updateTrueFriendCodesFile = countWrite
+    return friendManager
+
+
+def requestCode(friendManager, avId):
+    # Returns the code the avatar was given, or None if it wasn't given one
+    friendManager.air.senderAvId = avId
+    friendManager.requestSecret()
+    fieldName, (result, tfCode) = friendManager.air.responses.pop()
+    if fieldName != 'requestSecretResponse' or result != 1:
+        return None
+
+    return tfCode
+
+
+def submitCode(friendManager, avId, tfCode):
+    friendManager.air.senderAvId = avId
+    friendManager.submitSecret(tfCode)
+    fieldName, (result, friendId) = friendManager.air.responses.pop()
+    return result
+
+
+def deleteFriendManager(friendManager):
+    friendManager.delete()
+    taskMgr.remove('tf-codes-save-task')
+
+
+def handOutCodes(clock, numCodes, numFrames):
+    # Codes are handed out between 20:00 on March 31st and 4:00 on April 1st, so they expire in two batches
+    start = datetime.datetime(2026, 3, 31, 20, 0)
+    frameTime = datetime.timedelta(hours=8) / numFrames
+    clock.setDate(start)
+    friendManager = makeFriendManager(StartingDistrictId + 200, clock)
+    codesPerFrame = -(-numCodes // numFrames)
+    for frame in range(numFrames):
+        for _ in range(codesPerFrame):
+            if requestCode(friendManager, 100000000) is None:
+                raise SystemExit('Could not get a True Friend code!')
+
+        clock.advanceTo(start + frameTime * (frame + 1))
+
+    return friendManager
+
+
+def timeSteps(numSteps):
+    start = time.perf_counter()
+    for _ in range(numSteps):
+        taskMgr.step()
+
+    return (time.perf_counter() - start) / numSteps
+
+
+def timeBaseline(revision, numCodes):
+    # The old task looked at every code every frame
+    FriendManagerAI = harness.loadBaseline(revision, 'otp/friends/FriendManagerAI.py').FriendManagerAI
+    friendManager = FriendManagerAI(FakeAIRepository(StartingDistrictId + 300))
+    taskMgr.remove('tf-codes-clear-task')
+    today = datetime.datetime.now().day
+    for i in range(numCodes):
+        friendManager.tfCodes['%06d' % i] = (100000000, today)
+
+    class Task:
+        again = 'again'
+
+    start = time.perf_counter()
+    for _ in range(10):
+        friendManager._FriendManagerAI__trueFriendCodesTask(Task())
+
+    print('%s: %.1f us per frame with %d codes.' % (revision, (time.perf_counter() - start) / 10 * 1000000, numCodes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the expiry of True Friend codes.')
+    parser.add_argument('--codes', type=int, default=100000, help='Number of codes to hand out at once.')
+    parser.add_argument('--frames', type=int, default=100, help='Number of frames to hand them out over.')
+    parser.add_argument('--baseline', help='Also time the expiry task at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    with tempfile.TemporaryDirectory() as dataFolder:
+        # FriendManagerAI keeps its codes in here
+        harness.setupGame('server-data-folder %s' % os.path.join(dataFolder, ''), headless=True)
+        clock = SimulatedClock()
+        start = time.perf_counter()
+        friendManager = handOutCodes(clock, args.codes, args.frames)
+        handOutTime = time.perf_counter() - start
+        numCodes = len(friendManager.tfCodes)
+        print('%d codes over %d frames in %.2f s: the code file was written %d times, %.1f us per frame with '
+              'nothing expiring.' % (numCodes, args.frames, handOutTime, friendManager.numWrites,
+                                     timeSteps(1000) * 1000000))
+
+        for expiresOn in ExpiryDates:
+            writes = friendManager.numWrites
+            start = time.perf_counter()
+            clock.advanceTo(expiresOn)
+            clock.advanceTo(expiresOn + datetime.timedelta(seconds=friendManager.tfCodeSaveDelay + 1))
+            print('%s: %d codes left after %.1f ms, the code file was written %d times.' % (
+                expiresOn, len(friendManager.tfCodes), (time.perf_counter() - start) * 1000,
+                friendManager.numWrites - writes))
+
+        deleteFriendManager(friendManager)
+        if args.baseline:
+            timeBaseline(args.baseline, args.codes)
+
+
+if __name__ == '__main__':
+    main()
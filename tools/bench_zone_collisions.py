@@ -0,0 +1,258 @@
+# Time the AI's collision traversals for a crowd of estates full of pets and toons.
+#
+# Every estate zone gets --pets pets and --toons toons walking around at random, the toons
+# jumping now and then. Each of them has a pet look sphere, like the real ones, which the zone
+# data store traverses as often as PetConstants.LookPeriod asks. Afterwards everyone stands
+# still long enough to be traversed once more, and every looker must then be looking at exactly
+# the other lookers its sphere touches.
+#
+# With --baseline, the same estates are also run with AIZoneData and PetLookerAI at that
+# revision, along with what the estates and toons did for collisions back then: each estate
+# traversed its zone once for every pet in it every frame, and each toon had a task of its
+# own that put its sphere back on the ground.
+#
+# Usage (from the repository root):
+#     python tools/bench_zone_collisions.py [--estates 100] [--pets 6] [--toons 6] [--frames 300] [--baseline <rev>]
+
+import argparse
+import collections
+import math
+import os
+import random
+import sys
+import time
+
+import harness
+
+FrameTime = 1.0 / 30
+EstateZoneId = 30000
+StillFrames = 30
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+    # Just enough of an AI repository for objects with zone data.
+
+    def __init__(self, zoneDataStore):
+        harness.FakeAIRepository.__init__(self)
+        self.zoneDataStore = zoneDataStore
+
+    def getZoneDataStore(self):
+        return self.zoneDataStore
+
+
+def makeLookerClass(PetLookerAI):
+    from direct.distributed.DistributedNodeAI import DistributedNodeAI
+
+    class Looker(DistributedNodeAI, PetLookerAI):
+        # A pet or a toon walking around an estate, with nothing but its look sphere.
+
+        def __init__(self, air, doId, zoneId, isPet, rng):
+            DistributedNodeAI.__init__(self, air)
+            PetLookerAI.__init__(self)
+            self.doId = doId
+            self.parentId = air.districtId
+            self.zoneId = zoneId
+            self.isPet = isPet
+            self.rng = rng
+            self.heading = rng.uniform(0, 2 * math.pi)
+            self.reparentTo(self.getRender())
+            self.setPos(rng.uniform(-60, 60), rng.uniform(-60, 60), 0)
+
+        def _isPet(self):
+            return self.isPet
+
+        def _isPetLookerGrounded(self):
+            return not self.isPet
+
+        def walk(self):
+            self.heading += self.rng.uniform(-0.3, 0.3)
+            x = max(-60, min(60, self.getX() + math.cos(self.heading)))
+            y = max(-60, min(60, self.getY() + math.sin(self.heading)))
+            z = 0
+            if not self.isPet and self.rng.random() < 0.1:
+                z = self.rng.uniform(0, 4)
+
+            self.setPos(x, y, z)
+
+    return Looker
+
+
+class EstateBench:
+    # Estates full of lookers, run with the given AIZoneData and PetLookerAI modules.
+
+    def __init__(self, zoneDataModule, petLookerModule, numEstates, numPets, numToons, seed, baseline):
+        self.baseline = baseline
+        self.zoneDataStore = zoneDataModule.AIZoneDataStore()
+        self.air = FakeAIRepository(self.zoneDataStore)
+        Looker = makeLookerClass(petLookerModule.PetLookerAI)
+        rng = random.Random(seed)
+        self.lookers = []
+        self.estates = []
+        doId = 100000000
+        for i in range(numEstates):
+            zoneId = EstateZoneId + i * 100
+            pets = []
+            for j in range(numPets + numToons):
+                looker = Looker(self.air, doId, zoneId, j < numPets, rng)
+                looker.enterPetLook()
+                self.lookers.append(looker)
+                if looker.isPet:
+                    pets.append(looker)
+
+                doId += 1
+
+            self.estates.append(pets)
+
+        from direct.showbase.DirectObject import DirectObject
+        from toontown.pets.PetLookerAI import getStartLookingAtOtherEvent
+
+        self.numLookStarts = 0
+        self.listener = DirectObject()
+        for looker in self.lookers:
+            self.listener.accept(getStartLookingAtOtherEvent(looker.doId), self.countLookStart)
+
+        if baseline:
+            self.startBaselineTasks()
+
+    def countLookStart(self, other):
+        self.numLookStarts += 1
+
+    def startBaselineTasks(self):
+        from otp.otpbase import OTPGlobals
+
+        for index, pets in enumerate(self.estates):
+            def collisionLoop(task, pets=pets):
+                for pet in pets:
+                    pet.getCollTrav().traverse(pet.getRender())
+
+                return task.cont
+
+            taskMgr.add(collisionLoop, 'bench-collisionLoop-%d' % index, sort=30)
+
+        for looker in self.lookers:
+            if not looker.isPet:
+                def moveSphere(task, looker=looker):
+                    looker.lookSphereNodePath.setZ(looker.getRender(), 0)
+                    return task.cont
+
+                taskMgr.add(moveSphere, 'bench-moveSphere-%d' % looker.doId, priority=OTPGlobals.AICollMovePriority)
+
+    def run(self, numFrames):
+        frameTime = 0.0
+        for frame in range(numFrames):
+            for looker in self.lookers:
+                looker.walk()
+
+            globalClock.setFrameTime(globalClock.getFrameTime() + FrameTime)
+            start = time.perf_counter()
+            taskMgr.step()
+            frameTime += time.perf_counter() - start
+
+        # Stand still long enough for every zone to be traversed again
+        for frame in range(StillFrames):
+            for looker in self.lookers:
+                looker.setZ(0)
+
+            globalClock.setFrameTime(globalClock.getFrameTime() + FrameTime)
+            taskMgr.step()
+
+        return frameTime / numFrames
+
+    def checkLooks(self):
+        from toontown.pets import PetConstants
+
+        def getRadius(looker):
+            return PetConstants.PetSphereRadius if looker.isPet else PetConstants.NonPetSphereRadius
+
+        byZone = collections.defaultdict(list)
+        for looker in self.lookers:
+            byZone[looker.zoneId].append(looker)
+
+        for lookers in byZone.values():
+            for looker in lookers:
+                # Pets look at everyone, toons only at pets
+                expected = set()
+                for other in lookers:
+                    if other is looker or not (looker.isPet or other.isPet):
+                        continue
+
+                    distance = (other.getPos() - looker.getPos()).length()
+                    if distance < getRadius(looker) + getRadius(other) - 0.01:
+                        expected.add(other.doId)
+                    elif distance <= getRadius(looker) + getRadius(other) + 0.01:
+                        # Too close to call
+                        expected.discard(other.doId)
+                        if other.doId in looker.others:
+                            expected.add(other.doId)
+
+                if set(looker.others) != expected:
+                    raise SystemExit('Looker %d is looking at %s instead of %s!' % (
+                        looker.doId, sorted(looker.others), sorted(expected)))
+
+    def destroy(self):
+        for looker in self.lookers:
+            # Looking away first, since PetLookerAI couldn't do it itself before
+            for otherId in list(looker.others):
+                looker._handleLookingAtOtherStop(otherId)
+
+            looker.exitPetLook()
+            looker.ignoreAll()
+            looker.releaseZoneData()
+
+        self.listener.ignoreAll()
+        taskMgr.removeTasksMatching('bench-*')
+        self.zoneDataStore.destroy()
+
+
+def printReport(name, bench, frameTime):
+    stats = bench.zoneDataStore.getCollTravStats() if not bench.baseline else {}
+    line = '%-9s %.3f ms per frame' % (name, frameTime * 1000)
+    if stats:
+        numTraversals = sum(numTraversals for numTraversals, totalTime, maxTime in stats.values())
+        totalTime = sum(totalTime for numTraversals, totalTime, maxTime in stats.values())
+        maxTime = max(maxTime for numTraversals, totalTime, maxTime in stats.values())
+        line += ', %d zones traversed %d times, %.3f ms per traversal, %.3f ms longest' % (
+            len(stats), numTraversals, totalTime / numTraversals * 1000, maxTime * 1000)
+
+    print(line + ', %d looks started' % bench.numLookStarts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time the collision traversals of estates full of pets and toons.')
+    parser.add_argument('--estates', type=int, default=100, help='Number of estates.')
+    parser.add_argument('--pets', type=int, default=6, help='Number of pets in every estate.')
+    parser.add_argument('--toons', type=int, default=6, help='Number of toons in every estate.')
+    parser.add_argument('--frames', type=int, default=300, help='Number of frames to run.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--stats', action='store_true', help='Also print the traversal times of every zone.')
+    parser.add_argument('--baseline', help='Also run the estates with the collision code at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(headless=True)
+    from otp.ai import AIZoneData
+    from toontown.pets import PetLookerAI
+
+    bench = EstateBench(AIZoneData, PetLookerAI, args.estates, args.pets, args.toons, args.seed, False)
+    frameTime = bench.run(args.frames)
+    bench.checkLooks()
+    printReport('Current', bench, frameTime)
+    if args.stats:
+        bench.zoneDataStore.notify.setInfo(1)
+        bench.zoneDataStore.printStats(collTravTimes=True)
+
+    bench.destroy()
+
+    if args.baseline:
+        zoneDataModule = harness.loadBaseline(args.baseline, 'otp/ai/AIZoneData.py')
+        petLookerModule = harness.loadBaseline(args.baseline, 'toontown/pets/PetLookerAI.py')
+        bench = EstateBench(zoneDataModule, petLookerModule, args.estates, args.pets, args.toons, args.seed, True)
+        frameTime = bench.run(args.frames)
+        bench.checkLooks()
+        printReport(args.baseline, bench, frameTime)
+        bench.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# Benchmark Archipelago generation with the Toontown apworld.
+#
+# Generates multiworlds of 1, 10 and 50 Toontown slots with fixed seeds, once with the
+# rules in ruledefs.py evaluated directly and once with the compiled rules. Every
+# generation runs in a fresh interpreter, and reports the CPU time it took. The
+# spoilers of both runs must be identical, otherwise the benchmark fails.
+#
+# This needs an Archipelago checkout with this repository's apworld installed in it
+# (worlds/toontown, or toontown.apworld in custom_worlds).
+#
+# Usage (from the repository root):
+#     python tools/benchmark_apworld_generation.py --archipelago ../Archipelago [--slots 1 10 50] [--seed 1]
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+
+
+# Runs inside the child interpreter from the Archipelago checkout.
+CHILD_TEMPLATE = '''
+import json, sys, time
+sys.argv = %(argv)r
+import worlds
+import worlds.toontown
+worlds.toontown.COMPILE_RULES = %(compile)r
+from Generate import main as generate
+from Main import main as ERmain
+start = time.process_time()
+erargs, seed = generate()
+ERmain(erargs, seed)
+sys.stdout.write('\\n' + json.dumps({'cpu': time.process_time() - start}))
+'''
+
+
+def writePlayerFiles(path, slots, example):
+    with open(example) as f:
+        template = f.read()
+
+    for slot in range(1, slots + 1):
+        with open(os.path.join(path, 'Toon%d.yaml' % slot), 'w') as f:
+            f.write(template.replace('name: Colorful Toon', 'name: Toon%d' % slot, 1))
+
+
+def readSpoiler(outputPath):
+    for filename in os.listdir(outputPath):
+        if filename.endswith('_Spoiler.txt'):
+            with open(os.path.join(outputPath, filename), encoding='utf-8') as f:
+                return f.read()
+
+        if filename.endswith('.zip'):
+            with zipfile.ZipFile(os.path.join(outputPath, filename)) as archive:
+                for name in archive.namelist():
+                    if name.endswith('_Spoiler.txt'):
+                        return archive.read(name).decode('utf-8')
+
+    raise RuntimeError('No spoiler was written to %s' % outputPath)
+
+
+def generate(archipelago, playerFiles, seed, compileRules):
+    outputPath = tempfile.mkdtemp(prefix='toontown-output-')
+    try:
+        argv = ['Generate.py', '--player_files_path', playerFiles, '--outputpath', outputPath,
+                '--seed', str(seed), '--spoiler', '2']
+        code = CHILD_TEMPLATE % {'argv': argv, 'compile': compileRules}
+        result = subprocess.run([sys.executable, '-c', code], cwd=archipelago, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError('Generation failed:\n' + result.stderr[-4000:])
+
+        stats = json.loads(result.stdout.splitlines()[-1])
+        return stats['cpu'], readSpoiler(outputPath)
+    finally:
+        shutil.rmtree(outputPath, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark Toontown apworld generation.')
+    parser.add_argument('--archipelago', required=True, help='Path to an Archipelago checkout.')
+    parser.add_argument('--slots', type=int, nargs='+', default=[1, 10, 50], help='Multiworld sizes to generate.')
+    parser.add_argument('--seed', type=int, default=1, help='Seed used for every generation.')
+    args = parser.parse_args()
+
+    archipelago = os.path.abspath(args.archipelago)
+    example = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'apworld', 'EXAMPLE_TOONTOWN.yaml')
+    failed = False
+    for slots in args.slots:
+        playerFiles = tempfile.mkdtemp(prefix='toontown-players-')
+        try:
+            writePlayerFiles(playerFiles, slots, example)
+            before, beforeSpoiler = generate(archipelago, playerFiles, args.seed, False)
+            after, afterSpoiler = generate(archipelago, playerFiles, args.seed, True)
+        finally:
+            shutil.rmtree(playerFiles, ignore_errors=True)
+
+        identical = beforeSpoiler == afterSpoiler
+        failed = failed or not identical
+        print('%2d slot(s), seed %d: ruledefs %.2f s CPU, compiled %.2f s CPU (%.2fx), spoiler %s' % (
+            slots, args.seed, before, after, before / after if after else 0.0,
+            'identical' if identical else 'DIFFERENT'))
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,209 @@
+# Benchmark for CatalogGenerator.
+#
+# Delivers catalogs to synthetic avatars the way CatalogManagerAI.deliverCatalogFor
+# does: each avatar gets the monthly, weekly and back catalogs for a random week and
+# day, then the ones for the week after that.
+#
+# Pass --baseline with a git revision to also run the CatalogGenerator from that
+# revision. Older revisions pick items with the global random module, so it is
+# seeded with the same seed the current generator is given. Every catalog both
+# versions produce must be identical.
+#
+# Usage (from the repository root):
+#     python tools/benchmark_catalog_generator.py [--avatars 5000] [--seed 0] [--baseline <rev>]
+
+import argparse
+import builtins
+import os
+import random
+import sys
+import time
+import types
+
+import harness
+
+
+def setupGame():
+    harness.setupGame(startAI=False)
+
+    # CatalogGenerator reads its settings from the AI's config
+    from direct.showbase import DConfig
+    builtins.simbase = types.SimpleNamespace(config=DConfig)
+
+
+class SyntheticAvatar:
+    # Just enough of a DistributedToonAI for the catalog items to decide what to offer.
+
+    def __init__(self, doId, rng):
+        from toontown.catalog import CatalogItem
+        from toontown.catalog.CatalogItemList import CatalogItemList
+        from toontown.toon import ToonDNA
+
+        self.doId = doId
+        self.style = ToonDNA.ToonDNA()
+        self.style.newToonRandom(seed=rng.randrange(1, 2 ** 32), gender=rng.choice(('m', 'f')))
+        self.hat = self.glasses = self.backpack = self.shoes = (0, 0, 0)
+        self.hatList = []
+        self.glassesList = []
+        self.backpackList = []
+        self.shoesList = []
+        self.clothesTopsList = []
+        self.clothesBottomsList = []
+        self.maxClothes = rng.choice((10, 15, 20, 25))
+        self.maxAccessories = rng.choice((0, 50))
+        self.maxBankMoney = rng.choice((1000, 2500, 5000, 7500, 10000))
+        self.fishingRod = rng.randint(0, 4)
+        self.customMessages = rng.sample(range(100, 200), 5)
+        self.emoteAccess = [rng.randint(0, 1) for _ in range(30)]
+        self.petTrickPhrases = []
+        self.gardenStarted = rng.choice((0, 1))
+        self.gardenSpecials = []
+        self.shovelSkill = rng.randint(0, 300)
+        self.nametagStyle = 0
+        self.houseId = 0
+        self.accountDays = 0
+        deliveryStore = CatalogItem.Customization | CatalogItem.DeliveryDate
+        self.onOrder = CatalogItemList(store=deliveryStore)
+        self.onGiftOrder = CatalogItemList(store=deliveryStore)
+        self.mailboxContents = CatalogItemList(store=CatalogItem.Customization)
+        self.awardMailboxContents = CatalogItemList(store=CatalogItem.Customization)
+        self.onAwardOrder = CatalogItemList(store=deliveryStore)
+        self.monthlyCatalog = CatalogItemList()
+        self.weeklyCatalog = CatalogItemList()
+        self.backCatalog = CatalogItemList()
+
+    def getStyle(self):
+        return self.style
+
+    def getHat(self):
+        return self.hat
+
+    def getGlasses(self):
+        return self.glasses
+
+    def getBackpack(self):
+        return self.backpack
+
+    def getShoes(self):
+        return self.shoes
+
+    def getHatList(self):
+        return self.hatList
+
+    def getGlassesList(self):
+        return self.glassesList
+
+    def getBackpackList(self):
+        return self.backpackList
+
+    def getShoesList(self):
+        return self.shoesList
+
+    def getClothesTopsList(self):
+        return self.clothesTopsList
+
+    def getClothesBottomsList(self):
+        return self.clothesBottomsList
+
+    def getMaxClothes(self):
+        return self.maxClothes
+
+    def getMaxAccessories(self):
+        return self.maxAccessories
+
+    def getMaxBankMoney(self):
+        return self.maxBankMoney
+
+    def getFishingRod(self):
+        return self.fishingRod
+
+    def getGardenStarted(self):
+        return self.gardenStarted
+
+    def getGardenSpecials(self):
+        return self.gardenSpecials
+
+    def getBoxCapability(self):
+        return 0
+
+    def getAccountDays(self):
+        return self.accountDays
+
+    def isClosetFull(self, extraClothes=0):
+        return 0
+
+    def isTrunkFull(self, extraAccessories=0):
+        return 0
+
+    def setCatalog(self, monthlyCatalog, weeklyCatalog, backCatalog):
+        from toontown.catalog.CatalogItemList import CatalogItemList
+        self.monthlyCatalog = CatalogItemList(monthlyCatalog)
+        self.weeklyCatalog = CatalogItemList(weeklyCatalog)
+        self.backCatalog = CatalogItemList(backCatalog)
+
+
+def makeDeliveries(numAvatars, rng):
+    from toontown.catalog import CatalogGenerator
+
+    # Spread the deliveries over a few years, so plenty of different days come up
+    start = time.mktime((2024, 1, 1, 12, 0, 0, 0, 0, -1))
+    deliveries = []
+    for doId in range(numAvatars):
+        week = rng.randint(1, len(CatalogGenerator.WeeklySchedule) + 5)
+        deliveryTime = start + rng.randrange(3 * 365) * 86400
+        deliveries.append((100000000 + doId, rng.randrange(2 ** 32), week, deliveryTime))
+
+    return deliveries
+
+
+def deliverCatalogs(CatalogGenerator, deliveries, seed, seedGlobalRandom):
+    if seedGlobalRandom:
+        random.seed(seed)
+        generator = CatalogGenerator()
+    else:
+        generator = CatalogGenerator(seed=seed)
+
+    catalogs = []
+    elapsed = 0.0
+    for doId, avatarSeed, week, deliveryTime in deliveries:
+        avatar = SyntheticAvatar(doId, random.Random(avatarSeed))
+        previousWeek = week - 1
+        for currentWeek in (week, week + 1):
+            weekStart = (deliveryTime + (currentWeek - week) * 604800) / 60
+            start = time.process_time()
+            monthlyCatalog = generator.generateMonthlyCatalog(avatar, weekStart)
+            weeklyCatalog = generator.generateWeeklyCatalog(avatar, currentWeek, monthlyCatalog)
+            backCatalog = generator.generateBackCatalog(avatar, currentWeek, previousWeek, weeklyCatalog)
+            elapsed += time.process_time() - start
+            avatar.setCatalog(monthlyCatalog, weeklyCatalog, backCatalog)
+            catalogs.append((monthlyCatalog.getBlob(), weeklyCatalog.getBlob(), backCatalog.getBlob()))
+            previousWeek = currentWeek
+
+    return elapsed, catalogs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CatalogGenerator.')
+    parser.add_argument('--avatars', type=int, default=5000, help='Number of synthetic avatars.')
+    parser.add_argument('--baseline', help='Git revision of CatalogGenerator to compare against.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    setupGame()
+    from toontown.catalog.CatalogGenerator import CatalogGenerator
+
+    deliveries = makeDeliveries(args.avatars, random.Random(args.seed))
+    current, currentCatalogs = deliverCatalogs(CatalogGenerator, deliveries, args.seed, False)
+    print('%d avatars, current:  %.3f s CPU' % (args.avatars, current))
+    if args.baseline:
+        BaselineCatalogGenerator = harness.loadBaseline(args.baseline, 'toontown/catalog/CatalogGenerator.py').CatalogGenerator
+        baseline, baselineCatalogs = deliverCatalogs(BaselineCatalogGenerator, deliveries, args.seed, True)
+        print('%d avatars, baseline: %.3f s CPU (%.2fx)' % (args.avatars, baseline, baseline / current if current else 0.0))
+        if baselineCatalogs != currentCatalogs:
+            raise SystemExit('The catalogs generated by the baseline and current CatalogGenerator differ!')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+# Microbenchmark for CatalogItemList.
+#
+# Builds synthetic toons with 200 item back catalogs and delivery queues, then runs
+# what the AI does with them: loading the fields, checking the next delivery date,
+# extracting delivered items and re-encoding what is left, and ordering new items.
+#
+# Pass --baseline with a git revision to also run the CatalogItemList from that
+# revision. Every blob both versions produce must be identical.
+#
+# Usage (from the repository root):
+#     python tools/benchmark_catalog_item_list.py [--toons 1000] [--items 200] [--baseline <rev>]
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import harness
+
+
+def getItemPool():
+    from toontown.catalog import CatalogGenerator
+    from toontown.catalog.CatalogItem import CatalogItem
+
+    pool = []
+
+    def collect(entry):
+        if isinstance(entry, CatalogItem):
+            pool.append(entry)
+        elif isinstance(entry, (tuple, list)):
+            for subEntry in entry:
+                collect(subEntry)
+
+    collect(CatalogGenerator.MonthlySchedule)
+    collect(CatalogGenerator.WeeklySchedule)
+    return [item for item in pool if canRoundTrip(item)]
+
+
+# Some schedule entries are templates (e.g. furniture without a color picked yet) that can't be stored as they are.
+def canRoundTrip(item):
+    from toontown.catalog import CatalogItem
+    from toontown.catalog.CatalogInvalidItem import CatalogInvalidItem
+    from direct.distributed.PyDatagram import PyDatagram
+    from direct.distributed.PyDatagramIterator import PyDatagramIterator
+
+    store = CatalogItem.Customization | CatalogItem.DeliveryDate
+    item.deliveryDate = 0
+    try:
+        dg = PyDatagram()
+        CatalogItem.encodeCatalogItem(dg, item, store)
+    except Exception:
+        return False
+    finally:
+        item.deliveryDate = None
+
+    di = PyDatagramIterator(dg)
+    return not isinstance(CatalogItem.decodeCatalogItem(di, CatalogItem.CatalogItemVersion, store), CatalogInvalidItem) \
+        and di.getRemainingSize() == 0
+
+
+def copyOrder(item, rng):
+    from toontown.catalog import CatalogItem
+    from toontown.catalog.CatalogItemList import CatalogItemList
+
+    # Round trip the item so each order is its own copy
+    item = CatalogItemList(CatalogItemList([item], store=CatalogItem.Customization).getBlob(),
+                           store=CatalogItem.Customization)[0]
+    item.deliveryDate = rng.randint(1000, 2000)
+    return item
+
+
+def makeToons(numToons, numItems, rng):
+    from toontown.catalog import CatalogItem
+    from toontown.catalog.CatalogItemList import CatalogItemList
+
+    pool = getItemPool()
+    deliveryStore = CatalogItem.Customization | CatalogItem.DeliveryDate
+    toons = []
+    for _ in range(numToons):
+        backCatalog = CatalogItemList(rng.sample(pool, min(numItems, len(pool))), store=CatalogItem.Customization)
+        onOrder = CatalogItemList([copyOrder(item, rng) for item in rng.sample(pool, 20)], store=deliveryStore)
+        toons.append((backCatalog.getBlob(), onOrder.getBlob(), copyOrder(rng.choice(pool), rng)))
+
+    return toons
+
+
+def runWorkload(CatalogItemList, toons, now):
+    from toontown.catalog import CatalogItem
+
+    deliveryStore = CatalogItem.Customization | CatalogItem.DeliveryDate
+    blobs = []
+    start = time.process_time()
+    for backCatalogBlob, onOrderBlob, newItem in toons:
+        # The toon's fields are set from the database
+        backCatalog = CatalogItemList(backCatalogBlob, store=CatalogItem.Customization)
+        onOrder = CatalogItemList(onOrderBlob, store=deliveryStore)
+        len(backCatalog)
+
+        # Checking on and delivering their orders
+        nextTime = onOrder.getNextDeliveryDate()
+        delivered, remaining = onOrder.extractDeliveryItems(now)
+        blobs.append(remaining.getBlob())
+        blobs.append(delivered.getBlob())
+
+        # Ordering something new, then re-encoding the queue
+        remaining.append(newItem)
+        remaining.getNextDeliveryDate()
+        blobs.append(remaining.getBlob())
+        blobs.append(backCatalog.getBlob())
+        blobs.append(nextTime)
+
+    return time.process_time() - start, blobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CatalogItemList.')
+    parser.add_argument('--toons', type=int, default=1000, help='Number of synthetic toons.')
+    parser.add_argument('--items', type=int, default=200, help='Number of items in each back catalog.')
+    parser.add_argument('--baseline', help='Git revision of CatalogItemList to compare against.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(startAI=False)
+    from toontown.catalog.CatalogItemList import CatalogItemList
+
+    rng = random.Random(args.seed)
+    toons = makeToons(args.toons, args.items, rng)
+    # A second pass over the same toons shows the interned blob layouts at work
+    for label in ('first pass', 'second pass'):
+        current, currentBlobs = runWorkload(CatalogItemList, toons, 1500)
+        print('%-12s current:  %.3f s CPU' % (label, current))
+        if args.baseline:
+            BaselineCatalogItemList = harness.loadBaseline(args.baseline, 'toontown/catalog/CatalogItemList.py').CatalogItemList
+            baseline, baselineBlobs = runWorkload(BaselineCatalogItemList, toons, 1500)
+            print('%-12s baseline: %.3f s CPU (%.2fx)' % (label, baseline, baseline / current if current else 0.0))
+            if baselineBlobs != currentBlobs:
+                raise SystemExit('The blobs produced by the baseline and current CatalogItemList differ!')
+
+
+if __name__ == '__main__':
+    main()
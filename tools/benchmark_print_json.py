@@ -0,0 +1,207 @@
+# Measure the CPU cost of handing PrintJSON packets to many toons in the same Archipelago room.
+#
+# Every toon's client receives its own copy of each PrintJSON packet. This replays a session for a number of
+# toons connected to the same room and compares formatting each copy separately (how it was done before the
+# shared cache) against the shared per-room cache used by PrintJSONPacket now. Both paths have to produce the
+# exact same text for every toon, the benchmark fails if they don't. A client that hasn't loaded its data
+# packages yet must not hand its unknown names to the others either.
+#
+# A session can be recorded by enabling the packet dump in ArchipelagoClient, which writes every PrintJSON
+# packet it receives to output/PrintJSON. Without a recording, a session of generated messages is replayed.
+#
+# Usage (from the repository root):
+#     python tools/benchmark_print_json.py [--toons 50] [--messages 10000] [--session output/PrintJSON]
+
+import argparse
+import glob
+import json
+import os
+import random
+import sys
+import time
+from copy import deepcopy
+
+
+ITEM_FLAGS = (0b000, 0b001, 0b010, 0b100)
+MESSAGE_TYPES = ('ItemSend', 'ItemSend', 'ItemSend', 'Hint', 'Chat', 'Join')
+
+
+class BenchmarkSlot:
+
+    def __init__(self, name):
+        self.name = name
+
+
+class BenchmarkToon:
+
+    def __init__(self):
+        self.messages = []
+
+    def queueArchipelagoMessage(self, message, relevant=True):
+        self.messages.append(message)
+
+
+# Stands in for an ArchipelagoClient that has finished connecting to a room.
+# All clients in a room share the same names, just like clients that loaded the same data packages.
+class BenchmarkClient:
+
+    def __init__(self, slot, slotNames, items, locations, seedName):
+        from toontown.archipelago.util.data_package import DataPackage
+
+        self.slot = slot
+        self.slot_name = slotNames[slot]
+        self.team = 0
+        self.seed_name = seedName
+        self.av = BenchmarkToon()
+        self._slots = {slotId: BenchmarkSlot(name) for slotId, name in slotNames.items()}
+        self.global_data_package = DataPackage()
+        self.global_data_package.id_to_item_name = items
+        self.global_data_package.id_to_location_name = locations
+
+    def get_slot_info(self, slot):
+        return self._slots[int(slot)]
+
+    def get_item_name(self, itemId):
+        return self.global_data_package.get_item_from_id(itemId)
+
+    def get_location_name(self, locationId):
+        return self.global_data_package.get_location_from_id(locationId)
+
+
+def generateSession(numMessages, numSlots, rng):
+    session = []
+    for _ in range(numMessages):
+        messageType = rng.choice(MESSAGE_TYPES)
+        sender = rng.randint(1, numSlots)
+        receiver = rng.randint(1, numSlots)
+        item = {'item': rng.randint(1, 500), 'location': rng.randint(1, 2000), 'player': sender, 'flags': rng.choice(ITEM_FLAGS)}
+        if messageType == 'ItemSend':
+            data = [{'type': 'player_id', 'text': str(sender)}, {'text': ' sent '},
+                    {'type': 'item_id', 'text': str(item['item']), 'player': receiver, 'flags': item['flags']},
+                    {'text': ' to '}, {'type': 'player_id', 'text': str(receiver)}, {'text': ' ('},
+                    {'type': 'location_id', 'text': str(item['location']), 'player': sender}, {'text': ')'}]
+        elif messageType == 'Hint':
+            data = [{'text': '[Hint]: '}, {'type': 'player_id', 'text': str(receiver)}, {'text': "'s "},
+                    {'type': 'item_id', 'text': str(item['item']), 'player': receiver, 'flags': item['flags']},
+                    {'text': ' is at '}, {'type': 'location_id', 'text': str(item['location']), 'player': sender},
+                    {'text': ' in '}, {'type': 'player_id', 'text': str(sender)}, {'text': "'s World"}]
+        elif messageType == 'Chat':
+            data = [{'text': f'Player{sender}: hello from slot {sender}'}]
+        else:
+            data = [{'text': f'Player{sender} (Team #1) playing Toontown has joined. Client(0.4.4), [\'AP\'].'}]
+
+        session.append({'cmd': 'PrintJSON', 'type': messageType, 'receiving': receiver, 'item': item, 'data': data})
+
+    return session
+
+
+def loadSession(path, numMessages):
+    packets = []
+    for filename in sorted(glob.glob(os.path.join(path, '*.json'))):
+        with open(filename) as f:
+            packets.append(json.load(f))
+
+    if not packets:
+        raise SystemExit(f'No recorded PrintJSON packets found in {path}')
+
+    # Loop the recording until we have enough messages
+    return [packets[i % len(packets)] for i in range(numMessages)]
+
+
+# How every client formatted PrintJSON packets on its own before they were shared
+def handleUncached(packet, client):
+    from toontown.archipelago.util import global_text_properties
+    from toontown.archipelago.util.net_utils import JSONPartFormatter
+
+    parser = JSONPartFormatter(deepcopy(packet.data), client)
+    ret = ''
+    for part in parser.get_formatted_parts():
+        p3dcolor = global_text_properties.get_property_code_from_json_code(part['color'])
+        ret += f"\1{p3dcolor}\1{part['text']}\2"
+
+    client.av.queueArchipelagoMessage(ret, relevant=packet.is_relevant_to(client.slot))
+
+
+def replay(session, clients, handler):
+    from toontown.archipelago.packets.clientbound.print_json_packet import PrintJSONPacket
+
+    start = time.process_time()
+    for message in session:
+        # The AP server sends every client its own copy of the packet
+        for client in clients:
+            handler(PrintJSONPacket(json.loads(message)), client)
+
+    return time.process_time() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark PrintJSON formatting for many toons in one room.')
+    parser.add_argument('--toons', type=int, default=50, help='Number of toons connected to the room.')
+    parser.add_argument('--messages', type=int, default=10000, help='Number of messages to replay.')
+    parser.add_argument('--session', help='Directory of recorded PrintJSON packets to replay.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed used to generate a session.')
+    args = parser.parse_args()
+
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    sys.path.insert(0, os.getcwd())
+    from toontown.archipelago.util.print_json_cache import print_json_cache
+
+    rng = random.Random(args.seed)
+    if args.session:
+        session = loadSession(args.session, args.messages)
+    else:
+        session = generateSession(args.messages, args.toons, rng)
+
+    # Names for every slot, item and location that could show up in the session
+    slotIds, itemIds, locationIds = set(range(1, args.toons + 1)), set(), set()
+    for packet in session:
+        for part in packet['data']:
+            partType = part.get('type')
+            if partType == 'player_id':
+                slotIds.add(int(part['text']))
+            elif partType == 'item_id':
+                itemIds.add(int(part['text']))
+            elif partType == 'location_id':
+                locationIds.add(int(part['text']))
+
+    slotNames = {slotId: f'Player{slotId}' for slotId in slotIds}
+    items = {itemId: f'Item #{itemId}' for itemId in itemIds}
+    locations = {locationId: f'Location #{locationId}' for locationId in locationIds}
+    rawSession = [json.dumps(packet) for packet in session]
+
+    def makeClients():
+        return [BenchmarkClient(slot, slotNames, items, locations, 'benchmark-seed') for slot in range(1, args.toons + 1)]
+
+    uncachedClients = makeClients()
+    uncached = replay(rawSession, uncachedClients, handleUncached)
+
+    print_json_cache.clear()
+    cachedClients = makeClients()
+    cached = replay(rawSession, cachedClients, lambda packet, client: packet.handle(client))
+
+    for before, after in zip(uncachedClients, cachedClients):
+        if before.av.messages != after.av.messages:
+            raise SystemExit(f'Slot {before.slot} received different messages with the shared cache!')
+
+    # The first client of the room to see each message has no item or location names yet
+    hits, misses = print_json_cache.hits, print_json_cache.misses
+    print_json_cache.clear()
+    loadingClients = makeClients()
+    loadingClients[0].global_data_package.id_to_item_name = {}
+    loadingClients[0].global_data_package.id_to_location_name = {}
+    replay(rawSession, loadingClients, lambda packet, client: packet.handle(client))
+    for before, after in zip(uncachedClients[1:], loadingClients[1:]):
+        if before.av.messages != after.av.messages:
+            raise SystemExit(f'Slot {before.slot} was given names from a client that had not loaded them yet!')
+
+    total = len(rawSession) * args.toons
+    print(f'{args.toons} toons, {len(rawSession)} messages ({total} packets handled)')
+    print(f'  per client formatting: {uncached:.3f} s CPU ({uncached / total * 1e6:.1f} us per packet)')
+    print(f'  shared room cache:     {cached:.3f} s CPU ({cached / total * 1e6:.1f} us per packet)')
+    print(f'  cache hits: {hits}, misses: {misses}')
+    if cached:
+        print(f'  speedup: {uncached / cached:.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,298 @@
+# Count what the AI sends to the message director during a 4 toon battle, with and without the send buffer.
+#
+# The battle is a synthesized trace of the field updates DistributedBattleBaseAI and the toons send
+# for a 3 round battle against 4 cogs, frame by frame: joining, choosing gags, the
+# movies, an NPC gag restock, the rewards and the battle being deleted. The suits need
+# the game's Panda3D fork to be created, so the trace is built from the battle code
+# instead of being captured from a live battle.
+#
+# Every update is formatted with the real dc file and written to a fake message director
+# socket that counts datagrams and bytes. With the send buffer on, each frame's
+# datagrams must come out once the task manager has stepped, in the same order, minus
+# the stored field updates that were replaced later in that frame.
+#
+# Then a toon's inventory is updated, its hp, and its inventory again, in one frame. The hp
+# update is not mergeable, so both inventory updates must be sent, on either side of it.
+#
+# Usage (from the repository root):
+#     python tools/check_ai_send_buffer.py [--battles 100]
+
+import argparse
+import os
+import sys
+
+import harness
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+    # Sends datagrams the same way ToontownAIRepository does, to a FakeMessageDirector.
+
+    def __init__(self, messageDirector, sendBuffer=None):
+        harness.FakeAIRepository.__init__(self, messageDirector)
+        self.sendBuffer = sendBuffer
+
+    def send(self, datagram):
+        if self.sendBuffer is not None:
+            self.sendBuffer.add(datagram)
+        else:
+            self.sendImmediate(datagram)
+
+    def sendImmediate(self, datagram):
+        self.messageDirector.sendDatagram(datagram)
+
+    def sendUpdateToChannel(self, do, channelId, fieldName, args):
+        field = do.dclass.getFieldByName(fieldName)
+        datagram = field.aiFormatUpdate(do.doId, channelId, self.ourChannel, args)
+        if self.sendBuffer is None:
+            self.send(datagram)
+            return
+
+        self.sendBuffer.addUpdate(do.doId, channelId, field, datagram)
+
+
+class FakeObject:
+
+    def __init__(self, dcFile, dclassName, doId):
+        self.dclass = dcFile.getClassByName(dclassName)
+        self.doId = doId
+
+
+def inventory(seed):
+    # 7 tracks of 7 gag levels
+    return bytes((seed + i) % 10 for i in range(49))
+
+
+def buildBattleTrace(dcFile, battleNumber):
+    # Each frame is a list of (object, channel or None for the object itself, field name, args), or
+    # (object, None, None, None) for the object being deleted.
+    doIdBase = 100000000 + battleNumber * 100
+    battle = FakeObject(dcFile, 'DistributedBattle', doIdBase)
+    toons = [FakeObject(dcFile, 'DistributedToon', doIdBase + 1 + i) for i in range(4)]
+    suits = [FakeObject(dcFile, 'DistributedSuit', doIdBase + 11 + i) for i in range(4)]
+    toonIds = [toon.doId for toon in toons]
+    suitIds = [suit.doId for suit in suits]
+
+    def members(activeSuits, activeToons):
+        return [suitIds, '', '', activeSuits, '', '', toonIds, '', '', activeToons, '', '', 0]
+
+    def chosenAttacks(tracks, levels, targets):
+        return [toonIds, tracks, levels, targets]
+
+    def movie(tracks, levels):
+        toonAttacks = [[i, tracks[i], levels[i], 0, [12, 0, 0, 0], 0, 0, [0, 0, 0, 0], 0, 0] for i in range(4)]
+        suitAttacks = [[i, 3, i, [0, 4, 0, 0], 0, 0, 0] for i in range(4)]
+        return [[1, toonIds, suitIds, toonAttacks, suitAttacks, []]]
+
+    frames = []
+    # Toon 0 runs into a cog and the other 3 join
+    frames.append([(toons[0], None, 'setBattleId', [battle.doId]),
+                   (battle, None, 'setMembers', members('0', '0')),
+                   (battle, None, 'setState', ['FaceOff', 0])])
+    for i in range(1, 4):
+        frames.append([(toons[i], None, 'setBattleId', [battle.doId]),
+                       (battle, None, 'setMembers', members('0123'[:i + 1], '0123'[:i + 1]))])
+    frames.append([(battle, None, 'setMembers', members('0123', '0123')),
+                   (battle, None, 'setState', ['WaitForInput', 0])])
+
+    for roundIndex in range(3):
+        restock = roundIndex == 1
+        tracks = [9 if restock else 4, 4, 5, 3]
+        levels = [0, roundIndex + 2, roundIndex + 1, roundIndex]
+        # Each toon picks a gag in their own frame
+        for i in range(4):
+            frames.append([(battle, None, 'setChosenToonAttacks', chosenAttacks(tracks[:i + 1] + [-1] * (3 - i),
+                                                                                levels[:i + 1] + [-1] * (3 - i),
+                                                                                [0] * 4))])
+
+        frames.append([(battle, None, 'setMovie', movie(tracks, levels)),
+                       (battle, None, 'setState', ['PlayMovie', 0])])
+
+        # __movieDone: gags are used up, the NPC restocks everyone, then the damage is dealt
+        frame = []
+        if restock:
+            frame.append((toons[0], None, 'setNPCFriendsDict', [[[2001, 2]]]))
+            for i, toon in enumerate(toons):
+                frame.append((toon, None, 'setInventory', [inventory(roundIndex * 10 + i)]))
+
+        for i, toon in enumerate(toons):
+            if tracks[i] != 9:
+                frame.append((toon, None, 'setInventory', [inventory(roundIndex * 10 + i + 5)]))
+
+        for i, suit in enumerate(suits):
+            frame.append((suit, None, 'setHP', [max(0, 60 - (roundIndex + 1) * 20 - i)]))
+        for i, toon in enumerate(toons):
+            frame.append((toon, None, 'setHp', [60 - roundIndex * 4 - i]))
+            frame.append((toon, None, 'setEarnedExperience', [[roundIndex * 10, 0, 0, roundIndex * 5, 0, 0, 0]]))
+
+        frame.append((battle, None, 'setMembers', members('0123', '0123')))
+        frame.append((battle, None, 'setChosenToonAttacks', chosenAttacks([], [], [])))
+        frame.append((battle, None, 'setState', ['WaitForInput' if roundIndex < 2 else 'Reward', 0]))
+        frames.append(frame)
+
+    # The rewards, then the battle lets go of everyone and is deleted
+    frame = [(battle, None, 'setBattleExperience',
+              [value for toonId in toonIds for value in (toonId, [0] * 7, [30] * 7, [], [], [], [], [], [])]
+              + [[], []])]
+    for i, toon in enumerate(toons):
+        frame.append((toon, None, 'setExperience', [[100 + i] * 7]))
+        frame.append((toon, None, 'setInventory', [inventory(50 + i)]))
+        frame.append((toon, None, 'setCogStatus', [[1] * 32]))
+        frame.append((toon, None, 'setCogCount', [[2] * 32]))
+
+    frames.append(frame)
+    frame = [(battle, None, 'setMembers', members('', '')), (battle, None, 'setState', ['Resume', 0])]
+    for i, toon in enumerate(toons):
+        frame.append((toon, None, 'setBattleId', [0]))
+        frame.append((toon, None, 'setHp', [50 - i]))
+        frame.append((toon, None, 'setInventory', [inventory(50 + i)]))
+        frame.append((toon, None, 'setCogStatus', [[2] * 32]))
+
+    frame.append((battle, None, None, None))
+    frames.append(frame)
+    return frames
+
+
+def sendFrame(air, frame):
+    from direct.distributed.MsgTypes import STATESERVER_OBJECT_DELETE_RAM
+    from direct.distributed.PyDatagram import PyDatagram
+
+    for do, channelId, fieldName, args in frame:
+        if fieldName is None:
+            dg = PyDatagram()
+            dg.addServerHeader(do.doId, air.ourChannel, STATESERVER_OBJECT_DELETE_RAM)
+            dg.addUint32(do.doId)
+            air.send(dg)
+        elif channelId is None:
+            air.sendUpdate(do, fieldName, args)
+        else:
+            air.sendUpdateToChannel(do, channelId, fieldName, args)
+
+
+def getExpectedFrame(frame, datagrams):
+    # Works out what the send buffer should send for a frame, the slow way: a stored field update is
+    # dropped when the same one is sent again later in the frame, with no other datagram or update
+    # of the same object in between.
+    from toontown.util.astron.AstronSendBuffer import AstronSendBuffer
+
+    expected = []
+    for index, (do, channelId, fieldName, args) in enumerate(frame):
+        if fieldName is not None:
+            field = do.dclass.getFieldByName(fieldName)
+            if AstronSendBuffer.isMergeable(field):
+                key = (do.doId, channelId, fieldName)
+                replaced = False
+                for laterDo, laterChannelId, laterFieldName, _ in frame[index + 1:]:
+                    if laterFieldName is None:
+                        break
+                    if (laterDo.doId, laterChannelId, laterFieldName) == key:
+                        replaced = True
+                        break
+                    if laterDo.doId == do.doId and not AstronSendBuffer.isMergeable(
+                            laterDo.dclass.getFieldByName(laterFieldName)):
+                        break
+
+                if replaced:
+                    continue
+
+        expected.append(datagrams[index])
+
+    return expected
+
+
+def runBattles(dcFile, numBattles, useBuffer, merge):
+    from toontown.util.astron.AstronSendBuffer import AstronSendBuffer
+
+    messageDirector = harness.FakeMessageDirector()
+    sendBuffer = None
+    if useBuffer:
+        sendBuffer = AstronSendBuffer(messageDirector.sendDatagram, merge=merge)
+        sendBuffer.start('checkFlushSendBuffer')
+
+    air = FakeAIRepository(messageDirector, sendBuffer)
+    frames = 0
+    for battleNumber in range(numBattles):
+        for frame in buildBattleTrace(dcFile, battleNumber):
+            sent = len(messageDirector.datagrams)
+            sendFrame(air, frame)
+            if useBuffer:
+                if len(messageDirector.datagrams) != sent:
+                    raise SystemExit('The send buffer sent something before the end of the frame!')
+
+                taskMgr.step()
+                if len(sendBuffer):
+                    raise SystemExit('The send buffer was not flushed at the end of the frame!')
+
+            frames += 1
+
+    if sendBuffer is not None:
+        sendBuffer.stop()
+
+    return messageDirector, frames
+
+
+def checkUpdateInBetween(dcFile):
+    from toontown.util.astron.AstronSendBuffer import AstronSendBuffer
+
+    toon = FakeObject(dcFile, 'DistributedToon', 100000001)
+    otherToon = FakeObject(dcFile, 'DistributedToon', 100000002)
+    if AstronSendBuffer.isMergeable(toon.dclass.getFieldByName('setHp')):
+        raise SystemExit('setHp is mergeable, pick another field to update in between!')
+
+    frame = [(toon, None, 'setInventory', [inventory(1)]),
+             (otherToon, None, 'setInventory', [inventory(2)]),
+             (toon, None, 'setHp', [10]),
+             (toon, None, 'setInventory', [inventory(3)]),
+             (otherToon, None, 'setInventory', [inventory(4)])]
+    unbuffered = harness.FakeMessageDirector()
+    sendFrame(FakeAIRepository(unbuffered), frame)
+    messageDirector = harness.FakeMessageDirector()
+    sendBuffer = AstronSendBuffer(messageDirector.sendDatagram)
+    sendFrame(FakeAIRepository(messageDirector, sendBuffer), frame)
+    sendBuffer.flush()
+    # Only the other toon's first inventory update can go
+    if messageDirector.datagrams != unbuffered.datagrams[:1] + unbuffered.datagrams[2:]:
+        raise SystemExit('An update was merged past another update of the same object!')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Count the datagrams a 4 toon battle sends, with and without the send buffer.')
+    parser.add_argument('--battles', type=int, default=100, help='Number of battles to run.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame()
+    from panda3d.core import Filename
+    from panda3d.direct import DCFile
+
+    dcFile = DCFile()
+    if not dcFile.read(Filename('astron/dclass/tto.dc')):
+        raise SystemExit('Could not read astron/dclass/tto.dc')
+
+    before, frames = runBattles(dcFile, args.battles, False, False)
+    unmerged, _ = runBattles(dcFile, args.battles, True, False)
+    after, _ = runBattles(dcFile, args.battles, True, True)
+    if unmerged.datagrams != before.datagrams:
+        raise SystemExit('Without merging, the send buffer must send exactly what was sent without it!')
+
+    # Check every frame on its own against what merging should have left of it
+    expected = []
+    for battleNumber in range(args.battles):
+        for frame in buildBattleTrace(dcFile, battleNumber):
+            messageDirector = harness.FakeMessageDirector()
+            sendFrame(FakeAIRepository(messageDirector), frame)
+            expected.extend(getExpectedFrame(frame, messageDirector.datagrams))
+
+    if after.datagrams != expected:
+        raise SystemExit('The send buffer did not send the updates it should have, in the order they were made!')
+
+    checkUpdateInBetween(dcFile)
+    print('%d battles, %d frames.' % (args.battles, frames))
+    print('Before: %6d datagrams, %8d bytes' % (len(before.datagrams), before.getNumBytes()))
+    print('After:  %6d datagrams, %8d bytes (%d fewer datagrams, %d fewer bytes)' % (
+        len(after.datagrams), after.getNumBytes(), len(before.datagrams) - len(after.datagrams),
+        before.getNumBytes() - after.getNumBytes()))
+
+
+if __name__ == '__main__':
+    main()
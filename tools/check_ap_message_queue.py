@@ -0,0 +1,253 @@
+# Load test the per toon Archipelago message queue with a stream of PrintJSON packets.
+#
+# --toons toons are connected to the same room, each with its own DistributedToonAPMessageQueue.
+# A PrintJSON session (recorded with the packet dump in ArchipelagoClient, or generated like
+# benchmark_print_json.py does) is replayed to every toon's client at --rate packets a frame,
+# the way the AP client's packet event hands them to the main thread. Every other toon filters
+# to its own items with '!filter mine'. Meanwhile a second thread queues status lines for every
+# toon with d_sendArchipelagoMessage, like the AP socket thread does while it connects and
+# reconnects. The task manager runs on a slaved clock at 30 frames a second.
+#
+# Every status line must reach its toon exactly once and in order, and no toon may be sent
+# more than one update a frame. Without a rate limit, every PrintJSON line a toon doesn't
+# filter out must reach it, repeated lines being counted from their '(xN)'. With the default
+# rate limit, no toon may get more PrintJSON lines in a window than the limit, and every line
+# must be either sent or counted in a summary. '!filter' followed by anything other than a
+# space must not be taken for the command.
+#
+# Usage (from the repository root):
+#     python tools/check_ap_message_queue.py [--toons 50] [--messages 3000] [--rate 10] [--session output/PrintJSON]
+
+import argparse
+import collections
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+
+import harness
+
+FrameTime = 1.0 / 30
+StatusLinesPerToon = 200
+RepeatedLine = re.compile(r'^(.*) \(x(\d+)\)$')
+Summary = re.compile(r'^(\d+) Archipelago message\(s\) were skipped')
+
+
+class QueueToon:
+    # What DistributedToonAPMessageQueue needs of a DistributedToonAI. Keeps every update the queue sends,
+    # and every line it was asked to queue.
+
+    def __init__(self, slot, rateLimitMessages):
+        from toontown.archipelago.apclient.distributed_toon_apmessage_queue import APMessageFilter, \
+            DistributedToonAPMessageQueue
+
+        self.doId = 100000000 + slot
+        self.apMessageQueue = DistributedToonAPMessageQueue(self, rateLimitMessages=rateLimitMessages)
+        if slot % 2:
+            self.apMessageQueue.setMessageFilter(APMessageFilter.MINE)
+        self.queued = []  # PrintJSON lines that passed the filter
+        self.statusLines = []
+        self.updates = []  # (frame time, start of the rate limit window, messages)
+
+    def uniqueName(self, name):
+        return '%s-%d' % (name, self.doId)
+
+    def queueArchipelagoMessage(self, message, relevant=True):
+        from toontown.archipelago.apclient.distributed_toon_apmessage_queue import APMessageFilter
+
+        if relevant or self.apMessageQueue.getMessageFilter() == APMessageFilter.ALL:
+            self.queued.append(message)
+        self.apMessageQueue.queue(message, relevant=relevant)
+
+    def d_sendArchipelagoMessage(self, message):
+        self.apMessageQueue.queue(message, important=True)
+
+    def d_sendArchipelagoMessages(self, messages):
+        if messages:
+            self.updates.append((globalClock.getFrameTime(), self.apMessageQueue._windowStart, messages))
+
+
+def sendStatusLines(toons, rng):
+    # Runs on its own thread, like ArchipelagoClient's socket thread
+    for i in range(StatusLinesPerToon):
+        for toon in toons:
+            line = '[AP Client Thread] status %d for %d' % (i, toon.doId)
+            toon.statusLines.append(line)
+            toon.d_sendArchipelagoMessage(line)
+        time.sleep(rng.uniform(0, 0.002))
+
+
+def runRoom(rawSession, makeClients, rate, rateLimitMessages, seed):
+    from toontown.archipelago.packets.clientbound.print_json_packet import PrintJSONPacket
+    from toontown.archipelago.util.print_json_cache import print_json_cache
+
+    print_json_cache.clear()
+    clients = makeClients()
+    toons = []
+    for client in clients:
+        client.av = QueueToon(client.slot, rateLimitMessages)
+        client.av.apMessageQueue.start()
+        toons.append(client.av)
+
+    statusThread = threading.Thread(target=sendStatusLines, args=(toons, random.Random(seed)))
+    statusThread.start()
+    start = globalClock.getFrameTime()
+    frame = 0
+    frameTime = 0.0
+    packets = list(rawSession)
+    while packets or statusThread.is_alive():
+        for raw in packets[:rate]:
+            # The AP server sends every client its own copy of the packet
+            for client in clients:
+                PrintJSONPacket(json.loads(raw)).handle(client)
+        del packets[:rate]
+
+        frame += 1
+        globalClock.setFrameTime(start + frame * FrameTime)
+        frameStart = time.perf_counter()
+        taskMgr.step()
+        frameTime += time.perf_counter() - frameStart
+
+    statusThread.join()
+    # Let the last rate limit window end, so its summary goes out
+    for i in range(int(toons[0].apMessageQueue.rateLimitWindow / FrameTime) + 2):
+        frame += 1
+        globalClock.setFrameTime(start + frame * FrameTime)
+        taskMgr.step()
+
+    for toon in toons:
+        toon.apMessageQueue.stop()
+
+    return toons, frame, frameTime
+
+
+def checkToon(toon, rateLimitMessages):
+    statusLines = set(toon.statusLines)
+    received = []
+    printJson = collections.Counter()
+    skipped = 0
+    windows = collections.Counter()
+    frameTimes = [frameTime for frameTime, windowStart, messages in toon.updates]
+    if len(frameTimes) != len(set(frameTimes)):
+        raise SystemExit('Toon %d was sent more than one update in a frame!' % toon.doId)
+
+    for frameTime, windowStart, messages in toon.updates:
+        for message in messages:
+            match = RepeatedLine.match(message)
+            line, count = (match.group(1), int(match.group(2))) if match else (message, 1)
+            summary = Summary.match(line)
+            if summary:
+                skipped += int(summary.group(1))
+            elif line in statusLines:
+                received.extend([line] * count)
+            else:
+                printJson[line] += count
+                windows[windowStart] += 1
+
+    if received != toon.statusLines:
+        raise SystemExit('Toon %d got %d of its %d status lines, or out of order!' % (
+            toon.doId, len(received), len(toon.statusLines)))
+
+    queued = collections.Counter(toon.queued)
+    if rateLimitMessages is None:
+        if printJson != queued:
+            raise SystemExit('Toon %d did not get the PrintJSON lines it was sent!' % toon.doId)
+        return sum(printJson.values()), 0
+
+    if printJson - queued:
+        raise SystemExit('Toon %d got PrintJSON lines it was never sent!' % toon.doId)
+
+    if windows and max(windows.values()) > rateLimitMessages:
+        raise SystemExit('Toon %d got %d PrintJSON lines in one window!' % (toon.doId, max(windows.values())))
+
+    # Lines are dropped after repeats were merged, so a skipped line may stand for a few of them
+    if queued - printJson and not skipped:
+        raise SystemExit('Toon %d lost PrintJSON lines without being told!' % toon.doId)
+
+    return sum(printJson.values()), skipped
+
+
+def checkFilterCommand():
+    from toontown.archipelago.apclient.ap_client_enums import APClientEnums
+    from toontown.archipelago.apclient.archipelago_session import ArchipelagoSession
+
+    class FakeSession:
+        def __init__(self):
+            self.filters = []
+            self.client = type('FakeClient', (), {'state': APClientEnums.DISCONNECTED})()
+
+        def handle_filter(self, option):
+            self.filters.append(option)
+
+    for message, expected in (('!filter mine', ['mine']), ('!filter  all ', ['all']), ('!filter', ['']),
+                              ('!filtermine', []), ('!filters', [])):
+        session = FakeSession()
+        ArchipelagoSession.handle_chat(session, message)
+        if session.filters != expected:
+            raise SystemExit('%r was taken as !filter %s!' % (message, session.filters))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the Archipelago message queue with PrintJSON packets.')
+    parser.add_argument('--toons', type=int, default=50, help='Number of toons connected to the room.')
+    parser.add_argument('--messages', type=int, default=3000, help='Number of PrintJSON packets to replay.')
+    parser.add_argument('--rate', type=int, default=10, help='PrintJSON packets a frame.')
+    parser.add_argument('--session', help='Directory of recorded PrintJSON packets to replay.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(headless=True)
+    from toontown.archipelago.apclient.distributed_toon_apmessage_queue import DEFAULT_RATE_LIMIT_MESSAGES
+    from tools.benchmark_print_json import BenchmarkClient, generateSession, loadSession
+
+    checkFilterCommand()
+
+    rng = random.Random(args.seed)
+    if args.session:
+        session = loadSession(args.session, args.messages)
+    else:
+        session = generateSession(args.messages, args.toons, rng)
+
+    slotIds, itemIds, locationIds = set(range(1, args.toons + 1)), set(), set()
+    for packet in session:
+        for part in packet['data']:
+            partType = part.get('type')
+            if partType == 'player_id':
+                slotIds.add(int(part['text']))
+            elif partType == 'item_id':
+                itemIds.add(int(part['text']))
+            elif partType == 'location_id':
+                locationIds.add(int(part['text']))
+
+    slotNames = {slotId: f'Player{slotId}' for slotId in slotIds}
+    items = {itemId: f'Item #{itemId}' for itemId in itemIds}
+    locations = {locationId: f'Location #{locationId}' for locationId in locationIds}
+    rawSession = [json.dumps(packet) for packet in session]
+
+    def makeClients():
+        return [BenchmarkClient(slot, slotNames, items, locations, 'load-test-seed') for slot in range(1, args.toons + 1)]
+
+    print('%d toons, %d PrintJSON packets at %d a frame, %d status lines a toon from another thread.' % (
+        args.toons, len(rawSession), args.rate, StatusLinesPerToon))
+    for name, rateLimitMessages in (('No rate limit', None), ('Rate limited', DEFAULT_RATE_LIMIT_MESSAGES)):
+        toons, numFrames, frameTime = runRoom(rawSession, makeClients, args.rate,
+                                              rateLimitMessages or 1 << 30, args.seed)
+        numLines = numSkipped = 0
+        for toon in toons:
+            lines, skipped = checkToon(toon, rateLimitMessages)
+            numLines += lines
+            numSkipped += skipped
+
+        numUpdates = sum(len(toon.updates) for toon in toons)
+        print('%-13s %d updates over %d frames (%.2f a toon a frame), %d PrintJSON lines delivered, %d skipped, '
+              '%.3f ms per frame' % (name, numUpdates, numFrames, numUpdates / numFrames / len(toons), numLines,
+                                     numSkipped, frameTime / numFrames * 1000))
+
+
+if __name__ == '__main__':
+    main()
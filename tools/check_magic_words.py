@@ -0,0 +1,160 @@
+# Check the Magic Word dispatch table against the old TTOffMagicWordManagerAI.
+#
+# Every registered alias is requested through both the current manager and the one
+# from a git revision, with arguments built from each word's declared arguments
+# (plus a few malformed ones). Both run against the same fake AI repository with
+# every word's handleWord recording its call instead of running, and the responses
+# and recorded calls must match.
+#
+# A word used on the entire server is then run on a few thousand toons to check
+# that it reaches every toon exactly once, a few toons per frame, and answers once.
+#
+# Usage (from the repository root):
+#     python tools/check_magic_words.py [--baseline HEAD~1] [--toons 2000]
+
+import argparse
+import builtins
+import os
+import sys
+
+import harness
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+    # Just enough of an AI repository for the manager, and for toons to be created.
+
+    def __init__(self):
+        harness.FakeAIRepository.__init__(self)
+        self.defaultAccessLevel = 'SYSTEM_ADMIN'
+
+    def addToon(self, doId, zoneId, accessLevel):
+        from toontown.toon.DistributedToonAI import DistributedToonAI
+
+        toon = DistributedToonAI(self)
+        toon.doId = doId
+        toon.zoneId = zoneId
+        toon.accessLevel = accessLevel
+        toon.setName('Toon %d' % doId)
+        self.doId2do[doId] = toon
+        return toon
+
+
+def makeManager(managerClass, air):
+    manager = managerClass(air)
+    manager.doId = 4000
+    manager.responses = []
+
+    def sendUpdateToAvatarId(avId, fieldName, args):
+        manager.responses.append((avId, fieldName, args))
+
+    manager.sendUpdateToAvatarId = sendUpdateToAvatarId
+    return manager
+
+
+def recordWords(calls):
+    # Swap every word's handleWord for one that only records what it was called with.
+    from toontown.spellbook import MagicWordIndex
+
+    def handleWord(self, invoker, avId, toon, *args):
+        calls.append((self.__class__.__name__, getattr(invoker, 'doId', None), avId, args))
+        return '%s ran on %s' % (self.__class__.__name__, avId)
+
+    for wordClass in MagicWordIndex.magicWordClasses.values():
+        wordClass.handleWord = handleWord
+
+
+def getArgumentStrings(wordInfo):
+    from toontown.spellbook.MagicWordConfig import ARGUMENT_TYPE
+
+    samples = {int: '3', float: '2.5', str: 'word', bool: '1'}
+    values = [samples.get(arg[ARGUMENT_TYPE], 'word') for arg in wordInfo['args']]
+    strings = ['', wordInfo['example'].strip(), 'word', '1 2 3 4 5 6 7 8', '  7  ', '1.5 x']
+    for count in range(1, len(values) + 1):
+        strings.append(' '.join(values[:count]))
+        strings.append(' '.join(values[:count]) + ' with extra words')
+
+    return strings
+
+
+def runRequest(manager, air, calls, invokerId, command, affectRange, affectType):
+    del manager.responses[:]
+    del calls[:]
+    air.senderAvId = invokerId
+    manager.requestExecuteMagicWord(affectRange, affectType, 0, 0, command)
+    while taskMgr.getTasksMatching('executeMagicWord-*'):
+        taskMgr.step()
+
+    return list(manager.responses), list(calls)
+
+
+def compareWords(BaselineManager, CurrentManager):
+    from toontown.spellbook import MagicWordIndex
+    from toontown.spellbook.MagicWordConfig import AFFECT_SINGLE, AFFECT_SINGULAR
+
+    air = FakeAIRepository()
+    builtins.simbase.air = air
+    invoker = air.addToon(1000001, 2000, 700)
+    calls = []
+    recordWords(calls)
+    baseline = makeManager(BaselineManager, air)
+    current = makeManager(CurrentManager, air)
+    requests = 0
+    for wordName, wordInfo in MagicWordIndex.magicWordIndex.items():
+        for args in getArgumentStrings(wordInfo):
+            command = ('%s %s' % (wordName, args)).rstrip()
+            expected = runRequest(baseline, air, calls, invoker.doId, command, AFFECT_SINGLE, AFFECT_SINGULAR)
+            result = runRequest(current, air, calls, invoker.doId, command, AFFECT_SINGLE, AFFECT_SINGULAR)
+            if result != expected:
+                raise SystemExit('~%s: expected %s, got %s' % (command, expected, result))
+            requests += 1
+
+    print('%d aliases, %d requests, all responses match.' % (len(MagicWordIndex.magicWordIndex), requests))
+
+
+def checkServerWideWord(CurrentManager, numToons):
+    from toontown.spellbook.MagicWordConfig import AFFECT_SERVER, AFFECT_SINGLE
+
+    air = FakeAIRepository()
+    builtins.simbase.air = air
+    invoker = air.addToon(1000001, 2000, 700)
+    for i in range(numToons):
+        air.addToon(2000000 + i, 2000 + i % 5, 100)
+
+    calls = []
+    recordWords(calls)
+    manager = makeManager(CurrentManager, air)
+    air.senderAvId = invoker.doId
+    manager.requestExecuteMagicWord(AFFECT_SINGLE, AFFECT_SERVER, 0, 0, 'hp 15')
+    frames = 0
+    while taskMgr.getTasksMatching('executeMagicWord-*'):
+        if len(calls) > (frames + 1) * manager.targetsPerFrame:
+            raise SystemExit('More than %d toons were handled in one frame!' % manager.targetsPerFrame)
+        taskMgr.step()
+        frames += 1
+
+    targets = sorted(call[2] for call in calls)
+    if targets != sorted(air.doId2do.keys()):
+        raise SystemExit('Not every toon was handled exactly once!')
+    if len(manager.responses) != 1 or manager.responses[0][2][0] != 'Success':
+        raise SystemExit('Expected one response, got %s' % manager.responses)
+
+    print('Server wide word ran on %d toons over %d frames, with one response.' % (len(targets), frames))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the Magic Word dispatch table.')
+    parser.add_argument('--baseline', default='HEAD~1', help='Git revision of TTOffMagicWordManagerAI to compare against.')
+    parser.add_argument('--toons', type=int, default=2000, help='Number of toons for the server wide word.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(startAI=False)
+    from toontown.spellbook.TTOffMagicWordManagerAI import TTOffMagicWordManagerAI
+
+    compareWords(harness.loadBaseline(args.baseline, 'toontown/spellbook/TTOffMagicWordManagerAI.py').TTOffMagicWordManagerAI, TTOffMagicWordManagerAI)
+    checkServerWideWord(TTOffMagicWordManagerAI, args.toons)
+
+
+if __name__ == '__main__':
+    main()
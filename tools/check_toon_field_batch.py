@@ -0,0 +1,164 @@
+# Count the datagrams DistributedToonAI.newToon sends, and check that a client ends up with the same toon.
+#
+# newToon resets every stat of a toon inside a field batch. It is run once on a real
+# DistributedToonAI as it is, and once on another calling the reset with no batch open,
+# the way it was done before field batches. Everything the toon sends is formatted with
+# the real dc file and kept.
+#
+# Each datagram is then turned into what the client agent forwards to the toon's owner:
+# STATESERVER_OBJECT_SET_FIELD as CLIENT_OBJECT_SET_FIELD, and STATESERVER_OBJECT_SET_FIELDS
+# as CLIENT_OBJECT_SET_FIELDS, which is split back up with AstronFieldBatch.splitClientUpdate
+# as OTPClientRepository does. The last value the client gets for every field must be the
+# same either way, and must unpack with the dc file.
+#
+# Usage (from the repository root):
+#     python tools/check_toon_field_batch.py
+
+import builtins
+import os
+import sys
+
+import harness
+
+AvId = 100000000
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+    # Formats updates the way the AI repository does, and keeps every datagram sent in its message director.
+
+    def __init__(self):
+        harness.FakeAIRepository.__init__(self, harness.FakeMessageDirector())
+        self.doLiveUpdates = False
+        self.holidayManager = None
+
+
+def makeToon(dcFile):
+    from panda3d.direct import DCPacker
+    from toontown.toon import ToonDNA
+    from toontown.toon.DistributedToonAI import DistributedToonAI
+
+    air = FakeAIRepository()
+    builtins.simbase.air = air
+    toon = DistributedToonAI(air)
+    toon.doId = AvId
+    toon.dclass = dcFile.getClassByName('DistributedToon')
+    air.doId2do[toon.doId] = toon
+    # Give it the default value of every required field, as a generate from the database would
+    for i in range(toon.dclass.getNumInheritedFields()):
+        field = toon.dclass.getInheritedField(i)
+        if field.getName() == 'setDNAString':
+            dna = ToonDNA.ToonDNA()
+            dna.newToonRandom(seed=1)
+            toon.setDNAString(dna.makeNetString())
+        elif field.isRequired() and field.asAtomicField() is not None and hasattr(toon, field.getName()):
+            packer = DCPacker()
+            packer.setUnpackData(field.getDefaultValue())
+            packer.beginUnpack(field)
+            args = packer.unpackObject()
+            packer.endUnpack()
+            getattr(toon, field.getName())(*args)
+
+    return toon
+
+
+def toClientDatagram(data):
+    # What the client agent sends the toon's owner for one datagram the AI sent
+    from direct.distributed.MsgTypes import CLIENT_OBJECT_SET_FIELD, CLIENT_OBJECT_SET_FIELDS, \
+        STATESERVER_OBJECT_SET_FIELD, STATESERVER_OBJECT_SET_FIELDS
+    from direct.distributed.PyDatagram import PyDatagram
+    from direct.distributed.PyDatagramIterator import PyDatagramIterator
+
+    serverDg = PyDatagram(data)
+    di = PyDatagramIterator(serverDg)
+    for i in range(di.getUint8()):
+        di.getUint64()
+
+    di.getUint64()
+    msgType = di.getUint16()
+    clientMsgType = {STATESERVER_OBJECT_SET_FIELD: CLIENT_OBJECT_SET_FIELD,
+                     STATESERVER_OBJECT_SET_FIELDS: CLIENT_OBJECT_SET_FIELDS}.get(msgType)
+    if clientMsgType is None:
+        raise SystemExit('The toon sent a datagram of type %d, which is not a field update!' % msgType)
+
+    dg = PyDatagram()
+    dg.addUint16(clientMsgType)
+    dg.appendData(di.getRemainingBytes())
+    return dg
+
+
+def receiveUpdates(dcFile, datagrams):
+    # Returns the last value the client got for every field, by field number
+    from direct.distributed.MsgTypes import CLIENT_OBJECT_SET_FIELDS
+    from direct.distributed.PyDatagramIterator import PyDatagramIterator
+    from panda3d.direct import DCPacker
+    from toontown.util.astron.AstronFieldBatch import AstronFieldBatch
+
+    fields = {}
+    for data in datagrams:
+        # The iterators don't keep their datagrams alive
+        dg = toClientDatagram(data)
+        di = PyDatagramIterator(dg)
+        if di.getUint16() == CLIENT_OBJECT_SET_FIELDS:
+            fieldDgs = AstronFieldBatch.splitClientUpdate(dcFile, di)
+            updates = [PyDatagramIterator(fieldDg) for fieldDg in fieldDgs]
+            for update in updates:
+                update.getUint16()
+        else:
+            updates = [di]
+
+        for update in updates:
+            if update.getUint32() != AvId:
+                raise SystemExit('The client got an update for another object!')
+
+            packer = DCPacker()
+            packer.setUnpackData(update.getRemainingBytes())
+            field = dcFile.getFieldByIndex(packer.rawUnpackUint16())
+            packer.beginUnpack(field)
+            value = packer.unpackObject()
+            if not packer.endUnpack() or packer.getNumUnpackedBytes() != len(update.getRemainingBytes()):
+                raise SystemExit('The client could not unpack its update to %s!' % field.getName())
+
+            fields[field.getName()] = value
+
+    return fields
+
+
+def main():
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame()
+    from panda3d.core import Filename
+    from panda3d.direct import DCFile
+    from toontown.toon.DistributedToonAI import DistributedToonAI
+    DistributedToonAI.notify.setInfo(0)
+
+    dcFile = DCFile()
+    if not dcFile.read(Filename('astron/dclass/tto.dc')):
+        raise SystemExit('Could not read astron/dclass/tto.dc')
+
+    unbatchedToon = makeToon(dcFile)
+    unbatchedToon._DistributedToonAI__resetToNewToon()
+    unbatched = unbatchedToon.air.messageDirector.datagrams
+    batchedToon = makeToon(dcFile)
+    batchedToon.newToon()
+    batched = batchedToon.air.messageDirector.datagrams
+
+    unbatchedFields = receiveUpdates(dcFile, unbatched)
+    batchedFields = receiveUpdates(dcFile, batched)
+    if batchedFields != unbatchedFields:
+        changed = sorted(name for name in set(batchedFields) | set(unbatchedFields)
+                         if batchedFields.get(name) != unbatchedFields.get(name))
+        raise SystemExit('The client ended up with different values for %s!' % ', '.join(changed))
+
+    # Committing a batch that isn't open must not leave the toon batching everything after it
+    batchedToon.commitFieldBatch()
+    if batchedToon._fieldBatchDepth != 0:
+        raise SystemExit('commitFieldBatch with no batch open left the depth at %d!' % batchedToon._fieldBatchDepth)
+
+    print('newToon without a batch: %3d datagrams, %5d bytes' % (len(unbatched), sum(len(data) for data in unbatched)))
+    print('newToon with a batch:    %3d datagrams, %5d bytes' % (len(batched), sum(len(data) for data in batched)))
+    print('The client got the same %d fields either way.' % len(batchedFields))
+
+
+if __name__ == '__main__':
+    main()
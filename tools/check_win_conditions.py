@@ -0,0 +1,163 @@
+# Check every Archipelago win condition against a real DistributedToonAI, and time the goal check.
+#
+# Each condition registered in archipelago/definitions/win_conditions.py has a list of cases
+# here: a way to set up the toon, the slot data it was connected with, and whether the
+# condition must be satisfied. A condition without cases fails the check, so new goals get
+# cases too. The cog boss goal is tried with every set of bosses beaten, through setCogLevels
+# and through incCogLevel as a boss fight would, for every number of bosses required, and
+# with the slot data both set by the AI and unpacked from astron.
+#
+# The registry itself must refuse a name twice, and list the conditions a toon is missing.
+#
+# Then winConditionSatisfied and getSlotData are timed --calls times each. With --baseline,
+# they are also timed with DistributedToonAI at that revision.
+#
+# Usage (from the repository root):
+#     python tools/check_win_conditions.py [--calls 100000] [--baseline <rev>]
+
+import argparse
+import builtins
+import itertools
+import os
+import sys
+import time
+
+import harness
+
+AvId = 100000000
+
+
+def makeToon(toonClass):
+    air = harness.FakeAIRepository()
+    builtins.simbase.air = air
+    toon = toonClass(air)
+    toon.doId = AvId
+    toon.setCogTypes([0, 0, 0, 0])
+    toon.setCogLevels([0, 0, 0, 0])
+    air.doId2do[toon.doId] = toon
+    return toon
+
+
+def beatBossesWithCogLevels(toon, depts):
+    # A cog level above 0 means the department's boss has been beaten
+    toon.setCogLevels([1 if dept in depts else 0 for dept in range(4)])
+
+
+def beatBossesWithPromotions(toon, depts):
+    # What a boss fight does for every toon that wins it
+    for dept in depts:
+        toon.incCogLevel(dept)
+
+
+def getCogBossCases():
+    cases = []
+    for numBeaten in range(5):
+        for depts in itertools.combinations(range(4), numBeaten):
+            for beatBosses in (beatBossesWithCogLevels, beatBossesWithPromotions):
+                # No cog_bosses_required in the slot data means all 4
+                cases.append((beatBosses, depts, {}, numBeaten >= 4))
+                for required in range(5):
+                    cases.append((beatBosses, depts, {'cog_bosses_required': required}, numBeaten >= required))
+
+    return cases
+
+
+# Win condition name -> [(function setting up the toon, its argument, slot data, satisfied)]
+Cases = {
+    'cog_bosses': getCogBossCases(),
+}
+
+
+def checkConditions(toonClass):
+    from toontown.archipelago.definitions.win_conditions import WIN_CONDITIONS
+    from toontown.util.astron.AstronDict import AstronDict
+
+    missing = sorted(set(WIN_CONDITIONS) - set(Cases))
+    if missing:
+        raise SystemExit('No cases for the win conditions %s!' % ', '.join(missing))
+
+    numCases = 0
+    for name, cases in Cases.items():
+        condition = WIN_CONDITIONS[name]
+        for setUp, arg, slotData, satisfied in cases:
+            # The AI sets slot data from a dict, while astron hands over the packed struct
+            for packSlotData in (dict, lambda slotData: AstronDict.fromDict(slotData).toStruct()):
+                toon = makeToon(toonClass)
+                toon.setSlotData(packSlotData(slotData))
+                setUp(toon, arg)
+                if condition(toon) != satisfied:
+                    raise SystemExit('%s was %s for %s(%s) with slot data %s!' % (
+                        name, not satisfied, setUp.__name__, arg, slotData))
+
+                if toon.getSlotData() != AstronDict.fromDict(slotData).toStruct():
+                    raise SystemExit('getSlotData gave %s for slot data %s!' % (toon.getSlotData(), slotData))
+
+                numCases += 1
+
+    return numCases
+
+
+def checkRegistry(toonClass):
+    from toontown.archipelago.definitions import win_conditions
+
+    try:
+        win_conditions.win_condition('cog_bosses')(lambda av: True)
+    except KeyError:
+        pass
+    else:
+        raise SystemExit('A second win condition named cog_bosses was registered!')
+
+    toon = makeToon(toonClass)
+    toon.setSlotData({'cog_bosses_required': 2})
+    beatBossesWithCogLevels(toon, [0])
+    if win_conditions.get_unsatisfied_win_conditions(toon) != ['cog_bosses'] or toon.winConditionSatisfied():
+        raise SystemExit('A toon with 1 of 2 bosses beaten was not missing cog_bosses!')
+
+    beatBossesWithPromotions(toon, [3])
+    if win_conditions.get_unsatisfied_win_conditions(toon) or not toon.winConditionSatisfied():
+        raise SystemExit('A toon with 2 of 2 bosses beaten had not reached its goal!')
+
+
+def timeCalls(toonClass, calls):
+    toon = makeToon(toonClass)
+    toon.setSlotData({'cog_bosses_required': 4, 'seed': 'x' * 32, 'goal': 0, 'death_link': False})
+    beatBossesWithCogLevels(toon, [0, 1, 2])
+    results = {}
+    for method in (toon.winConditionSatisfied, toon.getSlotData):
+        start = time.perf_counter()
+        for i in range(calls):
+            method()
+        results[method.__name__] = (time.perf_counter() - start) / calls
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check the Archipelago win conditions and time the goal check.')
+    parser.add_argument('--calls', type=int, default=100000, help='Number of calls to time each method with.')
+    parser.add_argument('--baseline', help='Also time DistributedToonAI at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame()
+    from toontown.toon.DistributedToonAI import DistributedToonAI
+    DistributedToonAI.notify.setInfo(0)
+
+    numCases = checkConditions(DistributedToonAI)
+    checkRegistry(DistributedToonAI)
+    print('%d cases over %d win conditions passed.' % (numCases, len(Cases)))
+
+    timings = [('Current', timeCalls(DistributedToonAI, args.calls))]
+    if args.baseline:
+        module = harness.loadBaseline(args.baseline, 'toontown/toon/DistributedToonAI.py')
+        module.DistributedToonAI.notify.setInfo(0)
+        timings.append((args.baseline, timeCalls(module.DistributedToonAI, args.calls)))
+
+    for name, results in timings:
+        print('%-9s winConditionSatisfied %.3f us, getSlotData %.3f us' % (
+            name, results['winConditionSatisfied'] * 1e6, results['getSlotData'] * 1e6))
+
+
+if __name__ == '__main__':
+    main()
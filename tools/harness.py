@@ -0,0 +1,148 @@
+# What the scripts in tools/ and the tests in tests/ share: setting the game up without a server,
+# a fake AI repository and message director for the code they run to send through, and loading
+# a module the way it was at another git revision.
+#
+# Everything here expects to be run from the repository root.
+
+import builtins
+import collections
+import os
+import subprocess
+import types
+
+RepositoryRoot = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+
+def setupGame(configData='', startAI=True, headless=False):
+    # Loads the AI's config, with configData on top of it, and starts the AI's globals unless told not to.
+    # Headless, nothing is drawn, frames don't sleep, and the clock only moves when it is told to.
+    from panda3d.core import ClockObject, loadPrcFile, loadPrcFileData
+    for prc in ('config/common.prc', 'config/development.prc'):
+        loadPrcFile(prc)
+
+    if configData:
+        loadPrcFileData('harness', configData)
+
+    class game:
+        name = 'toontown'
+        process = 'server'
+
+    builtins.game = game
+    if not startAI:
+        return
+
+    from otp.ai import AIBaseGlobal
+    if headless:
+        taskMgr.remove('igLoop')
+        taskMgr.remove('aiSleep')
+        globalClock.setMode(ClockObject.MSlave)
+
+
+def loadBaseline(revision, path):
+    # Runs the module at path the way it was at revision, next to the current one in the same package.
+    source = subprocess.run(['git', 'show', '%s:%s' % (revision, path)], capture_output=True, text=True,
+                            check=True).stdout
+    package = os.path.dirname(path).replace('/', '.')
+    name = os.path.splitext(os.path.basename(path))[0]
+    module = types.ModuleType('%s.Baseline%s' % (package, name))
+    module.__package__ = package
+    exec(compile(source, '%s@%s' % (os.path.basename(path), revision), 'exec'), module.__dict__)
+    return module
+
+
+class FakeMessageDirector:
+    # Stands in for the message director's socket, keeping everything written to it.
+
+    def __init__(self):
+        self.datagrams = []
+
+    def sendDatagram(self, datagram):
+        self.datagrams.append(datagram.getMessage())
+
+    def getNumBytes(self):
+        # Every datagram is preceded by its 16 bit length on the wire
+        return sum(len(data) + 2 for data in self.datagrams)
+
+
+class FakeAIRepository:
+    # Just enough of an AI repository for objects to be generated, updated and deleted without a server.
+    # With a message director, updates are formatted the way the AI does and sent to it. Without one,
+    # objects don't need a dclass, and their updates go nowhere. Server events are kept in self.serverEvents.
+
+    def __init__(self, messageDirector=None):
+        self.messageDirector = messageDirector
+        self.ourChannel = 401000000
+        self.districtId = 200000000
+        self.dclassesByName = collections.defaultdict(lambda: None)
+        self.doId2do = {}
+        self.nextDoId = 300000000
+        self.nextZoneId = 60000
+        self.senderAvId = 0
+        self.serverEvents = []
+        self.pendingDeletes = []
+
+    def getTrackClsends(self):
+        return False
+
+    def getAvatarIdFromSender(self):
+        return self.senderAvId
+
+    def getAvatarExitEvent(self, avId):
+        return 'distObjDelete-%d' % avId
+
+    def allocateZone(self, owner=None):
+        self.nextZoneId += 1
+        return self.nextZoneId
+
+    def deallocateZone(self, zoneId):
+        pass
+
+    def deallocateChannel(self, channel):
+        pass
+
+    def generateWithRequired(self, do, parentId, zoneId, optionalFields=[]):
+        do.doId = self.nextDoId
+        self.nextDoId += 1
+        do.parentId = parentId
+        do.zoneId = zoneId
+        self.doId2do[do.doId] = do
+        self.objectGenerated(do)
+
+    def requestDelete(self, do):
+        # Like the state server, deletes happen a little later than they are asked for
+        self.pendingDeletes.append(do)
+
+    def processDeletes(self):
+        pendingDeletes, self.pendingDeletes = self.pendingDeletes, []
+        for do in pendingDeletes:
+            if self.doId2do.pop(getattr(do, 'doId', None), None) is None:
+                continue
+
+            self.objectDeleted(do)
+            do.delete()
+
+    def objectGenerated(self, do):
+        pass
+
+    def objectDeleted(self, do):
+        pass
+
+    def send(self, datagram):
+        if self.messageDirector is not None:
+            self.messageDirector.sendDatagram(datagram)
+
+    def sendUpdate(self, do, fieldName, args):
+        self.sendUpdateToChannel(do, do.doId, fieldName, args)
+
+    def sendUpdateToChannel(self, do, channelId, fieldName, args):
+        if self.messageDirector is None:
+            return
+
+        field = do.dclass.getFieldByName(fieldName)
+        self.send(field.aiFormatUpdate(do.doId, channelId, self.ourChannel, args))
+
+    def writeServerEvent(self, logtype, *args, **kwargs):
+        self.serverEvents.append((logtype,) + args)
+
+    def logServerEvent(self, name, fields):
+        self.serverEvents.append((name, fields))
@@ -0,0 +1,153 @@
+# Measure the import cost of the AI, UberDOG and client start paths.
+#
+# Each entry point is imported in a fresh interpreter with -X importtime, so no
+# server is started and no window is opened. For every entry point this prints
+# the wall-clock time and peak RSS of the import, followed by the modules with
+# the highest cumulative import time. Every entry is imported once beforehand,
+# so that the bytecode cache is warm.
+#
+# The data entry imports just the modules whose bulk data tables are loaded on
+# demand, which don't need panda3d.toontown or the Astron repositories.
+#
+# With --baseline, every entry is also imported from a temporary git worktree
+# of that revision.
+#
+# Usage (from the repository root):
+#     python tools/profile_startup.py [--top N] [--entry ai|ud|client|data ...] [--baseline <rev>]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+
+# Each entry point is (game process, setup, imports). Only the imports are timed. The client's
+# modules expect a ShowBase to exist (aspect2d is a default argument in places), so its setup
+# opens a ShowBase without a window, and its time is left out of the import's.
+ENTRY_POINTS = {
+    'ai': ('server', '',
+           'from otp.ai.AIBaseGlobal import *\n'
+           'from toontown.ai.ToontownAIRepository import ToontownAIRepository\n'),
+    'ud': ('server', '',
+           'from otp.ai.AIBaseGlobal import *\n'
+           'from toontown.uberdog.ToontownUberRepository import ToontownUberRepository\n'),
+    'client': ('client',
+               'from panda3d.core import loadPrcFileData\n'
+               'loadPrcFileData("", "window-type none\\naudio-library-name null")\n'
+               'from direct.showbase.ShowBase import ShowBase\n'
+               'ShowBase()\n',
+               'from toontown.distributed.ToontownClientRepository import ToontownClientRepository\n'),
+    'data': ('server', 'from otp.ai.AIBaseGlobal import *\n',
+             'import toontown.coghq.FactorySpecs\n'
+             'import toontown.effects.DistributedFireworkShowAI\n'
+             'import toontown.cogdominium.CogdoMaze\n'),
+}
+
+# Runs inside the child interpreter. Mirrors the builtins the start scripts set
+# up before their first toontown import, then reports wall clock and peak RSS.
+CHILD_TEMPLATE = '''
+import builtins, json, resource, sys, time
+from panda3d.core import loadPrcFile
+for prc in ('config/common.prc', 'config/development.prc'):
+    loadPrcFile(prc)
+
+class game:
+    name = 'toontown'
+    process = %(process)r
+
+builtins.game = game
+%(setup)s
+print('profile_startup: imports start', file=sys.stderr, flush=True)
+rssBefore = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+%(imports)s
+elapsed = time.perf_counter() - start
+rssAfter = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+sys.stdout.write(json.dumps({'wall': elapsed, 'rssBefore': rssBefore, 'rssAfter': rssAfter}))
+'''
+
+
+def parseImportTimes(stderr):
+    # Lines look like: "import time:   self [us] |  cumulative | imported package"
+    # Only what is imported after the setup counts
+    times = {}
+    lines = stderr.splitlines()
+    if 'profile_startup: imports start' in lines:
+        lines = lines[lines.index('profile_startup: imports start') + 1:]
+
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+
+        try:
+            selfUs = int(fields[0])
+            cumulativeUs = int(fields[1])
+        except ValueError:
+            continue
+
+        times[fields[2].strip()] = (selfUs, cumulativeUs)
+
+    return times
+
+
+def profileEntry(name, top, folder, label):
+    process, setup, imports = ENTRY_POINTS[name]
+    code = CHILD_TEMPLATE % {'process': process, 'setup': setup, 'imports': imports}
+    for run in range(2):
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                capture_output=True, text=True, cwd=folder)
+
+    print('== %s (%s) ==' % (name, label))
+    if result.returncode != 0:
+        print('  import failed (exit code %d):' % result.returncode)
+        errorLines = [line for line in result.stderr.splitlines() if not line.startswith('import time:')]
+        for line in errorLines[-10:]:
+            print('    ' + line)
+
+        return
+
+    stats = json.loads(result.stdout.splitlines()[-1])
+    # ru_maxrss is reported in kilobytes on Linux.
+    print('  wall clock: %.3f s' % stats['wall'])
+    print('  peak RSS:   %.1f MB (+%.1f MB during import)' % (stats['rssAfter'] / 1024.0,
+                                                          (stats['rssAfter'] - stats['rssBefore']) / 1024.0))
+    times = parseImportTimes(result.stderr)
+    ranked = sorted(times.items(), key=lambda item: item[1][1], reverse=True)
+    print('  %-60s %10s %10s' % ('module', 'self ms', 'cumul ms'))
+    for module, (selfUs, cumulativeUs) in ranked[:top]:
+        print('  %-60s %10.1f %10.1f' % (module, selfUs / 1000.0, cumulativeUs / 1000.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile start path import costs.')
+    parser.add_argument('--top', type=int, default=25, help='Number of modules to list per entry point.')
+    parser.add_argument('--entry', action='append', choices=sorted(ENTRY_POINTS),
+                        help='Entry point(s) to profile. Defaults to all of them.')
+    parser.add_argument('--baseline', help='Also profile the entry points at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    names = args.entry or ('ai', 'ud', 'client', 'data')
+    for name in names:
+        profileEntry(name, args.top, os.getcwd(), 'working tree')
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as folder:
+            worktree = os.path.join(folder, 'baseline')
+            subprocess.run(['git', 'worktree', 'add', '--detach', worktree, args.baseline], check=True,
+                           capture_output=True)
+            try:
+                for name in names:
+                    profileEntry(name, args.top, worktree, args.baseline)
+            finally:
+                subprocess.run(['git', 'worktree', 'remove', '--force', worktree], check=True)
+
+
+if __name__ == '__main__':
+    main()
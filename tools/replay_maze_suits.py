@@ -0,0 +1,154 @@
+# Replay the maze minigame's suits and check that they walk the same tracks as at another revision.
+#
+# For every maze in MazeData and every seed from 0 to --seeds, the suits of a game are set up the
+# way DistributedMazeGame does it: four per player, all drawing from one RandomNumGen seeded with
+# the seed, with walk periods drawn from it too and every other seed at a difficulty high enough
+# for suits to turn around. MazeSuit.thinkSuits then runs them for --seconds of game time at 30
+# frames a second on a slaved clock, and the tile each suit is on, the one it walks to next and
+# its direction are written down after every frame.
+#
+# The same games are replayed with MazeData, MazeBase and MazeSuit at the --baseline revision,
+# and every track must match frame for frame. The time spent in thinkSuits is printed for both.
+#
+# Suit.Suit needs the client's models, so the suits are stood in for by bare NodePaths. The
+# tracks don't depend on them.
+#
+# Usage (from the repository root):
+#     python tools/replay_maze_suits.py --baseline <rev> [--seeds 20] [--seconds 60]
+
+import argparse
+import builtins
+import os
+import sys
+import time
+import types
+
+import harness
+
+FrameTime = 1.0 / 30
+
+
+def setupGame():
+    from panda3d.core import NodePath
+    harness.setupGame(headless=True)
+    builtins.render = NodePath('render')
+    builtins.hidden = NodePath('hidden')
+
+    # Stand in for Suit.Suit, which loads the client's models
+    class Suit(NodePath):
+
+        def __init__(self):
+            NodePath.__init__(self, 'suit')
+
+        def setDNA(self, dna):
+            self.dna = dna
+
+        def loop(self, animName):
+            pass
+
+        def pose(self, animName, frame):
+            pass
+
+        def setPlayRate(self, rate, animName):
+            pass
+
+        def delete(self):
+            self.removeNode()
+
+    import toontown.suit
+    module = types.ModuleType('toontown.suit.Suit')
+    module.Suit = Suit
+    sys.modules['toontown.suit.Suit'] = module
+    toontown.suit.Suit = module
+
+
+class MazeCode:
+    # MazeData, MazeBase and MazeSuit from one revision.
+
+    def __init__(self, mazeData, mazeBase, mazeSuit):
+        self.mazeData = mazeData
+        self.mazeBase = mazeBase
+        self.mazeSuit = mazeSuit
+
+    def getMazeData(self, mazeName):
+        if hasattr(self.mazeData, 'getMazeData'):
+            return self.mazeData.getMazeData(mazeName)
+
+        return self.mazeData.mazeData[mazeName]
+
+
+def replayGame(code, mazeName, numPlayers, seed, seconds):
+    # Returns the suits' tracks, and how long thinkSuits took
+    from direct.showbase.RandomNumGen import RandomNumGen
+    from panda3d.core import NodePath
+
+    maze = code.mazeBase.MazeBase(NodePath('maze'), code.getMazeData(mazeName), code.mazeData.CELL_WIDTH,
+                                  parent=NodePath('mazeParent'))
+    randomNumGen = RandomNumGen(seed)
+    numSuits = 4 * numPlayers
+    periods = [randomNumGen.randint(40, 130) for i in range(numSuits)]
+    difficulty = 0.8 if seed % 2 else 0.3
+    suits = [code.mazeSuit.MazeSuit(i, maze, randomNumGen, periods[i], difficulty) for i in range(numSuits)]
+    startTime = globalClock.getFrameTime()
+    for suit in suits:
+        suit.onstage()
+        suit.gameStart(startTime)
+
+    tracks = []
+    thinkTime = 0.0
+    for frame in range(int(seconds / FrameTime)):
+        globalClock.setFrameTime(startTime + (frame + 1) * FrameTime)
+        thinkStart = time.perf_counter()
+        code.mazeSuit.MazeSuit.thinkSuits(suits, startTime)
+        thinkTime += time.perf_counter() - thinkStart
+        tracks.append(tuple((suit.TX, suit.TY, suit.nextTX, suit.nextTY, suit.direction) for suit in suits))
+
+    for suit in suits:
+        suit.gameEnd()
+        suit.destroy()
+
+    maze.destroy()
+    return tracks, thinkTime
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that the maze minigame's suits walk the same tracks as at "
+                                                 "another revision.")
+    parser.add_argument('--baseline', required=True, help='Revision to compare the tracks with.')
+    parser.add_argument('--seeds', type=int, default=20, help='Number of seeds to replay every maze with.')
+    parser.add_argument('--seconds', type=float, default=60.0, help='Game time to replay every game for.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    setupGame()
+    from toontown.minigame import MazeBase, MazeData, MazeSuit
+
+    current = MazeCode(MazeData, MazeBase, MazeSuit)
+    baseline = MazeCode(*[harness.loadBaseline(args.baseline, 'toontown/minigame/%s.py' % name)
+                          for name in ('MazeData', 'MazeBase', 'MazeSuit')])
+    thinkTimes = [0.0, 0.0]
+    numGames = 0
+    numMoves = 0
+    for numPlayers, (mazeName,) in enumerate(MazeData.mazeNames, 1):
+        for seed in range(args.seeds):
+            tracks, thinkTime = replayGame(current, mazeName, numPlayers, seed, args.seconds)
+            baselineTracks, baselineThinkTime = replayGame(baseline, mazeName, numPlayers, seed, args.seconds)
+            thinkTimes[0] += thinkTime
+            thinkTimes[1] += baselineThinkTime
+            for frame, (suits, baselineSuits) in enumerate(zip(tracks, baselineTracks)):
+                if suits != baselineSuits:
+                    raise SystemExit('In %s with seed %d, the suits went %s after %d frames, not %s!' % (
+                        mazeName, seed, suits, frame + 1, baselineSuits))
+
+            numGames += 1
+            numMoves += len([frame for frame in range(1, len(tracks)) if tracks[frame] != tracks[frame - 1]])
+
+    print('%d games replayed the same as at %s, with the suits moving in %d frames between them.' % (
+        numGames, args.baseline, numMoves))
+    print('thinkSuits took %.1f ms in all, and %.1f ms at %s.' % (thinkTimes[0] * 1000, thinkTimes[1] * 1000,
+                                                                 args.baseline))
+
+
+if __name__ == '__main__':
+    main()
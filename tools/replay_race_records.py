@@ -0,0 +1,111 @@
+# Replay race results through the kart track record boards and check them against
+# the original list-based record keeping from RaceManagerAI.
+#
+# Random race results (and the occasional daily/weekly reset) are fed to both
+# implementations. After every result, the bonus awarded and every leaderboard
+# must match.
+#
+# Usage (from the repository root):
+#     python tools/replay_race_records.py [--results 10000] [--seed 0]
+
+import argparse
+import os
+import random
+import sys
+
+
+def makeReferenceRecords(RaceGlobals):
+    records = {}
+    for trackId in RaceGlobals.TrackIds:
+        records[str(trackId)] = {}
+        for i in RaceGlobals.PeriodIds:
+            records[str(trackId)][str(i)] = []
+            for j in range(0, RaceGlobals.NumRecordsPerPeriod):
+                records[str(trackId)][str(i)].append(RaceGlobals.getDefaultRecord(trackId))
+
+    return records
+
+
+# RaceManagerAI.checkTimeRecord before the record boards, without the AI side effects
+def referenceCheckTimeRecord(RaceGlobals, trackRecords, trackId, time, raceType, numRacers, name):
+    bonus = 0
+    for period in RaceGlobals.PeriodIds:
+        for record in range(0, RaceGlobals.NumRecordsPerPeriod):
+            recordTime = trackRecords[str(trackId)][str(period)][record][0]
+            if time < recordTime:
+                trackRecords[str(trackId)][str(period)].insert(record, (time, raceType, numRacers, name))
+                trackRecords[str(trackId)][str(period)] = trackRecords[str(trackId)][str(period)][:RaceGlobals.NumRecordsPerPeriod]
+                bonus = RaceGlobals.PeriodDict[period]
+                break
+
+    return bonus
+
+
+def boardCheckTimeRecord(RaceGlobals, boards, trackId, time, raceType, numRacers, name):
+    bonus = 0
+    for period in RaceGlobals.PeriodIds:
+        board = boards[trackId][period]
+        rank = board.getRank(time)
+        if rank is None:
+            continue
+
+        board.insert(rank, (time, raceType, numRacers, name))
+        bonus = RaceGlobals.PeriodDict[period]
+
+    return bonus
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check track record boards against the original implementation.')
+    parser.add_argument('--results', type=int, default=10000, help='Number of race results to replay.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the random race results.')
+    args = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from toontown.racing import RaceGlobals
+    from toontown.racing.RaceRecordBoard import RaceRecordBoard
+
+    rng = random.Random(args.seed)
+    reference = makeReferenceRecords(RaceGlobals)
+    boards = {trackId: {period: RaceRecordBoard(trackId) for period in RaceGlobals.PeriodIds}
+              for trackId in RaceGlobals.TrackIds}
+    newRecords = 0
+    for result in range(args.results):
+        # Every now and then the daily or weekly records get reset
+        if rng.random() < 0.002:
+            period = rng.choice((RaceGlobals.Daily, RaceGlobals.Weekly))
+            for trackId in RaceGlobals.TrackIds:
+                for i in range(0, RaceGlobals.NumRecordsPerPeriod):
+                    reference[str(trackId)][str(period)][i] = RaceGlobals.getDefaultRecord(trackId)
+                boards[trackId][period].reset()
+
+        trackId = rng.choice(RaceGlobals.TrackIds)
+        # Round some of the times so ties with existing records come up too
+        time = RaceGlobals.getDefaultRecordTime(trackId) * rng.uniform(0.6, 1.1)
+        if rng.random() < 0.5:
+            time = round(time, 1)
+
+        raceType = rng.choice((RaceGlobals.Practice, RaceGlobals.ToonBattle, RaceGlobals.Circuit))
+        numRacers = rng.randint(1, RaceGlobals.MaxRacers)
+        name = 'Toon %d' % rng.randint(1, 500)
+        expected = referenceCheckTimeRecord(RaceGlobals, reference, trackId, time, raceType, numRacers, name)
+        bonus = boardCheckTimeRecord(RaceGlobals, boards, trackId, time, raceType, numRacers, name)
+        if bonus != expected:
+            raise SystemExit('Result %d: bonus %s does not match the expected %s' % (result, bonus, expected))
+
+        newRecords += bool(bonus)
+        for period in RaceGlobals.PeriodIds:
+            if boards[trackId][period].getRecords() != reference[str(trackId)][str(period)]:
+                raise SystemExit('Result %d: leaderboard for track %s period %s does not match' % (result, trackId, period))
+
+    # Everything should still match at the end, including tracks that haven't been raced on in a while
+    for trackId in RaceGlobals.TrackIds:
+        for period in RaceGlobals.PeriodIds:
+            if boards[trackId][period].getRecords() != reference[str(trackId)][str(period)]:
+                raise SystemExit('Leaderboard for track %s period %s does not match' % (trackId, period))
+
+    print('%d race results replayed, %d set a record, all leaderboards match.' % (args.results, newRecords))
+
+
+if __name__ == '__main__':
+    main()
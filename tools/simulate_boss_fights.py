@@ -0,0 +1,963 @@
+# Headless scripted boss fights against the VP, CFO, CJ and CEO AIs.
+#
+# Real bosses are created by a real LobbyManagerAI for real toons, on a fake AI repository.
+# Fake clients play every toon: they answer the boss's barriers, get zapped by some of its
+# attacks, and send the same messages the client does in every round. In the VP they
+# touch the cage and throw pies, in the CFO they work the cranes, grab goons and safes and
+# stomp goons, in the CJ they fire themselves at the jury chairs and then throw pies at the
+# scale, and in the CEO they serve the diners and squirt the boss. The turn based cog
+# battles in between are skipped, the same way the skip magic words do it.
+#
+# The task manager runs on a slaved clock, so nothing ever waits on real time. For every
+# boss, the time each phase of its fights took is reported, along with whether the toons
+# won, what they were rewarded with, and how much CPU time the AI spent on a fight.
+#
+# Every crane league and scale league ruleset the AI can send is checked first: every CFO
+# modifier at every tier, applied to the default ruleset, must still be valid, and every
+# ruleset and modifier must pack into its field in tto.dc and come back the same. The
+# rulesets sent during the fights are checked the same way.
+#
+# Usage (from the repository root):
+#     python tools/simulate_boss_fights.py [--bosses vp,cfo,cj,ceo] [--fights 2] [--toons 4] [--hit-chance 0.3] [--modifiers] [--seed 0]
+#     python tools/simulate_boss_fights.py --rulesets-only
+
+import argparse
+import builtins
+import collections
+import heapq
+import os
+import random
+import sys
+import time
+
+from panda3d.direct import CConnectionRepository
+
+import harness
+
+# Fight time that passes every frame, which is also how often the clients decide what to do
+FrameTime = 0.25
+
+# No fight should ever take this long
+MaxFightTime = 3 * 60 * 60
+
+ToonMaxHp = 137
+
+# How long the clients take to skip a round they don't play
+SkipDelay = 1.0
+
+# Floats are packed as fixed point numbers, so they don't come back exactly the same
+PackTolerance = 0.01
+
+
+def loadDcFile():
+    from panda3d.core import Filename
+    from panda3d.direct import DCFile
+
+    dcFile = DCFile()
+    if not dcFile.read(Filename('astron/dclass/tto.dc')):
+        raise SystemExit('Could not read astron/dclass/tto.dc')
+
+    return dcFile
+
+
+def sameValues(a, b):
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(sameValues(x, y) for x, y in zip(a, b))
+
+    return abs(a - b) <= PackTolerance
+
+
+def packAndUnpack(dcFile, className, fieldName, args):
+    # Packs the arguments into the field like the AI does, and unpacks them again like the client does
+    from direct.distributed.PyDatagramIterator import PyDatagramIterator
+    from panda3d.direct import DCPacker
+
+    field = dcFile.getClassByName(className).getFieldByName(fieldName)
+    try:
+        datagram = field.aiFormatUpdate(0, 0, 0, args)
+    except TypeError as e:
+        raise SystemExit('%s.%s could not be packed: %s' % (className, fieldName, e))
+
+    # Channel count, channel, sender, message type, doId and field number
+    dgi = PyDatagramIterator(datagram)
+    dgi.getUint8()
+    dgi.getUint64()
+    dgi.getUint64()
+    dgi.getUint16()
+    dgi.getUint32()
+    dgi.getUint16()
+    packer = DCPacker()
+    packer.setUnpackData(dgi.getRemainingBytes())
+    packer.beginUnpack(field)
+    unpacked = field.unpackArgs(packer)
+    if not packer.endUnpack():
+        raise SystemExit('%s.%s could not be unpacked from %s' % (className, fieldName, args))
+
+    return list(unpacked)
+
+
+def checkCFORuleset(dcFile, ruleset, description):
+    from toontown.coghq import CraneLeagueGlobals
+
+    problems = []
+    struct = ruleset.asStruct()
+    if CraneLeagueGlobals.CFORuleset.fromStruct(struct).asStruct() != struct:
+        problems.append('%s does not come back the same from fromStruct' % description)
+
+    unpacked, = packAndUnpack(dcFile, 'DistributedCashbotBoss', 'setRawRuleset', [struct])
+    if not sameValues(unpacked, struct):
+        problems.append('%s is %s after going through setRawRuleset: %s' % (description, struct, unpacked))
+
+    if ruleset.CFO_MAX_HP <= 0:
+        problems.append('%s gives the CFO %s HP' % (description, ruleset.CFO_MAX_HP))
+    if ruleset.TIMER_MODE_TIME_LIMIT <= 0:
+        problems.append('%s has a time limit of %s' % (description, ruleset.TIMER_MODE_TIME_LIMIT))
+    for name in ('MIN_GOON_IMPACT', 'MIN_SAFE_IMPACT', 'MIN_DEHELMET_IMPACT', 'SIDECRANE_IMPACT_STUN_THRESHOLD'):
+        if not 0 <= getattr(ruleset, name) <= .95:
+            problems.append('%s has %s set to %s' % (description, name, getattr(ruleset, name)))
+
+    return problems
+
+
+def checkCFOModifiers(dcFile, modifiers, description):
+    from toontown.coghq import CraneLeagueGlobals
+
+    problems = []
+    structs = [modifier.asStruct() for modifier in modifiers]
+    unpacked, = packAndUnpack(dcFile, 'DistributedCashbotBoss', 'setModifiers', [structs])
+    if not sameValues(unpacked, structs):
+        problems.append('%s are %s after going through setModifiers: %s' % (description, structs, unpacked))
+
+    for modifier in modifiers:
+        copy = CraneLeagueGlobals.CFORulesetModifierBase.fromStruct(modifier.asStruct())
+        if type(copy) is not type(modifier) or copy.tier != modifier.tier:
+            problems.append('%s tier %d does not come back the same from fromStruct' % (type(modifier).__name__, modifier.tier))
+
+        # The client shows these in the heat display
+        try:
+            modifier.getName()
+            modifier.getDescription() % {'color_start': '', 'color_end': ''}
+            modifier.getHeat()
+        except Exception as e:
+            problems.append('%s tier %d can not be shown to the client: %r' % (type(modifier).__name__, modifier.tier, e))
+
+    return problems
+
+
+def checkCJRuleset(dcFile, ruleset, description):
+    from toontown.coghq import ScaleLeagueGlobals
+
+    problems = []
+    struct = ruleset.asStruct()
+    if ScaleLeagueGlobals.CJRuleset.fromStruct(struct).asStruct() != struct:
+        problems.append('%s does not come back the same from fromStruct' % description)
+
+    unpacked, = packAndUnpack(dcFile, 'DistributedLawbotBoss', 'setRawRuleset', [struct])
+    if not sameValues(unpacked, struct):
+        problems.append('%s is %s after going through setRawRuleset: %s' % (description, struct, unpacked))
+
+    if ruleset.CJ_MAX_HP <= 0:
+        problems.append('%s gives the CJ %s HP' % (description, ruleset.CJ_MAX_HP))
+
+    return problems
+
+
+def checkRulesets(dcFile):
+    from toontown.coghq import CraneLeagueGlobals, ScaleLeagueGlobals
+
+    problems = []
+    numRulesets = 0
+    for rulesetClass in (CraneLeagueGlobals.CFORuleset, CraneLeagueGlobals.SemiFinalsCFORuleset,
+                         CraneLeagueGlobals.FinalsCFORuleset):
+        ruleset = rulesetClass()
+        ruleset.validate()
+        problems.extend(checkCFORuleset(dcFile, ruleset, rulesetClass.__name__))
+        numRulesets += 1
+
+    # Every modifier the AI can roll, at every tier it can roll them at
+    modifierClasses = CraneLeagueGlobals.NON_SPECIAL_MODIFIER_CLASSES + CraneLeagueGlobals.SPECIAL_MODIFIER_CLASSES
+    for modifierClass in CraneLeagueGlobals.CFORulesetModifierBase.MODIFIER_SUBCLASSES.values():
+        if modifierClass not in modifierClasses:
+            problems.append('%s can never be rolled' % modifierClass.__name__)
+
+    minTier, maxTier = CraneLeagueGlobals.CFORuleset().MODIFIER_TIER_RANGE
+    for modifierClass in modifierClasses:
+        for tier in range(minTier, maxTier + 1):
+            modifier = modifierClass(tier)
+            ruleset = CraneLeagueGlobals.CFORuleset()
+            modifier.apply(ruleset)
+            ruleset.validate()
+            description = '%s tier %d' % (modifierClass.__name__, tier)
+            problems.extend(checkCFORuleset(dcFile, ruleset, description))
+            problems.extend(checkCFOModifiers(dcFile, [modifier], description))
+            numRulesets += 1
+
+    ruleset = ScaleLeagueGlobals.CJRuleset()
+    ruleset.validate()
+    problems.extend(checkCJRuleset(dcFile, ruleset, 'CJRuleset'))
+    numRulesets += 1
+
+    return problems, numRulesets
+
+
+class FakeHolidayManager:
+
+    def __init__(self):
+        self.currentHolidays = []
+
+    def isMoreXpHolidayRunning(self):
+        return False
+
+
+class FakeSuitInvasionManager:
+
+    def getInvadingCog(self):
+        return None, 0
+
+
+class FakeKilledCogsManager:
+    # Stands in for the quest and cog page managers, which are told about the cogs a toon defeated.
+
+    def __init__(self):
+        self.numCalls = 0
+
+    def toonKilledCogs(self, toon, suitsKilled, zoneId, *args):
+        self.numCalls += 1
+
+
+class FakeAIRepository(harness.FakeAIRepository, CConnectionRepository):
+    # Just enough of an AI repository for bosses, their objects and toons. Updates sent by anything in a
+    # boss's zone go to that fight's FightClient. The CFO's objects are smooth nodes, which need a real
+    # CConnectionRepository, even though they never send anything through it.
+
+    def __init__(self, simulator):
+        CConnectionRepository.__init__(self, False, False)
+        harness.FakeAIRepository.__init__(self)
+        self.simulator = simulator
+        self.config = simbase.config
+        self.clients = {}
+        self.holidayManager = FakeHolidayManager()
+        self.suitInvasionManager = FakeSuitInvasionManager()
+        self.questManager = FakeKilledCogsManager()
+        self.cogPageManager = FakeKilledCogsManager()
+        # Battles stop and start the toons' passive healing
+        from toontown.safezone.SafeZoneManagerAI import SafeZoneManagerAI
+        self.safeZoneManager = SafeZoneManagerAI(self)
+
+    def sendSetLocation(self, do, parentId, zoneId):
+        pass
+
+    def objectGenerated(self, do):
+        self.simulator.objectGenerated(do)
+
+    def objectDeleted(self, do):
+        self.simulator.objectDeleted(do)
+
+    def sendUpdate(self, do, fieldName, args):
+        client = self.clients.get(do.zoneId)
+        if client:
+            client.handleUpdate(do, fieldName, args)
+
+    def sendUpdateToChannel(self, do, channelId, fieldName, args):
+        client = self.clients.get(do.zoneId)
+        if client:
+            client.handleUpdate(do, fieldName, args)
+
+
+class FightClient:
+    # Plays the clients of every toon in a single boss fight. Subclasses script the rounds of each boss.
+
+    # Rounds the clients don't play, and the state the boss is skipped to from them
+    Skips = {}
+    # States in which playRound is called every frame
+    ActionStates = ()
+    # Barriers the round scripts answer themselves, or answer after this long
+    BarrierDelays = {}
+
+    def __init__(self, simulator, boss):
+        from direct.distributed.ClockDelta import globalClockDelta
+        from toontown.toonbase import ToontownGlobals
+
+        self.globalClockDelta = globalClockDelta
+        self.ToontownGlobals = ToontownGlobals
+        self.simulator = simulator
+        self.rng = simulator.rng
+        self.boss = boss
+        self.states = []
+        self.updates = collections.Counter()
+        self.barriers = {}
+        self.answered = set()
+        self.left = set()
+        self.rulesetProblems = []
+        self.battleExperience = 0
+        self.finishTime = None
+        self.watchStates()
+
+    def watchStates(self):
+        # The boss doesn't send every state it goes to, so they are caught on the way in
+        setState = self.boss.setState
+
+        def recordState(state):
+            self.states.append((state, globalClock.getFrameTime()))
+            setState(state)
+            self.enteredState(state)
+
+        self.boss.setState = recordState
+
+    def getOutcome(self):
+        states = [state for state, start in self.states]
+        if 'Victory' in states:
+            return 'won'
+        if 'Defeat' in states:
+            return 'lost'
+        return 'unfinished'
+
+    def getToon(self, avId):
+        return self.simulator.air.doId2do.get(avId)
+
+    def getAliveToons(self):
+        return [avId for avId in self.boss.involvedToons if avId not in self.left and self.getToon(avId).getHp() > 0]
+
+    def sendAs(self, avId, method, *args):
+        # Sends a field update to the boss or one of its objects as if avId's client sent it
+        if self.boss.isDeleted() or avId in self.left:
+            return
+
+        self.simulator.air.senderAvId = avId
+        self.simulator.timeAI(method, *args)
+
+    def later(self, delay, function, *args):
+        self.simulator.later(delay, function, *args)
+
+    def handleUpdate(self, do, fieldName, args):
+        self.updates[fieldName] += 1
+        if do is self.boss:
+            handler = getattr(self, 'handle_' + fieldName, None)
+            if handler:
+                handler(*args)
+
+    def handle_setBarrierData(self, data):
+        for context, name, avIds in data:
+            self.barriers[name] = (context, avIds)
+            if name in self.Skips:
+                continue
+
+            delay = self.BarrierDelays.get(name, 0)
+            if delay is None:
+                continue
+
+            self.answerBarrier(name, delay)
+
+    def answerBarrier(self, name, delay=0):
+        context, avIds = self.barriers[name]
+        for avId in avIds:
+            if (context, avId) in self.answered:
+                continue
+
+            self.answered.add((context, avId))
+            self.later(delay + self.rng.uniform(0.5, 3.0), self.sendAs, avId, self.boss.setBarrierReady, context)
+
+    def handle_setBattleExperience(self, *args):
+        self.battleExperience += 1
+
+    def getZapDamages(self):
+        return self.ToontownGlobals.BossCogDamageLevels
+
+    def handle_setAttackCode(self, attackCode, avId):
+        # Some of the attacks the boss makes land on the toons they were aimed at
+        if attackCode not in self.getZapDamages():
+            return
+
+        targets = [avId] if avId else self.getAliveToons()
+        for target in targets:
+            if self.rng.random() < self.simulator.hitChance:
+                self.later(self.rng.uniform(0.5, 2.0), self.zap, target, attackCode)
+
+    def zap(self, avId, attackCode):
+        toon = self.getToon(avId)
+        if self.boss.state not in self.ActionStates or not toon or toon.getHp() <= 0:
+            return
+
+        timestamp = self.globalClockDelta.localToNetworkTime(globalClock.getFrameTime())
+        self.sendAs(avId, self.boss.zapToon, 0, 0, 0, 0, 0, 0, 0, 0, attackCode, timestamp)
+
+    def enteredState(self, state):
+        if state in self.Skips:
+            self.later(SkipDelay, self.skip, state, self.Skips[state])
+        elif state == 'Epilogue':
+            for avId in self.boss.involvedToons:
+                self.later(self.rng.uniform(2.0, 5.0), self.leave, avId)
+
+        self.enterRound(state)
+
+    def skip(self, fromState, toState):
+        if self.boss.isDeleted() or self.boss.state != fromState:
+            return
+
+        self.simulator.timeAI(self.boss.exitIntroduction)
+        self.simulator.timeAI(self.boss.b_setState, toState)
+
+    def leave(self, avId):
+        self.sendAs(avId, self.boss.avatarExit)
+        self.left.add(avId)
+
+    def tick(self, now):
+        if not self.boss.isDeleted() and self.boss.state in self.ActionStates:
+            self.playRound(now)
+
+    def enterRound(self, state):
+        pass
+
+    def playRound(self, now):
+        pass
+
+
+class SellbotFightClient(FightClient):
+    Skips = {'Introduction': 'PrepareBattleThree'}
+    ActionStates = ('BattleThree', 'NearVictory')
+
+    def __init__(self, simulator, boss):
+        FightClient.__init__(self, simulator, boss)
+        self.finalPieSplat = False
+
+    def enterRound(self, state):
+        if state == 'BattleThree':
+            for avId in self.boss.involvedToons:
+                self.later(self.rng.uniform(1.0, 4.0), self.sendAs, avId, self.boss.touchCage)
+
+    def playRound(self, now):
+        if self.boss.state == 'NearVictory':
+            avIds = self.getAliveToons()
+            if avIds and not self.finalPieSplat:
+                self.finalPieSplat = True
+                self.later(self.rng.uniform(1.0, 3.0), self.sendAs, self.rng.choice(avIds), self.boss.finalPieSplat)
+            return
+
+        avIds = self.getAliveToons()
+        for avId in avIds:
+            # Pies only hurt the VP while he is dizzy, which takes a pie in his open undercarriage
+            if self.boss.attackCode != self.ToontownGlobals.BossCogDizzyNow:
+                if self.rng.random() < 0.05:
+                    self.sendAs(avId, self.boss.hitBossInsides)
+            elif self.rng.random() < 0.3:
+                self.sendAs(avId, self.boss.hitBoss, 1)
+
+            if len(avIds) > 1 and self.rng.random() < 0.01:
+                self.sendAs(avId, self.boss.hitToon, self.rng.choice([other for other in avIds if other != avId]))
+
+
+class CraneOperator:
+    # One toon in the crane round, and what they are doing with their crane.
+
+    def __init__(self, avId):
+        self.avId = avId
+        self.crane = None
+        self.object = None
+        self.readyTime = 0.0
+
+
+class CashbotFightClient(FightClient):
+    Skips = {'Introduction': 'PrepareBattleThree'}
+    ActionStates = ('BattleThree',)
+
+    def __init__(self, simulator, boss):
+        from toontown.coghq.DistributedCashbotBossSideCraneAI import DistributedCashbotBossSideCraneAI
+
+        FightClient.__init__(self, simulator, boss)
+        self.DistributedCashbotBossSideCraneAI = DistributedCashbotBossSideCraneAI
+        self.operators = {}
+        self.rewardIds = []
+        self.modifiers = []
+
+    def handle_setRawRuleset(self, struct):
+        from toontown.coghq import CraneLeagueGlobals
+
+        ruleset = CraneLeagueGlobals.CFORuleset.fromStruct(struct)
+        self.rulesetProblems.extend(checkCFORuleset(self.simulator.dcFile, ruleset, 'The CFO\'s ruleset'))
+
+    def handle_setModifiers(self, structs):
+        from toontown.coghq import CraneLeagueGlobals
+
+        self.modifiers = [CraneLeagueGlobals.CFORulesetModifierBase.fromStruct(struct) for struct in structs]
+        self.rulesetProblems.extend(checkCFOModifiers(self.simulator.dcFile, self.modifiers, 'The CFO\'s modifiers'))
+
+    def handle_setRewardId(self, rewardId):
+        self.rewardIds.append(rewardId)
+
+    def getZapDamages(self):
+        return self.boss.ruleset.CFO_ATTACKS_BASE_DAMAGE
+
+    def enterRound(self, state):
+        if state == 'BattleThree':
+            # Side cranes can't pick up safes, so they are taken last
+            cranes = sorted(self.boss.cranes, key=lambda crane: isinstance(crane, self.DistributedCashbotBossSideCraneAI))
+            for index, avId in enumerate(self.boss.involvedToons):
+                operator = CraneOperator(avId)
+                self.operators[avId] = operator
+                self.later(self.rng.uniform(1.0, 3.0), self.takeCrane, operator, cranes[index % len(cranes)])
+        elif state == 'Reward':
+            # The resistance message is applied partway through the reward movie
+            for avId in self.boss.involvedToons:
+                self.later(self.rng.uniform(5.0, 10.0), self.sendAs, avId, self.boss.applyReward)
+
+    def takeCrane(self, operator, crane):
+        if self.boss.state != 'BattleThree':
+            return
+
+        self.sendAs(operator.avId, crane.requestControl)
+        if crane.avId == operator.avId:
+            operator.crane = crane
+
+    def pickTarget(self, operator):
+        # Safes while the CFO is dizzy or wearing a helmet, goons the rest of the time
+        sideCrane = isinstance(operator.crane, self.DistributedCashbotBossSideCraneAI)
+        held = [other.object for other in self.operators.values()]
+        if not sideCrane and (self.boss.attackCode == self.ToontownGlobals.BossCogDizzy or self.boss.heldObject):
+            safes = [safe for safe in self.boss.safes if safe.state in ('Initial', 'Free') and safe not in held]
+            if safes:
+                return self.rng.choice(safes)
+
+        goons = [goon for goon in self.boss.goons if goon.state in ('Walk', 'Stunned', 'Recovery', 'Battle') and goon not in held]
+        if goons:
+            return self.rng.choice(goons)
+
+        return None
+
+    def playRound(self, now):
+        for operator in self.operators.values():
+            if not operator.crane or now < operator.readyTime:
+                continue
+
+            toon = self.getToon(operator.avId)
+            if toon.getHp() <= 0:
+                continue
+
+            if operator.object is None:
+                if self.rng.random() < 0.02:
+                    self.stompGoon(operator, now)
+                    continue
+
+                target = self.pickTarget(operator)
+                if target is None:
+                    continue
+
+                self.sendAs(operator.avId, target.requestGrab)
+                if target.state == 'Grabbed' and target.avId == operator.avId:
+                    operator.object = target
+                    operator.readyTime = now + self.rng.uniform(2.0, 5.0)
+            else:
+                self.swing(operator, now)
+
+    def swing(self, operator, now):
+        target = operator.object
+        operator.object = None
+        operator.readyTime = now + self.rng.uniform(0.5, 1.5)
+        if target.isDeleted() or target.state != 'Grabbed' or target.avId != operator.avId:
+            return
+
+        if self.rng.random() < 0.7:
+            self.sendAs(operator.avId, target.hitBoss, self.rng.uniform(0.3, 1.0), operator.crane.doId)
+
+        # Goons are destroyed when they hit, and a safe that hit might be his helmet now
+        if target.state == 'Grabbed' and target.avId == operator.avId:
+            self.sendAs(operator.avId, target.requestDrop)
+            self.later(0.5, self.sendAs, operator.avId, target.hitFloor)
+            self.later(1.5, self.freeObject, operator.avId, target)
+
+    def freeObject(self, avId, target):
+        if not target.isDeleted():
+            self.sendAs(avId, target.requestFree, self.rng.uniform(-50, 50), self.rng.uniform(-50, 50), 0, self.rng.uniform(0, 360))
+
+    def stompGoon(self, operator, now):
+        # Step off the crane, stomp a goon and get back on
+        goons = [goon for goon in self.boss.goons if goon.state == 'Walk']
+        if not goons:
+            return
+
+        crane = operator.crane
+        self.sendAs(operator.avId, crane.requestFree)
+        operator.crane = None
+        self.later(self.rng.uniform(1.0, 2.0), self.sendAs, operator.avId, self.rng.choice(goons).requestStunned,
+                   self.rng.uniform(3.0, 5.0))
+        self.later(self.rng.uniform(3.0, 5.0), self.takeCrane, operator, crane)
+
+
+class LawbotFightClient(FightClient):
+    Skips = {'Introduction': 'RollToBattleTwo'}
+    ActionStates = ('BattleTwo', 'BattleThree')
+
+    def __init__(self, simulator, boss):
+        from toontown.toonbase import ToontownGlobals
+
+        FightClient.__init__(self, simulator, boss)
+        # The clients are ready once the jury box has finished moving
+        self.BarrierDelays = {'BattleTwo': ToontownGlobals.LawbotBossJuryBoxMoveTime}
+        self.cannons = {}
+
+    def handle_setRawRuleset(self, struct):
+        from toontown.coghq import ScaleLeagueGlobals
+
+        ruleset = ScaleLeagueGlobals.CJRuleset.fromStruct(struct)
+        self.rulesetProblems.extend(checkCJRuleset(self.simulator.dcFile, ruleset, 'The CJ\'s ruleset'))
+
+    def enterRound(self, state):
+        if state == 'BattleTwo':
+            for index, avId in enumerate(self.boss.involvedToons):
+                self.later(self.rng.uniform(1.0, 3.0), self.enterCannon, avId, self.boss.cannons[index % len(self.boss.cannons)])
+        elif state == 'BattleThree':
+            for avId in self.boss.involvedToons:
+                self.later(self.rng.uniform(1.0, 4.0), self.sendAs, avId, self.boss.touchWitnessStand)
+
+    def enterCannon(self, avId, cannon):
+        self.sendAs(avId, cannon.requestEnter)
+        if cannon.avId == avId:
+            self.cannons[avId] = [cannon, globalClock.getFrameTime() + self.rng.uniform(2.0, 4.0)]
+
+    def playRound(self, now):
+        if self.boss.state == 'BattleTwo':
+            self.fireCannons(now)
+            return
+
+        avIds = self.getAliveToons()
+        for avId in avIds:
+            if self.rng.random() < 0.3:
+                self.sendAs(avId, self.boss.hitBoss, 1)
+
+            if len(avIds) > 1 and self.rng.random() < 0.01:
+                self.sendAs(avId, self.boss.hitToon, self.rng.choice([other for other in avIds if other != avId]))
+
+    def fireCannons(self, now):
+        from toontown.minigame import CannonGameGlobals
+
+        for avId, (cannon, fireTime) in list(self.cannons.items()):
+            if now < fireTime:
+                continue
+
+            self.cannons[avId][1] = float('inf')
+            self.sendAs(avId, cannon.setCannonLit, self.rng.uniform(-30, 30), self.rng.uniform(10, 60))
+            self.later(CannonGameGlobals.FUSE_TIME + self.rng.uniform(2.0, 3.0), self.land, avId, cannon)
+
+    def land(self, avId, cannon):
+        if self.boss.state != 'BattleTwo':
+            return
+
+        chairs = [index for index, chair in enumerate(self.boss.chairs) if chair.state != 'ToonJuror']
+        if chairs and self.rng.random() < 0.6:
+            self.sendAs(avId, self.boss.hitChair, self.rng.choice(chairs), cannon.index)
+
+        # Landing puts them straight back in the cannon if they have any cannon balls left
+        self.sendAs(avId, cannon.setLanded)
+        if cannon.avId == avId:
+            self.cannons[avId][1] = globalClock.getFrameTime() + self.rng.uniform(2.0, 4.0)
+        else:
+            del self.cannons[avId]
+
+
+class BossbotFightClient(FightClient):
+    Skips = {'Introduction': 'PrepareBattleTwo', 'PrepareBattleThree': 'PrepareBattleFour'}
+    ActionStates = ('BattleTwo', 'BattleFour')
+    # The clients are ready once every diner has been served
+    BarrierDelays = {'BattleTwo': None}
+
+    def __init__(self, simulator, boss):
+        FightClient.__init__(self, simulator, boss)
+        self.readyTimes = collections.defaultdict(float)
+        self.nextFoodNum = 0
+
+    def playRound(self, now):
+        if self.boss.state == 'BattleTwo':
+            self.serveFood(now)
+            return
+
+        avIds = self.getAliveToons()
+        for avId in avIds:
+            if self.rng.random() < 0.1:
+                self.sendAs(avId, self.boss.hitBoss, self.rng.choice((1, 2, 2, 3)))
+            if self.rng.random() < 0.02:
+                self.sendAs(avId, self.boss.ballHitBoss, self.rng.randint(1, 3))
+            if len(avIds) > 1 and self.rng.random() < 0.01:
+                self.sendAs(avId, self.boss.hitToon, self.rng.choice([other for other in avIds if other != avId]))
+
+    def serveFood(self, now):
+        hungryDiners = []
+        dinersLeft = False
+        for tableIndex, table in enumerate(self.boss.tables):
+            for chairIndex in range(table.numDiners):
+                status = table.getDinerStatus(chairIndex)
+                if status in (table.HUNGRY, table.ANGRY):
+                    hungryDiners.append((tableIndex, chairIndex))
+                if status != table.DEAD:
+                    dinersLeft = True
+
+        if not dinersLeft:
+            if 'BattleTwo' in self.barriers:
+                self.answerBarrier('BattleTwo')
+            return
+
+        for avId in self.getAliveToons():
+            if now < self.readyTimes[avId]:
+                continue
+
+            if not self.boss.toonFoodStatus.get(avId):
+                self.nextFoodNum += 1
+                self.sendAs(avId, self.boss.requestGetFood, self.rng.randrange(len(self.boss.foodBelts)),
+                            self.rng.randrange(4), self.nextFoodNum)
+                self.readyTimes[avId] = now + self.rng.uniform(2.0, 4.0)
+            elif hungryDiners:
+                self.sendAs(avId, self.boss.requestServeFood, *self.rng.choice(hungryDiners))
+                self.readyTimes[avId] = now + self.rng.uniform(1.0, 3.0)
+
+
+def getRewards(toon):
+    return {
+        'cog suit levels': sum(toon.getCogLevels()),
+        'SOS cards': sum(toon.NPCFriendsDict.values()),
+        'unites': sum(count for textId, count in toon.getResistanceMessages()),
+        'pink slips': toon.getPinkSlips(),
+        'cog summons': sum(bin(summons).count('1') for summons in toon.getCogSummonsEarned()),
+        'checked locations': len(toon.checkedLocations),
+        'jellybeans': toon.getTotalMoney(),
+        'gag experience': sum(toon.experience.getCurrentExperience()),
+    }
+
+
+class BossFightSimulator:
+
+    def __init__(self, dcFile, numToons, hitChance, modifiers, seed):
+        from toontown.coghq.LobbyManagerAI import LobbyManagerAI
+        from toontown.suit.DistributedBossbotBossAI import DistributedBossbotBossAI
+        from toontown.suit.DistributedCashbotBossAI import DistributedCashbotBossAI
+        from toontown.suit.DistributedLawbotBossAI import DistributedLawbotBossAI
+        from toontown.suit.DistributedSellbotBossAI import DistributedSellbotBossAI
+
+        self.dcFile = dcFile
+        self.numToons = numToons
+        self.hitChance = hitChance
+        self.rng = random.Random(seed)
+        # The bosses pick their attacks, modifiers and rewards with the random module
+        random.seed(seed)
+        self.air = FakeAIRepository(self)
+        builtins.simbase.air = self.air
+
+        def makeCashbotBoss(air):
+            boss = DistributedCashbotBossAI(air)
+            boss.rollModsOnStart = modifiers
+            return boss
+
+        self.bosses = {
+            'vp': (DistributedSellbotBossAI, SellbotFightClient),
+            'cfo': (makeCashbotBoss, CashbotFightClient),
+            'cj': (DistributedLawbotBossAI, LawbotFightClient),
+            'ceo': (DistributedBossbotBossAI, BossbotFightClient),
+        }
+        self.lobbies = {name: LobbyManagerAI(self.air, constructor) for name, (constructor, clientClass) in self.bosses.items()}
+        self.clientClass = None
+        self.client = None
+        self.pending = []
+        self.numPending = 0
+        self.nextAvId = 100000000
+        self.now = 0.0
+        self.aiTime = 0.0
+
+    def timeAI(self, method, *args):
+        start = time.perf_counter()
+        try:
+            return method(*args)
+        finally:
+            self.aiTime += time.perf_counter() - start
+
+    def later(self, delay, function, *args):
+        # Client work is kept out of the task manager, so its time isn't counted as the AI's
+        self.numPending += 1
+        heapq.heappush(self.pending, (self.now + delay, self.numPending, function, args))
+
+    def objectGenerated(self, do):
+        from toontown.suit.DistributedBossCogAI import DistributedBossCogAI
+
+        if isinstance(do, DistributedBossCogAI):
+            self.client = self.clientClass(self, do)
+            self.air.clients[do.zoneId] = self.client
+
+    def objectDeleted(self, do):
+        if self.client and do is self.client.boss:
+            self.client.finishTime = self.now
+            del self.air.clients[do.zoneId]
+
+    def makeToon(self):
+        from otp.otpbase import OTPGlobals
+        from toontown.battle import ToontownBattleGlobals
+        from toontown.coghq import CogDisguiseGlobals
+        from toontown.suit import SuitDNA
+        from toontown.toon import InventoryBase
+        from toontown.toon.DistributedToonAI import DistributedToonAI
+
+        toon = DistributedToonAI(self.air)
+        toon.doId = self.nextAvId
+        self.nextAvId += 1
+        toon.setName('Toon %d' % toon.doId)
+        toon.setMaxHp(ToonMaxHp)
+        toon.setHp(ToonMaxHp)
+        toon.setExperience([0] * len(ToontownBattleGlobals.Tracks))
+        toon.setTrackAccess([1] * len(ToontownBattleGlobals.Tracks))
+        toon.setMaxCarry(80)
+        toon.setInventory(InventoryBase.InventoryBase(toon).makeNetString())
+        toon.setMaxMoney(250)
+        toon.setMoney(0)
+        toon.setBankMoney(0)
+        toon.setGameAccess(OTPGlobals.AccessFull)
+        toon.setCogTypes([0] * 4)
+        toon.setCogLevels([0] * 4)
+        toon.setCogParts(list(CogDisguiseGlobals.PartsPerSuitBitmasks))
+        # Half the toons are ready for a promotion
+        toon.setCogMerits([CogDisguiseGlobals.getTotalMerits(toon, dept) if self.rng.random() < 0.5 else 0 for dept in range(4)])
+        toon.setMaxNPCFriends(16)
+        toon.setNPCFriendsDict([])
+        toon.setResistanceMessages([])
+        toon.setPinkSlips(0)
+        toon.setCogSummonsEarned([0] * len(SuitDNA.suitHeadTypes))
+        toon.setQuests([])
+        toon.setCheckedLocations([])
+        self.air.doId2do[toon.doId] = toon
+        return toon
+
+    def step(self):
+        self.now += FrameTime
+        globalClock.setFrameTime(self.now)
+        self.timeAI(taskMgr.step)
+        self.timeAI(self.air.processDeletes)
+        while self.pending and self.pending[0][0] <= self.now:
+            dueTime, num, function, args = heapq.heappop(self.pending)
+            function(*args)
+
+        if self.client and self.client.finishTime is None:
+            self.client.tick(self.now)
+
+    def runFight(self, name):
+        constructor, self.clientClass = self.bosses[name]
+        toons = [self.makeToon() for _ in range(self.numToons)]
+        before = {toon.doId: getRewards(toon) for toon in toons}
+        startTime = self.now
+        aiTime = self.aiTime
+        bossZone = self.timeAI(self.lobbies[name].createBossOffice, [toon.doId for toon in toons])
+        client = self.client
+        for toon in toons:
+            toon.zoneId = bossZone
+
+        while client.finishTime is None:
+            self.step()
+            if self.now - startTime > MaxFightTime:
+                raise SystemExit('A %s fight never finished, it got stuck in %s!' % (name, client.states[-1][0]))
+
+        # Let anything the boss left behind be cleaned up before the next fight
+        for _ in range(int(30 / FrameTime)):
+            self.step()
+
+        self.pending = []
+        rewards = collections.Counter()
+        for toon in toons:
+            after = getRewards(toon)
+            for reward, amount in after.items():
+                rewards[reward] += amount - before[toon.doId][reward]
+            del self.air.doId2do[toon.doId]
+
+        self.client = None
+        return FightResult(client, startTime, self.aiTime - aiTime, rewards)
+
+
+class FightResult:
+
+    def __init__(self, client, startTime, aiTime, rewards):
+        self.outcome = client.getOutcome()
+        self.aiTime = aiTime
+        self.rewards = rewards
+        self.fightTime = client.finishTime - startTime
+        self.battleExperience = client.battleExperience
+        self.updates = client.updates
+        self.rulesetProblems = client.rulesetProblems
+        self.modifiers = [type(modifier).__name__ for modifier in getattr(client, 'modifiers', [])]
+        self.phases = []
+        for index, (state, start) in enumerate(client.states):
+            end = client.states[index + 1][1] if index + 1 < len(client.states) else client.finishTime
+            self.phases.append((state, end - start))
+
+
+def printReport(name, results, numToons):
+    print('\n%s: %d fights, %d won, %d lost, %.1f minutes of fight time each, %.3f s of AI time each (%.1f ms per fight minute)' % (
+        name.upper(), len(results), sum(result.outcome == 'won' for result in results),
+        sum(result.outcome == 'lost' for result in results), sum(result.fightTime for result in results) / len(results) / 60,
+        sum(result.aiTime for result in results) / len(results),
+        sum(result.aiTime for result in results) * 1000 / max(sum(result.fightTime for result in results) / 60, 1e-9)))
+
+    print('  Phases (average seconds):')
+    phaseTimes = collections.defaultdict(list)
+    for result in results:
+        for state, duration in result.phases:
+            phaseTimes[state].append(duration)
+    for state, durations in phaseTimes.items():
+        print('    %-20s %8.1f  (%d times)' % (state, sum(durations) / len(durations), len(durations)))
+
+    print('  Rewards per toon:')
+    rewards = collections.Counter()
+    for result in results:
+        rewards.update(result.rewards)
+    for reward, amount in sorted(rewards.items()):
+        print('    %-20s %8.2f' % (reward, amount / (len(results) * numToons)))
+    print('    battle experience sent in %d of %d fights' % (sum(result.battleExperience > 0 for result in results), len(results)))
+
+    modifiers = collections.Counter(modifier for result in results for modifier in result.modifiers)
+    if modifiers:
+        print('  Modifiers rolled: %s' % ', '.join('%s %d' % item for item in modifiers.most_common()))
+
+    updates = collections.Counter()
+    for result in results:
+        updates.update(result.updates)
+    print('  Updates sent per fight: %d (%s)' % (sum(updates.values()) / len(results),
+                                                 ', '.join('%s %d' % (field, count / len(results)) for field, count in updates.most_common(8))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run scripted boss fights without clients.')
+    parser.add_argument('--bosses', default='vp,cfo,cj,ceo', help='Comma separated bosses to fight.')
+    parser.add_argument('--fights', type=int, default=2, help='Number of fights against every boss.')
+    parser.add_argument('--toons', type=int, default=4, help='Number of toons in every fight.')
+    parser.add_argument('--hit-chance', type=float, default=0.3, help='Chance for a boss attack to hit a toon.')
+    parser.add_argument('--modifiers', action='store_true', help='Roll random modifiers for every CFO.')
+    parser.add_argument('--rulesets-only', action='store_true', help='Only check the rulesets, without fighting.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(headless=True)
+    dcFile = loadDcFile()
+
+    problems, numRulesets = checkRulesets(dcFile)
+    print('Checked %d rulesets, %d problems.' % (numRulesets, len(problems)))
+    if problems:
+        raise SystemExit('\n'.join(problems))
+
+    if args.rulesets_only:
+        return
+
+    bosses = args.bosses.split(',')
+    simulator = BossFightSimulator(dcFile, args.toons, args.hit_chance, args.modifiers, args.seed)
+    for name in bosses:
+        if name not in simulator.bosses:
+            raise SystemExit('There is no boss called %s!' % name)
+
+    allResults = {}
+    for name in bosses:
+        allResults[name] = [simulator.runFight(name) for _ in range(args.fights)]
+        printReport(name, allResults[name], args.toons)
+
+    print('\nServer events:')
+    for logtype, count in collections.Counter(event[0] for event in simulator.air.serverEvents).most_common():
+        print('  %6d  %s' % (count, logtype))
+
+    problems = [problem for results in allResults.values() for result in results for problem in result.rulesetProblems]
+    if problems:
+        raise SystemExit('\n'.join(problems))
+
+
+if __name__ == '__main__':
+    main()
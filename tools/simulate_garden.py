@@ -0,0 +1,400 @@
+# Simulate an estate garden for a number of days, without waiting for them to go by.
+#
+# The garden is read from a JSON file in the format GardenManagerAI keeps in backups/gardens,
+# or from the backup of the avatar id given instead. Its owner visits their estate once a day,
+# at the time of day the simulation starts, which is when GardenManagerAI loads the garden and
+# its plants catch up on the days they missed. They water the plots they are asked to on each
+# visit, with the watering can given. After every visit, the growth, water level and state of
+# each plant are printed, along with anything that wilted, recovered, grew or went missing.
+#
+# Nothing in a garden dies: a plant that isn't watered dries out down to a water level of -2.
+# Flowers wilt once their water level is below 0 and trees when it is -2, or when the tree below
+# them on their track is missing. Plants stop growing while they are dry. A garden whose owner
+# is not in the estate is not loaded at all, and neither is one the garden code can't read.
+#
+# --check runs known gardens through the simulator and checks the results, so the growth
+# math can be checked without waiting days for it.
+#
+# Usage (from the repository root):
+#     python tools/simulate_garden.py <garden.json or avId> [--days 14] [--start 2026-10-19T12:00]
+#                                     [--water 0-13:all] [--water 2:tree3] [--can 0]
+#     python tools/simulate_garden.py --check
+
+import argparse
+import copy
+import datetime
+import json
+import os
+import sys
+
+import harness
+
+ONE_DAY = 86400
+OwnerAvId = 100000000
+EstateZoneId = 30000
+
+
+class SimulatedClock:
+    # The clock the gardens grow by. It only moves when we move it.
+
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeToon:
+    # Just enough of a toon to own a garden and water it.
+
+    def __init__(self, doId, wateringCan):
+        self.doId = doId
+        self.wateringCan = wateringCan
+        self.trackBonusLevel = [-1] * 7
+
+    def getWateringCan(self):
+        return self.wateringCan
+
+    def b_setTrackBonusLevel(self, trackBonusLevel):
+        self.trackBonusLevel = trackBonusLevel
+
+
+class FakeEstate:
+
+    def __init__(self, activeToons):
+        self.activeToons = activeToons
+        self.zoneId = EstateZoneId
+
+
+def makeSimulatedGarden(data):
+    from toontown.estate.GardenManagerAI import GardenAI
+
+    class SimulatedGarden(GardenAI):
+        # A garden that is kept in data instead of in backups/gardens.
+
+        def loadData(self):
+            self.data = data
+            self.dbExists = True
+
+        def update(self):
+            pass
+
+    return SimulatedGarden
+
+
+class PlantState:
+    # What a plant looked like right after a visit.
+
+    def __init__(self, name, isFlower, growthLevel, growthThresholds, waterLevel, wilted):
+        self.name = name
+        self.isFlower = isFlower
+        self.growthLevel = growthLevel
+        self.growthThresholds = growthThresholds
+        self.waterLevel = waterLevel
+        self.wilted = wilted
+
+    def getStage(self):
+        if not self.growthThresholds:
+            return 'growth %d' % self.growthLevel
+
+        stages = ('blooming' if self.isFlower else 'fruiting', 'full grown', 'established')
+        for threshold, stage in zip(reversed(self.growthThresholds), stages):
+            if self.growthLevel >= threshold:
+                return stage
+
+        return 'seedling'
+
+    def describe(self):
+        description = '%s, %s (growth %d)' % (self.name, self.getStage(), self.growthLevel)
+        if self.waterLevel is not None:
+            description += ', water %d' % self.waterLevel
+
+        if self.wilted:
+            description += ', wilted'
+
+        return description
+
+
+class GardenSimulator:
+    # Visits one toon's garden once a day, and keeps what it looked like after every visit.
+
+    def __init__(self, data, start, houseIndex=0, wateringCan=0):
+        from toontown.estate.DistributedStatuaryAI import DistributedStatuaryAI
+        from toontown.estate.GardenManagerAI import GardenManagerAI
+
+        self.DistributedStatuaryAI = DistributedStatuaryAI
+        self.data = copy.deepcopy(data)
+        self.start = start
+        self.clock = SimulatedClock(start)
+        self.air = harness.FakeAIRepository()
+        self.toon = FakeToon(OwnerAvId, wateringCan)
+        self.air.doId2do[self.toon.doId] = self.toon
+        activeToons = [0] * 6
+        activeToons[houseIndex] = self.toon.doId
+        self.gardenMgr = GardenManagerAI(self.air, FakeEstate(activeToons), clock=self.clock)
+        self.gardenClass = makeSimulatedGarden(self.data)
+        self.states = []
+
+    def visit(self, day, waterings):
+        # The owner comes home, waters their plants and leaves again
+        self.clock.now = self.start + day * ONE_DAY
+        garden = self.gardenClass(self.air, self.gardenMgr, self.toon.doId)
+        try:
+            loaded = garden.load(self.gardenMgr.estate)
+        except Exception as e:
+            raise SystemExit('Day %d: the garden could not be loaded: %r' % (day, e))
+
+        if not loaded:
+            raise SystemExit('Day %d: the garden was not loaded, because its owner is not in the estate.' % day)
+
+        self.gardenMgr.gardens[self.toon.doId] = garden
+        plants = self.getPlants(garden)
+        self.air.senderAvId = self.toon.doId
+        for slot in waterings:
+            plant = plants.get(slot)
+            if plant is not None and not isinstance(plant, self.DistributedStatuaryAI):
+                plant.waterPlant()
+
+        state = {slot: self.getPlantState(plant) for slot, plant in plants.items()}
+        self.states.append(state)
+        garden.destroy()
+        del self.gardenMgr.gardens[self.toon.doId]
+        self.air.processDeletes()
+        return state
+
+    def getPlants(self, garden):
+        plants = {}
+        for tree in garden.trees:
+            plants['tree%d' % tree.getTreeIndex()] = tree
+
+        for flower in garden.flowers:
+            plants['flower%d' % flower.getFlowerIndex()] = flower
+
+        for obj in garden.objects:
+            if isinstance(obj, self.DistributedStatuaryAI):
+                plants['statuary'] = obj
+
+        return plants
+
+    def getPlantState(self, plant):
+        from toontown.estate import GardenGlobals
+
+        attributes = GardenGlobals.PlantAttributes[plant.getTypeIndex()]
+        if isinstance(plant, self.DistributedStatuaryAI):
+            return PlantState(attributes['name'], False, plant.getGrowthLevel(), attributes.get('growthThresholds'),
+                              None, False)
+
+        isFlower = attributes['plantType'] == GardenGlobals.FLOWER_TYPE
+        if isFlower:
+            wilted = plant.getWaterLevel() < 0
+        else:
+            wilted = bool(plant.getWilted())
+
+        return PlantState(attributes['name'], isFlower, plant.getGrowthLevel(), attributes['growthThresholds'],
+                          plant.getWaterLevel(), wilted)
+
+
+def getChanges(before, after):
+    changes = []
+    for slot in sorted(set(before) | set(after), key=getSlotOrder):
+        if slot not in after:
+            changes.append('%s went missing' % slot)
+        elif slot not in before:
+            changes.append('%s appeared' % slot)
+        else:
+            if after[slot].wilted and not before[slot].wilted:
+                changes.append('%s wilted' % slot)
+            elif before[slot].wilted and not after[slot].wilted:
+                changes.append('%s recovered' % slot)
+
+            if after[slot].getStage() != before[slot].getStage():
+                changes.append('%s is now %s' % (slot, after[slot].getStage()))
+
+    return changes
+
+
+def getSlotOrder(slot):
+    kind = slot.rstrip('0123456789')
+    return ('tree', 'flower', 'statuary').index(kind), int(slot[len(kind):] or 0)
+
+
+def parseWaterings(waterings, days):
+    # Each one is DAYS:PLOTS, where DAYS is a day or a range of days like 0-13, and PLOTS is a
+    # comma separated list of plots like tree3 or flower0, or trees, flowers or all.
+    allTrees = ['tree%d' % i for i in range(8)]
+    allFlowers = ['flower%d' % i for i in range(10)]
+    wateringsByDay = [set() for _ in range(days + 1)]
+    for watering in waterings:
+        try:
+            dayRange, plots = watering.split(':')
+            first, _, last = dayRange.partition('-')
+            first = int(first)
+            last = int(last) if last else first
+        except ValueError:
+            raise SystemExit('Waterings look like DAYS:PLOTS, not %s' % watering)
+
+        slots = set()
+        for plot in plots.split(','):
+            if plot in ('trees', 'all'):
+                slots.update(allTrees)
+
+            if plot in ('flowers', 'all'):
+                slots.update(allFlowers)
+
+            if plot in allTrees or plot in allFlowers:
+                slots.add(plot)
+            elif plot not in ('trees', 'flowers', 'all'):
+                raise SystemExit('There is no plot called %s' % plot)
+
+        for day in range(max(first, 0), min(last, days) + 1):
+            wateringsByDay[day].update(slots)
+
+    return wateringsByDay
+
+
+def simulate(data, start, days, waterings=(), houseIndex=0, wateringCan=0):
+    simulator = GardenSimulator(data, start, houseIndex, wateringCan)
+    for day, dayWaterings in enumerate(parseWaterings(waterings, days)):
+        simulator.visit(day, dayWaterings)
+
+    return simulator
+
+
+def printReport(simulator, waterings):
+    before = {}
+    for day, state in enumerate(simulator.states):
+        date = datetime.datetime.fromtimestamp(simulator.start + day * ONE_DAY)
+        print('Day %d (%s):' % (day, date.strftime('%Y-%m-%d %H:%M')))
+        for slot in sorted(state, key=getSlotOrder):
+            print('    %-9s %s' % (slot, state[slot].describe()))
+
+        if not state:
+            print('    Nothing is planted.')
+
+        wateredSlots = sorted(waterings[day] & set(state), key=getSlotOrder)
+        if wateredSlots:
+            print('    Watered %s.' % ', '.join(wateredSlots))
+
+        for change in getChanges(before, state) if day else []:
+            print('    * %s' % change)
+
+        before = state
+
+
+def readGarden(garden):
+    if garden.isdigit():
+        garden = 'backups/gardens/garden_%s.json' % garden
+
+    try:
+        with open(garden) as file:
+            data = json.load(file)
+    except (OSError, ValueError) as e:
+        raise SystemExit('Could not read %s: %s' % (garden, e))
+
+    data.pop('_id', None)
+    return data
+
+
+def makePlant(planted, waterLevel, lastCheck, growthLevel, extra=0):
+    return [planted, waterLevel, lastCheck, growthLevel, extra]
+
+
+def checkSimulator():
+    from toontown.estate import GardenGlobals
+    from toontown.estate.GardenManagerAI import GardenAI, NULL_DATA, NULL_PLANT
+
+    start = int(datetime.datetime(2026, 10, 19, 12, 0).timestamp())
+    problems = []
+
+    def check(description, ok):
+        if not ok:
+            problems.append(description)
+
+    # A daisy planted on day 0 and watered every day is full grown and stays watered
+    data = copy.deepcopy(NULL_DATA)
+    data['flowers'] = [NULL_PLANT] * 10
+    data['flowers'][0] = makePlant(49, 0, 0, 0)
+    daisy = simulate(data, start, 5, ['0-5:flower0']).states
+    check('A watered daisy did not grow', daisy[-1]['flower0'].getStage() == 'blooming')
+    check('A watered daisy wilted', not any(state['flower0'].wilted for state in daisy))
+
+    # A daisy that is never watered dries out, wilts and never grows. Watering it brings it back.
+    dryDaisy = simulate(data, start, 6).states
+    firstWilted = min(day for day, state in enumerate(dryDaisy) if state['flower0'].wilted)
+    check('A dry daisy kept growing once it wilted',
+          len({state['flower0'].growthLevel for state in dryDaisy[firstWilted:]}) == 1)
+    check('A dry daisy did not wilt', dryDaisy[-1]['flower0'].wilted)
+    check('A dry daisy dried out below -2', min(state['flower0'].waterLevel for state in dryDaisy) == -2)
+    rescued = simulate(data, start, 6, ['6:flower0']).states
+    check('Watering a wilted daisy did not bring it back', not rescued[-1]['flower0'].wilted)
+
+    # A tree is planted dry, and left alone it wilts. A tree without the one below it on its track wilts right away.
+    data = copy.deepcopy(NULL_DATA)
+    data['trees'] = [NULL_PLANT] * 8
+    data['trees'][0] = makePlant(GardenGlobals.getTreeTypeIndex(0, 0), -1, 0, 0)
+    data['trees'][1] = makePlant(GardenGlobals.getTreeTypeIndex(1, 1), 5, 0, 0)
+    trees = simulate(data, start, 4).states
+    check('A dry tree did not wilt', trees[-1]['tree0'].wilted)
+    check('A tree without the tree it depends on did not wilt', trees[0]['tree1'].wilted)
+    wateredTrees = simulate(data, start, 4, ['0-4:trees']).states
+    check('A watered tree wilted', not any(state['tree0'].wilted for state in wateredTrees))
+    check('A watered tree did not grow', wateredTrees[-1]['tree0'].growthLevel > 0)
+
+    # Statuary grows one level every four days, from when it was placed
+    data = copy.deepcopy(NULL_DATA)
+    data['statuary'] = GardenAI.S_pack(0, start, 230, 0)
+    statuary = simulate(data, start, 9).states
+    check('Statuary did not grow every four days',
+          [state['statuary'].growthLevel for state in statuary] == [0] * 4 + [1] * 4 + [2] * 2)
+
+    # The owner staying away for a week must come out the same as visiting every day
+    data = copy.deepcopy(NULL_DATA)
+    data['flowers'] = [makePlant(49 + i % 7, i - 2, start - i * ONE_DAY // 3, 0, 0) for i in range(10)]
+    data['trees'] = [makePlant(GardenGlobals.getTreeTypeIndex(i % 7, 0), i, start - i * ONE_DAY, i, 0)
+                     for i in range(8)]
+    daily = simulate(data, start, 7)
+    once = GardenSimulator(data, start)
+    once.visit(7, set())
+    check('Visiting every day did not grow the garden like visiting once did', daily.data == once.data)
+
+    if problems:
+        raise SystemExit('\n'.join(problems))
+
+    print('The simulated gardens grew as expected.')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate an estate garden for a number of days.')
+    parser.add_argument('garden', nargs='?', help='Garden JSON file, or the avatar id of a garden in backups/gardens.')
+    parser.add_argument('--days', type=int, default=14, help='Number of days to simulate.')
+    parser.add_argument('--start', help='When the first visit is, like 2026-10-19T12:00. Defaults to now.')
+    parser.add_argument('--water', action='append', default=[], metavar='DAYS:PLOTS',
+                        help='Plots to water, like 3:tree2 or 0-13:flowers,tree0. Can be given more than once.')
+    parser.add_argument('--can', type=int, default=0, help='Watering can the owner has, from 0 to 3.')
+    parser.add_argument('--house', type=int, default=0, help='Index of the owner\'s house in the estate.')
+    parser.add_argument('--check', action='store_true', help='Check the simulator against known gardens.')
+    args = parser.parse_args()
+
+    if not args.check and args.garden is None:
+        parser.error('a garden is needed, unless --check is given')
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame()
+
+    if args.check:
+        checkSimulator()
+        return
+
+    data = readGarden(args.garden)
+    if args.start:
+        start = int(datetime.datetime.fromisoformat(args.start).timestamp())
+    else:
+        start = int(datetime.datetime.now().timestamp())
+
+    simulator = simulate(data, start, args.days, args.water, args.house, args.can)
+    printReport(simulator, parseWaterings(args.water, args.days))
+
+
+if __name__ == '__main__':
+    main()
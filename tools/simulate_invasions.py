@@ -0,0 +1,318 @@
+# Run a cog invasion across every suit planner of a district, without waiting for it to go by.
+#
+# SuitInvasionManagerAI is run against a suit planner for every street in
+# DistributedSuitPlannerAI.SuitHoodInfo. The real planners need the street DNA and the game's
+# Panda3D fork, so each one is a stand-in built on the planner's own releaseInvasionSuit,
+# getInvasionWeight and flySuits, taken from its source. Each one keeps its street's cog
+# population topped up every 10 to 12 seconds like the real upkeep does, and asks the manager
+# for an invasion cog for every cog it spawns. Cogs walk around for a few minutes and leave,
+# unless toons defeat them first, and fly away when flySuits tells them to. Toons only fight on
+# some streets, with a random number of toons on each, and the rest of the streets are left
+# alone. One street wants no cogs at all. Everything runs on the task manager with a slaved
+# clock, --frame seconds at a time.
+#
+# The street populations settle for a minute before the invasion starts, and the simulation
+# goes on until the invasion ended and every planner rolled over. Then it reports how long
+# the invasion took, and each street's share of the cogs, how many it spawned and how many
+# were defeated on it. tests/test_invasions.py checks the invasion went the way it should.
+#
+# With --baseline, the same district also runs an invasion with SuitInvasionManagerAI at that
+# revision, which counted spawned cogs instead of defeated ones and flew every street's cogs
+# away at once.
+#
+# Usage (from the repository root):
+#     python tools/simulate_invasions.py [--cogs 1000] [--seed 0] [--frame 0.25] [--baseline <rev>]
+
+import argparse
+import ast
+import collections
+import os
+import random
+import sys
+
+import harness
+
+PlannerPath = 'toontown/suit/DistributedSuitPlannerAI.py'
+# What is taken from the real planner
+PlannerMethods = ('releaseInvasionSuit', 'getInvasionWeight', 'flySuits')
+PlannerAttributes = ('SuitHoodInfo', 'SUIT_HOOD_INFO_MAX')
+InvadingCog = 'tbc'
+SettleTime = 60.0
+SuitLifetime = (60.0, 240.0)
+# Chance each second that one toon defeats a cog walking on its street
+DefeatRate = 0.02
+
+
+def loadPlannerClass():
+    # Only the invasion methods of DistributedSuitPlannerAI are run. Its module needs the game's Panda3D fork,
+    # and these methods only need what a stand-in planner gives them.
+    with open(PlannerPath, encoding='utf-8') as file:
+        tree = ast.parse(file.read())
+
+    classDef = next(node for node in tree.body if isinstance(node, ast.ClassDef)
+                    and node.name == 'DistributedSuitPlannerAI')
+    body = []
+    for node in classDef.body:
+        if isinstance(node, ast.FunctionDef) and node.name in PlannerMethods:
+            body.append(node)
+        elif isinstance(node, ast.Assign) and any(getattr(target, 'id', None) in PlannerAttributes
+                                                  for target in node.targets):
+            body.append(node)
+
+    missing = set(PlannerMethods) - {node.name for node in body if isinstance(node, ast.FunctionDef)}
+    if missing:
+        raise SystemExit("Couldn't find %s in DistributedSuitPlannerAI!" % ', '.join(sorted(missing)))
+
+    classDef.bases = []
+    classDef.body = body
+    namespace = {'__name__': 'toontown.suit.DistributedSuitPlannerAI'}
+    exec(compile(ast.Module(body=[classDef], type_ignores=[]), PlannerPath, 'exec'), namespace)
+    return namespace[classDef.name]
+
+
+class FakeSuit:
+
+    def __init__(self, suitPlanner, doId, invader, invasionId):
+        self.suitPlanner = suitPlanner
+        self.doId = doId
+        self.invader = invader
+        self.invasionId = invasionId
+        self.currHP = 10
+        self.pathState = 1
+
+    def flyAwayNow(self):
+        # What DistributedSuitAI does, without a path to stop
+        from toontown.suit import SuitTimings
+
+        self.pathState = 2
+        self.suitPlanner.district.flownAway(self.suitPlanner, self)
+        taskMgr.remove('fake-suit-%d' % self.doId)
+        taskMgr.doMethodLater(SuitTimings.toSky, self.suitPlanner.walkedOff, 'fake-suit-%d' % self.doId,
+                              extraArgs=[self])
+
+
+def makeStreetClass(plannerClass):
+
+    class StreetSuitPlanner(plannerClass):
+        # Keeps a street's cogs coming and going like DistributedSuitPlannerAI does, with toons fighting them.
+
+        def __init__(self, air, district, hoodInfoIdx, numToons, wantsCogs):
+            hoodInfo = self.SuitHoodInfo[hoodInfoIdx]
+            self.air = air
+            self.district = district
+            self.zoneId = hoodInfo[0]
+            self.hoodInfoIdx = hoodInfoIdx
+            self.currDesired = (hoodInfo[1] + hoodInfo[2]) // 2 if wantsCogs else 0
+            self.numToons = numToons
+            self.suitList = []
+            taskMgr.doMethodLater(district.rng.random() * 12.0, self.upkeepSuitPopulation,
+                                  'fake-upkeep-%d' % self.zoneId)
+            if numToons:
+                taskMgr.doMethodLater(1.0, self.fightSuits, 'fake-fight-%d' % self.zoneId)
+
+        def destroy(self):
+            taskMgr.remove('fake-upkeep-%d' % self.zoneId)
+            taskMgr.remove('fake-fight-%d' % self.zoneId)
+            for suit in self.suitList:
+                taskMgr.remove('fake-suit-%d' % suit.doId)
+
+        def createNewSuit(self):
+            manager = self.air.suitInvasionManager
+            invasionId = 0
+            if hasattr(manager, 'requestInvasionSuit'):
+                suitName, skeleton = manager.requestInvasionSuit(self.zoneId)
+                if suitName is not None:
+                    invasionId = manager.getInvasionId()
+            else:
+                suitName, skeleton = manager.getInvadingCog()
+
+            suit = FakeSuit(self, self.district.allocateDoId(), suitName is not None, invasionId)
+            self.suitList.append(suit)
+            self.district.spawned(self, suit, suitName)
+            lifetime = self.district.rng.uniform(*SuitLifetime)
+            taskMgr.doMethodLater(lifetime, self.walkedOff, 'fake-suit-%d' % suit.doId, extraArgs=[suit])
+
+        def upkeepSuitPopulation(self, task):
+            deficit = (self.currDesired - len(self.suitList) + 3) // 4
+            for i in range(max(0, deficit)):
+                self.createNewSuit()
+
+            task.delayTime = 10.0 + self.district.rng.random() * 2.0
+            return task.again
+
+        def fightSuits(self, task):
+            for i in range(self.numToons):
+                walking = [suit for suit in self.suitList if suit.pathState == 1]
+                if walking and self.district.rng.random() < DefeatRate:
+                    suit = self.district.rng.choice(walking)
+                    suit.currHP = 0
+                    self.district.defeated(self, suit)
+                    self.removeSuit(suit)
+
+            return task.again
+
+        def walkedOff(self, suit):
+            self.removeSuit(suit)
+
+        def removeSuit(self, suit):
+            # Like DistributedSuitPlannerAI.removeSuit
+            taskMgr.remove('fake-suit-%d' % suit.doId)
+            if suit in self.suitList:
+                self.suitList.remove(suit)
+                self.releaseInvasionSuit(suit)
+
+    return StreetSuitPlanner
+
+
+class FakeNewsManager:
+
+    def __init__(self, district):
+        self.district = district
+
+    def d_setInvasionStatus(self, msgType, cogType, numRemaining, skeleton):
+        from toontown.toonbase import ToontownGlobals
+
+        self.district.statuses.append((globalClock.getFrameTime(), msgType))
+        manager = self.district.air.suitInvasionManager
+        if msgType == ToontownGlobals.SuitInvasionEnd and hasattr(manager, 'getStreetProgress'):
+            # What the manager counted, before it forgets the invasion
+            self.district.progress = manager.getStreetProgress()
+
+
+class FakeAIRepository(harness.FakeAIRepository):
+
+    def __init__(self, district, managerClass):
+        harness.FakeAIRepository.__init__(self)
+        self.suitPlanners = {}
+        self.newsManager = FakeNewsManager(district)
+        self.suitInvasionManager = managerClass(self)
+
+
+class District:
+    # Every street of a district, the toons fighting on some of them, and what happened during an invasion.
+
+    def __init__(self, managerClass, plannerClass, seed):
+        self.rng = random.Random(seed)
+        self.air = FakeAIRepository(self, managerClass)
+        self.nextDoId = 400000000
+        self.statuses = []
+        self.spawns = collections.Counter()
+        self.mostInvaders = collections.Counter()
+        self.defeats = collections.Counter()
+        self.invasionDefeatTimes = []
+        self.lateSpawns = 0
+        self.flights = collections.defaultdict(set)
+        self.invadersFlown = 0
+        self.progress = {}
+        streetClass = makeStreetClass(plannerClass)
+        noCogsIdx = self.rng.randrange(len(plannerClass.SuitHoodInfo))
+        for hoodInfoIdx in range(len(plannerClass.SuitHoodInfo)):
+            numToons = self.rng.choice((0, 0, 1, 2, 4, 6))
+            suitPlanner = streetClass(self.air, self, hoodInfoIdx, numToons, hoodInfoIdx != noCogsIdx)
+            self.air.suitPlanners[suitPlanner.zoneId] = suitPlanner
+
+    def destroy(self):
+        for suitPlanner in self.air.suitPlanners.values():
+            suitPlanner.destroy()
+
+        taskMgr.remove('invasion-timeout')
+        taskMgr.remove('invasion-rollover')
+
+    def allocateDoId(self):
+        self.nextDoId += 1
+        return self.nextDoId
+
+    def isInvading(self):
+        return self.air.suitInvasionManager.getInvading()
+
+    def spawned(self, suitPlanner, suit, suitName):
+        if suitName is not None and not self.isInvading():
+            self.lateSpawns += 1
+        elif suitName is not None:
+            self.spawns[suitPlanner.zoneId] += 1
+            numInvaders = len([suit for suit in suitPlanner.suitList if suit.invader])
+            self.mostInvaders[suitPlanner.zoneId] = max(self.mostInvaders[suitPlanner.zoneId], numInvaders)
+
+    def defeated(self, suitPlanner, suit):
+        if suit.invader and self.isInvading():
+            self.defeats[suitPlanner.zoneId] += 1
+            self.invasionDefeatTimes.append(globalClock.getFrameTime())
+
+    def flownAway(self, suitPlanner, suit):
+        self.flights[globalClock.getFrameTime()].add(suitPlanner.zoneId)
+        if suit.invasionId and self.isInvading() and suit.invasionId == self.air.suitInvasionManager.getInvasionId():
+            self.invadersFlown += 1
+
+    def step(self, seconds, frame):
+        for i in range(int(round(seconds / frame))):
+            globalClock.setFrameTime(globalClock.getFrameTime() + frame)
+            taskMgr.step()
+
+    def run(self, numCogs, frame, rolloverTime):
+        self.step(SettleTime, frame)
+        self.flights.clear()
+        startTime = globalClock.getFrameTime()
+        manager = self.air.suitInvasionManager
+        manager.startInvasion(InvadingCog, numCogs, 0)
+        quotas = {zoneId: street.quota for zoneId, street in getattr(manager, 'streets', {}).items()}
+        while self.isInvading():
+            self.step(frame, frame)
+
+        endTime = globalClock.getFrameTime()
+        self.step(rolloverTime + 30.0, frame)
+        return startTime, endTime, quotas
+
+    def countInvaders(self):
+        return sum(1 for suitPlanner in self.air.suitPlanners.values() for suit in suitPlanner.suitList
+                   if suit.invader and suit.pathState == 1)
+
+
+def printReport(name, district, numCogs, startTime, endTime, quotas):
+    planners = district.air.suitPlanners
+    flown = collections.Counter()
+    for frameTime, zoneIds in district.flights.items():
+        flown[frameTime] = len(zoneIds)
+
+    print('%s: the invasion of %d cogs ended after %.1f minutes, with %d spawned and %d defeated. '
+          'Cogs flew away from at most %d streets in one frame.' % (
+              name, numCogs, (endTime - startTime) / 60.0, sum(district.spawns.values()),
+              len(district.invasionDefeatTimes), max(flown.values(), default=0)))
+    if quotas:
+        print('    street  weight  toons  share  spawned  defeated')
+        for zoneId in sorted(planners):
+            planner = planners[zoneId]
+            print('    %6d  %6d  %5d  %5d  %7d  %8d' % (zoneId, planner.getInvasionWeight(), planner.numToons,
+                                                        quotas[zoneId], district.spawns[zoneId],
+                                                        district.defeats[zoneId]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a cog invasion across every suit planner of a district.')
+    parser.add_argument('--cogs', type=int, default=1000, help='Number of cogs in the invasion.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--frame', type=float, default=0.25, help='Seconds the clock moves every frame.')
+    parser.add_argument('--baseline', help='Also run the invasion with SuitInvasionManagerAI at this git revision.')
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    harness.setupGame(headless=True)
+    from toontown.suit.SuitInvasionManagerAI import SuitInvasionManagerAI
+
+    plannerClass = loadPlannerClass()
+    district = District(SuitInvasionManagerAI, plannerClass, args.seed)
+    rolloverTime = district.air.suitInvasionManager.rolloverTime
+    startTime, endTime, quotas = district.run(args.cogs, args.frame, rolloverTime)
+    printReport('Current', district, args.cogs, startTime, endTime, quotas)
+    district.destroy()
+
+    if args.baseline:
+        module = harness.loadBaseline(args.baseline, 'toontown/suit/SuitInvasionManagerAI.py')
+        district = District(module.SuitInvasionManagerAI, plannerClass, args.seed)
+        startTime, endTime, quotas = district.run(args.cogs, args.frame, 0)
+        printReport(args.baseline, district, args.cogs, startTime, endTime, quotas)
+        district.destroy()
+
+
+if __name__ == '__main__':
+    main()
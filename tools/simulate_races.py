@@ -0,0 +1,507 @@
+# Headless kart race simulator for DistributedRaceAI and RaceManagerAI.
+#
+# Real races are created by a real RaceManagerAI, with real toons, on a fake AI
+# repository. Fake clients play every racer: they answer the race's barriers, drive
+# scripted lap times while sending heresMyT like the client does, pick up and throw
+# gags, and leave once they have seen their results. A few of them never show up,
+# drive too slowly and get kicked, or disconnect halfway. Practice, toon battle and
+# circuit races (all 3 legs) are mixed.
+#
+# The task manager runs on a slaved clock, half a second of race time per frame, so
+# nothing ever waits on real time, and many races run side by side.
+#
+# At the end, the tickets, trophies, circuit points and server events the races handed
+# out are reported, along with how long the trophy checks took. Pass --baseline with a
+# git revision to also run the RaceManagerAI from that revision on the same races;
+# every toon and every server event must come out the same.
+#
+# Usage (from the repository root):
+#     python tools/simulate_races.py [--races 2000] [--concurrent 32] [--checks 20000] [--seed 0] [--baseline <rev>]
+
+import argparse
+import builtins
+import collections
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from panda3d.direct import CConnectionRepository
+
+import harness
+
+# Race time that passes every frame, which is also how often clients send heresMyT
+FrameTime = 0.5
+
+# Enough for every toon to keep paying entry fees
+StartingTickets = 10000
+
+TimedMethods = ('checkForRaceTrophies', 'checkForCircuitTrophies', 'checkForNonRaceTrophies',
+                'checkHistoryForTrophy', 'checkHistoryForTrophyByValue', 'checkForTrophies')
+
+
+def setupGame(dataFolder):
+    # RaceManagerAI keeps its track records in here
+    harness.setupGame('server-data-folder %s' % os.path.join(dataFolder, ''), headless=True)
+
+    from otp.otpbase import PythonUtil
+    PythonUtil.time = SimulatedTime()
+
+
+class SimulatedTime:
+    # nonRepeatingRandomList seeds the random module with time.time() before picking the starting places,
+    # which would make no two runs alike. Our races happen on the simulated clock, so that is the time it gets.
+
+    def time(self):
+        return globalClock.getFrameTime()
+
+
+class FakeAIRepository(harness.FakeAIRepository, CConnectionRepository):
+    # Just enough of an AI repository for races, karts and toons. Updates sent by a race go to its RaceClient.
+    # The karts' smooth nodes need a real CConnectionRepository, even though they never send anything through it.
+
+    def __init__(self, simulator):
+        CConnectionRepository.__init__(self, False, False)
+        harness.FakeAIRepository.__init__(self)
+        self.simulator = simulator
+        self.clients = {}
+        self.raceMgr = None
+
+    def objectGenerated(self, do):
+        self.simulator.objectGenerated(do)
+
+    def objectDeleted(self, do):
+        self.simulator.objectDeleted(do)
+
+    def sendUpdate(self, do, fieldName, args):
+        client = self.clients.get(do.doId)
+        if client:
+            client.handleUpdate(fieldName, args)
+
+    def sendUpdateToChannel(self, do, channelId, fieldName, args):
+        client = self.clients.get(do.doId)
+        if client:
+            client.handleUpdate(fieldName, args)
+
+    def logServerEvent(self, name, fields):
+        # Kept the way writeServerEvent was called before, so events still compare with a baseline's
+        fields = dict(fields)
+        self.serverEvents.append((name, fields.pop('avId', None), '|'.join(str(value) for value in fields.values())))
+
+
+class Driver:
+    # One racer's kart during a race.
+
+    def __init__(self, avId, lapTime, startTime, disconnectTime):
+        self.avId = avId
+        self.lapTime = lapTime
+        self.startTime = startTime
+        self.disconnectTime = disconnectTime
+        self.progress = 0.0
+        self.gag = None
+        self.throwTime = None
+
+
+class RaceClient:
+    # Plays the clients of every racer in a single race.
+
+    def __init__(self, simulator, race):
+        from direct.distributed.ClockDelta import globalClockDelta
+        from toontown.racing import RaceGlobals
+        from toontown.racing.DistributedGagAI import DistributedGagAI
+
+        self.globalClockDelta = globalClockDelta
+        self.RaceGlobals = RaceGlobals
+        self.DistributedGagAI = DistributedGagAI
+        self.simulator = simulator
+        self.rng = simulator.rng
+        self.race = race
+        self.answered = set()
+        self.gags = {}
+        self.drivers = {}
+        self.gone = set()
+        self.leaving = set()
+        self.noShows = set(avId for avId in race.avIds if self.rng.random() < 0.02)
+
+    def sendAs(self, avId, method, *args):
+        # Sends a field update to the race as if avId's client sent it
+        if self.race.isDeleted() or avId in self.gone:
+            return
+
+        self.simulator.air.senderAvId = avId
+        method(*args)
+
+    def handleUpdate(self, fieldName, args):
+        handler = getattr(self, 'handle_' + fieldName, None)
+        if handler:
+            handler(*args)
+
+    def handle_setBarrierData(self, data):
+        for context, name, avIds in data:
+            for avId in avIds:
+                if (context, avId) in self.answered or avId in self.noShows:
+                    continue
+
+                self.answered.add((context, avId))
+                self.simulator.later(self.rng.uniform(0.5, 3.0), self.sendAs, avId, self.race.setBarrierReady, context)
+
+    def handle_genGag(self, slot, pos, index):
+        self.gags[slot] = index
+
+    def handle_startRace(self, timestamp):
+        RaceGlobals = self.RaceGlobals
+        now = globalClock.getFrameTime()
+        recordTime = RaceGlobals.TrackDict[self.race.trackId][2]
+        for avId in self.race.avIds:
+            if avId in self.race.kickedAvIds:
+                continue
+
+            # Most racers are somewhere between a record and just missing the qualifying time, a few are hopeless
+            qualifyingTime = RaceGlobals.getQualifyingTime(self.race.trackId)
+            raceTime = self.rng.uniform(recordTime * 0.9, qualifyingTime * 1.1)
+            if self.rng.random() < 0.02:
+                raceTime = qualifyingTime * 3
+            disconnectTime = None
+            if self.rng.random() < 0.01:
+                disconnectTime = now + self.rng.uniform(5, raceTime)
+
+            self.drivers[avId] = Driver(avId, raceTime / self.race.lapCount, now + RaceGlobals.RaceCountdown + 0.5,
+                                        disconnectTime)
+
+    def handle_goToSpeedway(self, avIds, reason):
+        # Kicked racers leave as soon as their client hears about it, which is never right away
+        for avId in avIds:
+            if avId not in self.leaving:
+                self.leaving.add(avId)
+                self.simulator.later(self.rng.uniform(0.1, 1.0), self.leave, avId)
+
+    def handle_setPlace(self, avId, totalTime, place, entryFee, qualify, winnings, bonus, trophies, circuitPoints,
+                        circuitTime):
+        self.simulator.recordPlace(self.race, avId, place, entryFee, qualify, winnings, bonus, trophies, circuitPoints)
+        if not (self.race.isCircuit() and self.race.isLastRace()):
+            self.simulator.later(self.rng.uniform(2.0, 10.0), self.leave, avId)
+
+    def handle_setCircuitPlace(self, avId, place, entryFee, winnings, bonus, trophies):
+        self.simulator.recordCircuitPlace(self.race, avId, place, entryFee, winnings, bonus, trophies)
+
+    def handle_endCircuitRace(self):
+        if self.race.isLastRace():
+            for avId in self.race.avIds:
+                self.simulator.later(self.rng.uniform(2.0, 10.0), self.leave, avId)
+
+    def leave(self, avId):
+        self.drivers.pop(avId, None)
+        self.sendAs(avId, self.race.racerLeft, avId)
+        self.gone.add(avId)
+
+    def disconnect(self, avId):
+        self.drivers.pop(avId, None)
+        self.gone.add(avId)
+        self.simulator.disconnected.add(avId)
+        messenger.send(self.simulator.air.getAvatarExitEvent(avId))
+
+    def getStandings(self):
+        return sorted(self.drivers.values(), key=lambda driver: driver.progress, reverse=True)
+
+    def tick(self, now):
+        if not self.drivers:
+            return
+
+        timestamp = self.globalClockDelta.localToNetworkTime(now)
+        lapCount = self.race.lapCount
+        for place, driver in enumerate(self.getStandings()):
+            if driver.disconnectTime is not None and now >= driver.disconnectTime:
+                self.disconnect(driver.avId)
+                continue
+
+            if now < driver.startTime:
+                continue
+
+            driver.progress = (now - driver.startTime) / driver.lapTime
+            laps = min(int(driver.progress), lapCount)
+            self.sendAs(driver.avId, self.race.heresMyT, driver.avId, laps, driver.progress % 1.0, timestamp)
+            if laps >= lapCount:
+                # Finished, so there is nothing left to drive
+                del self.drivers[driver.avId]
+                continue
+
+            self.useGags(driver, place, now)
+
+    def moveKarts(self):
+        # Pies are aimed at whoever is closest in front, so the karts need to be where their drivers are
+        for driver in self.drivers.values():
+            racer = self.race.racers.get(driver.avId)
+            if racer and racer.kart:
+                racer.kart.setY(driver.progress * 1000)
+
+    def useGags(self, driver, place, now):
+        if driver.gag is None:
+            if self.rng.random() >= 0.05:
+                return
+
+            slots = [slot for slot, index in self.gags.items() if index is not None]
+            if slots:
+                slot = self.rng.choice(slots)
+                index = self.gags[slot]
+                gagFreq = self.RaceGlobals.GagFreq
+                driver.gag = gagFreq[min(place, len(gagFreq) - 1)][index]
+                driver.throwTime = now + self.rng.uniform(2.0, 8.0)
+                self.gags[slot] = None
+                self.sendAs(driver.avId, self.race.hasGag, slot, driver.gag, index)
+        elif now >= driver.throwTime:
+            if driver.gag == self.RaceGlobals.PIE:
+                self.moveKarts()
+
+            driver.gag = None
+            self.sendAs(driver.avId, self.race.requestThrow, 0, 0, 0)
+            # Somebody else might drive into a banana
+            for gag in list(getattr(self.race, 'thrownGags', [])):
+                if isinstance(gag, self.DistributedGagAI) and self.rng.random() < 0.3:
+                    others = [avId for avId in self.drivers if avId != gag.ownerId]
+                    if others:
+                        avId = self.rng.choice(others)
+                        self.sendAs(avId, gag.hitSomebody, avId, self.globalClockDelta.localToNetworkTime(now))
+
+
+class RaceSimulator:
+
+    def __init__(self, RaceManagerAI, numToons, seed):
+        from toontown.toon.DistributedToonAI import DistributedToonAI
+
+        self.rng = random.Random(seed)
+        # DistributedRaceAI picks starting places and gags with the random module
+        random.seed(seed)
+        self.air = FakeAIRepository(self)
+        builtins.simbase.air = self.air
+        self.raceMgr = RaceManagerAI(self.air)
+        self.air.raceMgr = self.raceMgr
+        self.timings = collections.defaultdict(lambda: [0, 0.0])
+        for name in TimedMethods:
+            self.timeMethod(name)
+
+        self.toons = []
+        for i in range(numToons):
+            toon = DistributedToonAI(self.air)
+            toon.doId = 100000000 + i
+            toon.zoneId = 8000
+            toon.setName('Racer %d' % i)
+            toon.setTickets(StartingTickets)
+            toon.setKartingHistory([0] * 16)
+            toon.setKartingTrophies([0] * 33)
+            toon.setKartingPersonalBest([0] * 6)
+            toon.setKartingPersonalBest2([0] * 12)
+            self.air.doId2do[toon.doId] = toon
+            self.toons.append(toon)
+
+        self.freeToons = list(self.toons)
+        self.toonRaces = {}
+        self.disconnected = set()
+        self.laterTasks = 0
+        self.raceTypes = collections.Counter()
+        self.tickets = collections.defaultdict(collections.Counter)
+        self.circuitPoints = collections.Counter()
+        self.places = []
+
+    def timeMethod(self, name):
+        method = getattr(self.raceMgr, name)
+        timing = self.timings[name]
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                timing[0] += 1
+                timing[1] += time.perf_counter() - start
+
+        setattr(self.raceMgr, name, timed)
+
+    def later(self, delay, function, *args):
+        self.laterTasks += 1
+        taskMgr.doMethodLater(delay, function, 'simulatedClient-%d' % self.laterTasks, extraArgs=list(args))
+
+    def objectGenerated(self, do):
+        from toontown.racing.DistributedRaceAI import DistributedRaceAI
+
+        if isinstance(do, DistributedRaceAI):
+            self.air.clients[do.doId] = RaceClient(self, do)
+            for avId in do.avIds:
+                self.toonRaces[avId] = do
+
+    def objectDeleted(self, do):
+        client = self.air.clients.pop(do.doId, None)
+        if not client:
+            return
+
+        for avId in client.race.avIds:
+            if self.toonRaces.get(avId) is not do:
+                continue
+
+            # This was their last race, they go back to the playground
+            del self.toonRaces[avId]
+            toon = self.air.doId2do[avId]
+            if avId in self.disconnected:
+                # They logged back in, so without the kart they had
+                self.disconnected.discard(avId)
+                toon.kart = None
+            self.freeToons.append(toon)
+
+    def startRace(self):
+        from toontown.racing import RaceGlobals
+
+        raceType = self.rng.choice((RaceGlobals.Practice, RaceGlobals.Practice, RaceGlobals.ToonBattle,
+                                    RaceGlobals.ToonBattle, RaceGlobals.Circuit))
+        trackId = self.rng.choice(RaceGlobals.TrackIds)
+        circuitLoop = []
+        if raceType == RaceGlobals.Circuit:
+            # getCircuitLoop prints the loop it found
+            with contextlib.redirect_stdout(io.StringIO()):
+                circuitLoop = RaceGlobals.getCircuitLoop(trackId)
+
+        numRacers = min(self.rng.randint(1, RaceGlobals.MaxRacers), len(self.freeToons))
+        self.rng.shuffle(self.freeToons)
+        players = [self.freeToons.pop().doId for _ in range(numRacers)]
+        self.raceTypes[raceType] += 1
+        self.raceMgr.createRace(trackId, raceType, 3, players, circuitLoop=circuitLoop[1:], circuitPoints={},
+                                circuitTimes={}, qualTimes=[], circuitTimeList={}, circuitTotalBonusTickets={})
+
+    def recordPlace(self, race, avId, place, entryFee, qualify, winnings, bonus, trophies, circuitPoints):
+        tickets = self.tickets[race.raceType]
+        tickets['entry fees back'] += entryFee
+        tickets['winnings'] += winnings
+        tickets['record bonuses'] += bonus
+        tickets['qualified'] += qualify
+        self.places.append((race.trackId, race.raceType, race.toonCount, avId, place, qualify, tuple(trophies)))
+        if race.isCircuit() and race.isLastRace():
+            self.circuitPoints[sum(circuitPoints)] += 1
+
+    def recordCircuitPlace(self, race, avId, place, entryFee, winnings, bonus, trophies):
+        tickets = self.tickets['circuit totals']
+        tickets['entry fees back'] += entryFee
+        tickets['winnings'] += winnings
+        tickets['record bonuses'] += bonus
+        self.places.append((race.trackId, 'circuit', race.toonCount, avId, place, 0, tuple(trophies)))
+
+    def step(self, now):
+        globalClock.setFrameTime(now)
+        taskMgr.step()
+        self.air.processDeletes()
+        for client in list(self.air.clients.values()):
+            client.tick(now)
+
+    def run(self, numRaces, concurrent):
+        # Every run starts the clock over, so the same races happen at the same times
+        now = 0.0
+        globalClock.setFrameTime(now)
+        started = 0
+        startTime = time.perf_counter()
+        while started < numRaces or self.raceMgr.races or self.air.pendingDeletes:
+            while started < numRaces and len(self.raceMgr.races) < concurrent and self.freeToons:
+                self.startRace()
+                started += 1
+
+            now += FrameTime
+            self.step(now)
+            if now > numRaces * 3600:
+                raise SystemExit('The races never finished!')
+
+        # Let the karts be cleaned up, then write the records out
+        for _ in range(int(30 / FrameTime)):
+            now += FrameTime
+            self.step(now)
+
+        self.raceMgr.flushRecordFile()
+        taskMgr.remove(self.raceMgr.uniqueName('update-leaderboards'))
+        return time.perf_counter() - startTime, now
+
+    def getTrophies(self):
+        return collections.Counter(index for toon in self.toons for index, won in enumerate(toon.getKartingTrophies()) if won)
+
+    def getDigest(self):
+        toons = [(toon.doId, toon.getTickets(), list(toon.getKartingTrophies()), list(toon.getKartingHistory()),
+                  list(toon.getKartingPersonalBestAll())) for toon in self.toons]
+        return toons, list(self.places), list(self.air.serverEvents)
+
+    def benchmarkCheckForTrophies(self, numChecks):
+        # Nothing in a race calls checkForTrophies, so it gets the same kind of work directly
+        from toontown.racing import RaceGlobals
+
+        for _ in range(numChecks):
+            toon = self.rng.choice(self.toons)
+            self.raceMgr.checkForTrophies(self.rng.randint(1, RaceGlobals.MaxRacers), self.rng.choice(RaceGlobals.TrackIds),
+                                          self.rng.choice((RaceGlobals.ToonBattle, RaceGlobals.Circuit)),
+                                          self.rng.randint(1, RaceGlobals.MaxRacers), toon.doId)
+
+
+def printReport(simulator, numRaces, elapsed, raceTime):
+    from toontown.racing import RaceGlobals
+    from toontown.toonbase import TTLocalizer
+
+    raceTypeNames = {RaceGlobals.Practice: 'practice', RaceGlobals.ToonBattle: 'toon battle', RaceGlobals.Circuit: 'circuit'}
+    print('%d races (%s) in %.1f s, %.0f races per minute, %.1f hours of race time.' % (
+        numRaces, ', '.join('%d %s' % (count, raceTypeNames[raceType]) for raceType, count in sorted(simulator.raceTypes.items())),
+        elapsed, numRaces / elapsed * 60 if elapsed else 0.0, raceTime / 3600))
+
+    print('\nTickets:')
+    for raceType, tickets in sorted(simulator.tickets.items(), key=lambda item: str(item[0])):
+        print('  %-15s %s' % (raceTypeNames.get(raceType, raceType), ', '.join('%s %d' % item for item in sorted(tickets.items()))))
+    tickets = sum(toon.getTickets() for toon in simulator.toons)
+    print('  %-15s %d (%+d)' % ('toons now own', tickets, tickets - len(simulator.toons) * StartingTickets))
+
+    print('\nTrophies:')
+    for index, count in sorted(simulator.getTrophies().items()):
+        print('  %5d  %s' % (count, TTLocalizer.KartTrophyDescriptions[index]))
+
+    print('\nFinal circuit points:')
+    for points, count in sorted(simulator.circuitPoints.items()):
+        print('  %3d points: %d' % (points, count))
+
+    print('\nServer events:')
+    for logtype, count in collections.Counter(event[0] for event in simulator.air.serverEvents).most_common():
+        print('  %6d  %s' % (count, logtype))
+
+    print('\nTrophy checks:')
+    for name in TimedMethods:
+        calls, seconds = simulator.timings[name]
+        print('  %-30s %7d calls %8.3f s %6.1f us/call' % (name, calls, seconds, seconds / calls * 1e6 if calls else 0.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate kart races without clients.')
+    parser.add_argument('--races', type=int, default=2000, help='Number of races (whole circuits count as one).')
+    parser.add_argument('--concurrent', type=int, default=32, help='Number of races running at the same time.')
+    parser.add_argument('--checks', type=int, default=20000, help='Number of checkForTrophies calls to benchmark.')
+    parser.add_argument('--baseline', help='Git revision of RaceManagerAI to compare against.')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    os.chdir(harness.RepositoryRoot)
+    sys.path.insert(0, os.getcwd())
+    with tempfile.TemporaryDirectory() as dataFolder:
+        setupGame(dataFolder)
+        from toontown.racing.RaceManagerAI import RaceManagerAI
+
+        numToons = args.concurrent * 4 + 16
+        simulator = RaceSimulator(RaceManagerAI, numToons, args.seed)
+        elapsed, raceTime = simulator.run(args.races, args.concurrent)
+        digest = simulator.getDigest()
+        simulator.benchmarkCheckForTrophies(args.checks)
+        printReport(simulator, args.races, elapsed, raceTime)
+        if args.baseline:
+            # The record file from the first run must not leak into the second one
+            if os.path.exists(simulator.raceMgr.filename):
+                os.remove(simulator.raceMgr.filename)
+            baseline = RaceSimulator(harness.loadBaseline(args.baseline, 'toontown/racing/RaceManagerAI.py').RaceManagerAI, numToons, args.seed)
+            baselineElapsed, _ = baseline.run(args.races, args.concurrent)
+            print('\nBaseline %s: %.1f s' % (args.baseline, baselineElapsed))
+            if baseline.getDigest() != digest:
+                raise SystemExit('The toons, places or server events of the baseline and current RaceManagerAI differ!')
+
+            print('The toons, places and server events are the same as the baseline\'s.')
+
+
+if __name__ == '__main__':
+    main()
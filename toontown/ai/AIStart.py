@@ -98,3 +98,5 @@ except Exception:
     simbase.air.writeServerEvent('ai-exception', avId=simbase.air.getAvatarIdFromSender(),
                                  accId=simbase.air.getAccountIdFromSender(), exception=info)
     raise
+finally:
+    simbase.air.shutdown()
@@ -19,6 +19,7 @@ from toontown.ai.WelcomeValleyManagerAI import WelcomeValleyManagerAI
 from toontown.archipelago.distributed.DistributedArchipelagoManagerAI import DistributedArchipelagoManagerAI
 from toontown.building.DistributedTrophyMgrAI import DistributedTrophyMgrAI
 from toontown.catalog.CatalogManagerAI import CatalogManagerAI
+from toontown.catalog.DeliverySchedulerAI import DeliverySchedulerAI
 from toontown.coghq.CogSuitManagerAI import CogSuitManagerAI
 from toontown.coghq.CountryClubManagerAI import CountryClubManagerAI
 from toontown.coghq.FactoryManagerAI import FactoryManagerAI
@@ -62,6 +63,7 @@ from toontown.toonbase import ToontownGlobals, TTLocalizer
 from toontown.tutorial.TutorialManagerAI import TutorialManagerAI
 from toontown.uberdog.DistributedInGameNewsMgrAI import DistributedInGameNewsMgrAI
 from toontown.uberdog.DistributedPartyManagerAI import DistributedPartyManagerAI
+from toontown.util.astron.AstronSendBuffer import AstronSendBuffer
 
 
 class ToontownAIRepository(ToontownInternalRepository):
@@ -82,6 +84,7 @@ class ToontownAIRepository(ToontownInternalRepository):
         self.holidayManager = None
         self.welcomeValleyManager = None
         self.catalogManager = None
+        self.deliveryScheduler = None
         self.zoneDataStore = None
         self.inGameNewsMgr = None
         self.trophyMgr = None
@@ -124,9 +127,49 @@ class ToontownAIRepository(ToontownInternalRepository):
         # When relogging
         self.archipelagoConnectionCache: Dict[int, tuple] = {}
 
+        # Holds everything we send during a frame and sends it at the end of the frame, see AstronSendBuffer
+        self.sendBuffer = None
+        if self.config.GetBool('want-ai-send-buffer', False):
+            self.sendBuffer = AstronSendBuffer(self.sendImmediate, merge=self.config.GetBool('ai-send-buffer-merge', True))
+            self.sendBuffer.start(self.uniqueName('flushSendBuffer'))
+
     def getTrackClsends(self):
         return False
 
+    def send(self, datagram):
+        if self.sendBuffer is not None:
+            self.sendBuffer.add(datagram)
+        else:
+            self.sendImmediate(datagram)
+
+    def sendImmediate(self, datagram):
+        # Sends the datagram right away, even if the send buffer is on.
+        ToontownInternalRepository.send(self, datagram)
+
+    def sendUpdateToChannel(self, do, channelId, fieldName, args):
+        if self.sendBuffer is None:
+            ToontownInternalRepository.sendUpdateToChannel(self, do, channelId, fieldName, args)
+            return
+
+        field = do.dclass.getFieldByName(fieldName)
+        datagram = field.aiFormatUpdate(do.doId, channelId, self.ourChannel, args)
+        self.sendBuffer.addUpdate(do.doId, channelId, field, datagram)
+
+    def shutdown(self):
+        # Called by AIStart once the task manager stops. Anything only saved every so often is written now.
+        if self.raceMgr:
+            self.raceMgr.flushRecordFile()
+        if self.friendManager:
+            self.friendManager.flushTrueFriendCodesFile()
+        for buildingManager in self.buildingManagers.values():
+            buildingManager.flushSave()
+
+        # Whatever was sent during the last frame goes out before the connection is closed
+        if self.sendBuffer is not None:
+            self.sendBuffer.stop()
+
+        ToontownInternalRepository.shutdown(self)
+
     def handleConnected(self):
         ToontownInternalRepository.handleConnected(self)
 
@@ -172,6 +215,9 @@ class ToontownAIRepository(ToontownInternalRepository):
         # Create our zone data store...
         self.zoneDataStore = AIZoneDataStore()
 
+        # Create our delivery scheduler...
+        self.deliveryScheduler = DeliverySchedulerAI(self)
+
         # Create our pet manager...
         self.petMgr = PetManagerAI(self)
 
@@ -58,6 +58,7 @@ class ArchipelagoClient(DirectObject):
         self.av = av  # DistributedToonAI that owns this client
         self.slot: int = -1  # Our slot ID given when we connect
         self.team: int = 999
+        self.seed_name: str = ''  # Name of the generation of the room we are connected to, given in RoomInfo
         self.uuid: str = ''  # not sure how important this is atm but just generating something in udpate_id method
 
         # Actually defines correct values for variables above
@@ -3,6 +3,7 @@ from typing import List
 
 from toontown.archipelago.apclient.ap_client_enums import APClientEnums
 from toontown.archipelago.apclient.archipelago_client import ArchipelagoClient
+from toontown.archipelago.apclient.distributed_toon_apmessage_queue import APMessageFilter
 from toontown.archipelago.definitions import util
 from toontown.archipelago.definitions.death_reason import DeathReason
 from toontown.archipelago.packets.serverbound.bounce_packet import BouncePacket
@@ -48,6 +49,19 @@ class ArchipelagoSession:
         self.client.update_identification(self.client.slot_name, new_password)
         self.avatar.d_setSystemMessage(0, f"Updated password")
 
+    def handle_filter(self, option: str):
+        filters = {
+            'all': APMessageFilter.ALL,
+            'mine': APMessageFilter.MINE,
+        }
+        messageFilter = filters.get(option.lower())
+        if messageFilter is None:
+            self.avatar.d_setSystemMessage(0, f"Usage: !filter <{'|'.join(filters)}>")
+            return
+
+        self.avatar.apMessageQueue.setMessageFilter(messageFilter)
+        self.avatar.d_setSystemMessage(0, f"Now showing {option.lower()} Archipelago messages")
+
     # Called from DisToonAI when this toon sends a chat message
     def handle_chat(self, message: str):
 
@@ -72,6 +86,11 @@ class ArchipelagoSession:
         if message.startswith('!disconnect'):
             return self.handle_disconnect()
 
+        # Handle the case where they want to change which messages show up in their log
+        command, _, option = message.partition(' ')
+        if command == '!filter':
+            return self.handle_filter(option.strip())
+
         # Below we are only gonna consider the case we have a valid connection
         if self.client.state in (APClientEnums.DISCONNECTED, APClientEnums.CONNECTING):
             return
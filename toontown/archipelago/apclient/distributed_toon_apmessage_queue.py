@@ -1,30 +1,70 @@
-from typing import List
+import collections
+from enum import IntEnum
+from typing import Deque, Dict, List
 
-# How many times a second should we process the queue of messages for the toon?
-DEFAULT_QUEUE_PROCESS_FREQUENCY = 3
-TASK_DELAY_TIME = 1 / DEFAULT_QUEUE_PROCESS_FREQUENCY
-# How many messages per run should we process if we have a lot of messages to handle?
-DEFAULT_QUEUE_MESSAGE_BATCH = 5
+# How many messages a toon may be sent per rate limit window. Anything over this is dropped and summarized
+# once the window is over, so a busy multiworld can't flood a toon's log (or the AI) with updates.
+DEFAULT_RATE_LIMIT_MESSAGES = 30
+DEFAULT_RATE_LIMIT_WINDOW = 5.0
 
 
-# A container for messages stored on DistributedToonAI that runs at a certain defined interval and handles a defined
-# amount of AP message to send to a toon
+# Which messages a toon wants to see in their log
+class APMessageFilter(IntEnum):
+    ALL = 0  # Everything the AP server sends us
+    MINE = 1  # Only item and hint messages that involve our slot, plus anything that isn't about items
+
+
+# A container for messages stored on DistributedToonAI. Every message sent to a toon goes through here.
+# Once per frame, everything queued since the last frame is collapsed into a single sendArchipelagoMessages update.
+# Repeated lines are merged, and messages over the rate limit are dropped and summarized.
+# Messages may be queued from the AP client thread, they are only ever sent from the main thread.
+# Appending to and popping from a deque are atomic, so neither side has to lock.
 class DistributedToonAPMessageQueue:
 
-    def __init__(self, toon):
+    def __init__(self, toon, rateLimitMessages=DEFAULT_RATE_LIMIT_MESSAGES, rateLimitWindow=DEFAULT_RATE_LIMIT_WINDOW):
         self.toon = toon
-        self._queue: List[str] = []
+        self._queue: Deque[str] = collections.deque()
+        self._importantQueue: Deque[str] = collections.deque()  # Never filtered or dropped, errors and connection status live here
+        self.rateLimitMessages = rateLimitMessages
+        self.rateLimitWindow = rateLimitWindow
+        self._windowStart = None
+        self._sentThisWindow = 0
+        self._droppedThisWindow = 0
+        self.messageFilter: APMessageFilter = APMessageFilter.ALL
 
     def __getTaskName(self):
         return self.toon.uniqueName('apmessage-queue')
 
-    def queue(self, message: str) -> None:
+    def setMessageFilter(self, messageFilter: APMessageFilter) -> None:
+        self.messageFilter = messageFilter
+
+    def getMessageFilter(self) -> APMessageFilter:
+        return self.messageFilter
+
+    # Queue a message to be sent next frame.
+    # :param relevant - False if this message only concerns other slots, it is skipped when filtering to MINE
+    # :param important - True if this message should never be filtered or dropped by the rate limit
+    def queue(self, message: str, relevant: bool = True, important: bool = False) -> None:
+        if important:
+            self._importantQueue.append(message)
+            return
+
+        if not relevant and self.messageFilter == APMessageFilter.MINE:
+            return
+
         self._queue.append(message)
 
+    # Takes out the messages that were in the queue when called. Anything the AP client thread queues meanwhile
+    # is left for the next drain.
+    @staticmethod
+    def __drain(queue: Deque[str]) -> List[str]:
+        return [queue.popleft() for _ in range(len(queue))]
+
     # Call to forcibly send all messages in the queue
     def finish(self):
-        self.toon.d_sendArchipelagoMessages(self._queue)
-        self._queue.clear()
+        important = self.__drain(self._importantQueue)
+        messages = self.__drain(self._queue)
+        self.toon.d_sendArchipelagoMessages(self.collapse(important + messages))
 
     def start(self):
         self.stop()
@@ -34,17 +74,40 @@ class DistributedToonAPMessageQueue:
         self.finish()
         taskMgr.remove(self.__getTaskName())
 
-    # Called via a task. Send messages in the queue if we have any.
-    def __process(self, task):
-        task.delayTime = TASK_DELAY_TIME
+    # Merges repeated lines into one, keeping the order each line was first seen in
+    @staticmethod
+    def collapse(messages: List[str]) -> List[str]:
+        counts: Dict[str, int] = {}
+        for message in messages:
+            counts[message] = counts.get(message, 0) + 1
+
+        return [message if count == 1 else f"{message} (x{count})" for message, count in counts.items()]
 
-        operations = min(len(self._queue), DEFAULT_QUEUE_MESSAGE_BATCH)
-        if operations <= 0:
-            return task.again
+    def __getOverflowSummary(self) -> str:
+        return f"{self._droppedThisWindow} Archipelago message(s) were skipped to avoid flooding your log."
 
+    # Called via a task every frame. Send everything queued since last frame as one update.
+    def __process(self, task):
+        now = globalClock.getFrameTime()
         toSend: List[str] = []
-        for index in range(operations):
-            toSend.append(self._queue.pop(0))
+        if self._windowStart is None or now - self._windowStart >= self.rateLimitWindow:
+            if self._droppedThisWindow > 0:
+                toSend.append(self.__getOverflowSummary())
+            self._windowStart = now
+            self._sentThisWindow = 0
+            self._droppedThisWindow = 0
+
+        if not self._queue and not self._importantQueue and not toSend:
+            return task.cont
+
+        important = self.collapse(self.__drain(self._importantQueue))
+        messages = self.collapse(self.__drain(self._queue))
+        budget = max(0, self.rateLimitMessages - self._sentThisWindow - len(important))
+        if len(messages) > budget:
+            self._droppedThisWindow += len(messages) - budget
+            messages = messages[:budget]
 
+        toSend += important + messages
+        self._sentThisWindow += len(important) + len(messages)
         self.toon.d_sendArchipelagoMessages(toSend)
-        return task.again
+        return task.cont
@@ -25,8 +25,13 @@ class DistributedToonRewardQueue:
 
     # Call to forcibly apply all rewards in the queue
     def finish(self):
-        for reward in self._queue:
-            reward.apply()
+        if not self._queue:
+            return
+
+        # Rewards usually touch several fields, send them to the state server as one update
+        with self.toon.fieldBatch():
+            for reward in self._queue:
+                reward.apply()
         self._queue.clear()
 
     def start(self):
@@ -45,8 +50,9 @@ class DistributedToonRewardQueue:
         if operations <= 0:
             return task.again
 
-        for index in range(operations):
-            reward = self._queue.pop(0)
-            reward.apply()
+        with self.toon.fieldBatch():
+            for index in range(operations):
+                reward = self._queue.pop(0)
+                reward.apply()
 
         return task.again
@@ -0,0 +1,43 @@
+# Registry of the conditions that make up a toon's Archipelago goal.
+# Every registered condition has to be satisfied before the goal is complete.
+# Conditions should only read state that the toon already keeps up to date as its fields change
+# (e.g. DistributedToonAI.getBossesDefeated()), so checking the goal stays cheap no matter how many exist.
+from typing import Callable, Dict
+
+# Typing hack, can remove later
+TYPING = False
+if TYPING:
+    from toontown.toon.DistributedToonAI import DistributedToonAI
+
+
+WinCondition = Callable[["DistributedToonAI"], bool]
+
+WIN_CONDITIONS: Dict[str, WinCondition] = {}
+
+
+# Decorator used to register a new win condition under a given name
+def win_condition(name: str):
+    def register(condition: WinCondition) -> WinCondition:
+        if name in WIN_CONDITIONS:
+            raise KeyError(f"Win condition {name} is already registered")
+        WIN_CONDITIONS[name] = condition
+        return condition
+    return register
+
+
+# Returns a list of the names of every condition the toon has not satisfied yet
+def get_unsatisfied_win_conditions(av: "DistributedToonAI") -> list:
+    return [name for name, condition in WIN_CONDITIONS.items() if not condition(av)]
+
+
+def win_conditions_satisfied(av: "DistributedToonAI") -> bool:
+    for condition in WIN_CONDITIONS.values():
+        if not condition(av):
+            return False
+    return True
+
+
+# Default goal, defeat a certain amount of the cog bosses at least once
+@win_condition("cog_bosses")
+def cog_bosses_defeated(av: "DistributedToonAI") -> bool:
+    return av.getBossesDefeated() >= av.slotData.get('cog_bosses_required', 4)
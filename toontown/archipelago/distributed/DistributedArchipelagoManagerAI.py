@@ -3,9 +3,11 @@ from typing import Union, List
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.DistributedObjectAI import DistributedObjectAI
 
+from otp.distributed import OtpDoGlobals
 from toontown.archipelago.apclient.ap_client_enums import APClientEnums
 from toontown.archipelago.apclient.archipelago_session import ArchipelagoSession
 from toontown.archipelago.util.archipelago_information import ArchipelagoInformation
+from toontown.archipelago.util.print_json_cache import PrintJSONCache
 from toontown.toon.DistributedToonAI import DistributedToonAI
 
 
@@ -77,6 +79,18 @@ class DistributedArchipelagoManagerAI(DistributedObjectAI):
 
         self.d_sync(infoToSend)
 
+        # The UberDOG also needs to know which room this toon is in now, so it can declare them to the toons
+        # they are playing with.
+        session = self.__getSession(avId)
+        if session is not None:
+            self.updateToonLocation(avId, PrintJSONCache.get_room_key(session.client))
+
+    # Called when a toon gets to this district, or connects to an Archipelago room.
+    # The OnlinePlayerManager only declares toons to the toons they share a district or room with (or are friends with).
+    def updateToonLocation(self, avId, roomKey=''):
+        self.air.sendUpdateToDoId('OnlinePlayerManager', 'setToonLocation', OtpDoGlobals.OTP_DO_ID_ONLINE_PLAYER_MANAGER,
+                                  [avId, self.air.districtId, roomKey])
+
     # Given an toon ID, return the ID of the team they are on.
     # Returns None if they are either not on a team, or not connected to Archipelago.
     def getToonTeam(self, avId) -> Union[int, None]:
@@ -69,29 +69,31 @@ class ConnectedPacket(ClientBoundPacketBase):
 
     def handle_first_time_player(self, av):
 
-        #  Reset stats
-        av.newToon()
-
-        # Set their max HP
-        av.b_setMaxHp(self.slot_data.get('starting_laff', 15))
-        av.b_setHp(av.getMaxHp())
-
-        # Set their starting money
-        av.b_setMoney(self.slot_data.get('starting_money', 50))
-
-        # Set their starting gag xp multiplier
-        av.b_setBaseGagSkillMultiplier(self.slot_data.get('base_global_gag_xp', 2))
-
-        # Give them gold rod if set in yaml
-        fish_progression = FishProgression(self.slot_data.get('fish_progression', 3))
-        need_gold_rod = fish_progression in (FishProgression.Licenses, FishProgression.Nonne)
-        if need_gold_rod:
-            av.b_setFishingRod(FishGlobals.MaxRodId)
-
-        # Give them global TP access if set in yaml
-        global_tpsanity = self.slot_data.get('tpsanity', TPSanity.default) == TPSanity.option_none
-        if global_tpsanity:
-            av.b_setTeleportAccess(ToontownGlobals.HoodsForTeleportAll)
+        # Send everything below to the state server as a single field update
+        with av.fieldBatch():
+            #  Reset stats
+            av.newToon()
+
+            # Set their max HP
+            av.b_setMaxHp(self.slot_data.get('starting_laff', 15))
+            av.b_setHp(av.getMaxHp())
+
+            # Set their starting money
+            av.b_setMoney(self.slot_data.get('starting_money', 50))
+
+            # Set their starting gag xp multiplier
+            av.b_setBaseGagSkillMultiplier(self.slot_data.get('base_global_gag_xp', 2))
+
+            # Give them gold rod if set in yaml
+            fish_progression = FishProgression(self.slot_data.get('fish_progression', 3))
+            need_gold_rod = fish_progression in (FishProgression.Licenses, FishProgression.Nonne)
+            if need_gold_rod:
+                av.b_setFishingRod(FishGlobals.MaxRodId)
+
+            # Give them global TP access if set in yaml
+            global_tpsanity = self.slot_data.get('tpsanity', TPSanity.default) == TPSanity.option_none
+            if global_tpsanity:
+                av.b_setTeleportAccess(ToontownGlobals.HoodsForTeleportAll)
 
     # Given the option defined in the YAML for RNG generation and the seed of the AP playthrough
     # Return a new modified seed based on what option was chosen in the YAML
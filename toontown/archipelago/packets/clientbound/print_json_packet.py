@@ -1,8 +1,8 @@
 from copy import deepcopy
 from typing import List
 
-from toontown.archipelago.util import global_text_properties
-from toontown.archipelago.util.net_utils import JSONMessagePart, JSONtoTextParser, JSONPartFormatter
+from toontown.archipelago.util.net_utils import JSONMessagePart, JSONtoTextParser
+from toontown.archipelago.util.print_json_cache import print_json_cache
 from toontown.archipelago.packets.clientbound.clientbound_packet_base import ClientBoundPacketBase
 
 
@@ -17,24 +17,30 @@ class PrintJSONPacket(ClientBoundPacketBase):
         # Textual content of this message
         self.data: List[JSONMessagePart] = self.read_raw_field('data')
 
+        # What kind of message this is, and who is involved if it is about an item
+        self.type: str = self.read_raw_field('type', ignore_missing=True)
+        self.receiving: int = self.read_raw_field('receiving', ignore_missing=True)
+        self.item: dict = self.read_raw_field('item', ignore_missing=True)
+
         # There are a lot more fields in this packet that I am ignoring as they are basically optional
-        # type, receiving, item, found, team, slot, message, tags, countdown
+        # found, team, slot, message, tags, countdown
 
-    def handle(self, client):
+    # Whether this message involves the given slot. Messages that aren't about items are always relevant.
+    def is_relevant_to(self, slot: int) -> bool:
+        if self.type not in ('ItemSend', 'ItemCheat', 'Hint'):
+            return True
 
-        # Parser for outputting to console if we want debug
-        self.debug(JSONtoTextParser(client).parse(deepcopy(self.data)))
+        if self.receiving == slot:
+            return True
 
-        # Our parser that is Panda3D friendly
-        parser = JSONPartFormatter(deepcopy(self.data), client)
-        formatted_parts = parser.get_formatted_parts()
+        return self.item is not None and self.item.get('player') == slot
 
-        # Loop through all the parts and build a string
-        ret = ''
-        for part in formatted_parts:
-            color = part['color']
-            text = part['text']
-            p3dcolor = global_text_properties.get_property_code_from_json_code(color)
-            ret += f"\1{p3dcolor}\1{text}\2"
+    def handle(self, client):
+
+        # Parser for outputting to console if we want debug
+        if self.DEBUG:
+            self.debug(JSONtoTextParser(client).parse(deepcopy(self.data)))
 
-        client.av.queueArchipelagoMessage(ret)
+        # Every client in the same room receives this exact message, names are resolved once and shared between them
+        ret = print_json_cache.render(self.data, client)
+        client.av.queueArchipelagoMessage(ret, relevant=self.is_relevant_to(client.slot))
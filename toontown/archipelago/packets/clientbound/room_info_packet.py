@@ -81,6 +81,9 @@ class RoomInfoPacket(ClientBoundPacketBase):
     def handle(self, client):
         self.debug("Handling packet")
 
+        # Remember which generation this room is playing, clients in the same room can share some work with this
+        client.seed_name = self.seed_name or ''
+
         # We should check in with our data packages
         self.update_data_packages(client)
 
@@ -241,31 +241,36 @@ class JSONPartFormatter:
         for part in self.parts:
 
             new_part: JSONMessagePart = deepcopy(part)
-
-            # What type of part is this?
-            part_type = part['type'] if 'type' in part else 'default'
-
-            # Switch statement basically on how we should handle the types of parts
-            if part_type in ('player_id', 'player_name'):
-                self.handle_player_part(new_part)
-            elif part_type in ('item_id', 'item_name'):
-                self.handle_item_part(new_part)
-            elif part_type in ('location_id', 'location_name'):
-                self.handle_location_part(new_part)
-            elif part_type == 'entrance_name':
-                self.handle_entrance_part(new_part)
-            elif part_type in ('default', 'text'):
-                self.handle_default_part(new_part)
-            elif part_type == 'color':  # No need to do anything, color is already defined
-                pass
-            else:
-                print(f"Unknown JSONMessagePart type: {part_type}, reverting to default part behavior")
-                self.handle_default_part(new_part)
-
+            self.get_formatted_part(new_part)
             new_parts.append(new_part)
 
         return new_parts
 
+    # Replaces the IDs and defines the color of a single JSONMessagePart in place
+    def get_formatted_part(self, part: JSONMessagePart) -> JSONMessagePart:
+
+        # What type of part is this?
+        part_type = part['type'] if 'type' in part else 'default'
+
+        # Switch statement basically on how we should handle the types of parts
+        if part_type in ('player_id', 'player_name'):
+            self.handle_player_part(part)
+        elif part_type in ('item_id', 'item_name'):
+            self.handle_item_part(part)
+        elif part_type in ('location_id', 'location_name'):
+            self.handle_location_part(part)
+        elif part_type == 'entrance_name':
+            self.handle_entrance_part(part)
+        elif part_type in ('default', 'text'):
+            self.handle_default_part(part)
+        elif part_type == 'color':  # No need to do anything, color is already defined
+            pass
+        else:
+            print(f"Unknown JSONMessagePart type: {part_type}, reverting to default part behavior")
+            self.handle_default_part(part)
+
+        return part
+
     # Modifies a JSONMessagePart assuming it is a player type
     def handle_player_part(self, part: JSONMessagePart) -> None:
 
@@ -0,0 +1,159 @@
+# A cache shared by every ArchipelagoClient on the AI that turns PrintJSON message parts into text.
+#
+# The AP server sends the same PrintJSON packet to every client connected to a room, so when a lot of toons in a
+# district are playing the same multiworld we would end up resolving the same player/item/location names once per toon.
+# Instead, the first client to see a message resolves it into a neutral list of tokens. Every client (including the
+# first one) then only has to render that list from its own perspective, highlighting its own slot.
+# A client that is still loading its data packages can't name everything yet, so what it resolves is never shared.
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+from toontown.archipelago.util import global_text_properties
+from toontown.archipelago.util.net_utils import JSONMessagePart, JSONPartFormatter
+
+# How many distinct messages we remember across all rooms before the oldest ones are forgotten
+DEFAULT_MAX_ENTRIES = 2048
+
+# Colors for player parts, depending on whether the player is the toon viewing the message or someone else
+COLOR_LOCAL_PLAYER = 'magenta'
+COLOR_OTHER_PLAYER = 'yellow'
+
+
+# A single piece of text with its names already resolved.
+# owner is set on player parts, it is the slot ID (int) or slot name (str) the part refers to and is what decides
+# how the part is highlighted for a given toon. Every other part has the same color for everyone.
+class PrintJSONToken(NamedTuple):
+    text: str
+    color: str
+    owner: Union[int, str, None] = None
+
+
+class PrintJSONEntry:
+
+    def __init__(self, tokens: List[PrintJSONToken]):
+        self.tokens: List[PrintJSONToken] = tokens
+        self._owners = tuple(token.owner for token in tokens if token.owner is not None)
+        # Rendered messages, keyed by which of the owners above are the viewing toon
+        self._rendered: Dict[Tuple[bool, ...], str] = {}
+
+    # Returns the Panda3D friendly text for this message from the perspective of the given slot
+    def render(self, slot: int, slot_name: str) -> str:
+        perspective = tuple(self.__is_local(owner, slot, slot_name) for owner in self._owners)
+        rendered = self._rendered.get(perspective)
+        if rendered is None:
+            rendered = self._rendered[perspective] = self.__render(slot, slot_name)
+        return rendered
+
+    @staticmethod
+    def __is_local(owner: Union[int, str], slot: int, slot_name: str) -> bool:
+        if isinstance(owner, int):
+            return owner == slot
+        return owner == slot_name
+
+    def __render(self, slot: int, slot_name: str) -> str:
+        ret = ''
+        for token in self.tokens:
+            color = token.color
+            if token.owner is not None:
+                color = COLOR_LOCAL_PLAYER if self.__is_local(token.owner, slot, slot_name) else COLOR_OTHER_PLAYER
+            p3dcolor = global_text_properties.get_property_code_from_json_code(color)
+            ret += f"\1{p3dcolor}\1{token.text}\2"
+        return ret
+
+
+# Resolves a list of message parts into tokens using the names known by the given client.
+# This is the same formatting as JSONPartFormatter, just without picking a perspective for player parts.
+def tokenize(parts: List[JSONMessagePart], client) -> List[PrintJSONToken]:
+    formatter = JSONPartFormatter(parts, client)
+    tokens: List[PrintJSONToken] = []
+    for part in parts:
+        part_type = part['type'] if 'type' in part else 'default'
+        if part_type == 'player_id':
+            pid = int(part['text'])
+            tokens.append(PrintJSONToken(client.get_slot_info(pid).name, COLOR_OTHER_PLAYER, pid))
+            continue
+
+        if part_type == 'player_name':
+            tokens.append(PrintJSONToken(part['text'], COLOR_OTHER_PLAYER, part['text']))
+            continue
+
+        # Everything else looks the same no matter who is reading it, let the formatter handle it
+        new_part = dict(part)
+        formatter.get_formatted_part(new_part)
+        tokens.append(PrintJSONToken(new_part['text'], new_part['color']))
+
+    return tokens
+
+
+# Whether the given client knows the name of every item and location in the message parts
+def is_resolved(parts: List[JSONMessagePart], client) -> bool:
+    data_package = client.global_data_package
+    for part in parts:
+        part_type = part['type'] if 'type' in part else 'default'
+        if part_type == 'item_id' and int(part['text']) not in data_package.id_to_item_name:
+            return False
+        if part_type == 'location_id' and int(part['text']) not in data_package.id_to_location_name:
+            return False
+
+    return True
+
+
+class PrintJSONCache:
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bytes], PrintJSONEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_room_key(client) -> str:
+        # Names are only the same for clients that are playing the same seed.
+        # If we don't know the seed yet, don't share anything with other clients
+        seed_name: Optional[str] = getattr(client, 'seed_name', None)
+        if not seed_name:
+            return f'client-{id(client)}'
+        return f'{seed_name}-{client.team}'
+
+    @staticmethod
+    def hash_parts(parts: List[JSONMessagePart]) -> bytes:
+        # Every client is sent the same JSON for a message, so its key order is already consistent
+        raw = json.dumps(parts, separators=(',', ':'))
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).digest()
+
+    # Returns the entry for the given message parts, resolving them with the given client if nobody has yet
+    def get_entry(self, parts: List[JSONMessagePart], client) -> PrintJSONEntry:
+        key = (self.get_room_key(client), self.hash_parts(parts))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = PrintJSONEntry(tokenize(parts, client))
+        if not is_resolved(parts, client):
+            return entry
+
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    # Returns the Panda3D friendly text for the given message parts from the perspective of the given client
+    def render(self, parts: List[JSONMessagePart], client) -> str:
+        return self.get_entry(parts, client).render(client.slot, client.slot_name)
+
+
+# The cache shared by every client on this process
+print_json_cache = PrintJSONCache()
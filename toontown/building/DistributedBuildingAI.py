@@ -279,6 +279,12 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         self.toonTakeOver()
         return Task.done
 
+    # Lets our building manager know which state we're in now, it keeps its block lists sorted by state
+    def __updateBuildingMgr(self):
+        buildingMgr = self.air.buildingManagers.get(self.zoneId)
+        if buildingMgr:
+            buildingMgr.updateBlockState(self)
+
     def enterOff(self):
         pass
 
@@ -317,6 +323,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
                 self.trophyMgr.addTrophy(avId, name, self.numFloors)
 
     def enterWaitForVictors(self, victorList, savedBy):
+        self.__updateBuildingMgr()
         activeToons = []
         for t in victorList:
             toon = None
@@ -329,7 +336,8 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
             toon = None
             if t:
                 toon = self.getToon(t)
-                self.air.writeServerEvent('buildingDefeated', t, '%s|%s|%s|%s' % (self.track, self.numFloors, self.zoneId, victorList))
+                self.air.logServerEvent('buildingDefeated', {'avId': t, 'track': self.track, 'numFloors': self.numFloors,
+                                                             'zoneId': self.zoneId, 'victors': list(victorList)})
             if toon != None:
                 self.air.questManager.toonKilledBuilding(toon, self.track, self.difficulty, self.numFloors, self.zoneId, activeToons)
 
@@ -357,6 +365,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         return
 
     def enterWaitForVictorsFromCogdo(self, victorList, savedBy):
+        self.__updateBuildingMgr()
         activeToons = []
         for t in victorList:
             toon = None
@@ -371,7 +380,8 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
                 toon = None
                 if t:
                     toon = self.getToon(t)
-                    self.air.writeServerEvent('buildingDefeated', t, '%s|%s|%s|%s' % (self.track, self.numFloors, self.zoneId, victorList))
+                    self.air.logServerEvent('buildingDefeated', {'avId': t, 'track': self.track, 'numFloors': self.numFloors,
+                                                                 'zoneId': self.zoneId, 'victors': list(victorList)})
                 if toon != None:
                     self.air.questManager.toonKilledCogdo(toon, self.difficulty, self.numFloors, self.zoneId, activeToons)
 
@@ -401,6 +411,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         return
 
     def enterBecomingToon(self):
+        self.__updateBuildingMgr()
         self.d_setState('becomingToon')
         name = self.taskName(str(self.block) + '_becomingToon-timer')
         taskMgr.doMethodLater(SuitBuildingGlobals.VICTORY_SEQUENCE_TIME, self.becomingToonTask, name)
@@ -410,6 +421,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         taskMgr.remove(name)
 
     def enterBecomingToonFromCogdo(self):
+        self.__updateBuildingMgr()
         self.d_setState('becomingToonFromCogdo')
         name = self.taskName(str(self.block) + '_becomingToonFromCogdo-timer')
         taskMgr.doMethodLater(SuitBuildingGlobals.VICTORY_SEQUENCE_TIME, self.becomingToonTask, name)
@@ -420,10 +432,11 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
 
     def becomingToonTask(self, task):
         self.fsm.request('toon')
-        self.suitPlannerExt.buildingMgr.save()
+        self.suitPlannerExt.buildingMgr.requestSave()
         return Task.done
 
     def enterToon(self):
+        self.__updateBuildingMgr()
         self.d_setState('toon')
         exteriorZoneId, interiorZoneId = self.getExteriorAndInteriorZoneId()
         if simbase.config.GetBool('want-new-toonhall', 1) and ZoneUtil.getCanonicalZoneId(interiorZoneId) == ToonHall:
@@ -444,7 +457,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         self.becameSuitTime = 0
         self.knockKnock = DistributedKnockKnockDoorAI.DistributedKnockKnockDoorAI(self.air, self.block)
         self.knockKnock.generateWithRequired(exteriorZoneId)
-        self.air.writeServerEvent('building-toon', self.doId, '%s|%s' % (self.zoneId, self.block))
+        self.air.logServerEvent('building-toon', {'doId': self.doId, 'zoneId': self.zoneId, 'block': self.block})
 
     def createExteriorDoor(self):
         result = DistributedDoorAI.DistributedDoorAI(self.air, self.block, DoorTypes.EXT_STANDARD)
@@ -454,6 +467,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         self.door.setDoorLock(FADoorCodes.BUILDING_TAKEOVER)
 
     def enterClearOutToonInterior(self):
+        self.__updateBuildingMgr()
         self.d_setState('clearOutToonInterior')
         if hasattr(self, 'interior'):
             self.interior.setState('beingTakenOver')
@@ -469,6 +483,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         return Task.done
 
     def enterBecomingSuit(self):
+        self.__updateBuildingMgr()
         self.sendUpdate('setSuitData', [
          ord(self.track), self.difficulty, self.numFloors])
         self.d_setState('becomingSuit')
@@ -490,10 +505,11 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
 
     def becomingSuitTask(self, task):
         self.fsm.request('suit')
-        self.suitPlannerExt.buildingMgr.save()
+        self.suitPlannerExt.buildingMgr.requestSave()
         return Task.done
 
     def enterSuit(self):
+        self.__updateBuildingMgr()
         self.sendUpdate('setSuitData', [
          ord(self.track), self.difficulty, self.numFloors])
         zoneId, interiorZoneId = self.getExteriorAndInteriorZoneId()
@@ -502,7 +518,8 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         exteriorZoneId, interiorZoneId = self.getExteriorAndInteriorZoneId()
         self.elevator = DistributedElevatorExtAI.DistributedElevatorExtAI(self.air, self)
         self.elevator.generateWithRequired(exteriorZoneId)
-        self.air.writeServerEvent('building-cog', self.doId, '%s|%s|%s|%s' % (self.zoneId, self.block, self.track, self.numFloors))
+        self.air.logServerEvent('building-cog', {'doId': self.doId, 'zoneId': self.zoneId, 'block': self.block,
+                                                 'track': self.track, 'numFloors': self.numFloors})
 
     def exitSuit(self):
         del self.planner
@@ -511,6 +528,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
             del self.elevator
 
     def enterClearOutToonInteriorForCogdo(self):
+        self.__updateBuildingMgr()
         self.d_setState('clearOutToonInteriorForCogdo')
         if hasattr(self, 'interior'):
             self.interior.setState('beingTakenOver')
@@ -526,6 +544,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         return Task.done
 
     def enterBecomingCogdo(self):
+        self.__updateBuildingMgr()
         self.sendUpdate('setSuitData', [
          ord(self.track), self.difficulty, self.numFloors])
         self.d_setState('becomingCogdo')
@@ -546,6 +565,7 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
             del self.knockKnock
 
     def enterBecomingCogdoFromCogdo(self):
+        self.__updateBuildingMgr()
         self.d_setState('becomingCogdoFromCogdo')
         name = self.taskName(str(self.block) + '_becomingCogdoFromCogdo-timer')
         taskMgr.doMethodLater(SuitBuildingGlobals.VICTORY_RUN_TIME, self.becomingCogdoTask, name)
@@ -557,10 +577,11 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
 
     def becomingCogdoTask(self, task):
         self.fsm.request('cogdo')
-        self.suitPlannerExt.buildingMgr.save()
+        self.suitPlannerExt.buildingMgr.requestSave()
         return Task.done
 
     def enterCogdo(self):
+        self.__updateBuildingMgr()
         self.sendUpdate('setSuitData', [
          ord(self.track), self.difficulty, self.numFloors])
         zoneId, interiorZoneId = self.getExteriorAndInteriorZoneId()
@@ -571,7 +592,8 @@ class DistributedBuildingAI(DistributedObjectAI.DistributedObjectAI):
         self.elevator = DistributedCogdoElevatorExtAI(self.air, self, fSkipOpening=self.fSkipElevatorOpening)
         self.fSkipElevatorOpening = False
         self.elevator.generateWithRequired(exteriorZoneId)
-        self.air.writeServerEvent('building-cogdo', self.doId, '%s|%s|%s' % (self.zoneId, self.block, self.numFloors))
+        self.air.logServerEvent('building-cogdo', {'doId': self.doId, 'zoneId': self.zoneId, 'block': self.block,
+                                                   'numFloors': self.numFloors})
 
     def exitCogdo(self):
         del self.planner
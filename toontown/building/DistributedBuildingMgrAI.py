@@ -12,12 +12,18 @@ import time, random
 class DistributedBuildingMgrAI:
     notify = DirectNotifyGlobal.directNotify.newCategory('DistributedBuildingMgrAI')
     serverDatafolder = simbase.config.GetString('server-data-folder', '')
+    saveDelay = simbase.config.GetFloat('building-save-delay', 30.0)
 
     def __init__(self, air, branchID, dnaStore, trophyMgr):
         self.branchID = branchID
         self.canonicalBranchID = ZoneUtil.getCanonicalZoneId(branchID)
         self.air = air
         self.__buildings = {}
+        self.__blockOrder = {}
+        self.__suitBlocks = set()
+        self.__cogdoBlocks = set()
+        self.__establishedSuitBlocks = set()
+        self.__toonBlocks = set()
         self.dnaStore = dnaStore
         self.trophyMgr = trophyMgr
         self.shard = str(air.districtId)
@@ -27,59 +33,94 @@ class DistributedBuildingMgrAI:
         return
 
     def cleanup(self):
-        taskMgr.remove(str(self.branchID) + '_delayed_save-timer')
+        self.flushSave()
         for building in list(self.__buildings.values()):
             building.cleanup()
 
         self.__buildings = {}
+        self.__blockOrder = {}
+        for blocks in self.__getBlockSets():
+            blocks.clear()
 
     def isValidBlockNumber(self, blockNumber):
         return blockNumber in self.__buildings
 
     def delayedSaveTask(self, task):
-        self.save()
         self.doLaterTask = None
+        self.save()
         return Task.done
 
+    def requestSave(self):
+        # Takeovers come in bursts, so rather than rewriting the file for every one of them
+        # we write at most once every saveDelay seconds per street.
+        if self.doLaterTask:
+            return
+
+        self.doLaterTask = taskMgr.doMethodLater(self.saveDelay, self.delayedSaveTask, str(self.branchID) + '_delayed_save-timer')
+
+    def flushSave(self):
+        # Write a pending save right away. The AI repository calls this when it shuts down.
+        if self.doLaterTask:
+            taskMgr.remove(self.doLaterTask)
+            self.doLaterTask = None
+            self.save()
+
+    def __getBlockSets(self):
+        return (self.__suitBlocks, self.__cogdoBlocks, self.__establishedSuitBlocks, self.__toonBlocks)
+
+    def __addBuilding(self, blockNumber, building):
+        self.__buildings[blockNumber] = building
+        self.__blockOrder.setdefault(blockNumber, len(self.__blockOrder))
+        # HQs and shops never change state, and are never suit or toon blocks.
+        if isinstance(building, DistributedBuildingAI.DistributedBuildingAI):
+            self.updateBlockState(building)
+
+    def updateBlockState(self, building):
+        # Called by buildings whenever their FSM changes state, so the block getters below
+        # don't have to look at every building on the street each time they're called.
+        blockNumber = building.block
+        if self.__buildings.get(blockNumber) is not building:
+            return
+
+        for blocks in self.__getBlockSets():
+            blocks.discard(blockNumber)
+
+        if building.isSuitBlock():
+            self.__suitBlocks.add(blockNumber)
+        else:
+            self.__toonBlocks.add(blockNumber)
+        if building.isCogdo():
+            self.__cogdoBlocks.add(blockNumber)
+        if building.isEstablishedSuitBlock():
+            self.__establishedSuitBlocks.add(blockNumber)
+
+    def __getOrderedBlocks(self, blocks):
+        # Keep the order the buildings were created in, callers pick from these lists with the RNG.
+        return sorted(blocks, key=self.__blockOrder.__getitem__)
+
     def isSuitBlock(self, blockNumber):
-        return self.__buildings[blockNumber].isSuitBlock()
+        return blockNumber in self.__suitBlocks
 
     def getSuitBlocks(self):
-        blocks = []
-        for i in list(self.__buildings.values()):
-            if i.isSuitBlock():
-                blocks.append(i.getBlock()[0])
+        return self.__getOrderedBlocks(self.__suitBlocks)
 
-        return blocks
+    def getNumSuitBlocks(self):
+        return len(self.__suitBlocks)
 
     def isCogdoBlock(self, blockNumber):
-        return self.__buildings[blockNumber].isCogdo()
+        return blockNumber in self.__cogdoBlocks
 
     def getCogdoBlocks(self):
-        blocks = []
-        for i in list(self.__buildings.values()):
-            if i.isCogdo():
-                blocks.append(i.getBlock()[0])
+        return self.__getOrderedBlocks(self.__cogdoBlocks)
 
-        return blocks
+    def getNumCogdoBlocks(self):
+        return len(self.__cogdoBlocks)
 
     def getEstablishedSuitBlocks(self):
-        blocks = []
-        for i in list(self.__buildings.values()):
-            if i.isEstablishedSuitBlock():
-                blocks.append(i.getBlock()[0])
-
-        return blocks
+        return self.__getOrderedBlocks(self.__establishedSuitBlocks)
 
     def getToonBlocks(self):
-        blocks = []
-        for i in list(self.__buildings.values()):
-            if isinstance(i, HQBuildingAI.HQBuildingAI):
-                continue
-            if not i.isSuitBlock():
-                blocks.append(i.getBlock()[0])
-
-        return blocks
+        return self.__getOrderedBlocks(self.__toonBlocks)
 
     def getBuildings(self):
         return list(self.__buildings.values())
@@ -173,7 +214,7 @@ class DistributedBuildingMgrAI:
                 building.setState('toon')
         else:
             building.setState('toon')
-        self.__buildings[blockNumber] = building
+        self.__addBuilding(blockNumber, building)
         return building
 
     def newAnimBuilding(self, blockNumber, blockData=None):
@@ -194,7 +235,7 @@ class DistributedBuildingMgrAI:
                 building.setState('toon')
         else:
             building.setState('toon')
-        self.__buildings[blockNumber] = building
+        self.__addBuilding(blockNumber, building)
         return building
 
     def newHQBuilding(self, blockNumber):
@@ -203,7 +244,7 @@ class DistributedBuildingMgrAI:
         exteriorZoneId = ZoneUtil.getTrueZoneId(exteriorZoneId, self.branchID)
         interiorZoneId = self.branchID - self.branchID % 100 + 500 + blockNumber
         building = HQBuildingAI.HQBuildingAI(self.air, exteriorZoneId, interiorZoneId, blockNumber)
-        self.__buildings[blockNumber] = building
+        self.__addBuilding(blockNumber, building)
         return building
 
     def newGagshopBuilding(self, blockNumber):
@@ -212,7 +253,7 @@ class DistributedBuildingMgrAI:
         exteriorZoneId = ZoneUtil.getTrueZoneId(exteriorZoneId, self.branchID)
         interiorZoneId = self.branchID - self.branchID % 100 + 500 + blockNumber
         building = GagshopBuildingAI.GagshopBuildingAI(self.air, exteriorZoneId, interiorZoneId, blockNumber)
-        self.__buildings[blockNumber] = building
+        self.__addBuilding(blockNumber, building)
         return building
 
     def newPetshopBuilding(self, blockNumber):
@@ -221,7 +262,7 @@ class DistributedBuildingMgrAI:
         exteriorZoneId = ZoneUtil.getTrueZoneId(exteriorZoneId, self.branchID)
         interiorZoneId = self.branchID - self.branchID % 100 + 500 + blockNumber
         building = PetshopBuildingAI.PetshopBuildingAI(self.air, exteriorZoneId, interiorZoneId, blockNumber)
-        self.__buildings[blockNumber] = building
+        self.__addBuilding(blockNumber, building)
         return building
 
     def newKartShopBuilding(self, blockNumber):
@@ -230,7 +271,7 @@ class DistributedBuildingMgrAI:
         exteriorZoneId = ZoneUtil.getTrueZoneId(exteriorZoneId, self.branchID)
         interiorZoneId = self.branchID - self.branchID % 100 + 500 + blockNumber
         building = KartShopBuildingAI(self.air, exteriorZoneId, interiorZoneId, blockNumber)
-        self.__buildings[blockNumber] = building
+        self.__addBuilding(blockNumber, building)
         return building
 
     def getFileName(self):
@@ -245,19 +286,16 @@ class DistributedBuildingMgrAI:
             jsonData = i.getJsonData()
             blocks[str(jsonData['block'])] = jsonData
 
-        json.dump(blocks, file, indent=4)
+        json.dump(blocks, file, separators=(',', ':'))
 
     def save(self):
+        # Write to a temporary file and swap it in, so a crash mid-write never leaves a truncated file behind.
         try:
             fileName = self.getFileName()
-            backup = fileName + self.backupExtension
-            if os.path.exists(fileName):
-                os.rename(fileName, backup)
-            file = open(fileName, 'w')
-            self.saveTo(file)
-            file.close()
-            if os.path.exists(backup):
-                os.remove(backup)
+            tempFileName = fileName + '.tmp'
+            with open(tempFileName, 'w') as file:
+                self.saveTo(file)
+            os.replace(tempFileName, fileName)
         except EnvironmentError:
             self.notify.warning(str(sys.exc_info()[1]))
 
@@ -272,15 +310,19 @@ class DistributedBuildingMgrAI:
 
     def load(self):
         fileName = self.getFileName()
+        # save() no longer makes a backup, so one left by an older server crashing mid-write holds the last
+        # complete save. Put it back in place, or it would keep overriding every save made after it.
+        backup = fileName + self.backupExtension
+        if os.path.exists(backup):
+            try:
+                os.replace(backup, fileName)
+            except EnvironmentError:
+                self.notify.warning(str(sys.exc_info()[1]))
+
         try:
-            file = open(fileName + self.backupExtension, 'r')
-            if os.path.exists(fileName):
-                os.remove(fileName)
+            file = open(fileName, 'r')
         except IOError:
-            try:
-                file = open(fileName, 'r')
-            except IOError:
-                return {}
+            return {}
 
         blocks = self.loadFrom(file)
         file.close()
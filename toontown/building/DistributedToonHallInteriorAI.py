@@ -14,7 +14,7 @@ class DistributedToonHallInteriorAI(DistributedToonInteriorAI):
             phase = 'not available'
         else:
             phase = str(result)
-        self.air.writeServerEvent('sillyMeter', avId, 'enter|%s' % phase)
+        self.air.logServerEvent('sillyMeter', {'avId': avId, 'action': 'enter', 'phase': phase})
 
     def logToonLeft(self, avId, zoneId):
         result = self.getCurPhase()
@@ -22,7 +22,7 @@ class DistributedToonHallInteriorAI(DistributedToonInteriorAI):
             phase = 'not available'
         else:
             phase = str(result)
-        self.air.writeServerEvent('sillyMeter', avId, 'exit|%s' % phase)
+        self.air.logServerEvent('sillyMeter', {'avId': avId, 'action': 'exit', 'phase': phase})
 
     def getCurPhase(self):
         result = -1
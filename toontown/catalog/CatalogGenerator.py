@@ -1484,9 +1484,12 @@ WeeklySchedule = ((100,
 class CatalogGenerator:
     notify = DirectNotifyGlobal.directNotify.newCategory('CatalogGenerator')
 
-    def __init__(self):
+    def __init__(self, seed = None):
         self.__itemLists = {}
         self.__releasedItemLists = {}
+        self.__monthlyCandidates = {}
+        self.__weeklyCandidates = {}
+        self.random = random.Random(seed)
 
     def getReleasedCatalogList(self, weekStart):
         dayNumber = int(weekStart / (24 * 60))
@@ -1495,17 +1498,13 @@ class CatalogGenerator:
 
     def generateMonthlyCatalog(self, avatar, weekStart):
         dayNumber = int(weekStart / (24 * 60))
-        itemLists = self.__getMonthlyItemLists(dayNumber, weekStart)
-        monthlyCatalog = CatalogItemList.CatalogItemList()
-        for list in itemLists:
-            saleItem = 0
-            if isinstance(list, Sale):
-                list = list.args
-                saleItem = 1
-            for item in list:
-                monthlyCatalog += self.__selectItem(avatar, item, [], saleItem=saleItem)
+        candidates = self.__getMonthlyCandidates(dayNumber, weekStart)
+        items = []
+        excludedItems = self.__getExcludedItems(avatar, [])
+        for candidate in candidates:
+            items += self.__selectCandidate(avatar, candidate, [], excludedItems)
 
-        return monthlyCatalog
+        return CatalogItemList.CatalogItemList(items)
 
     def generateWeeklyCatalog(self, avatar, week, monthlyCatalog):
         weeklyCatalog = CatalogItemList.CatalogItemList()
@@ -1516,12 +1515,16 @@ class CatalogGenerator:
             if isinstance(schedule, Sale):
                 schedule = schedule.args
                 saleItem = 1
-            for item in schedule:
-                weeklyCatalog += self.__selectItem(avatar, item, monthlyCatalog, saleItem=saleItem)
+            excludedItems = self.__getExcludedItems(avatar, monthlyCatalog)
+            items = []
+            for candidate in self.__getWeeklyCandidates(week):
+                items += self.__selectCandidate(avatar, candidate, monthlyCatalog, excludedItems)
+
+            weeklyCatalog += items
 
             if nextAvailableCloset not in schedule:
-                weeklyCatalog += self.__selectItem(avatar, nextAvailableCloset, monthlyCatalog, saleItem=0)
-            weeklyCatalog += self.__selectItem(avatar, get50ItemTrunk, monthlyCatalog, saleItem=0)
+                weeklyCatalog += self.__selectItem(avatar, nextAvailableCloset, monthlyCatalog, saleItem=0, excludedItems=excludedItems)
+            weeklyCatalog += self.__selectItem(avatar, get50ItemTrunk, monthlyCatalog, saleItem=0, excludedItems=excludedItems)
         if time.time() < 1096617600.0:
 
             def hasPetTrick(catalog):
@@ -1542,13 +1545,17 @@ class CatalogGenerator:
         lastBackCatalog = avatar.backCatalog[:]
         thisWeek = min(len(WeeklySchedule), week - 1)
         lastWeek = min(len(WeeklySchedule), previousWeek)
+        excludedItems = self.__getExcludedItems(avatar, weeklyCatalog)
         for week in range(thisWeek, lastWeek, -1):
             self.notify.debug('Adding items from week %s to back catalog' % week)
             schedule = WeeklySchedule[week - 1]
             if not isinstance(schedule, Sale):
-                for item in schedule:
-                    for item in self.__selectItem(avatar, item, weeklyCatalog + backCatalog):
+                for candidate in self.__getWeeklyCandidates(week):
+                    for item in self.__selectCandidate(avatar, candidate, weeklyCatalog + backCatalog, excludedItems):
+                        numItems = len(backCatalog)
                         item.putInBackCatalog(backCatalog, lastBackCatalog)
+                        if len(backCatalog) > numItems:
+                            excludedItems.add(id(backCatalog[-1]))
 
         if previousWeek < week:
             self.notify.debug('Adding current items from week %s to back catalog' % previousWeek)
@@ -1629,17 +1636,75 @@ class CatalogGenerator:
         self.__itemLists[dayNumber] = itemLists
         return itemLists
 
-    def __selectItem(self, avatar, item, duplicateItems, saleItem = 0):
+    def __getMonthlyCandidates(self, dayNumber, weekStart):
+        candidates = self.__monthlyCandidates.get(dayNumber)
+        if candidates != None:
+            return candidates
+        candidates = []
+        for list in self.__getMonthlyItemLists(dayNumber, weekStart):
+            saleItem = 0
+            if isinstance(list, Sale):
+                list = list.args
+                saleItem = 1
+            for item in list:
+                candidates.append(self.__makeCandidate(item, saleItem))
+
+        self.__monthlyCandidates[dayNumber] = candidates
+        return candidates
+
+    def __getWeeklyCandidates(self, week):
+        candidates = self.__weeklyCandidates.get(week)
+        if candidates != None:
+            return candidates
+        saleItem = 0
+        schedule = WeeklySchedule[week - 1]
+        if isinstance(schedule, Sale):
+            schedule = schedule.args
+            saleItem = 1
+        candidates = []
+        for item in schedule:
+            candidates.append(self.__makeCandidate(item, saleItem))
+
+        self.__weeklyCandidates[week] = candidates
+        return candidates
+
+    def __makeCandidate(self, item, saleItem = 0):
+        # Works out as much of a schedule entry as we can before we know who it is for.
+        # Entries that are functions can only be looked up once we have an avatar.
         chooseCount = 1
         if isinstance(item, Sale):
             item = item.args[0]
             saleItem = 1
+        if not callable(item):
+            if isinstance(item, tuple):
+                chooseCount, item = item
+            if isinstance(item, int):
+                item = MetaItems[item]
+        return (chooseCount, item, saleItem)
+
+    def __getExcludedItems(self, avatar, duplicateItems):
+        # Catalog items are only ever equal to themselves, so we can look them up by id
+        # rather than searching through each of these lists for every item we consider.
+        excludedItems = set()
+        for items in (duplicateItems, avatar.backCatalog, avatar.weeklyCatalog):
+            for item in items:
+                excludedItems.add(id(item))
+
+        return excludedItems
+
+    def __selectItem(self, avatar, item, duplicateItems, saleItem = 0, excludedItems = None):
+        if excludedItems == None:
+            excludedItems = self.__getExcludedItems(avatar, duplicateItems)
+        return self.__selectCandidate(avatar, self.__makeCandidate(item, saleItem), duplicateItems, excludedItems)
+
+    def __selectCandidate(self, avatar, candidate, duplicateItems, excludedItems):
+        chooseCount, item, saleItem = candidate
         if callable(item):
             item = item(avatar, duplicateItems)
-        if isinstance(item, tuple):
-            chooseCount, item = item
-        if isinstance(item, int):
-            item = MetaItems[item]
+            if isinstance(item, tuple):
+                chooseCount, item = item
+            if isinstance(item, int):
+                item = MetaItems[item]
         selection = []
         if isinstance(item, CatalogItem.CatalogItem):
             if not item.notOfferedTo(avatar):
@@ -1650,21 +1715,21 @@ class CatalogGenerator:
             for i in range(chooseCount):
                 if len(list) == 0:
                     return selection
-                item = self.__chooseFromList(avatar, list, duplicateItems)
+                item = self.__chooseFromList(avatar, list, excludedItems)
                 if item != None:
                     item.saleItem = saleItem
                     selection.append(item)
 
         return selection
 
-    def __chooseFromList(self, avatar, list, duplicateItems):
-        index = random.randrange(len(list))
+    def __chooseFromList(self, avatar, list, excludedItems):
+        index = self.random.randrange(len(list))
         item = list[index]
         del list[index]
-        while item.notOfferedTo(avatar) or item.reachedPurchaseLimit(avatar) or item in duplicateItems or item in avatar.backCatalog or item in avatar.weeklyCatalog:
+        while id(item) in excludedItems or item.notOfferedTo(avatar) or item.reachedPurchaseLimit(avatar):
             if len(list) == 0:
                 return None
-            index = random.randrange(len(list))
+            index = self.random.randrange(len(list))
             item = list[index]
             del list[index]
 
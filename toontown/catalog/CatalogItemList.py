@@ -1,4 +1,5 @@
 import functools
+from collections import OrderedDict
 
 from . import CatalogItem
 from panda3d.core import *
@@ -6,25 +7,98 @@ import types
 from direct.distributed.PyDatagram import PyDatagram
 from direct.distributed.PyDatagramIterator import PyDatagramIterator
 
+# How many distinct blobs we remember the layout of.
+BlobIndexCacheSize = 4096
+
+# Maps (blob, store) to the version of the blob, a tuple with the encoded bytes of each item in it
+# and a tuple with the delivery date of each item. Blobs are immutable and the same blobs get set over
+# and over (and are shared between toons with the same catalogs), so each one only needs to be walked once.
+# Items themselves are mutable, so every list still decodes its own items from these bytes when asked for them.
+__blobIndexCache = OrderedDict()
+
+
+def getBlobIndex(blob, store):
+    key = (blob, store)
+    index = __blobIndexCache.get(key)
+    if index != None:
+        __blobIndexCache.move_to_end(key)
+        return index
+
+    index = __makeBlobIndex(blob, store)
+    __blobIndexCache[key] = index
+    if len(__blobIndexCache) > BlobIndexCacheSize:
+        __blobIndexCache.popitem(last=False)
+    return index
+
+
+def __makeBlobIndex(blob, store):
+    from . import CatalogInvalidItem
+    segments = []
+    deliveryDates = []
+    dg = PyDatagram(blob)
+    di = PyDatagramIterator(dg)
+    versionNumber = di.getUint8()
+    while di.getRemainingSize() > 0:
+        start = di.getCurrentIndex()
+        item = CatalogItem.decodeCatalogItem(di, versionNumber, store)
+        if isinstance(item, CatalogInvalidItem.CatalogInvalidItem):
+            # We can't tell where this item ends, so this blob has to be decoded the old fashioned way.
+            return False
+        segments.append(blob[start:di.getCurrentIndex()])
+        deliveryDates.append(item.deliveryDate)
+
+    return (versionNumber, tuple(segments), tuple(deliveryDates))
+
+
+def decodeSegment(segment, versionNumber, store):
+    dg = PyDatagram(segment)
+    di = PyDatagramIterator(dg)
+    return CatalogItem.decodeCatalogItem(di, versionNumber, store)
+
+
 class CatalogItemList:
+    # Items are only decoded once something asks for them. Until then, an entry is kept as the bytes it
+    # was encoded as in our blob (its segment), along with its delivery date. Entries that were never
+    # decoded can't have been changed, so their segments are reused as-is when the list is re-encoded.
 
     def __init__(self, source = None, store = 0):
         self.store = store
         self.__blob = None
         self.__list = None
+        self.__segments = None
+        self.__deliveryDates = None
+        self.__segmentVersion = CatalogItem.CatalogItemVersion
         if isinstance(source, bytes):
             self.__blob = source
         elif isinstance(source, list):
-            self.__list = source[:]
+            self.__setItems(source[:])
         elif isinstance(source, CatalogItemList):
             if source.store == store:
                 if source.__list != None:
                     self.__list = source.__list[:]
+                    self.__segments = source.__segments[:]
+                    self.__deliveryDates = source.__deliveryDates[:]
+                    self.__segmentVersion = source.__segmentVersion
                 self.__blob = source.__blob
             else:
-                self.__list = source[:]
+                self.__setItems(source[:])
         return
 
+    def __setItems(self, items):
+        self.__list = items
+        self.__segments = [None] * len(items)
+        self.__deliveryDates = [None] * len(items)
+        self.__segmentVersion = CatalogItem.CatalogItemVersion
+
+    def __makeSubList(self, indices):
+        # Builds a new list out of some of our entries without decoding any of them.
+        subList = CatalogItemList(store=self.store)
+        subList.__list = [self.__list[i] for i in indices]
+        subList.__segments = [self.__segments[i] for i in indices]
+        subList.__deliveryDates = [self.__deliveryDates[i] for i in indices]
+        subList.__segmentVersion = self.__segmentVersion
+        return subList
+
     def markDirty(self):
         if self.__list:
             self.__blob = None
@@ -37,40 +111,50 @@ class CatalogItemList:
             return self.__blob
         return self.__makeBlob(store)
 
-    def getNextDeliveryDate(self):
-        if len(self) == 0:
-            return
+    def __getDeliveryDate(self, index):
+        if self.__segments[index] != None:
+            return self.__deliveryDates[index]
+        return self.__list[index].deliveryDate
+
+    def __getNextDeliveryIndex(self):
+        if self.__list == None:
+            self.__indexList()
         nextDeliveryDate = None
-        for item in self:
-            if item:
-                if nextDeliveryDate == None or item.deliveryDate < nextDeliveryDate:
-                    nextDeliveryDate = item.deliveryDate
+        nextDeliveryIndex = None
+        for index in range(len(self.__list)):
+            if self.__segments[index] == None and not self.__list[index]:
+                continue
+            deliveryDate = self.__getDeliveryDate(index)
+            if nextDeliveryDate == None or deliveryDate < nextDeliveryDate:
+                nextDeliveryDate = deliveryDate
+                nextDeliveryIndex = index
 
-        return nextDeliveryDate
+        return nextDeliveryIndex
 
-    def getNextDeliveryItem(self):
-        if len(self) == 0:
+    def getNextDeliveryDate(self):
+        index = self.__getNextDeliveryIndex()
+        if index == None:
             return
-        nextDeliveryDate = None
-        nextDeliveryItem = None
-        for item in self:
-            if item:
-                if nextDeliveryDate == None or item.deliveryDate < nextDeliveryDate:
-                    nextDeliveryDate = item.deliveryDate
-                    nextDeliveryItem = item
+        return self.__getDeliveryDate(index)
 
-        return nextDeliveryItem
+    def getNextDeliveryItem(self):
+        index = self.__getNextDeliveryIndex()
+        if index == None:
+            return
+        return self[index]
 
     def extractDeliveryItems(self, cutoffTime):
+        if self.__list == None:
+            self.__indexList()
         beforeTime = []
         afterTime = []
-        for item in self:
-            if item.deliveryDate <= cutoffTime:
-                beforeTime.append(item)
+        for index in range(len(self.__list)):
+            if self.__getDeliveryDate(index) <= cutoffTime:
+                beforeTime.append(index)
             else:
-                afterTime.append(item)
+                afterTime.append(index)
 
-        return (CatalogItemList(beforeTime, store=self.store), CatalogItemList(afterTime, store=self.store))
+        return (self.__makeSubList(beforeTime), self.__makeSubList(afterTime))
 
     def extractOldestItems(self, count):
         return (self[0:count], self[count:])
@@ -79,16 +163,50 @@ class CatalogItemList:
         self.__blob = self.__makeBlob(self.store)
 
     def __makeBlob(self, store):
+        if self.__list == None:
+            self.__indexList()
         dg = PyDatagram()
         if self.__list:
+            # Items that were never decoded are copied over as they are, only the rest need encoding.
+            reuseSegments = store == self.store and self.__segmentVersion == CatalogItem.CatalogItemVersion
             dg.addUint8(CatalogItem.CatalogItemVersion)
-            for item in self.__list:
-                CatalogItem.encodeCatalogItem(dg, item, store)
+            for index in range(len(self.__list)):
+                if reuseSegments and self.__segments[index] != None:
+                    dg.appendData(self.__segments[index])
+                else:
+                    CatalogItem.encodeCatalogItem(dg, self.__getItem(index), store)
 
         return dg.getMessage()
 
+    def __indexList(self):
+        index = None
+        if self.__blob:
+            index = getBlobIndex(self.__blob, self.store)
+        if index:
+            self.__segmentVersion, segments, deliveryDates = index
+            self.__list = [None] * len(segments)
+            self.__segments = list(segments)
+            self.__deliveryDates = list(deliveryDates)
+        else:
+            self.__setItems(self.__makeList(self.store))
+
+    def __getItem(self, index):
+        # Decodes the item at this index if it hasn't been already. Once it has been handed out it could be
+        # changed at any time, so from then on it is encoded from the item rather than the saved segment.
+        segment = self.__segments[index]
+        if segment != None:
+            self.__list[index] = decodeSegment(segment, self.__segmentVersion, self.store)
+            self.__segments[index] = None
+            self.__deliveryDates[index] = None
+        return self.__list[index]
+
     def __decodeList(self):
-        self.__list = self.__makeList(self.store)
+        if self.__list == None:
+            self.__indexList()
+        for index in range(len(self.__list)):
+            self.__getItem(index)
+
+        return self.__list
 
     def __makeList(self, store):
         list = []
@@ -102,60 +220,72 @@ class CatalogItemList:
 
         return list
 
-    def append(self, item):
+    def __insertItems(self, index, items):
         if self.__list == None:
-            self.__decodeList()
-        self.__list.append(item)
+            self.__indexList()
+        if isinstance(items, CatalogItemList) and items.store == self.store:
+            if items.__list == None:
+                items.__indexList()
+            if items.__segmentVersion != self.__segmentVersion:
+                items.__decodeList()
+            newList = items.__list[:]
+            newSegments = items.__segments[:]
+            newDeliveryDates = items.__deliveryDates[:]
+        else:
+            newList = list(items)
+            newSegments = [None] * len(newList)
+            newDeliveryDates = [None] * len(newList)
+        self.__list[index:index] = newList
+        self.__segments[index:index] = newSegments
+        self.__deliveryDates[index:index] = newDeliveryDates
         self.__blob = None
+
+    def append(self, item):
+        self.__insertItems(len(self), [item])
         return
 
     def extend(self, items):
         self += items
 
     def count(self, item):
-        if self.__list == None:
-            self.__decodeList()
-        return self.__list.count(item)
+        return self.__decodeList().count(item)
 
     def index(self, item):
-        if self.__list == None:
-            self.__decodeList()
-        return self.__list.index(item)
+        return self.__decodeList().index(item)
 
     def insert(self, index, item):
         if self.__list == None:
-            self.__decodeList()
+            self.__indexList()
         self.__list.insert(index, item)
+        self.__segments.insert(index, None)
+        self.__deliveryDates.insert(index, None)
         self.__blob = None
         return
 
     def pop(self, index = None):
         if self.__list == None:
-            self.__decodeList()
-        self.__blob = None
+            self.__indexList()
         if index == None:
-            return self.__list.pop()
-        else:
-            return self.__list.pop(index)
-        return
+            index = len(self.__list) - 1
+        item = self.__getItem(index)
+        del self[index]
+        return item
 
     def remove(self, item):
-        if self.__list == None:
-            self.__decodeList()
-        self.__list.remove(item)
-        self.__blob = None
+        del self[self.index(item)]
         return
 
     def reverse(self):
         if self.__list == None:
-            self.__decodeList()
+            self.__indexList()
         self.__list.reverse()
+        self.__segments.reverse()
+        self.__deliveryDates.reverse()
         self.__blob = None
         return
 
     def sort(self, cmpfunc = None):
-        if self.__list == None:
-            self.__decodeList()
+        self.__decodeList()
         if cmpfunc == None:
             self.__list.sort()
         else:
@@ -165,55 +295,59 @@ class CatalogItemList:
 
     def __len__(self):
         if self.__list == None:
-            self.__decodeList()
+            self.__indexList()
         return len(self.__list)
 
+    def __iter__(self):
+        # Like iterating by index, the list may change while it is being iterated over.
+        index = 0
+        while index < len(self):
+            yield self.__getItem(index)
+            index += 1
+
     def __getitem__(self, index):
         if self.__list == None:
-            self.__decodeList()
-        return self.__list[index]
+            self.__indexList()
+        if isinstance(index, slice):
+            return [self.__getItem(i) for i in range(*index.indices(len(self.__list)))]
+        return self.__getItem(range(len(self.__list))[index])
 
     def __setitem__(self, index, item):
         if self.__list == None:
-            self.__decodeList()
+            self.__indexList()
+        if isinstance(index, slice):
+            self.__setslice__(index, item)
+            return
         self.__list[index] = item
+        self.__segments[index] = None
+        self.__deliveryDates[index] = None
         self.__blob = None
         return
 
     def __delitem__(self, index):
         if self.__list == None:
-            self.__decodeList()
+            self.__indexList()
         del self.__list[index]
+        del self.__segments[index]
+        del self.__deliveryDates[index]
         self.__blob = None
         return
 
-    def __getslice__(self, i, j):
-        if self.__list == None:
-            self.__decodeList()
-        return CatalogItemList(self.__list[i:j], store=self.store)
-
-    def __setslice__(self, i, j, s):
-        if self.__list == None:
-            self.__decodeList()
+    def __setslice__(self, index, s):
         if isinstance(s, CatalogItemList):
-            self.__list[i:j] = s.__list
-        else:
-            self.__list[i:j] = s
-        self.__blob = None
-        return
-
-    def __delslice__(self, i, j):
-        if self.__list == None:
-            self.__decodeList()
-        del self.__list[i:j]
-        self.__blob = None
+            s = s.__decodeList()
+        if index.step not in (None, 1):
+            # Extended slices have to replace the same number of items, so we can swap them one by one.
+            for i, item in zip(range(*index.indices(len(self.__list))), s):
+                self[i] = item
+            return
+        start, stop, _ = index.indices(len(self.__list))
+        del self[start:max(start, stop)]
+        self.__insertItems(start, s)
         return
 
     def __iadd__(self, other):
-        if self.__list == None:
-            self.__decodeList()
-        self.__list += list(other)
-        self.__blob = None
+        self.__insertItems(len(self), other)
         return self
 
     def __add__(self, other):
@@ -228,10 +362,8 @@ class CatalogItemList:
         return self.output()
 
     def output(self, store = -1):
-        if self.__list == None:
-            self.__decodeList()
         inner = ''
-        for item in self.__list:
+        for item in self.__decodeList():
             inner += ', %s' % item.output(store)
 
         return 'CatalogItemList([%s])' % inner[2:]
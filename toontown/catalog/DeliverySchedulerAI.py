@@ -0,0 +1,113 @@
+import heapq
+import time
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
+
+
+class DeliverySchedulerAI:
+    """
+    Wakes up toons when something they are waiting for is due: their next catalog, their
+    catalog purchases and gifts, or their awards.
+
+    Every toon has at most one delivery of each kind scheduled. They are all kept in one heap
+    of (due time, avId, kind), which a single task sleeps on until the first one is due.
+    Rescheduling or cancelling a delivery doesn't touch the heap, its old entry is just skipped
+    when it comes up.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('DeliverySchedulerAI')
+
+    # The kinds of deliveries. Deliveries due at the same time for the same toon are made in this order.
+    Catalog = 0
+    Purchase = 1
+    Award = 2
+    Kinds = (Catalog, Purchase, Award)
+
+    def __init__(self, air, clock=time.time):
+        self.air = air
+        self.clock = clock
+        # Maps (avId, kind) to (due time, callback).
+        self.deliveries = {}
+        # Heap of (due time, avId, kind). Entries that no longer match self.deliveries are stale.
+        self.queue = []
+        self.nextWake = None
+        self.taskName = 'delivery-scheduler'
+
+    def delete(self):
+        taskMgr.remove(self.taskName)
+        self.deliveries = {}
+        self.queue = []
+        self.nextWake = None
+
+    def getTime(self):
+        return self.clock()
+
+    def schedule(self, avId, kind, dueTime, callback, keepEarlier=False):
+        # Calls callback() once dueTime has passed, instead of whatever this toon had scheduled
+        # for this kind. With keepEarlier, a delivery that is already due sooner is kept instead.
+        delivery = self.deliveries.get((avId, kind))
+        if keepEarlier and delivery is not None and delivery[0] <= dueTime:
+            return
+
+        self.deliveries[(avId, kind)] = (dueTime, callback)
+        heapq.heappush(self.queue, (dueTime, avId, kind))
+        if len(self.queue) > 2 * len(self.deliveries) + 64:
+            self.__compact()
+
+        self.__scheduleTask()
+
+    def cancel(self, avId, kind=None):
+        for kind in (self.Kinds if kind is None else (kind,)):
+            self.deliveries.pop((avId, kind), None)
+
+    def getDueTime(self, avId, kind):
+        delivery = self.deliveries.get((avId, kind))
+        if delivery is None:
+            return None
+
+        return delivery[0]
+
+    def getNumDeliveries(self):
+        return len(self.deliveries)
+
+    def __isStale(self, entry):
+        dueTime, avId, kind = entry
+        delivery = self.deliveries.get((avId, kind))
+        return delivery is None or delivery[0] != dueTime
+
+    def __compact(self):
+        # Too many stale entries piled up, so start over with just the current ones
+        self.queue = [(dueTime, avId, kind) for (avId, kind), (dueTime, callback) in self.deliveries.items()]
+        heapq.heapify(self.queue)
+
+    def __scheduleTask(self):
+        # The task sleeps until the next delivery is due, and is woken up earlier when one that is due sooner is added.
+        while self.queue and self.__isStale(self.queue[0]):
+            heapq.heappop(self.queue)
+
+        if not self.queue:
+            return
+
+        dueTime = self.queue[0][0]
+        if self.nextWake is not None and self.nextWake <= dueTime:
+            return
+
+        taskMgr.remove(self.taskName)
+        self.nextWake = dueTime
+        taskMgr.doMethodLater(max(0.0, dueTime - self.clock()), self.__deliveryTask, self.taskName)
+
+    def __deliveryTask(self, task):
+        self.nextWake = None
+        now = self.clock()
+        while self.queue and self.queue[0][0] <= now:
+            entry = heapq.heappop(self.queue)
+            if self.__isStale(entry):
+                continue
+
+            dueTime, avId, kind = entry
+            callback = self.deliveries.pop((avId, kind))[1]
+            # The callback may well schedule this toon's next delivery
+            callback()
+
+        self.__scheduleTask()
+        return Task.done
@@ -4,7 +4,6 @@ from direct.showbase.RandomNumGen import RandomNumGen
 from toontown.minigame.MazeBase import MazeBase
 from . import CogdoMazeGameGlobals as Globals
 from .CogdoMazeGameObjects import CogdoMazeWaterCooler
-from . import CogdoMazeData
 from . import CogdoUtil
 
 class CogdoMaze(MazeBase, DirectObject):
@@ -79,7 +78,11 @@ BARRIER_DATA_TOP = 1
 
 class CogdoMazeFactory:
 
-    def __init__(self, randomNumGen, width, height, frameWallThickness = Globals.FrameWallThickness, cogdoMazeData = CogdoMazeData):
+    def __init__(self, randomNumGen, width, height, frameWallThickness = Globals.FrameWallThickness, cogdoMazeData = None):
+        if cogdoMazeData is None:
+            # The quadrant collision tables are large, so they're only loaded once a maze is built.
+            from . import CogdoMazeData
+            cogdoMazeData = CogdoMazeData
         self._rng = RandomNumGen(randomNumGen)
         self.width = width
         self.height = height
@@ -4,6 +4,7 @@ from toontown.coghq import CountryClubRoomSpecs
 from toontown.toonbase import ToontownGlobals
 from direct.showbase.PythonUtil import normalDistrib, lerp
 import random
+from toontown.coghq.FacilityLayoutGlobals import mixLayoutSeed
 
 def printAllBossbotInfo():
     print('roomId: roomName')
@@ -175,6 +176,10 @@ testLayout = [
 
 # countryClubLayouts = testLayout
 
+CountryClubId2Layouts = {ToontownGlobals.BossbotCountryClubIntA: (0, 1, 2),
+ ToontownGlobals.BossbotCountryClubIntB: (3, 4, 5),
+ ToontownGlobals.BossbotCountryClubIntC: (6, 7, 8)}
+
 class CountryClubLayout:
     notify = DirectNotifyGlobal.directNotify.newCategory('CountryClubLayout')
 
@@ -283,7 +288,7 @@ class CountryClubLayout:
         return len(countryClubLayouts[self.layoutIndex])
 
     def getRng(self):
-        return random.Random(self.countryClubId * self.floorNum)
+        return random.Random(mixLayoutSeed(self.countryClubId, self.layoutIndex, self.floorNum))
 
     def _chooseBattleRooms(self, numBattlesLeft, allBattleRoomIds, baseIndex = 0, chosenBattleRooms = None):
         if chosenBattleRooms is None:
@@ -4,9 +4,6 @@ from toontown.toonbase import ToontownGlobals
 from toontown.coghq import CountryClubLayout
 from direct.showbase import DirectObject
 import random
-CountryClubId2Layouts = {ToontownGlobals.BossbotCountryClubIntA: (0, 1, 2),
- ToontownGlobals.BossbotCountryClubIntB: (3, 4, 5),
- ToontownGlobals.BossbotCountryClubIntC: (6, 7, 8)}
 
 class CountryClubManagerAI(DirectObject.DirectObject):
     notify = DirectNotifyGlobal.directNotify.newCategory('CountryClubManagerAI')
@@ -49,7 +46,7 @@ class CountryClubManagerAI(DirectObject.DirectObject):
 
         countryClubZone = self.air.allocateZone()
         if layoutIndex is None:
-            layoutIndex = random.choice(CountryClubId2Layouts[countryClubId])
+            layoutIndex = random.choice(CountryClubLayout.CountryClubId2Layouts[countryClubId])
         countryClub = DistributedCountryClubAI.DistributedCountryClubAI(self.air, countryClubId, countryClubZone, floor, players, layoutIndex)
         countryClub.generateWithRequired(countryClubZone)
         return countryClubZone
@@ -39,10 +39,14 @@ class DistributedMint(DistributedObject.DistributedObject):
         DistributedMint.notify.debug('setMintId: %s' % id)
         self.mintId = id
 
+    def setLayoutSeed(self, layoutSeed):
+        DistributedMint.notify.debug('setLayoutSeed: %s' % layoutSeed)
+        self.layoutSeed = layoutSeed
+
     def setFloorNum(self, num):
         DistributedMint.notify.debug('floorNum: %s' % num)
         self.floorNum = num
-        self.layout = MintLayout.MintLayout(self.mintId, self.floorNum)
+        self.layout = MintLayout.MintLayout(self.mintId, self.floorNum, self.layoutSeed)
 
     def setRoomDoIds(self, roomDoIds):
         self.roomDoIds = roomDoIds
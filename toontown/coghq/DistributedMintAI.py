@@ -8,17 +8,18 @@ from toontown.coghq import BattleExperienceAggregatorAI
 class DistributedMintAI(DistributedObjectAI.DistributedObjectAI):
     notify = DirectNotifyGlobal.directNotify.newCategory('DistributedMintAI')
 
-    def __init__(self, air, mintId, zoneId, floorNum, avIds):
+    def __init__(self, air, mintId, zoneId, floorNum, avIds, layoutSeed = 0):
         DistributedObjectAI.DistributedObjectAI.__init__(self, air)
         self.mintId = mintId
         self.zoneId = zoneId
         self.floorNum = floorNum
+        self.layoutSeed = layoutSeed
         self.avIds = avIds
 
     def generate(self):
         DistributedObjectAI.DistributedObjectAI.generate(self)
-        self.notify.info('generate %s, id=%s, floor=%s' % (self.doId, self.mintId, self.floorNum))
-        self.layout = MintLayout.MintLayout(self.mintId, self.floorNum)
+        self.notify.info('generate %s, id=%s, floor=%s, seed=%s' % (self.doId, self.mintId, self.floorNum, self.layoutSeed))
+        self.layout = MintLayout.MintLayout(self.mintId, self.floorNum, self.layoutSeed)
         self.rooms = []
         self.battleExpAggreg = BattleExperienceAggregatorAI.BattleExperienceAggregatorAI()
         for i in range(self.layout.getNumRooms()):
@@ -67,5 +68,8 @@ class DistributedMintAI(DistributedObjectAI.DistributedObjectAI):
     def getMintId(self):
         return self.mintId
 
+    def getLayoutSeed(self):
+        return self.layoutSeed
+
     def getFloorNum(self):
         return self.floorNum
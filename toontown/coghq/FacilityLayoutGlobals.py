@@ -0,0 +1,17 @@
+# Seeds for the random number generators that lay out Cog facilities (mints, stages and country clubs).
+# The AI and the clients both lay a facility out from these, so they must never depend on anything but
+# the values they are given.
+
+SeedMask = (1 << 64) - 1
+
+
+def mixLayoutSeed(*values):
+    # Mixes every value into one seed, SplitMix64 style. Unlike multiplying them together, values
+    # of 0 still matter, and swapping two values around gives a different seed.
+    seed = 0x9E3779B97F4A7C15
+    for value in values:
+        seed = (seed ^ (value & SeedMask)) * 0xBF58476D1CE4E5B9 & SeedMask
+        seed = (seed ^ (seed >> 27)) * 0x94D049BB133111EB & SeedMask
+        seed ^= seed >> 31
+
+    return seed
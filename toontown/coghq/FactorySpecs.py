@@ -6,10 +6,17 @@ from . import LawbotLegFactoryCogs
 
 
 def getFactorySpecModule(factoryId):
+    if __dev__ and factoryId == ToontownGlobals.MockupFactoryId:
+        # The mockup spec is large and only used for development, so it's loaded on demand.
+        from . import FactoryMockupSpec
+        return FactoryMockupSpec
     return FactorySpecModules[factoryId]
 
 
 def getCogSpecModule(factoryId):
+    if __dev__ and factoryId == ToontownGlobals.MockupFactoryId:
+        from . import FactoryMockupCogs
+        return FactoryMockupCogs
     return CogSpecModules[factoryId]
 
 
@@ -24,9 +31,3 @@ CogSpecModules = {
     ToontownGlobals.SellbotFactoryIntS: SellbotLegFactoryCogs,
     ToontownGlobals.LawbotOfficeInt: LawbotLegFactoryCogs
 }
-
-if __dev__:
-    from . import FactoryMockupSpec
-    FactorySpecModules[ToontownGlobals.MockupFactoryId] = FactoryMockupSpec
-    from . import FactoryMockupCogs
-    CogSpecModules[ToontownGlobals.MockupFactoryId] = FactoryMockupCogs
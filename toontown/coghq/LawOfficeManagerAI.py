@@ -5,10 +5,6 @@ from toontown.coghq import StageLayout
 from toontown.toonbase import ToontownGlobals
 from direct.showbase import DirectObject
 import random
-StageId2Layouts = {ToontownGlobals.LawbotStageIntA: (0, 1, 2),
- ToontownGlobals.LawbotStageIntB: (3, 4, 5),
- ToontownGlobals.LawbotStageIntC: (6, 7, 8),
- ToontownGlobals.LawbotStageIntD: (9, 10, 11)}
 
 class LawOfficeManagerAI(DirectObject.DirectObject):
     notify = DirectNotifyGlobal.directNotify.newCategory('LawOfficeManagerAI')
@@ -32,7 +28,7 @@ class LawOfficeManagerAI(DirectObject.DirectObject):
         for avId in players:
             if bboard.has('stageRoom-%s' % avId):
                 roomId = bboard.get('stageRoom-%s' % avId)
-                for lt in StageId2Layouts[StageId]:
+                for lt in StageLayout.StageId2Layouts[StageId]:
                     for i in range(StageLayout.getNumFloors(lt)):
                         layout = StageLayout.StageLayout(StageId, i, stageLayout=lt)
                         if roomId in layout.getRoomIds():
@@ -46,7 +42,7 @@ class LawOfficeManagerAI(DirectObject.DirectObject):
 
         StageZone = self.air.allocateZone()
         if layoutIndex is None:
-            layoutIndex = random.choice(StageId2Layouts[StageId])
+            layoutIndex = random.choice(StageLayout.StageId2Layouts[StageId])
         Stage = DistributedStageAI.DistributedStageAI(self.air, StageId, StageZone, floor, players, layoutIndex)
         Stage.generateWithRequired(StageZone)
         return StageZone
@@ -1,6 +1,7 @@
 from direct.directnotify import DirectNotifyGlobal
 from direct.showbase.PythonUtil import invertDictLossless
-from toontown.coghq import MintRoomSpecs
+from toontown.coghq import MintRoomSpecs, MintLayoutTable
+from toontown.coghq.FacilityLayoutGlobals import mixLayoutSeed
 from toontown.toonbase import ToontownGlobals
 from direct.showbase.PythonUtil import normalDistrib, lerp
 import random
@@ -69,584 +70,34 @@ def printNumBattles():
     iterateCashbotMints(func)
 
 
-BakedFloorLayouts = {12500:
-         {0: (0,
-              4,
-              1,
-              13,
-              6,
-              11,
-              7,
-              17),
-         1: (0,
-             4,
-             1,
-             13,
-             6,
-             11,
-             7,
-             22),
-         2: (0,
-             4,
-             1,
-             6,
-             13,
-             11,
-             7,
-             19),
-         3: (0,
-             4,
-             13,
-             1,
-             6,
-             11,
-             7,
-             24),
-         4: (0,
-             13,
-             4,
-             1,
-             6,
-             11,
-             7,
-             21),
-         5: (0,
-             1,
-             12,
-             7,
-             11,
-             13,
-             18),
-         6: (0,
-             1,
-             12,
-             13,
-             7,
-             11,
-             23),
-         7: (0,
-             1,
-             12,
-             7,
-             13,
-             11,
-             20),
-         8: (0,
-             1,
-             12,
-             13,
-             7,
-             11,
-             25),
-         9: (0,
-             1,
-             12,
-             7,
-             11,
-             13,
-             22),
-         10: (0,
-              13,
-              9,
-              11,
-              8,
-              1,
-              4,
-              19),
-         11: (0,
-              9,
-              11,
-              8,
-              1,
-              13,
-              4,
-              24),
-         12: (0,
-              9,
-              11,
-              8,
-              13,
-              1,
-              4,
-              21),
-         13: (0,
-              9,
-              13,
-              11,
-              8,
-              1,
-              4,
-              17),
-         14: (0,
-              9,
-              11,
-              13,
-              8,
-              1,
-              4,
-              23),
-         15: (0,
-              9,
-              11,
-              3,
-              13,
-              1,
-              14,
-              20),
-         16: (0,
-              9,
-              11,
-              3,
-              1,
-              13,
-              14,
-              25),
-         17: (0,
-              9,
-              11,
-              3,
-              1,
-              14,
-              13,
-              22),
-         18: (0,
-              9,
-              13,
-              11,
-              3,
-              1,
-              14,
-              18),
-         19: (0,
-              9,
-              11,
-              13,
-              3,
-              1,
-              14,
-              24)},
- 12600: {0: (0,
-             13,
-             4,
-             1,
-             15,
-             5,
-             11,
-             7,
-             17),
-         1: (0,
-             4,
-             13,
-             1,
-             15,
-             5,
-             11,
-             7,
-             18),
-         2: (0,
-             4,
-             1,
-             15,
-             13,
-             5,
-             11,
-             7,
-             20),
-         3: (0,
-             4,
-             1,
-             13,
-             15,
-             5,
-             11,
-             7,
-             22),
-         4: (0,
-             4,
-             1,
-             15,
-             5,
-             11,
-             7,
-             13,
-             23),
-         5: (0,
-             14,
-             1,
-             13,
-             12,
-             7,
-             11,
-             6,
-             25),
-         6: (0,
-             14,
-             1,
-             12,
-             7,
-             13,
-             11,
-             6,
-             18),
-         7: (0,
-             14,
-             1,
-             13,
-             12,
-             7,
-             11,
-             6,
-             19),
-         8: (0,
-             14,
-             1,
-             12,
-             7,
-             11,
-             13,
-             6,
-             21),
-         9: (0,
-             14,
-             1,
-             13,
-             12,
-             7,
-             11,
-             6,
-             23),
-         10: (0,
-              6,
-              11,
-              4,
-              9,
-              1,
-              4,
-              13,
-              24),
-         11: (0,
-              6,
-              11,
-              4,
-              13,
-              9,
-              1,
-              4,
-              17),
-         12: (0,
-              6,
-              11,
-              4,
-              9,
-              1,
-              13,
-              4,
-              19),
-         13: (0,
-              6,
-              11,
-              4,
-              13,
-              9,
-              1,
-              4,
-              20),
-         14: (0,
-              6,
-              11,
-              4,
-              9,
-              13,
-              1,
-              4,
-              22),
-         15: (0,
-              16,
-              11,
-              13,
-              12,
-              3,
-              1,
-              6,
-              8,
-              24),
-         16: (0,
-              16,
-              11,
-              12,
-              3,
-              1,
-              6,
-              13,
-              8,
-              25),
-         17: (0,
-              16,
-              11,
-              12,
-              13,
-              3,
-              1,
-              6,
-              8,
-              18),
-         18: (0,
-              16,
-              11,
-              12,
-              3,
-              13,
-              1,
-              6,
-              8,
-              20),
-         19: (0,
-              16,
-              11,
-              12,
-              13,
-              3,
-              1,
-              6,
-              8,
-              21)},
- 12700: {0: (0,
-             6,
-             1,
-             13,
-             12,
-             8,
-             5,
-             11,
-             9,
-             7,
-             17),
-         1: (0,
-             6,
-             1,
-             12,
-             8,
-             5,
-             13,
-             11,
-             9,
-             7,
-             23),
-         2: (0,
-             6,
-             1,
-             12,
-             13,
-             8,
-             5,
-             11,
-             9,
-             7,
-             21),
-         3: (0,
-             6,
-             1,
-             12,
-             8,
-             5,
-             11,
-             13,
-             9,
-             7,
-             19),
-         4: (0,
-             6,
-             1,
-             12,
-             13,
-             8,
-             5,
-             11,
-             9,
-             7,
-             17),
-         5: (0,
-             5,
-             1,
-             2,
-             16,
-             13,
-             11,
-             4,
-             6,
-             23),
-         6: (0,
-             5,
-             1,
-             2,
-             16,
-             11,
-             4,
-             13,
-             6,
-             21),
-         7: (0,
-             5,
-             1,
-             13,
-             2,
-             16,
-             11,
-             4,
-             6,
-             19),
-         8: (0,
-             5,
-             13,
-             1,
-             2,
-             16,
-             11,
-             4,
-             6,
-             17),
-         9: (0,
-             5,
-             13,
-             1,
-             2,
-             16,
-             11,
-             4,
-             6,
-             23),
-         10: (0,
-              13,
-              15,
-              11,
-              4,
-              3,
-              9,
-              1,
-              4,
-              14,
-              21),
-         11: (0,
-              15,
-              11,
-              13,
-              4,
-              3,
-              9,
-              1,
-              4,
-              14,
-              19),
-         12: (0,
-              15,
-              11,
-              4,
-              3,
-              9,
-              13,
-              1,
-              4,
-              14,
-              17),
-         13: (0,
-              15,
-              11,
-              13,
-              4,
-              3,
-              9,
-              1,
-              4,
-              14,
-              24),
-         14: (0,
-              15,
-              11,
-              4,
-              3,
-              9,
-              1,
-              13,
-              4,
-              14,
-              21),
-         15: (0,
-              13,
-              16,
-              2,
-              11,
-              6,
-              3,
-              1,
-              9,
-              8,
-              19),
-         16: (0,
-              16,
-              2,
-              11,
-              6,
-              3,
-              13,
-              1,
-              9,
-              8,
-              17),
-         17: (0,
-              16,
-              2,
-              11,
-              6,
-              3,
-              1,
-              9,
-              8,
-              13,
-              24),
-         18: (0,
-              16,
-              2,
-              11,
-              6,
-              3,
-              13,
-              1,
-              9,
-              8,
-              21),
-         19: (0,
-              13,
-              16,
-              2,
-              11,
-              6,
-              3,
-              1,
-              9,
-              8,
-              19)}}
+def getFloorLayouts(mintId, floorNum):
+    # Returns the room ids of every layout baked for a floor of a mint, or None if there aren't any.
+    return MintLayoutTable.MintFloorLayouts.get(mintId, {}).get(floorNum)
+
 
 class MintLayout:
     notify = DirectNotifyGlobal.directNotify.newCategory('MintLayout')
 
-    def __init__(self, mintId, floorNum):
+    def __init__(self, mintId, floorNum, layoutSeed = 0):
         self.mintId = mintId
         self.floorNum = floorNum
+        self.layoutSeed = layoutSeed
         self.roomIds = []
         self.hallways = []
         self.numRooms = 1 + ToontownGlobals.MintNumRooms[self.mintId][self.floorNum]
         self.numHallways = self.numRooms - 1
-        if self.mintId in BakedFloorLayouts and self.floorNum in BakedFloorLayouts[self.mintId]:
-            self.roomIds = list(BakedFloorLayouts[self.mintId][self.floorNum])
+        # Every mint instance picks one of the layouts baked for its floor with its own seed
+        floorLayouts = getFloorLayouts(self.mintId, self.floorNum)
+        if floorLayouts:
+            self.roomIds = list(floorLayouts[self.layoutSeed % len(floorLayouts)])
         else:
-            self.roomIds = self._genFloorLayout()
+            self.roomIds = self._genFloorLayout(self.getRng())
         hallwayRng = self.getRng()
         connectorRoomNames = MintRoomSpecs.CashbotMintConnectorRooms
         for i in range(self.numHallways):
             self.hallways.append(hallwayRng.choice(connectorRoomNames))
 
-    def _genFloorLayout(self):
-        rng = self.getRng()
+    def _genFloorLayout(self, rng):
         startingRoomIDs = MintRoomSpecs.CashbotMintEntranceIDs
         middleRoomIDs = MintRoomSpecs.CashbotMintMiddleRoomIDs
         finalRoomIDs = MintRoomSpecs.CashbotMintFinalRoomIDs
@@ -731,8 +182,11 @@ class MintLayout:
     def getFloorNum(self):
         return self.floorNum
 
+    def getLayoutSeed(self):
+        return self.layoutSeed
+
     def getRng(self):
-        return random.Random(self.mintId * self.floorNum)
+        return random.Random(mixLayoutSeed(self.mintId, self.floorNum, self.layoutSeed))
 
     def _chooseBattleRooms(self, numBattlesLeft, allBattleRoomIds, baseIndex = 0, chosenBattleRooms = None):
         if chosenBattleRooms is None:
@@ -0,0 +1,1093 @@
+# Generated by tools/bake_facility_layouts.py, do not edit by hand.
+# Maps mint ids to floor numbers to the room ids of every layout that floor can have.
+
+LayoutsPerFloor = 16
+
+MintFloorLayouts = {
+    12500: {
+        0: (
+            (0, 5, 9, 3, 11, 6, 25),
+            (0, 10, 15, 1, 13, 16, 17),
+            (0, 9, 11, 8, 14, 6, 17),
+            (0, 1, 14, 9, 6, 10, 20),
+            (0, 9, 11, 13, 3, 4, 19),
+            (0, 16, 1, 10, 9, 6, 23),
+            (0, 13, 9, 4, 5, 8, 21),
+            (0, 6, 11, 4, 10, 7, 18),
+            (0, 3, 15, 10, 11, 1, 20),
+            (0, 5, 1, 3, 15, 16, 25),
+            (0, 14, 16, 15, 11, 7, 17),
+            (0, 14, 15, 13, 16, 10, 21),
+            (0, 1, 9, 5, 4, 3, 24),
+            (0, 16, 14, 15, 8, 11, 18),
+            (0, 5, 9, 1, 14, 4, 23),
+            (0, 9, 11, 1, 4, 3, 22),
+        ),
+        1: (
+            (0, 4, 13, 7, 9, 3, 19),
+            (0, 6, 4, 3, 5, 8, 24),
+            (0, 4, 14, 10, 9, 7, 23),
+            (0, 11, 9, 16, 4, 1, 22),
+            (0, 14, 6, 16, 5, 9, 24),
+            (0, 6, 14, 9, 11, 13, 20),
+            (0, 8, 15, 13, 5, 1, 18),
+            (0, 1, 5, 10, 4, 6, 25),
+            (0, 16, 9, 10, 11, 4, 24),
+            (0, 6, 11, 10, 4, 14, 19),
+            (0, 9, 10, 11, 4, 16, 25),
+            (0, 3, 15, 5, 8, 16, 21),
+            (0, 3, 9, 1, 16, 6, 17),
+            (0, 11, 6, 7, 5, 4, 20),
+            (0, 15, 14, 1, 8, 5, 25),
+            (0, 14, 10, 9, 6, 3, 23),
+        ),
+        2: (
+            (0, 1, 7, 11, 15, 16, 3, 25),
+            (0, 16, 14, 13, 6, 4, 7, 24),
+            (0, 16, 6, 4, 3, 1, 14, 19),
+            (0, 13, 9, 3, 4, 16, 14, 19),
+            (0, 7, 9, 4, 1, 13, 14, 17),
+            (0, 9, 4, 10, 13, 5, 3, 24),
+            (0, 10, 13, 4, 14, 1, 6, 24),
+            (0, 11, 5, 14, 16, 3, 15, 19),
+            (0, 7, 4, 6, 3, 14, 10, 23),
+            (0, 14, 1, 13, 3, 11, 15, 21),
+            (0, 7, 6, 4, 1, 3, 11, 23),
+            (0, 7, 9, 13, 14, 4, 16, 23),
+            (0, 1, 5, 10, 11, 13, 15, 24),
+            (0, 11, 3, 10, 13, 15, 16, 18),
+            (0, 14, 16, 1, 15, 10, 3, 19),
+            (0, 10, 16, 1, 5, 4, 6, 17),
+        ),
+        3: (
+            (0, 13, 14, 6, 3, 10, 9, 24),
+            (0, 10, 16, 1, 7, 4, 9, 18),
+            (0, 16, 7, 9, 5, 4, 11, 21),
+            (0, 5, 11, 13, 4, 8, 9, 24),
+            (0, 6, 3, 4, 8, 13, 7, 24),
+            (0, 6, 11, 10, 7, 16, 9, 23),
+            (0, 4, 1, 7, 10, 6, 3, 17),
+            (0, 5, 4, 6, 10, 1, 8, 21),
+            (0, 15, 7, 1, 5, 11, 14, 17),
+            (0, 6, 5, 1, 10, 7, 9, 17),
+            (0, 14, 15, 7, 11, 16, 13, 19),
+            (0, 1, 8, 9, 3, 6, 10, 25),
+            (0, 14, 9, 10, 6, 13, 11, 18),
+            (0, 4, 1, 11, 7, 13, 9, 25),
+            (0, 14, 4, 5, 3, 6, 7, 22),
+            (0, 1, 11, 13, 15, 16, 10, 19),
+        ),
+        4: (
+            (0, 10, 6, 3, 8, 4, 1, 22),
+            (0, 3, 1, 5, 4, 7, 9, 24),
+            (0, 1, 13, 8, 3, 15, 7, 25),
+            (0, 7, 13, 1, 9, 6, 16, 22),
+            (0, 14, 9, 4, 1, 13, 16, 19),
+            (0, 4, 5, 6, 16, 11, 8, 22),
+            (0, 13, 9, 6, 3, 5, 10, 22),
+            (0, 13, 1, 8, 6, 4, 5, 23),
+            (0, 8, 4, 16, 6, 7, 11, 19),
+            (0, 16, 4, 11, 9, 5, 7, 20),
+            (0, 13, 10, 14, 15, 1, 7, 20),
+            (0, 16, 4, 9, 5, 14, 13, 22),
+            (0, 9, 1, 16, 4, 13, 8, 21),
+            (0, 15, 13, 1, 16, 14, 11, 20),
+            (0, 4, 1, 11, 7, 9, 5, 23),
+            (0, 5, 8, 14, 6, 4, 10, 20),
+        ),
+        5: (
+            (0, 6, 7, 14, 8, 3, 9, 19),
+            (0, 9, 13, 7, 10, 16, 6, 25),
+            (0, 7, 9, 1, 6, 8, 5, 19),
+            (0, 15, 3, 14, 1, 7, 13, 22),
+            (0, 11, 4, 1, 7, 8, 9, 20),
+            (0, 8, 6, 11, 13, 7, 9, 25),
+            (0, 13, 1, 4, 14, 7, 9, 17),
+            (0, 8, 7, 16, 15, 13, 14, 20),
+            (0, 14, 7, 11, 3, 6, 9, 19),
+            (0, 10, 7, 11, 8, 4, 9, 22),
+            (0, 9, 16, 14, 7, 4, 8, 19),
+            (0, 4, 3, 6, 5, 8, 10, 24),
+            (0, 9, 5, 10, 6, 16, 1, 19),
+            (0, 13, 9, 4, 5, 11, 14, 25),
+            (0, 11, 14, 1, 10, 16, 15, 19),
+            (0, 11, 1, 13, 9, 6, 7, 22),
+        ),
+        6: (
+            (0, 5, 9, 10, 11, 4, 14, 18),
+            (0, 1, 4, 8, 6, 5, 7, 19),
+            (0, 11, 7, 10, 6, 9, 8, 20),
+            (0, 4, 8, 9, 10, 1, 3, 20),
+            (0, 4, 10, 16, 8, 13, 9, 17),
+            (0, 15, 11, 14, 7, 16, 10, 24),
+            (0, 4, 9, 11, 10, 13, 16, 21),
+            (0, 6, 4, 3, 16, 8, 10, 23),
+            (0, 1, 3, 4, 9, 8, 13, 20),
+            (0, 8, 3, 16, 5, 9, 4, 23),
+            (0, 4, 16, 1, 10, 7, 6, 17),
+            (0, 11, 7, 3, 4, 9, 5, 20),
+            (0, 16, 9, 10, 5, 7, 6, 18),
+            (0, 8, 5, 3, 7, 1, 15, 20),
+            (0, 3, 14, 8, 16, 9, 4, 17),
+            (0, 3, 5, 7, 6, 16, 4, 19),
+        ),
+        7: (
+            (0, 7, 5, 16, 4, 13, 8, 6, 25),
+            (0, 8, 11, 10, 5, 13, 9, 6, 19),
+            (0, 7, 11, 1, 6, 4, 10, 16, 24),
+            (0, 1, 13, 10, 11, 14, 16, 15, 25),
+            (0, 6, 5, 16, 10, 9, 1, 11, 24),
+            (0, 3, 11, 15, 7, 1, 16, 14, 22),
+            (0, 11, 7, 15, 8, 5, 10, 3, 19),
+            (0, 14, 10, 8, 15, 7, 13, 3, 19),
+            (0, 10, 16, 9, 11, 3, 8, 6, 20),
+            (0, 5, 1, 11, 6, 10, 4, 3, 20),
+            (0, 11, 1, 13, 9, 6, 16, 3, 23),
+            (0, 6, 7, 10, 16, 3, 9, 11, 18),
+            (0, 5, 15, 7, 13, 3, 11, 8, 23),
+            (0, 7, 3, 5, 16, 14, 15, 13, 20),
+            (0, 5, 7, 14, 9, 6, 16, 13, 24),
+            (0, 7, 13, 1, 14, 9, 16, 4, 22),
+        ),
+        8: (
+            (0, 14, 13, 9, 6, 3, 1, 5, 23),
+            (0, 4, 6, 11, 13, 10, 16, 7, 21),
+            (0, 5, 1, 13, 16, 9, 7, 4, 18),
+            (0, 3, 1, 11, 6, 16, 9, 10, 17),
+            (0, 11, 13, 4, 5, 3, 1, 9, 20),
+            (0, 5, 3, 1, 14, 13, 15, 7, 25),
+            (0, 3, 14, 1, 4, 10, 9, 11, 17),
+            (0, 4, 8, 6, 10, 7, 5, 11, 23),
+            (0, 3, 11, 15, 7, 13, 10, 16, 22),
+            (0, 10, 16, 14, 7, 6, 5, 4, 19),
+            (0, 8, 14, 9, 13, 1, 7, 4, 19),
+            (0, 15, 3, 5, 7, 11, 8, 10, 17),
+            (0, 14, 6, 4, 10, 3, 16, 5, 18),
+            (0, 3, 15, 11, 7, 10, 1, 8, 25),
+            (0, 3, 6, 7, 11, 16, 14, 4, 22),
+            (0, 16, 9, 14, 13, 4, 11, 5, 22),
+        ),
+        9: (
+            (0, 13, 7, 9, 6, 11, 3, 16, 18),
+            (0, 3, 16, 10, 7, 15, 8, 11, 24),
+            (0, 1, 16, 5, 3, 14, 11, 15, 17),
+            (0, 4, 11, 10, 9, 3, 1, 5, 18),
+            (0, 5, 1, 16, 6, 3, 4, 13, 17),
+            (0, 9, 8, 11, 4, 3, 14, 13, 23),
+            (0, 6, 9, 7, 8, 3, 13, 14, 22),
+            (0, 3, 4, 9, 7, 13, 8, 5, 21),
+            (0, 4, 8, 1, 3, 6, 16, 7, 25),
+            (0, 10, 3, 14, 4, 8, 11, 6, 25),
+            (0, 5, 11, 15, 13, 1, 16, 14, 18),
+            (0, 6, 10, 11, 16, 1, 14, 9, 22),
+            (0, 9, 13, 3, 7, 11, 6, 5, 23),
+            (0, 5, 9, 8, 3, 13, 14, 4, 25),
+            (0, 16, 6, 7, 11, 14, 4, 5, 20),
+            (0, 6, 3, 5, 10, 9, 14, 16, 21),
+        ),
+        10: (
+            (0, 3, 5, 1, 7, 14, 10, 15, 22),
+            (0, 16, 8, 7, 13, 1, 3, 15, 20),
+            (0, 11, 9, 13, 10, 6, 7, 16, 20),
+            (0, 11, 16, 3, 14, 9, 10, 6, 25),
+            (0, 10, 15, 3, 7, 11, 14, 5, 21),
+            (0, 10, 16, 3, 1, 5, 13, 15, 21),
+            (0, 7, 14, 1, 5, 9, 4, 11, 25),
+            (0, 3, 5, 6, 8, 4, 7, 13, 18),
+            (0, 9, 10, 4, 13, 11, 14, 1, 21),
+            (0, 1, 13, 5, 11, 7, 9, 4, 24),
+            (0, 9, 3, 6, 7, 11, 10, 1, 24),
+            (0, 5, 7, 15, 10, 3, 13, 16, 21),
+            (0, 3, 9, 16, 6, 13, 11, 7, 20),
+            (0, 6, 5, 14, 7, 11, 4, 1, 18),
+            (0, 4, 13, 8, 16, 3, 7, 9, 21),
+            (0, 5, 13, 11, 3, 1, 4, 6, 25),
+        ),
+        11: (
+            (0, 1, 9, 11, 3, 8, 6, 14, 20),
+            (0, 7, 14, 6, 5, 11, 13, 4, 17),
+            (0, 6, 14, 8, 13, 5, 4, 10, 24),
+            (0, 6, 8, 7, 9, 16, 11, 13, 21),
+            (0, 4, 11, 1, 16, 6, 14, 13, 21),
+            (0, 14, 1, 13, 8, 7, 5, 15, 18),
+            (0, 8, 10, 5, 9, 7, 16, 4, 22),
+            (0, 5, 16, 9, 11, 14, 10, 6, 24),
+            (0, 7, 15, 8, 13, 16, 10, 5, 17),
+            (0, 13, 14, 7, 10, 5, 15, 3, 24),
+            (0, 8, 9, 13, 6, 14, 1, 7, 21),
+            (0, 7, 11, 8, 1, 10, 6, 4, 23),
+            (0, 3, 14, 10, 5, 9, 7, 4, 21),
+            (0, 8, 6, 13, 7, 1, 14, 9, 25),
+            (0, 7, 14, 9, 10, 11, 1, 4, 19),
+            (0, 3, 4, 13, 6, 14, 8, 5, 22),
+        ),
+        12: (
+            (0, 11, 8, 16, 5, 6, 13, 1, 4, 17),
+            (0, 11, 10, 13, 9, 4, 8, 7, 14, 25),
+            (0, 8, 14, 15, 7, 10, 11, 13, 3, 22),
+            (0, 6, 5, 9, 7, 10, 11, 13, 8, 24),
+            (0, 15, 5, 10, 8, 7, 11, 13, 14, 18),
+            (0, 11, 14, 1, 10, 15, 3, 8, 16, 23),
+            (0, 14, 11, 5, 9, 16, 6, 3, 1, 25),
+            (0, 14, 7, 15, 1, 10, 8, 3, 16, 24),
+            (0, 3, 16, 5, 7, 15, 11, 13, 8, 20),
+            (0, 11, 1, 5, 13, 9, 14, 6, 7, 21),
+            (0, 6, 8, 3, 9, 11, 16, 14, 5, 24),
+            (0, 1, 3, 5, 16, 6, 14, 13, 9, 21),
+            (0, 10, 8, 13, 6, 9, 11, 1, 7, 20),
+            (0, 14, 6, 16, 3, 8, 13, 4, 7, 21),
+            (0, 14, 11, 5, 3, 15, 10, 1, 16, 22),
+            (0, 7, 13, 3, 16, 15, 10, 11, 1, 17),
+        ),
+        13: (
+            (0, 10, 4, 8, 7, 1, 3, 14, 9, 17),
+            (0, 9, 14, 11, 10, 5, 4, 8, 7, 23),
+            (0, 6, 3, 11, 1, 8, 4, 10, 14, 22),
+            (0, 13, 3, 10, 5, 1, 11, 4, 6, 19),
+            (0, 6, 10, 9, 5, 1, 3, 14, 13, 18),
+            (0, 11, 14, 15, 1, 7, 10, 13, 16, 24),
+            (0, 5, 13, 11, 1, 7, 3, 4, 9, 21),
+            (0, 16, 5, 4, 14, 10, 6, 1, 11, 23),
+            (0, 6, 5, 3, 16, 13, 7, 14, 4, 18),
+            (0, 10, 5, 11, 1, 9, 14, 8, 6, 24),
+            (0, 15, 7, 10, 5, 3, 16, 8, 13, 18),
+            (0, 5, 15, 1, 16, 14, 10, 8, 11, 18),
+            (0, 14, 10, 4, 6, 7, 3, 11, 13, 22),
+            (0, 14, 8, 10, 7, 5, 11, 3, 15, 20),
+            (0, 7, 8, 13, 5, 10, 9, 11, 4, 23),
+            (0, 9, 1, 7, 3, 11, 4, 8, 16, 17),
+        ),
+        14: (
+            (0, 5, 7, 3, 13, 15, 1, 14, 16, 23),
+            (0, 5, 16, 8, 15, 10, 11, 1, 3, 23),
+            (0, 13, 1, 9, 11, 4, 5, 7, 14, 19),
+            (0, 7, 13, 5, 8, 14, 15, 16, 10, 23),
+            (0, 15, 13, 5, 7, 14, 1, 16, 10, 22),
+            (0, 10, 1, 4, 7, 16, 8, 9, 13, 18),
+            (0, 10, 16, 11, 7, 9, 4, 13, 8, 23),
+            (0, 1, 8, 10, 3, 9, 4, 11, 16, 20),
+            (0, 14, 4, 16, 11, 13, 5, 6, 7, 18),
+            (0, 11, 10, 8, 13, 15, 14, 7, 3, 19),
+            (0, 7, 14, 6, 16, 1, 9, 8, 3, 25),
+            (0, 14, 1, 13, 6, 8, 4, 11, 10, 24),
+            (0, 8, 4, 6, 7, 5, 1, 11, 16, 20),
+            (0, 11, 4, 13, 7, 6, 8, 16, 5, 25),
+            (0, 9, 11, 14, 3, 4, 8, 16, 10, 19),
+            (0, 11, 13, 7, 16, 1, 14, 15, 8, 19),
+        ),
+        15: (
+            (0, 8, 3, 5, 15, 11, 16, 7, 13, 23),
+            (0, 8, 6, 7, 1, 11, 9, 10, 14, 17),
+            (0, 11, 6, 1, 9, 8, 14, 10, 13, 20),
+            (0, 4, 3, 13, 11, 9, 14, 16, 8, 23),
+            (0, 3, 4, 7, 11, 6, 1, 10, 16, 19),
+            (0, 11, 8, 6, 10, 16, 3, 9, 5, 24),
+            (0, 10, 6, 9, 16, 7, 1, 11, 8, 20),
+            (0, 7, 9, 8, 5, 13, 11, 4, 10, 22),
+            (0, 14, 8, 11, 15, 7, 1, 16, 5, 23),
+            (0, 11, 1, 10, 5, 15, 16, 13, 3, 17),
+            (0, 8, 10, 5, 4, 7, 6, 11, 16, 20),
+            (0, 4, 16, 5, 14, 6, 1, 10, 8, 24),
+            (0, 10, 13, 4, 8, 9, 3, 14, 11, 22),
+            (0, 9, 1, 13, 7, 10, 4, 14, 16, 20),
+            (0, 1, 10, 11, 13, 3, 9, 6, 14, 24),
+            (0, 13, 3, 7, 8, 4, 14, 10, 9, 20),
+        ),
+        16: (
+            (0, 3, 6, 11, 4, 7, 16, 8, 13, 21),
+            (0, 9, 10, 7, 6, 8, 11, 3, 16, 18),
+            (0, 13, 14, 8, 7, 5, 3, 6, 4, 18),
+            (0, 1, 8, 6, 9, 14, 13, 16, 5, 25),
+            (0, 11, 4, 9, 5, 13, 7, 16, 14, 18),
+            (0, 14, 9, 13, 10, 1, 6, 11, 3, 22),
+            (0, 3, 11, 16, 8, 7, 14, 4, 6, 17),
+            (0, 10, 16, 1, 8, 6, 7, 11, 4, 17),
+            (0, 11, 3, 14, 6, 16, 13, 9, 1, 23),
+            (0, 3, 10, 7, 6, 14, 1, 16, 9, 18),
+            (0, 16, 10, 3, 13, 8, 5, 7, 15, 23),
+            (0, 7, 13, 11, 5, 6, 4, 8, 14, 19),
+            (0, 14, 10, 5, 16, 11, 13, 6, 9, 23),
+            (0, 15, 10, 13, 5, 14, 1, 16, 7, 17),
+            (0, 5, 11, 14, 7, 9, 10, 1, 4, 22),
+            (0, 10, 6, 13, 1, 8, 9, 16, 11, 20),
+        ),
+        17: (
+            (0, 3, 9, 7, 1, 11, 8, 6, 13, 10, 21),
+            (0, 11, 16, 1, 5, 9, 6, 13, 8, 10, 18),
+            (0, 7, 9, 14, 3, 10, 5, 11, 4, 13, 17),
+            (0, 16, 13, 5, 9, 8, 1, 11, 10, 4, 21),
+            (0, 5, 3, 16, 14, 11, 15, 8, 1, 7, 22),
+            (0, 14, 13, 3, 10, 16, 9, 5, 6, 7, 24),
+            (0, 13, 11, 7, 10, 15, 1, 5, 14, 8, 23),
+            (0, 13, 5, 11, 16, 7, 10, 15, 8, 14, 25),
+            (0, 9, 3, 16, 1, 13, 10, 14, 5, 6, 25),
+            (0, 16, 1, 8, 14, 5, 9, 6, 13, 10, 25),
+            (0, 14, 11, 10, 7, 3, 9, 13, 5, 4, 18),
+            (0, 10, 16, 7, 5, 3, 8, 15, 1, 13, 18),
+            (0, 13, 3, 5, 7, 6, 14, 8, 9, 16, 22),
+            (0, 16, 10, 11, 3, 13, 8, 4, 9, 5, 24),
+            (0, 6, 13, 11, 9, 5, 16, 3, 1, 8, 17),
+            (0, 4, 5, 3, 8, 6, 1, 13, 10, 7, 22),
+        ),
+        18: (
+            (0, 14, 1, 13, 9, 6, 7, 5, 16, 3, 17),
+            (0, 14, 7, 1, 3, 15, 5, 11, 16, 13, 24),
+            (0, 3, 10, 1, 11, 9, 16, 14, 4, 8, 18),
+            (0, 11, 14, 8, 10, 7, 4, 13, 6, 16, 24),
+            (0, 11, 14, 9, 7, 3, 1, 13, 8, 4, 18),
+            (0, 4, 11, 6, 13, 16, 3, 7, 14, 8, 17),
+            (0, 7, 10, 14, 8, 3, 15, 5, 11, 13, 22),
+            (0, 16, 10, 7, 14, 9, 11, 5, 3, 4, 19),
+            (0, 16, 7, 10, 9, 8, 11, 13, 6, 5, 20),
+            (0, 14, 1, 7, 13, 4, 9, 10, 5, 11, 22),
+            (0, 16, 3, 10, 5, 1, 9, 13, 8, 6, 25),
+            (0, 9, 4, 10, 1, 5, 7, 3, 11, 16, 22),
+            (0, 5, 11, 4, 8, 9, 16, 1, 14, 7, 24),
+            (0, 15, 11, 5, 1, 3, 14, 16, 13, 8, 20),
+            (0, 5, 1, 7, 4, 14, 16, 9, 10, 3, 24),
+            (0, 8, 11, 1, 5, 6, 16, 9, 3, 14, 17),
+        ),
+        19: (
+            (0, 13, 10, 1, 8, 5, 3, 15, 14, 7, 21),
+            (0, 3, 9, 1, 5, 14, 7, 10, 16, 4, 23),
+            (0, 16, 14, 5, 9, 10, 3, 11, 13, 6, 18),
+            (0, 6, 16, 14, 13, 5, 1, 4, 10, 3, 25),
+            (0, 13, 9, 11, 14, 16, 3, 5, 1, 4, 23),
+            (0, 10, 5, 7, 1, 3, 15, 8, 16, 14, 23),
+            (0, 5, 4, 10, 16, 8, 14, 1, 3, 6, 25),
+            (0, 3, 7, 10, 11, 1, 9, 16, 8, 4, 21),
+            (0, 3, 11, 13, 9, 5, 10, 7, 8, 6, 18),
+            (0, 1, 9, 14, 11, 13, 6, 5, 10, 7, 19),
+            (0, 3, 1, 9, 8, 16, 7, 6, 11, 14, 22),
+            (0, 8, 3, 5, 6, 9, 14, 11, 7, 16, 25),
+            (0, 3, 11, 6, 14, 10, 8, 13, 16, 4, 25),
+            (0, 4, 14, 16, 5, 10, 6, 11, 1, 7, 17),
+            (0, 7, 10, 16, 3, 13, 5, 15, 11, 8, 21),
+            (0, 5, 8, 3, 9, 7, 11, 10, 4, 16, 18),
+        ),
+    },
+    12600: {
+        0: (
+            (0, 3, 7, 13, 15, 5, 1, 4, 25),
+            (0, 14, 5, 6, 11, 1, 13, 15, 18),
+            (0, 7, 16, 9, 13, 6, 4, 10, 19),
+            (0, 9, 10, 6, 4, 7, 3, 13, 21),
+            (0, 7, 16, 5, 15, 9, 13, 8, 18),
+            (0, 13, 14, 16, 7, 11, 10, 12, 20),
+            (0, 4, 9, 6, 10, 13, 16, 8, 25),
+            (0, 3, 8, 2, 13, 5, 7, 1, 22),
+            (0, 7, 14, 9, 1, 3, 10, 15, 21),
+            (0, 3, 12, 5, 11, 8, 14, 10, 25),
+            (0, 5, 7, 11, 15, 10, 14, 9, 17),
+            (0, 1, 12, 16, 13, 8, 14, 7, 20),
+            (0, 14, 10, 8, 13, 11, 2, 1, 25),
+            (0, 3, 15, 6, 5, 16, 13, 11, 18),
+            (0, 11, 4, 3, 14, 13, 10, 15, 17),
+            (0, 3, 8, 5, 11, 2, 16, 13, 22),
+        ),
+        1: (
+            (0, 3, 5, 15, 10, 16, 9, 14, 25),
+            (0, 5, 13, 14, 7, 8, 12, 16, 23),
+            (0, 5, 11, 4, 9, 7, 6, 10, 19),
+            (0, 8, 2, 5, 13, 16, 14, 1, 21),
+            (0, 14, 16, 1, 15, 13, 9, 8, 20),
+            (0, 3, 4, 6, 11, 9, 5, 7, 19),
+            (0, 2, 8, 16, 10, 11, 14, 13, 24),
+            (0, 7, 15, 1, 10, 14, 9, 5, 22),
+            (0, 11, 3, 14, 5, 15, 7, 6, 24),
+            (0, 7, 14, 5, 3, 1, 13, 2, 25),
+            (0, 4, 5, 10, 6, 1, 7, 9, 23),
+            (0, 11, 7, 3, 13, 12, 10, 1, 23),
+            (0, 15, 10, 8, 5, 13, 3, 4, 18),
+            (0, 8, 7, 16, 4, 5, 6, 9, 23),
+            (0, 3, 8, 6, 16, 14, 4, 9, 21),
+            (0, 3, 12, 13, 7, 5, 1, 10, 18),
+        ),
+        2: (
+            (0, 6, 8, 16, 9, 7, 4, 10, 21),
+            (0, 5, 9, 10, 15, 13, 11, 3, 24),
+            (0, 8, 9, 4, 16, 5, 14, 6, 17),
+            (0, 7, 8, 1, 16, 2, 3, 5, 24),
+            (0, 6, 7, 11, 5, 15, 8, 1, 20),
+            (0, 8, 14, 3, 12, 7, 11, 1, 23),
+            (0, 9, 13, 10, 1, 15, 7, 11, 25),
+            (0, 7, 11, 14, 12, 5, 3, 10, 21),
+            (0, 5, 9, 14, 15, 3, 8, 13, 19),
+            (0, 11, 7, 4, 6, 13, 16, 9, 22),
+            (0, 1, 9, 3, 6, 4, 7, 14, 23),
+            (0, 14, 12, 10, 1, 8, 7, 13, 19),
+            (0, 14, 3, 2, 7, 1, 16, 8, 25),
+            (0, 8, 4, 11, 16, 10, 15, 7, 23),
+            (0, 6, 3, 7, 5, 4, 9, 13, 25),
+            (0, 9, 6, 13, 4, 5, 16, 10, 19),
+        ),
+        3: (
+            (0, 13, 1, 9, 8, 3, 5, 10, 15, 18),
+            (0, 8, 13, 4, 5, 6, 11, 9, 10, 23),
+            (0, 9, 10, 4, 8, 11, 1, 6, 7, 25),
+            (0, 5, 14, 9, 1, 6, 4, 8, 10, 24),
+            (0, 6, 16, 13, 14, 5, 11, 15, 8, 25),
+            (0, 3, 13, 7, 8, 1, 4, 6, 9, 19),
+            (0, 5, 9, 15, 13, 11, 3, 8, 7, 23),
+            (0, 1, 13, 8, 10, 12, 11, 3, 14, 22),
+            (0, 6, 9, 4, 8, 10, 16, 1, 5, 23),
+            (0, 7, 11, 9, 1, 4, 6, 5, 8, 23),
+            (0, 14, 8, 10, 15, 3, 7, 9, 11, 21),
+            (0, 1, 3, 10, 14, 6, 15, 16, 5, 18),
+            (0, 15, 11, 8, 5, 13, 4, 7, 1, 23),
+            (0, 7, 13, 2, 3, 16, 1, 14, 11, 20),
+            (0, 3, 4, 5, 7, 9, 10, 6, 13, 22),
+            (0, 14, 10, 1, 5, 16, 11, 2, 7, 25),
+        ),
+        4: (
+            (0, 13, 7, 4, 8, 1, 6, 10, 9, 20),
+            (0, 5, 1, 7, 8, 10, 14, 2, 13, 24),
+            (0, 16, 14, 1, 13, 3, 11, 12, 5, 19),
+            (0, 13, 9, 7, 10, 1, 15, 3, 8, 25),
+            (0, 3, 9, 1, 13, 8, 4, 6, 10, 18),
+            (0, 7, 9, 6, 10, 3, 14, 5, 4, 21),
+            (0, 3, 9, 15, 10, 8, 1, 11, 7, 21),
+            (0, 11, 2, 14, 3, 5, 1, 10, 16, 22),
+            (0, 3, 15, 14, 1, 5, 11, 4, 8, 17),
+            (0, 7, 13, 10, 12, 11, 3, 16, 8, 24),
+            (0, 16, 13, 2, 3, 8, 11, 10, 14, 24),
+            (0, 6, 9, 14, 7, 5, 13, 16, 4, 19),
+            (0, 3, 13, 11, 5, 6, 7, 9, 4, 19),
+            (0, 7, 1, 15, 3, 8, 9, 14, 11, 20),
+            (0, 16, 11, 14, 6, 4, 9, 5, 1, 20),
+            (0, 8, 16, 7, 1, 11, 2, 13, 5, 24),
+        ),
+        5: (
+            (0, 7, 8, 14, 11, 15, 3, 4, 16, 24),
+            (0, 10, 11, 16, 13, 3, 7, 12, 5, 22),
+            (0, 5, 4, 15, 8, 13, 10, 14, 16, 18),
+            (0, 7, 10, 6, 1, 11, 9, 8, 4, 22),
+            (0, 11, 10, 16, 7, 13, 2, 1, 5, 24),
+            (0, 13, 4, 1, 11, 6, 9, 8, 5, 21),
+            (0, 16, 8, 5, 3, 15, 14, 6, 1, 21),
+            (0, 13, 10, 12, 7, 1, 3, 8, 5, 23),
+            (0, 10, 6, 14, 8, 16, 9, 13, 4, 22),
+            (0, 5, 16, 2, 11, 1, 8, 14, 10, 24),
+            (0, 3, 1, 11, 16, 12, 10, 7, 13, 23),
+            (0, 14, 3, 5, 7, 12, 10, 13, 16, 19),
+            (0, 4, 16, 8, 5, 3, 6, 14, 9, 25),
+            (0, 8, 15, 3, 7, 5, 4, 14, 16, 25),
+            (0, 1, 6, 13, 16, 3, 15, 5, 8, 17),
+            (0, 5, 12, 11, 14, 3, 8, 16, 7, 24),
+        ),
+        6: (
+            (0, 11, 5, 10, 7, 13, 1, 2, 3, 25),
+            (0, 14, 13, 11, 10, 16, 8, 1, 2, 17),
+            (0, 16, 13, 4, 3, 11, 10, 6, 9, 21),
+            (0, 12, 5, 14, 8, 7, 16, 1, 3, 18),
+            (0, 8, 11, 6, 5, 16, 14, 15, 10, 25),
+            (0, 1, 11, 5, 13, 12, 14, 16, 10, 20),
+            (0, 14, 7, 4, 15, 3, 16, 1, 13, 21),
+            (0, 8, 16, 14, 13, 2, 5, 7, 11, 24),
+            (0, 13, 10, 8, 3, 7, 5, 1, 2, 24),
+            (0, 1, 3, 15, 13, 16, 9, 10, 5, 25),
+            (0, 4, 5, 6, 13, 16, 8, 14, 9, 18),
+            (0, 4, 8, 13, 16, 6, 14, 9, 11, 18),
+            (0, 13, 9, 15, 16, 1, 10, 14, 7, 23),
+            (0, 16, 15, 10, 6, 3, 14, 13, 8, 19),
+            (0, 15, 11, 13, 1, 5, 10, 9, 8, 25),
+            (0, 12, 10, 13, 1, 5, 11, 7, 14, 20),
+        ),
+        7: (
+            (0, 9, 16, 15, 8, 13, 11, 14, 3, 23),
+            (0, 8, 16, 6, 11, 15, 7, 1, 10, 17),
+            (0, 7, 2, 13, 5, 1, 3, 11, 8, 24),
+            (0, 7, 3, 13, 8, 6, 9, 4, 1, 25),
+            (0, 13, 1, 11, 6, 14, 9, 4, 10, 20),
+            (0, 6, 3, 11, 10, 16, 14, 4, 9, 18),
+            (0, 14, 9, 15, 11, 10, 7, 5, 8, 25),
+            (0, 7, 9, 1, 13, 16, 3, 4, 6, 24),
+            (0, 8, 7, 5, 13, 10, 12, 16, 3, 25),
+            (0, 13, 2, 1, 14, 5, 16, 8, 7, 19),
+            (0, 15, 8, 14, 6, 11, 5, 3, 10, 20),
+            (0, 10, 1, 11, 9, 14, 6, 4, 16, 20),
+            (0, 5, 13, 7, 10, 16, 11, 14, 2, 22),
+            (0, 11, 8, 5, 14, 16, 10, 7, 12, 21),
+            (0, 7, 1, 9, 5, 3, 15, 10, 16, 23),
+            (0, 1, 15, 10, 5, 9, 11, 7, 3, 21),
+        ),
+        8: (
+            (0, 3, 16, 10, 13, 4, 14, 15, 5, 19),
+            (0, 15, 11, 1, 9, 13, 3, 16, 7, 19),
+            (0, 11, 6, 5, 16, 13, 15, 7, 14, 18),
+            (0, 3, 4, 7, 9, 10, 8, 1, 6, 19),
+            (0, 9, 11, 14, 4, 6, 10, 1, 16, 19),
+            (0, 4, 11, 10, 15, 5, 13, 14, 1, 24),
+            (0, 2, 16, 1, 13, 10, 5, 3, 11, 19),
+            (0, 13, 8, 2, 14, 7, 10, 11, 5, 18),
+            (0, 15, 1, 14, 11, 8, 10, 4, 7, 19),
+            (0, 10, 4, 5, 3, 9, 8, 16, 6, 17),
+            (0, 7, 5, 12, 13, 3, 8, 10, 16, 25),
+            (0, 1, 13, 8, 12, 14, 16, 5, 11, 22),
+            (0, 6, 13, 8, 7, 9, 1, 16, 4, 25),
+            (0, 14, 13, 2, 8, 5, 10, 11, 1, 22),
+            (0, 14, 8, 3, 11, 9, 7, 6, 4, 18),
+            (0, 14, 4, 16, 7, 3, 9, 1, 6, 25),
+        ),
+        9: (
+            (0, 13, 5, 16, 3, 8, 1, 11, 10, 12, 24),
+            (0, 3, 7, 8, 16, 12, 11, 10, 1, 5, 25),
+            (0, 14, 4, 6, 3, 16, 1, 9, 7, 10, 22),
+            (0, 3, 5, 8, 15, 13, 1, 14, 7, 9, 25),
+            (0, 6, 13, 1, 15, 5, 7, 8, 11, 16, 24),
+            (0, 16, 14, 2, 3, 8, 13, 11, 10, 5, 22),
+            (0, 1, 3, 7, 4, 16, 11, 15, 10, 13, 22),
+            (0, 9, 10, 14, 8, 1, 6, 4, 7, 3, 25),
+            (0, 14, 7, 10, 16, 3, 12, 1, 11, 8, 24),
+            (0, 9, 15, 16, 10, 13, 3, 8, 7, 5, 20),
+            (0, 8, 1, 9, 7, 11, 14, 10, 16, 15, 23),
+            (0, 8, 10, 14, 5, 13, 11, 1, 12, 16, 17),
+            (0, 16, 13, 1, 6, 8, 4, 14, 7, 9, 23),
+            (0, 5, 13, 10, 16, 11, 2, 8, 1, 14, 19),
+            (0, 9, 11, 16, 13, 4, 10, 6, 5, 1, 19),
+            (0, 1, 3, 10, 16, 8, 14, 12, 11, 7, 23),
+        ),
+        10: (
+            (0, 16, 6, 13, 14, 5, 9, 7, 11, 4, 25),
+            (0, 3, 5, 6, 9, 8, 14, 4, 7, 11, 24),
+            (0, 3, 4, 9, 7, 10, 11, 1, 6, 13, 23),
+            (0, 3, 7, 9, 16, 1, 6, 10, 14, 4, 21),
+            (0, 8, 7, 9, 13, 1, 15, 5, 11, 16, 20),
+            (0, 7, 11, 9, 5, 14, 8, 16, 15, 13, 20),
+            (0, 11, 16, 12, 7, 5, 14, 10, 13, 8, 25),
+            (0, 6, 7, 8, 11, 13, 4, 9, 10, 14, 19),
+            (0, 3, 1, 10, 7, 12, 8, 5, 16, 13, 21),
+            (0, 7, 8, 1, 13, 16, 10, 2, 5, 11, 17),
+            (0, 2, 3, 13, 8, 7, 11, 1, 16, 14, 18),
+            (0, 11, 4, 16, 13, 15, 14, 5, 10, 3, 25),
+            (0, 6, 9, 7, 3, 10, 16, 1, 4, 5, 23),
+            (0, 11, 13, 7, 4, 9, 6, 3, 8, 10, 20),
+            (0, 1, 11, 13, 3, 12, 14, 10, 5, 8, 21),
+            (0, 13, 11, 7, 16, 1, 6, 15, 14, 5, 22),
+        ),
+        11: (
+            (0, 1, 8, 3, 16, 14, 7, 13, 12, 10, 23),
+            (0, 16, 5, 7, 14, 10, 9, 4, 13, 6, 22),
+            (0, 15, 5, 4, 7, 8, 16, 13, 3, 14, 25),
+            (0, 2, 16, 5, 13, 1, 10, 8, 14, 7, 18),
+            (0, 5, 16, 12, 11, 14, 13, 10, 8, 1, 21),
+            (0, 9, 10, 6, 1, 7, 5, 4, 14, 8, 23),
+            (0, 1, 14, 4, 6, 9, 16, 10, 8, 13, 17),
+            (0, 12, 10, 14, 16, 8, 3, 1, 7, 11, 24),
+            (0, 14, 10, 15, 11, 1, 3, 9, 16, 13, 19),
+            (0, 7, 14, 10, 3, 16, 11, 5, 13, 2, 22),
+            (0, 11, 16, 3, 9, 7, 13, 1, 5, 15, 20),
+            (0, 14, 8, 1, 2, 11, 16, 3, 7, 10, 25),
+            (0, 7, 10, 1, 6, 13, 9, 14, 4, 3, 20),
+            (0, 11, 14, 9, 4, 13, 6, 16, 10, 7, 24),
+            (0, 12, 8, 11, 5, 13, 3, 16, 14, 1, 19),
+            (0, 14, 13, 8, 10, 1, 5, 9, 6, 4, 20),
+        ),
+        12: (
+            (0, 14, 5, 1, 9, 15, 11, 16, 3, 8, 24),
+            (0, 14, 10, 8, 11, 5, 1, 16, 4, 15, 25),
+            (0, 7, 14, 2, 13, 5, 8, 3, 16, 11, 24),
+            (0, 13, 16, 7, 5, 2, 11, 1, 8, 14, 25),
+            (0, 11, 16, 15, 5, 6, 8, 7, 10, 13, 19),
+            (0, 12, 3, 16, 13, 11, 1, 5, 8, 14, 23),
+            (0, 10, 12, 16, 7, 11, 5, 13, 1, 3, 18),
+            (0, 14, 5, 1, 2, 8, 16, 10, 13, 3, 24),
+            (0, 6, 3, 7, 11, 13, 15, 14, 5, 8, 25),
+            (0, 11, 4, 8, 3, 5, 15, 7, 14, 1, 24),
+            (0, 10, 7, 13, 1, 14, 11, 5, 8, 2, 21),
+            (0, 14, 11, 9, 13, 5, 8, 6, 3, 4, 22),
+            (0, 13, 7, 11, 4, 14, 1, 16, 8, 15, 23),
+            (0, 8, 6, 3, 9, 5, 4, 14, 10, 13, 17),
+            (0, 7, 12, 14, 11, 10, 3, 5, 8, 1, 18),
+            (0, 3, 13, 1, 11, 9, 16, 7, 4, 6, 25),
+        ),
+        13: (
+            (0, 11, 7, 8, 1, 6, 15, 3, 13, 14, 17),
+            (0, 5, 7, 6, 14, 13, 9, 4, 8, 11, 25),
+            (0, 7, 9, 4, 5, 14, 13, 3, 6, 11, 22),
+            (0, 8, 5, 11, 9, 10, 15, 3, 14, 16, 18),
+            (0, 16, 5, 12, 13, 8, 10, 3, 14, 11, 17),
+            (0, 14, 3, 15, 7, 13, 8, 10, 4, 11, 25),
+            (0, 5, 13, 8, 10, 9, 14, 4, 6, 1, 20),
+            (0, 5, 8, 4, 13, 9, 16, 6, 10, 3, 23),
+            (0, 7, 3, 13, 8, 12, 11, 16, 14, 5, 24),
+            (0, 3, 7, 13, 4, 10, 14, 5, 9, 6, 17),
+            (0, 12, 16, 5, 14, 3, 11, 7, 1, 10, 24),
+            (0, 9, 6, 8, 1, 11, 5, 4, 10, 14, 21),
+            (0, 14, 11, 10, 2, 8, 5, 3, 7, 16, 20),
+            (0, 1, 4, 9, 8, 10, 14, 11, 6, 16, 19),
+            (0, 14, 9, 3, 11, 13, 6, 16, 4, 1, 24),
+            (0, 16, 7, 5, 12, 13, 8, 3, 10, 1, 19),
+        ),
+        14: (
+            (0, 1, 4, 6, 5, 9, 14, 3, 13, 7, 23),
+            (0, 10, 7, 13, 3, 8, 14, 2, 1, 16, 23),
+            (0, 4, 11, 14, 15, 3, 7, 13, 8, 10, 17),
+            (0, 6, 10, 4, 13, 1, 14, 9, 8, 11, 18),
+            (0, 13, 2, 5, 8, 14, 10, 3, 1, 16, 21),
+            (0, 8, 1, 14, 5, 10, 16, 11, 2, 7, 25),
+            (0, 7, 15, 3, 1, 6, 13, 5, 11, 14, 21),
+            (0, 1, 11, 12, 16, 10, 14, 3, 5, 13, 22),
+            (0, 14, 9, 1, 7, 6, 8, 4, 10, 13, 21),
+            (0, 8, 1, 11, 15, 14, 3, 4, 5, 16, 22),
+            (0, 13, 16, 14, 3, 2, 7, 11, 8, 10, 23),
+            (0, 16, 15, 8, 7, 10, 6, 14, 5, 11, 20),
+            (0, 13, 16, 15, 3, 7, 10, 5, 6, 14, 24),
+            (0, 7, 1, 13, 14, 10, 15, 6, 5, 8, 20),
+            (0, 10, 9, 13, 14, 4, 7, 6, 1, 5, 23),
+            (0, 10, 11, 4, 3, 6, 8, 9, 16, 14, 21),
+        ),
+        15: (
+            (0, 8, 7, 13, 10, 12, 5, 16, 3, 1, 14, 20),
+            (0, 11, 8, 14, 6, 4, 9, 13, 10, 5, 7, 17),
+            (0, 9, 4, 11, 1, 5, 6, 8, 14, 16, 7, 19),
+            (0, 13, 1, 10, 16, 3, 11, 4, 8, 15, 7, 22),
+            (0, 13, 3, 14, 1, 5, 16, 8, 11, 12, 10, 25),
+            (0, 8, 4, 13, 3, 10, 11, 15, 14, 1, 7, 17),
+            (0, 3, 6, 10, 13, 11, 8, 15, 7, 14, 1, 18),
+            (0, 9, 5, 1, 8, 14, 7, 3, 10, 15, 13, 17),
+            (0, 1, 11, 14, 6, 3, 13, 16, 15, 5, 10, 21),
+            (0, 7, 4, 9, 13, 6, 3, 5, 1, 10, 16, 22),
+            (0, 4, 13, 14, 1, 9, 5, 10, 3, 8, 6, 19),
+            (0, 16, 5, 3, 1, 9, 8, 10, 15, 14, 13, 22),
+            (0, 5, 1, 13, 16, 12, 3, 11, 10, 14, 7, 17),
+            (0, 7, 15, 6, 1, 8, 13, 14, 3, 11, 5, 20),
+            (0, 4, 7, 13, 5, 10, 16, 1, 11, 3, 15, 17),
+            (0, 11, 4, 7, 3, 8, 14, 15, 1, 13, 5, 22),
+        ),
+        16: (
+            (0, 5, 6, 9, 16, 11, 4, 10, 13, 1, 3, 25),
+            (0, 10, 8, 16, 15, 5, 13, 14, 3, 11, 9, 21),
+            (0, 6, 11, 9, 3, 14, 7, 16, 8, 13, 4, 22),
+            (0, 10, 5, 6, 16, 3, 4, 7, 1, 9, 14, 24),
+            (0, 13, 14, 5, 1, 11, 9, 4, 16, 6, 10, 24),
+            (0, 8, 11, 10, 1, 2, 14, 3, 7, 16, 13, 24),
+            (0, 10, 1, 4, 15, 13, 11, 14, 8, 5, 3, 19),
+            (0, 11, 7, 3, 2, 1, 5, 14, 16, 10, 8, 23),
+            (0, 1, 13, 14, 5, 10, 16, 8, 7, 11, 12, 25),
+            (0, 13, 3, 14, 16, 1, 2, 10, 7, 11, 5, 18),
+            (0, 1, 7, 8, 3, 13, 14, 2, 11, 10, 16, 17),
+            (0, 8, 2, 14, 7, 13, 11, 5, 10, 3, 16, 24),
+            (0, 3, 9, 8, 13, 1, 5, 16, 6, 4, 7, 19),
+            (0, 14, 3, 16, 10, 7, 2, 11, 5, 1, 8, 23),
+            (0, 8, 10, 1, 11, 3, 6, 4, 9, 13, 16, 17),
+            (0, 8, 9, 16, 1, 14, 5, 15, 13, 11, 10, 24),
+        ),
+        17: (
+            (0, 3, 1, 4, 6, 11, 14, 16, 9, 8, 10, 22),
+            (0, 11, 5, 14, 8, 3, 6, 9, 16, 10, 4, 23),
+            (0, 3, 5, 7, 11, 9, 1, 6, 13, 4, 8, 23),
+            (0, 1, 9, 8, 6, 4, 14, 16, 10, 13, 3, 22),
+            (0, 5, 15, 13, 7, 4, 10, 3, 14, 8, 11, 20),
+            (0, 11, 1, 8, 9, 4, 5, 16, 10, 6, 3, 23),
+            (0, 16, 10, 15, 6, 11, 8, 14, 13, 5, 3, 23),
+            (0, 9, 7, 10, 6, 1, 13, 5, 14, 3, 4, 22),
+            (0, 7, 5, 1, 13, 9, 6, 8, 4, 16, 11, 17),
+            (0, 15, 3, 16, 6, 11, 1, 8, 7, 5, 14, 19),
+            (0, 5, 7, 3, 2, 14, 10, 13, 11, 16, 1, 17),
+            (0, 13, 16, 1, 8, 7, 12, 10, 11, 5, 14, 25),
+            (0, 7, 10, 14, 13, 5, 1, 2, 8, 16, 3, 21),
+            (0, 7, 10, 14, 13, 5, 11, 15, 6, 1, 16, 22),
+            (0, 8, 11, 15, 16, 13, 10, 3, 14, 9, 1, 21),
+            (0, 7, 14, 1, 15, 9, 3, 11, 16, 13, 10, 19),
+        ),
+        18: (
+            (0, 14, 13, 5, 1, 11, 16, 8, 3, 10, 2, 25),
+            (0, 8, 4, 7, 16, 14, 15, 10, 13, 5, 11, 22),
+            (0, 8, 2, 16, 3, 11, 5, 1, 13, 7, 14, 22),
+            (0, 10, 16, 5, 11, 14, 3, 1, 2, 7, 8, 25),
+            (0, 3, 10, 11, 13, 1, 14, 16, 8, 12, 5, 25),
+            (0, 16, 5, 10, 3, 13, 11, 8, 12, 1, 14, 25),
+            (0, 11, 8, 10, 16, 5, 14, 13, 3, 7, 12, 17),
+            (0, 11, 8, 3, 9, 6, 4, 10, 16, 5, 14, 20),
+            (0, 7, 10, 14, 5, 15, 1, 8, 13, 3, 6, 22),
+            (0, 14, 16, 1, 2, 7, 8, 3, 5, 13, 10, 19),
+            (0, 13, 2, 3, 10, 11, 1, 8, 14, 16, 7, 20),
+            (0, 1, 8, 7, 13, 11, 10, 6, 15, 3, 16, 21),
+            (0, 5, 14, 8, 13, 10, 16, 11, 12, 3, 7, 18),
+            (0, 5, 7, 9, 16, 10, 4, 6, 3, 14, 8, 20),
+            (0, 7, 14, 10, 13, 5, 16, 8, 12, 1, 3, 22),
+            (0, 8, 4, 11, 16, 14, 15, 10, 7, 1, 3, 22),
+        ),
+        19: (
+            (0, 3, 1, 10, 7, 15, 13, 8, 4, 14, 5, 18),
+            (0, 16, 8, 13, 3, 14, 11, 6, 4, 9, 10, 25),
+            (0, 7, 3, 14, 11, 1, 2, 13, 8, 16, 5, 24),
+            (0, 2, 3, 11, 10, 5, 8, 1, 16, 13, 7, 18),
+            (0, 11, 12, 13, 1, 3, 10, 16, 5, 8, 7, 17),
+            (0, 7, 15, 16, 3, 9, 1, 5, 13, 10, 11, 24),
+            (0, 7, 8, 5, 2, 14, 3, 16, 13, 1, 11, 18),
+            (0, 7, 14, 8, 16, 13, 2, 10, 11, 3, 5, 25),
+            (0, 3, 15, 13, 14, 16, 9, 8, 1, 7, 11, 17),
+            (0, 11, 6, 14, 16, 4, 1, 10, 9, 13, 3, 17),
+            (0, 8, 11, 7, 10, 5, 9, 3, 15, 14, 1, 18),
+            (0, 10, 8, 5, 13, 14, 9, 11, 6, 4, 16, 22),
+            (0, 11, 3, 7, 10, 14, 1, 9, 5, 16, 15, 22),
+            (0, 5, 7, 10, 3, 14, 4, 15, 13, 16, 8, 21),
+            (0, 6, 1, 4, 8, 5, 3, 9, 14, 11, 16, 19),
+            (0, 11, 15, 5, 6, 3, 10, 1, 16, 14, 8, 25),
+        ),
+    },
+    12700: {
+        0: (
+            (0, 16, 14, 13, 5, 11, 7, 9, 1, 12, 17),
+            (0, 5, 12, 1, 11, 8, 3, 4, 10, 14, 23),
+            (0, 9, 10, 13, 5, 15, 1, 4, 7, 14, 22),
+            (0, 15, 1, 13, 6, 14, 8, 5, 9, 16, 24),
+            (0, 11, 14, 7, 10, 5, 4, 15, 16, 6, 20),
+            (0, 10, 9, 5, 1, 4, 15, 8, 3, 16, 25),
+            (0, 11, 5, 8, 14, 4, 16, 3, 1, 2, 18),
+            (0, 7, 6, 15, 1, 3, 11, 14, 8, 4, 22),
+            (0, 2, 4, 1, 14, 10, 11, 7, 5, 16, 22),
+            (0, 10, 8, 16, 7, 5, 9, 1, 6, 15, 19),
+            (0, 4, 5, 13, 15, 1, 11, 14, 8, 6, 20),
+            (0, 10, 2, 3, 7, 14, 16, 4, 1, 8, 20),
+            (0, 7, 1, 2, 8, 14, 10, 11, 16, 6, 23),
+            (0, 5, 8, 14, 2, 4, 1, 7, 10, 11, 18),
+            (0, 8, 1, 3, 9, 6, 7, 11, 14, 15, 19),
+            (0, 5, 7, 13, 4, 12, 14, 8, 10, 1, 24),
+        ),
+        1: (
+            (0, 14, 15, 6, 16, 9, 5, 11, 1, 13, 25),
+            (0, 9, 11, 8, 3, 2, 10, 5, 13, 7, 21),
+            (0, 11, 8, 10, 3, 14, 9, 2, 7, 5, 17),
+            (0, 11, 3, 6, 15, 14, 10, 9, 16, 8, 22),
+            (0, 16, 14, 8, 15, 3, 4, 9, 10, 7, 18),
+            (0, 10, 4, 14, 16, 1, 9, 15, 11, 13, 18),
+            (0, 8, 7, 6, 11, 3, 10, 2, 1, 5, 20),
+            (0, 10, 7, 13, 2, 9, 11, 5, 14, 16, 25),
+            (0, 4, 7, 10, 11, 6, 5, 8, 15, 14, 20),
+            (0, 5, 12, 11, 6, 16, 10, 1, 13, 7, 22),
+            (0, 9, 2, 11, 13, 5, 3, 8, 16, 7, 20),
+            (0, 1, 11, 3, 14, 9, 15, 7, 13, 4, 25),
+            (0, 13, 9, 6, 16, 1, 8, 15, 11, 14, 19),
+            (0, 3, 2, 13, 1, 7, 11, 10, 14, 4, 24),
+            (0, 12, 1, 8, 10, 11, 4, 3, 14, 16, 21),
+            (0, 12, 11, 13, 8, 16, 3, 10, 9, 7, 18),
+        ),
+        2: (
+            (0, 6, 1, 3, 11, 12, 7, 8, 10, 14, 24),
+            (0, 4, 3, 13, 15, 5, 11, 9, 10, 1, 24),
+            (0, 9, 13, 4, 1, 11, 3, 15, 8, 5, 17),
+            (0, 7, 1, 14, 8, 2, 4, 11, 10, 3, 24),
+            (0, 11, 1, 3, 14, 12, 4, 16, 7, 13, 24),
+            (0, 7, 16, 15, 1, 9, 11, 13, 8, 6, 22),
+            (0, 15, 9, 6, 3, 11, 5, 1, 13, 8, 18),
+            (0, 9, 6, 8, 1, 7, 5, 15, 11, 16, 17),
+            (0, 1, 16, 10, 2, 7, 11, 5, 9, 13, 17),
+            (0, 2, 1, 11, 14, 10, 13, 9, 5, 16, 18),
+            (0, 13, 15, 8, 6, 14, 3, 9, 5, 7, 17),
+            (0, 9, 4, 14, 13, 8, 7, 15, 11, 1, 24),
+            (0, 1, 12, 14, 5, 10, 4, 16, 8, 3, 20),
+            (0, 8, 13, 1, 2, 10, 7, 6, 5, 11, 22),
+            (0, 15, 11, 16, 8, 10, 9, 6, 5, 3, 21),
+            (0, 7, 10, 8, 13, 3, 1, 6, 16, 12, 19),
+        ),
+        3: (
+            (0, 8, 6, 15, 16, 9, 13, 1, 7, 14, 22),
+            (0, 11, 14, 13, 15, 9, 16, 10, 4, 3, 18),
+            (0, 9, 8, 10, 3, 1, 7, 15, 14, 6, 19),
+            (0, 5, 12, 1, 8, 7, 13, 4, 3, 14, 22),
+            (0, 1, 6, 15, 4, 16, 10, 7, 13, 5, 25),
+            (0, 11, 1, 16, 6, 14, 10, 8, 3, 12, 21),
+            (0, 15, 10, 14, 6, 16, 11, 5, 9, 7, 22),
+            (0, 10, 11, 4, 1, 3, 5, 14, 12, 7, 24),
+            (0, 16, 14, 13, 9, 7, 3, 11, 1, 12, 17),
+            (0, 15, 4, 10, 5, 6, 3, 11, 7, 13, 20),
+            (0, 14, 16, 7, 6, 13, 15, 11, 3, 4, 17),
+            (0, 15, 10, 11, 13, 1, 7, 4, 9, 16, 21),
+            (0, 16, 2, 5, 14, 3, 8, 7, 13, 9, 22),
+            (0, 3, 6, 15, 13, 11, 8, 5, 1, 4, 20),
+            (0, 10, 9, 5, 16, 1, 14, 15, 7, 6, 25),
+            (0, 9, 11, 1, 8, 13, 14, 15, 7, 4, 23),
+        ),
+        4: (
+            (0, 2, 16, 14, 10, 9, 5, 7, 8, 13, 3, 20),
+            (0, 1, 16, 9, 14, 7, 8, 13, 15, 6, 10, 23),
+            (0, 11, 16, 15, 10, 13, 9, 14, 5, 6, 7, 20),
+            (0, 1, 12, 10, 14, 11, 5, 4, 3, 16, 13, 19),
+            (0, 10, 1, 3, 9, 16, 8, 13, 2, 5, 11, 25),
+            (0, 14, 9, 10, 12, 16, 13, 8, 11, 5, 3, 22),
+            (0, 5, 10, 15, 7, 8, 6, 11, 9, 13, 14, 22),
+            (0, 11, 6, 3, 14, 1, 16, 4, 13, 15, 10, 21),
+            (0, 6, 4, 14, 7, 10, 1, 8, 15, 13, 11, 18),
+            (0, 10, 7, 11, 3, 5, 1, 9, 16, 2, 8, 21),
+            (0, 1, 7, 9, 14, 11, 3, 8, 12, 5, 16, 25),
+            (0, 1, 16, 13, 11, 4, 2, 10, 14, 5, 8, 24),
+            (0, 14, 3, 13, 9, 11, 4, 15, 10, 16, 8, 17),
+            (0, 1, 14, 12, 5, 16, 10, 8, 4, 7, 3, 17),
+            (0, 1, 3, 5, 14, 8, 6, 11, 7, 12, 13, 20),
+            (0, 1, 10, 5, 9, 8, 16, 14, 3, 12, 13, 25),
+        ),
+        5: (
+            (0, 11, 12, 14, 8, 1, 5, 10, 16, 6, 3, 25),
+            (0, 8, 16, 10, 3, 6, 12, 11, 5, 1, 14, 19),
+            (0, 16, 2, 3, 11, 10, 7, 9, 5, 1, 13, 24),
+            (0, 12, 8, 3, 13, 14, 10, 1, 5, 11, 4, 25),
+            (0, 14, 5, 9, 2, 7, 1, 10, 8, 11, 3, 21),
+            (0, 1, 15, 5, 4, 16, 3, 10, 8, 9, 11, 18),
+            (0, 15, 16, 14, 7, 3, 4, 13, 9, 10, 8, 17),
+            (0, 14, 13, 3, 2, 4, 8, 11, 1, 5, 10, 25),
+            (0, 11, 15, 13, 16, 7, 9, 4, 8, 5, 14, 18),
+            (0, 16, 4, 14, 12, 10, 1, 11, 3, 5, 7, 20),
+            (0, 10, 2, 5, 9, 14, 13, 8, 16, 3, 7, 20),
+            (0, 1, 16, 7, 5, 11, 14, 15, 4, 6, 13, 19),
+            (0, 16, 11, 2, 9, 5, 7, 1, 13, 10, 8, 17),
+            (0, 9, 10, 8, 3, 6, 14, 16, 5, 7, 15, 21),
+            (0, 1, 7, 4, 8, 11, 5, 9, 16, 14, 15, 18),
+            (0, 16, 4, 14, 8, 13, 9, 7, 11, 15, 1, 21),
+        ),
+        6: (
+            (0, 13, 6, 15, 3, 10, 9, 14, 8, 16, 11, 23),
+            (0, 5, 10, 9, 7, 1, 3, 16, 12, 14, 11, 21),
+            (0, 5, 6, 3, 14, 4, 8, 11, 13, 1, 15, 20),
+            (0, 3, 11, 10, 1, 8, 6, 7, 16, 2, 14, 20),
+            (0, 1, 5, 7, 3, 9, 8, 6, 10, 15, 14, 17),
+            (0, 13, 15, 5, 1, 4, 6, 14, 11, 16, 10, 23),
+            (0, 5, 7, 3, 11, 14, 10, 4, 16, 13, 2, 22),
+            (0, 12, 13, 14, 1, 16, 3, 10, 11, 6, 7, 25),
+            (0, 3, 15, 5, 11, 8, 4, 9, 7, 13, 1, 21),
+            (0, 5, 10, 4, 11, 15, 9, 16, 7, 3, 14, 23),
+            (0, 10, 16, 8, 15, 9, 13, 11, 5, 7, 4, 25),
+            (0, 11, 10, 4, 15, 6, 3, 16, 14, 8, 1, 22),
+            (0, 14, 4, 2, 8, 3, 5, 16, 10, 7, 1, 18),
+            (0, 5, 1, 7, 14, 2, 10, 16, 9, 3, 13, 24),
+            (0, 8, 10, 3, 14, 5, 11, 1, 13, 12, 6, 21),
+            (0, 3, 5, 15, 10, 13, 4, 6, 7, 1, 8, 19),
+        ),
+        7: (
+            (0, 13, 8, 1, 15, 16, 4, 10, 3, 9, 14, 22),
+            (0, 15, 6, 3, 14, 1, 10, 9, 8, 16, 11, 17),
+            (0, 3, 13, 5, 1, 6, 11, 14, 15, 8, 9, 22),
+            (0, 7, 12, 16, 13, 3, 1, 6, 11, 5, 8, 21),
+            (0, 9, 12, 11, 3, 13, 1, 16, 5, 8, 7, 23),
+            (0, 15, 5, 13, 10, 9, 7, 1, 11, 6, 3, 24),
+            (0, 13, 3, 7, 10, 12, 14, 4, 11, 8, 5, 17),
+            (0, 8, 15, 9, 3, 10, 4, 7, 1, 11, 16, 18),
+            (0, 16, 5, 13, 15, 14, 4, 1, 10, 7, 6, 21),
+            (0, 11, 6, 13, 14, 5, 12, 7, 3, 8, 10, 18),
+            (0, 10, 8, 3, 11, 5, 14, 4, 2, 16, 13, 18),
+            (0, 13, 7, 1, 14, 10, 12, 5, 9, 16, 11, 21),
+            (0, 8, 3, 11, 14, 9, 16, 7, 12, 13, 5, 19),
+            (0, 14, 10, 13, 6, 11, 7, 16, 15, 4, 5, 17),
+            (0, 3, 16, 5, 7, 11, 2, 1, 10, 8, 6, 25),
+            (0, 10, 4, 16, 14, 9, 7, 15, 11, 5, 8, 23),
+        ),
+        8: (
+            (0, 8, 10, 7, 5, 11, 12, 14, 1, 3, 4, 18),
+            (0, 5, 1, 8, 16, 3, 12, 11, 7, 4, 14, 23),
+            (0, 16, 11, 1, 6, 14, 10, 13, 12, 8, 7, 17),
+            (0, 9, 7, 11, 8, 16, 1, 10, 5, 12, 13, 22),
+            (0, 6, 11, 5, 13, 16, 8, 14, 2, 10, 1, 20),
+            (0, 7, 15, 4, 6, 8, 14, 1, 16, 5, 3, 22),
+            (0, 1, 5, 2, 11, 4, 14, 3, 7, 13, 8, 21),
+            (0, 9, 10, 11, 13, 3, 12, 16, 7, 8, 14, 22),
+            (0, 7, 16, 11, 4, 13, 1, 9, 14, 15, 3, 24),
+            (0, 3, 6, 13, 4, 16, 15, 7, 5, 14, 11, 18),
+            (0, 11, 1, 8, 6, 2, 5, 3, 7, 14, 13, 17),
+            (0, 5, 1, 7, 9, 12, 8, 14, 16, 3, 13, 25),
+            (0, 13, 7, 11, 15, 14, 16, 1, 9, 3, 6, 25),
+            (0, 8, 15, 5, 14, 6, 10, 11, 4, 3, 13, 24),
+            (0, 11, 14, 3, 16, 5, 8, 1, 12, 7, 9, 17),
+            (0, 7, 5, 8, 1, 2, 10, 14, 6, 13, 11, 19),
+        ),
+        9: (
+            (0, 4, 16, 1, 11, 5, 8, 10, 2, 13, 7, 19),
+            (0, 1, 16, 15, 8, 3, 11, 5, 10, 6, 9, 18),
+            (0, 11, 14, 13, 6, 7, 10, 8, 16, 12, 1, 17),
+            (0, 16, 15, 6, 13, 4, 1, 8, 7, 5, 14, 24),
+            (0, 5, 8, 13, 11, 7, 9, 2, 10, 1, 14, 17),
+            (0, 12, 16, 9, 13, 10, 14, 11, 3, 1, 5, 18),
+            (0, 9, 8, 10, 11, 16, 3, 7, 6, 13, 15, 22),
+            (0, 9, 8, 5, 14, 11, 3, 1, 16, 10, 12, 20),
+            (0, 13, 16, 10, 1, 15, 6, 4, 14, 3, 8, 24),
+            (0, 8, 3, 14, 11, 10, 16, 2, 7, 4, 13, 24),
+            (0, 10, 3, 1, 8, 7, 13, 9, 12, 11, 14, 25),
+            (0, 10, 7, 9, 14, 16, 11, 2, 3, 8, 5, 20),
+            (0, 1, 11, 16, 5, 14, 3, 8, 9, 2, 10, 24),
+            (0, 5, 14, 7, 8, 13, 12, 10, 1, 6, 16, 19),
+            (0, 6, 8, 11, 10, 4, 13, 7, 16, 15, 1, 20),
+            (0, 1, 4, 12, 13, 14, 11, 3, 10, 16, 8, 24),
+        ),
+        10: (
+            (0, 2, 14, 4, 1, 8, 3, 11, 7, 16, 13, 20),
+            (0, 3, 14, 13, 6, 10, 2, 8, 5, 16, 7, 22),
+            (0, 10, 2, 6, 16, 13, 8, 1, 11, 5, 7, 18),
+            (0, 6, 7, 14, 11, 3, 8, 1, 16, 12, 13, 21),
+            (0, 15, 10, 13, 3, 14, 4, 9, 16, 1, 5, 23),
+            (0, 10, 7, 14, 2, 1, 6, 3, 16, 13, 11, 24),
+            (0, 9, 13, 10, 12, 3, 1, 7, 11, 5, 8, 20),
+            (0, 10, 5, 7, 9, 3, 11, 16, 12, 1, 14, 21),
+            (0, 11, 7, 2, 14, 6, 5, 10, 1, 8, 16, 19),
+            (0, 1, 5, 13, 16, 15, 4, 6, 7, 14, 3, 21),
+            (0, 5, 14, 7, 16, 13, 3, 4, 2, 8, 10, 18),
+            (0, 7, 11, 3, 9, 1, 14, 15, 6, 8, 16, 23),
+            (0, 13, 16, 8, 6, 3, 14, 2, 11, 1, 10, 20),
+            (0, 16, 8, 6, 15, 10, 5, 7, 4, 1, 3, 17),
+            (0, 10, 14, 1, 5, 7, 2, 6, 16, 13, 11, 25),
+            (0, 12, 13, 14, 16, 8, 10, 5, 1, 11, 9, 23),
+        ),
+        11: (
+            (0, 3, 7, 5, 8, 11, 1, 9, 16, 4, 15, 25),
+            (0, 5, 7, 6, 3, 10, 8, 2, 11, 16, 13, 23),
+            (0, 15, 11, 13, 10, 16, 6, 4, 3, 5, 8, 20),
+            (0, 7, 15, 4, 16, 1, 14, 11, 8, 13, 9, 22),
+            (0, 8, 10, 13, 11, 5, 7, 15, 16, 4, 9, 20),
+            (0, 15, 10, 8, 4, 14, 9, 3, 11, 5, 7, 25),
+            (0, 16, 2, 5, 7, 10, 11, 1, 9, 14, 13, 25),
+            (0, 12, 16, 7, 5, 10, 8, 14, 4, 11, 13, 21),
+            (0, 13, 7, 5, 16, 1, 15, 11, 4, 9, 14, 20),
+            (0, 1, 10, 13, 15, 5, 7, 11, 9, 16, 6, 19),
+            (0, 14, 1, 3, 15, 4, 11, 10, 6, 7, 16, 20),
+            (0, 1, 15, 10, 6, 9, 13, 3, 5, 14, 11, 19),
+            (0, 6, 4, 8, 15, 16, 7, 10, 5, 3, 13, 19),
+            (0, 3, 6, 7, 1, 15, 5, 13, 4, 11, 10, 19),
+            (0, 2, 8, 10, 13, 11, 6, 1, 16, 7, 14, 18),
+            (0, 9, 15, 11, 7, 10, 13, 3, 5, 4, 1, 22),
+        ),
+        12: (
+            (0, 5, 13, 7, 1, 4, 3, 12, 16, 10, 14, 23),
+            (0, 5, 11, 8, 15, 4, 7, 13, 9, 16, 3, 18),
+            (0, 8, 3, 5, 6, 15, 4, 14, 11, 13, 1, 23),
+            (0, 5, 15, 14, 13, 9, 7, 16, 8, 11, 4, 21),
+            (0, 14, 6, 3, 1, 10, 15, 8, 13, 11, 9, 19),
+            (0, 11, 13, 10, 15, 16, 4, 3, 8, 1, 9, 24),
+            (0, 14, 4, 5, 15, 10, 3, 6, 8, 7, 11, 25),
+            (0, 16, 8, 14, 5, 7, 10, 9, 2, 3, 11, 24),
+            (0, 13, 9, 7, 11, 14, 15, 4, 3, 5, 8, 17),
+            (0, 5, 16, 4, 1, 10, 8, 7, 3, 14, 12, 19),
+            (0, 7, 10, 9, 4, 13, 11, 15, 1, 14, 16, 18),
+            (0, 16, 13, 3, 11, 10, 8, 6, 12, 1, 5, 24),
+            (0, 11, 3, 9, 1, 15, 6, 10, 5, 8, 13, 18),
+            (0, 10, 4, 1, 2, 11, 8, 3, 13, 7, 16, 23),
+            (0, 13, 1, 7, 8, 6, 12, 10, 3, 16, 14, 20),
+            (0, 5, 13, 11, 4, 8, 1, 12, 7, 16, 14, 19),
+        ),
+        13: (
+            (0, 13, 8, 9, 14, 10, 1, 12, 16, 7, 5, 20),
+            (0, 6, 10, 5, 1, 8, 11, 14, 16, 2, 7, 19),
+            (0, 8, 10, 3, 1, 12, 7, 16, 9, 11, 5, 23),
+            (0, 4, 5, 16, 14, 1, 3, 15, 9, 10, 11, 21),
+            (0, 3, 4, 6, 8, 5, 16, 14, 15, 7, 11, 24),
+            (0, 5, 4, 10, 13, 6, 15, 3, 16, 1, 8, 25),
+            (0, 1, 3, 10, 13, 6, 11, 7, 15, 9, 5, 24),
+            (0, 11, 7, 15, 3, 14, 9, 16, 6, 1, 8, 18),
+            (0, 14, 16, 10, 3, 6, 11, 5, 2, 1, 7, 21),
+            (0, 10, 13, 4, 7, 16, 14, 3, 5, 1, 2, 17),
+            (0, 14, 11, 13, 5, 6, 1, 3, 8, 7, 2, 25),
+            (0, 8, 6, 16, 7, 3, 12, 14, 5, 11, 13, 25),
+            (0, 11, 2, 14, 8, 16, 1, 3, 7, 10, 6, 17),
+            (0, 1, 10, 8, 5, 14, 16, 4, 13, 11, 2, 19),
+            (0, 10, 13, 3, 2, 1, 14, 11, 7, 8, 9, 25),
+            (0, 14, 8, 13, 16, 12, 1, 10, 5, 9, 3, 25),
+        ),
+        14: (
+            (0, 11, 5, 10, 3, 8, 13, 9, 16, 12, 7, 1, 20),
+            (0, 16, 14, 13, 4, 3, 11, 8, 7, 12, 10, 1, 17),
+            (0, 14, 8, 2, 13, 10, 3, 11, 1, 7, 6, 5, 20),
+            (0, 1, 14, 7, 9, 13, 4, 15, 11, 5, 3, 8, 20),
+            (0, 13, 5, 10, 4, 7, 11, 14, 3, 16, 2, 1, 23),
+            (0, 1, 3, 16, 13, 6, 9, 7, 11, 15, 14, 8, 23),
+            (0, 9, 16, 14, 8, 13, 5, 1, 7, 3, 10, 2, 24),
+            (0, 1, 6, 13, 8, 5, 11, 10, 15, 4, 16, 7, 20),
+            (0, 2, 10, 3, 1, 13, 6, 16, 14, 7, 11, 8, 25),
+            (0, 10, 5, 7, 14, 1, 8, 16, 4, 11, 13, 12, 24),
+            (0, 10, 16, 14, 3, 7, 4, 5, 11, 9, 1, 15, 23),
+            (0, 5, 14, 13, 8, 2, 16, 3, 10, 4, 11, 1, 20),
+            (0, 5, 14, 13, 7, 16, 8, 1, 10, 11, 12, 6, 21),
+            (0, 9, 13, 5, 15, 16, 8, 14, 6, 7, 3, 1, 22),
+            (0, 10, 15, 7, 13, 11, 6, 14, 8, 5, 3, 9, 24),
+            (0, 11, 9, 10, 15, 1, 13, 6, 5, 3, 8, 7, 20),
+        ),
+        15: (
+            (0, 4, 10, 1, 8, 11, 5, 9, 15, 14, 7, 16, 20),
+            (0, 7, 9, 13, 14, 2, 11, 3, 8, 1, 10, 16, 21),
+            (0, 6, 12, 11, 16, 13, 7, 8, 14, 1, 10, 5, 20),
+            (0, 7, 5, 15, 6, 11, 16, 14, 1, 9, 10, 8, 23),
+            (0, 3, 14, 7, 10, 12, 13, 6, 11, 5, 1, 16, 18),
+            (0, 7, 10, 8, 11, 3, 2, 13, 1, 4, 16, 14, 20),
+            (0, 7, 1, 11, 2, 16, 6, 14, 13, 3, 5, 10, 23),
+            (0, 3, 7, 16, 1, 8, 14, 12, 11, 5, 10, 6, 22),
+            (0, 5, 6, 9, 8, 7, 15, 3, 1, 11, 16, 10, 24),
+            (0, 6, 11, 16, 5, 9, 3, 15, 10, 8, 13, 1, 22),
+            (0, 11, 16, 1, 7, 5, 8, 4, 10, 3, 2, 13, 24),
+            (0, 14, 12, 8, 16, 10, 1, 13, 11, 3, 5, 9, 20),
+            (0, 10, 9, 3, 15, 1, 4, 16, 5, 8, 7, 14, 19),
+            (0, 4, 7, 10, 15, 8, 3, 1, 11, 5, 16, 9, 17),
+            (0, 14, 7, 10, 13, 11, 4, 5, 3, 8, 12, 16, 20),
+            (0, 3, 5, 4, 9, 14, 8, 10, 16, 1, 15, 11, 23),
+        ),
+        16: (
+            (0, 4, 8, 7, 3, 9, 16, 10, 11, 15, 14, 13, 25),
+            (0, 7, 13, 11, 1, 3, 8, 16, 9, 14, 12, 10, 25),
+            (0, 3, 15, 16, 8, 7, 4, 11, 13, 5, 14, 6, 18),
+            (0, 4, 10, 8, 16, 1, 11, 5, 13, 12, 3, 7, 24),
+            (0, 3, 8, 11, 13, 1, 7, 14, 10, 16, 4, 2, 19),
+            (0, 9, 14, 1, 5, 3, 8, 13, 16, 11, 12, 10, 23),
+            (0, 4, 12, 1, 16, 7, 11, 5, 10, 8, 13, 14, 23),
+            (0, 8, 10, 5, 1, 11, 12, 16, 14, 6, 13, 3, 21),
+            (0, 5, 14, 11, 15, 3, 13, 4, 8, 1, 7, 6, 17),
+            (0, 4, 7, 11, 2, 1, 3, 8, 5, 16, 13, 10, 20),
+            (0, 5, 14, 11, 8, 7, 10, 16, 2, 9, 1, 3, 20),
+            (0, 4, 10, 3, 9, 15, 5, 11, 1, 13, 14, 8, 24),
+            (0, 11, 8, 13, 16, 12, 4, 14, 5, 7, 1, 3, 21),
+            (0, 10, 11, 8, 13, 5, 1, 14, 2, 7, 9, 3, 25),
+            (0, 11, 14, 1, 8, 16, 5, 13, 7, 3, 9, 12, 24),
+            (0, 6, 13, 1, 11, 14, 7, 5, 3, 16, 8, 2, 25),
+        ),
+        17: (
+            (0, 10, 13, 1, 16, 6, 3, 14, 8, 11, 7, 2, 20),
+            (0, 10, 3, 1, 13, 14, 9, 11, 6, 8, 5, 15, 23),
+            (0, 10, 3, 9, 12, 1, 7, 16, 5, 11, 8, 13, 19),
+            (0, 10, 1, 6, 4, 7, 16, 11, 14, 3, 5, 15, 23),
+            (0, 6, 13, 16, 8, 11, 5, 3, 10, 15, 1, 4, 18),
+            (0, 13, 1, 16, 9, 3, 10, 7, 5, 14, 12, 11, 22),
+            (0, 8, 4, 1, 3, 15, 11, 14, 13, 16, 9, 10, 22),
+            (0, 7, 13, 16, 11, 12, 1, 10, 6, 5, 8, 14, 21),
+            (0, 12, 3, 13, 6, 16, 5, 11, 1, 8, 7, 10, 23),
+            (0, 11, 15, 5, 7, 9, 4, 3, 16, 1, 10, 8, 20),
+            (0, 11, 16, 2, 3, 13, 1, 10, 7, 8, 14, 9, 24),
+            (0, 11, 15, 5, 6, 13, 1, 9, 3, 14, 16, 7, 23),
+            (0, 4, 11, 15, 6, 3, 13, 5, 16, 1, 8, 10, 23),
+            (0, 14, 13, 3, 8, 16, 5, 10, 1, 12, 6, 7, 21),
+            (0, 9, 14, 10, 13, 6, 15, 5, 1, 3, 16, 8, 17),
+            (0, 3, 4, 8, 16, 7, 5, 2, 10, 1, 11, 13, 25),
+        ),
+        18: (
+            (0, 5, 6, 8, 3, 15, 7, 9, 16, 1, 11, 13, 24),
+            (0, 13, 16, 6, 7, 8, 11, 9, 15, 5, 1, 14, 18),
+            (0, 11, 5, 14, 9, 4, 10, 1, 8, 15, 16, 13, 20),
+            (0, 15, 13, 10, 9, 14, 7, 16, 1, 4, 5, 3, 24),
+            (0, 1, 2, 9, 10, 13, 8, 14, 16, 3, 11, 7, 22),
+            (0, 13, 11, 3, 7, 14, 4, 1, 6, 15, 16, 5, 24),
+            (0, 15, 16, 1, 11, 8, 7, 6, 5, 10, 14, 4, 19),
+            (0, 8, 5, 13, 7, 14, 16, 11, 6, 1, 10, 2, 18),
+            (0, 10, 6, 13, 7, 9, 3, 8, 5, 1, 15, 14, 23),
+            (0, 15, 16, 7, 10, 5, 13, 9, 3, 11, 6, 14, 22),
+            (0, 8, 5, 10, 16, 9, 3, 13, 14, 7, 11, 12, 18),
+            (0, 1, 11, 14, 16, 7, 6, 3, 13, 8, 10, 2, 23),
+            (0, 4, 10, 6, 11, 15, 3, 5, 7, 14, 13, 1, 23),
+            (0, 8, 5, 1, 12, 3, 6, 16, 7, 13, 11, 10, 22),
+            (0, 7, 11, 5, 13, 16, 3, 2, 14, 8, 6, 1, 19),
+            (0, 11, 16, 10, 5, 13, 4, 8, 7, 14, 2, 1, 22),
+        ),
+        19: (
+            (0, 12, 5, 7, 16, 1, 8, 14, 10, 4, 3, 11, 23),
+            (0, 5, 1, 10, 3, 16, 13, 2, 7, 6, 14, 8, 23),
+            (0, 14, 7, 13, 8, 15, 16, 11, 3, 9, 6, 1, 25),
+            (0, 14, 2, 5, 6, 8, 3, 10, 16, 7, 11, 13, 17),
+            (0, 3, 10, 16, 11, 8, 5, 1, 14, 7, 12, 4, 25),
+            (0, 7, 10, 11, 5, 1, 16, 2, 3, 14, 13, 4, 17),
+            (0, 4, 16, 11, 13, 3, 10, 7, 6, 14, 1, 15, 25),
+            (0, 5, 8, 3, 11, 1, 13, 2, 16, 10, 9, 14, 24),
+            (0, 11, 16, 7, 13, 5, 14, 2, 3, 8, 6, 10, 18),
+            (0, 1, 8, 13, 4, 11, 14, 7, 5, 2, 16, 10, 19),
+            (0, 15, 16, 14, 7, 13, 6, 8, 11, 3, 5, 4, 22),
+            (0, 6, 14, 5, 13, 16, 15, 11, 10, 7, 9, 8, 21),
+            (0, 1, 16, 5, 9, 11, 14, 7, 13, 6, 15, 8, 21),
+            (0, 3, 4, 11, 15, 7, 1, 9, 10, 5, 16, 14, 17),
+            (0, 6, 13, 5, 11, 15, 3, 16, 1, 4, 10, 8, 18),
+            (0, 9, 5, 14, 11, 13, 10, 1, 8, 3, 2, 16, 17),
+        ),
+    },
+}
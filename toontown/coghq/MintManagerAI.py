@@ -31,19 +31,23 @@ class MintManagerAI(DirectObject.DirectObject):
                 floor = min(floor, numFloors - 1)
                 break
 
+        # Picks one of the floor's layouts, and lays out its hallways
+        layoutSeed = random.randrange(1 << 32)
         for avId in players:
             if bboard.has('mintRoom-%s' % avId):
                 roomId = bboard.get('mintRoom-%s' % avId)
                 for i in range(numFloors):
-                    layout = MintLayout.MintLayout(mintId, i)
-                    if roomId in layout.getRoomIds():
-                        floor = i
+                    floorLayouts = MintLayout.getFloorLayouts(mintId, i) or ()
+                    for j, roomIds in enumerate(floorLayouts):
+                        if roomId in roomIds:
+                            floor = i
+                            layoutSeed = j
                 else:
                     from toontown.coghq import MintRoomSpecs
                     roomName = MintRoomSpecs.CashbotMintRoomId2RoomName[roomId]
                     MintManagerAI.notify.warning('room %s (%s) not found in any floor of mint %s' % (roomId, roomName, mintId))
 
         mintZone = self.air.allocateZone()
-        mint = DistributedMintAI.DistributedMintAI(self.air, mintId, mintZone, floor, players)
+        mint = DistributedMintAI.DistributedMintAI(self.air, mintId, mintZone, floor, players, layoutSeed)
         mint.generateWithRequired(mintZone)
         return mintZone
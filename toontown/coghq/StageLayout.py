@@ -4,6 +4,7 @@ from toontown.coghq import StageRoomSpecs
 from toontown.toonbase import ToontownGlobals
 from direct.showbase.PythonUtil import normalDistrib, lerp
 import random
+from toontown.coghq.FacilityLayoutGlobals import mixLayoutSeed
 
 
 def printAllCashbotInfo():
@@ -224,6 +225,11 @@ stageLayouts1 = [
     testLayout
 ]
 
+StageId2Layouts = {ToontownGlobals.LawbotStageIntA: (0, 1, 2),
+ ToontownGlobals.LawbotStageIntB: (3, 4, 5),
+ ToontownGlobals.LawbotStageIntC: (6, 7, 8),
+ ToontownGlobals.LawbotStageIntD: (9, 10, 11)}
+
 
 def getNumFloors(layoutIndex):
     return len(stageLayouts[layoutIndex])
@@ -306,7 +312,7 @@ class StageLayout:
         return len(stageLayouts[self.layoutId])
 
     def getRng(self):
-        return random.Random(self.stageId * self.floorNum)
+        return random.Random(mixLayoutSeed(self.stageId, self.layoutId, self.floorNum))
 
     def __str__(self):
         return 'StageLayout: id=%s, layout=%s, floor=%s, meritCogLevels=%s, numRooms=%s, numBattles=%s, numCogs=%s' % (
@@ -0,0 +1,219 @@
+import atexit
+import collections
+import json
+import os
+import random
+import socket
+import time
+
+from direct.directnotify import DirectNotifyGlobal
+from direct.stdpy import threading
+
+
+class EventLimit:
+    """
+    How much of one kind of event gets logged: a random sampleRate of them, and never more
+    than maxPerSecond in the same second (0 for no cap).
+    """
+
+    def __init__(self, sampleRate=1.0, maxPerSecond=0):
+        self.sampleRate = sampleRate
+        self.maxPerSecond = maxPerSecond
+        self.second = 0
+        self.numThisSecond = 0
+        self.numDropped = 0
+
+    def allow(self, now):
+        if self.sampleRate < 1.0 and random.random() >= self.sampleRate:
+            self.numDropped += 1
+            return False
+
+        if self.maxPerSecond:
+            second = int(now)
+            if second != self.second:
+                self.second = second
+                self.numThisSecond = 0
+
+            if self.numThisSecond >= self.maxPerSecond:
+                self.numDropped += 1
+                return False
+
+            self.numThisSecond += 1
+
+        return True
+
+
+class RotatingFileSink:
+    """
+    Appends lines to a file, which is moved to path.1 (and path.1 to path.2, and so on) once
+    it grows past maxBytes. Only the newest backups files are kept.
+    """
+
+    def __init__(self, path, maxBytes=16 * 1024 * 1024, backups=5):
+        self.path = path
+        self.maxBytes = maxBytes
+        self.backups = backups
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, lines):
+        for line in lines:
+            if self.maxBytes and self._file.tell() and self._file.tell() + len(line) + 1 > self.maxBytes:
+                self.rotate()
+
+            self._file.write(line + '\n')
+
+        self._file.flush()
+
+    def rotate(self):
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists('%s.%d' % (self.path, index)):
+                os.replace('%s.%d' % (self.path, index), '%s.%d' % (self.path, index + 1))
+
+        if self.backups:
+            os.replace(self.path, '%s.1' % self.path)
+        else:
+            os.remove(self.path)
+
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def close(self):
+        self._file.close()
+
+
+class UDPSink:
+    """
+    Sends lines to host:port over UDP, as many of them in each datagram as fit in maxDatagramSize.
+    Meant for a local collector, or a test listening for the events.
+    """
+
+    def __init__(self, host, port, maxDatagramSize=8192):
+        self.address = (host, port)
+        self.maxDatagramSize = maxDatagramSize
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def write(self, lines):
+        datagram = b''
+        for line in lines:
+            data = line.encode('utf-8') + b'\n'
+            if datagram and len(datagram) + len(data) > self.maxDatagramSize:
+                self._socket.sendto(datagram, self.address)
+                datagram = b''
+
+            datagram += data
+
+        if datagram:
+            self._socket.sendto(datagram, self.address)
+
+    def close(self):
+        self._socket.close()
+
+
+class ServerEventLog:
+    """
+    Structured server events, kept in memory and written out as newline-delimited JSON.
+
+    log() only checks the event's limit and appends it to a ring buffer, so it is cheap
+    enough to call from anywhere. A background thread takes everything in the ring every
+    flushInterval seconds, turns each event into a JSON line and hands them to the sink.
+    If the thread falls so far behind that the ring fills up, the oldest events are
+    overwritten, and counted in numOverwritten.
+
+    Fields are only turned into JSON when they are flushed, so they should not be changed
+    after being logged. Anything JSON doesn't know is written with str().
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('ServerEventLog')
+
+    def __init__(self, sender, sink, capacity=65536, flushInterval=1.0):
+        self.sender = sender
+        self.sink = sink
+        self.capacity = capacity
+        self.flushInterval = flushInterval
+        self.limits = {}
+        # Appending to and popping from a deque are atomic, so neither side has to lock
+        self._events = collections.deque(maxlen=capacity)
+        self._thread = None
+        self._stopping = threading.Event()
+        self._flushLock = threading.Lock()
+        self.numLogged = 0
+        self.numOverwritten = 0
+        self.numWritten = 0
+        self.numFailed = 0
+
+    def setLimit(self, name, sampleRate=1.0, maxPerSecond=0):
+        self.limits[name] = EventLimit(sampleRate, maxPerSecond)
+
+    def getNumDropped(self):
+        # Events that weren't logged because of their limits
+        return sum(limit.numDropped for limit in self.limits.values())
+
+    def log(self, name, fields):
+        now = time.time()
+        limit = self.limits.get(name)
+        if limit is not None and not limit.allow(now):
+            return
+
+        if len(self._events) == self.capacity:
+            self.numOverwritten += 1
+
+        self._events.append((now, name, fields))
+        self.numLogged += 1
+
+    def start(self):
+        if self._thread is not None:
+            return
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self.__flushLoop, name='ServerEventLog', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        if self._thread is not None:
+            self._stopping.set()
+            self._thread.join()
+            self._thread = None
+            atexit.unregister(self.stop)
+
+        self.flush()
+
+    def close(self):
+        self.stop()
+        self.sink.close()
+
+    def __flushLoop(self):
+        while not self._stopping.is_set():
+            self._stopping.wait(self.flushInterval)
+            self.flush()
+
+    def flush(self):
+        # Only the thread flushes while it runs, but stop() and anyone else may flush whenever they like
+        with self._flushLock:
+            lines = []
+            events = self._events
+            while events:
+                try:
+                    timestamp, name, fields = events.popleft()
+                except IndexError:
+                    break
+
+                lines.append(self.formatEvent(timestamp, name, fields))
+
+            if not lines:
+                return
+
+            try:
+                self.sink.write(lines)
+                self.numWritten += len(lines)
+            except Exception as e:
+                self.numFailed += len(lines)
+                self.notify.warning('Failed to write %d server events: %s' % (len(lines), e))
+
+    def formatEvent(self, timestamp, name, fields):
+        event = {'time': round(timestamp, 3), 'type': name, 'sender': self.sender}
+        event.update(fields)
+        return json.dumps(event, default=str, separators=(',', ':'))
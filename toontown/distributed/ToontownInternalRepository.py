@@ -1,8 +1,12 @@
+import os
+
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.AstronInternalRepository import AstronInternalRepository
 from direct.distributed.PyDatagram import PyDatagram
+from panda3d.core import ConfigVariableList
 
 from otp.distributed.OtpDoGlobals import *
+from toontown.distributed.ServerEventLog import RotatingFileSink, ServerEventLog, UDPSink
 
 
 class ToontownInternalRepository(AstronInternalRepository):
@@ -15,6 +19,50 @@ class ToontownInternalRepository(AstronInternalRepository):
         AstronInternalRepository.__init__(self, baseChannel, serverId, dcFileNames, dcSuffix, connectMethod,
                                           threadedNet)
 
+        # Structured server events, written out as JSON lines by a background thread, see ServerEventLog
+        self.serverEventLog = None
+        if self.config.GetBool('want-server-event-log', False):
+            self.serverEventLog = self.makeServerEventLog()
+            self.serverEventLog.start()
+
+    def makeServerEventLog(self):
+        udpAddress = self.config.GetString('server-event-log-udp', '')
+        if udpAddress:
+            host, port = udpAddress.rsplit(':', 1)
+            sink = UDPSink(host, int(port))
+        else:
+            folder = self.config.GetString('server-event-log-folder', 'logs/events/')
+            sink = RotatingFileSink(os.path.join(folder, '%s.ndjson' % self.eventLogId.replace(':', '-')),
+                                    self.config.GetInt('server-event-log-max-bytes', 16 * 1024 * 1024),
+                                    self.config.GetInt('server-event-log-backups', 5))
+
+        serverEventLog = ServerEventLog(self.eventLogId, sink, self.config.GetInt('server-event-log-capacity', 65536),
+                                        self.config.GetFloat('server-event-log-flush-interval', 1.0))
+
+        # Each one is "<event name> <sample rate> [<max events per second>]"
+        for limit in ConfigVariableList('server-event-log-limit'):
+            words = limit.split()
+            serverEventLog.setLimit(words[0], float(words[1]), int(words[2]) if len(words) > 2 else 0)
+
+        return serverEventLog
+
+    def logServerEvent(self, name, fields):
+        # Logs an event with named fields. They are only formatted later, away from the caller,
+        # so don't change any list or dict in them afterwards.
+        if self.serverEventLog is not None:
+            self.serverEventLog.log(name, fields)
+
+        if self.eventSocket is not None:
+            AstronInternalRepository.writeServerEvent(self, name, **fields)
+
+    def writeServerEvent(self, logtype, *args, **kwargs):
+        if self.serverEventLog is not None:
+            fields = {str(i + 1): arg for i, arg in enumerate(args)}
+            fields.update(kwargs)
+            self.serverEventLog.log(logtype, fields)
+
+        AstronInternalRepository.writeServerEvent(self, logtype, *args, **kwargs)
+
     def getAvatarIdFromSender(self):
         return self.getMsgSender() & 0xFFFFFFFF
 
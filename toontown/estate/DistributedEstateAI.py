@@ -67,9 +67,6 @@ class DistributedEstateAI(DistributedObjectAI):
             spot.generateWithRequired(self.zoneId)
             self.pond.addSpot(spot)
 
-        # Start the collision loop:
-        taskMgr.add(self.__collisionLoop, self.uniqueName('collisionLoop'), sort=30)
-
     def setEstateType(self, estateType):
         self.estateType = estateType
 
@@ -370,7 +367,6 @@ class DistributedEstateAI(DistributedObjectAI):
             self.cannons.remove(cannon)
 
         taskMgr.remove(self.uniqueName('rentalExpire'))
-        taskMgr.remove(self.uniqueName('collisionLoop'))
         DistributedObjectAI.delete(self)
 
     def destroy(self):
@@ -380,15 +376,3 @@ class DistributedEstateAI(DistributedObjectAI):
 
         del self.houses[:]
         self.requestDelete()
-
-    def __collisionLoop(self, task):
-        if hasattr(self, 'pets'):
-            for pet in self.pets:
-                if not pet:
-                    continue
-
-                collTrav = pet.getCollTrav()
-                if collTrav:
-                    collTrav.traverse(self.getRender())
-
-        return task.cont
@@ -1,5 +1,3 @@
-import time
-
 from direct.directnotify import DirectNotifyGlobal
 
 from toontown.estate import GardenGlobals
@@ -26,7 +24,7 @@ class DistributedFlowerAI(DistributedPlantBaseAI, FlowerBase):
         return self.flowerIndex
 
     def calculate(self, lastCheck):
-        now = int(time.time())
+        now = self.mgr.getTime()
         if lastCheck == 0:
             lastCheck = now
 
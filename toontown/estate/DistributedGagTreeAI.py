@@ -1,5 +1,3 @@
-import time
-
 from direct.directnotify import DirectNotifyGlobal
 
 from toontown.estate import GardenGlobals
@@ -47,7 +45,7 @@ class DistributedGagTreeAI(DistributedPlantBaseAI):
         return self.treeIndex
 
     def calculate(self, lastHarvested, lastCheck):
-        now = int(time.time())
+        now = self.mgr.getTime()
         if lastCheck == 0:
             lastCheck = now
 
@@ -146,7 +144,7 @@ class DistributedGagTreeAI(DistributedPlantBaseAI):
             harvested += 1
 
         av.d_setInventory(av.getInventory())
-        self.lastHarvested = int(time.time())
+        self.lastHarvested = self.mgr.getTime()
         self.d_setMovie(GardenGlobals.MOVIE_HARVEST)
         self.update()
 
@@ -1,5 +1,3 @@
-import time
-
 from direct.directnotify import DirectNotifyGlobal
 
 from toontown.estate import GardenGlobals
@@ -22,7 +20,7 @@ class DistributedStatuaryAI(DistributedLawnDecorAI):
     def calculate(self, lastCheck):
         self.attributes = GardenGlobals.PlantAttributes[self.index]
         self.growthThresholds = self.attributes.get('growthThresholds', (0, 0))
-        now = int(time.time())
+        now = self.mgr.getTime()
         self.lastCheck = lastCheck
         if self.lastCheck == 0:
             self.lastCheck = now
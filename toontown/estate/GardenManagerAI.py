@@ -1,5 +1,6 @@
 import json
 import os
+import time
 
 from direct.directnotify import DirectNotifyGlobal
 
@@ -38,6 +39,7 @@ class GardenAI:
         self.air = air
         self.gardenMgr = gardenMgr
         self.avId = avId
+        self.clock = gardenMgr.clock
         self.estate = None
         self._estateBoxes = None
         self.trees = set()
@@ -45,6 +47,10 @@ class GardenAI:
         self.objects = set()
         self.fileName = 'garden_%s.json' % avId
         self.filePath = 'backups/gardens/'
+        self.loadData()
+        self.data.pop('_id', None)
+
+    def loadData(self):
         try:
             with open(self.filePath + self.fileName, 'r') as f:
                 self.data = json.load(f)
@@ -58,8 +64,6 @@ class GardenAI:
             # Use self.update() to setup initial db:
             self.update()
 
-        self.data.pop('_id', None)
-
     def destroy(self):
         messenger.send('garden-%d-%d-going-down' % (id(self.gardenMgr), self.avId))
         for tree in self.trees:
@@ -171,6 +175,10 @@ class GardenAI:
         self.objects.add(obj)
         return obj
 
+    def getTime(self):
+        # Gardens grow by the time on this clock, which is the wall clock unless we were given another one
+        return int(self.clock())
+
     def getNullPlant(self):
         return NULL_PLANT
 
@@ -349,9 +357,10 @@ class GardenAI:
 class GardenManagerAI:
     notify = DirectNotifyGlobal.directNotify.newCategory('GardenManagerAI')
 
-    def __init__(self, air, estate):
+    def __init__(self, air, estate, clock=time.time):
         self.air = air
         self.estate = estate
+        self.clock = clock
         self.gardens = {}
 
     def loadGarden(self, avId):
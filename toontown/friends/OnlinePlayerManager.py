@@ -95,6 +95,15 @@ class OnlinePlayerManager(DistributedObjectGlobal):
             # Now fire an event if anywhere else in the code would like to implement some functionality.
             messenger.send(FriendsGlobals.FRIENDS_OFFLINE_EVENT, [oldToon.avId])
 
+    # Called with every toon that came online and went offline since the last update.
+    # The toons that went offline come first, since a toon may have logged out and back in since then.
+    def updateOnlineToons(self, cameOnlineData, wentOffline):
+        for avId in wentOffline:
+            self.toonWentOffline(avId)
+
+        for onlineToonData in cameOnlineData:
+            self.toonCameOnline(onlineToonData)
+
     # Called when we need to completely re-sync all online toons from the UD.
     def setOnlineToons(self, listOfToonData):
         self._onlineToonCache.clear()
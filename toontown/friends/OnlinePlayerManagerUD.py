@@ -1,11 +1,12 @@
 import json
 
-from typing import Dict, List
+from typing import Dict, Iterable, List, Set, Tuple
 
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.DistributedObjectGlobalUD import DistributedObjectGlobalUD
 from direct.distributed.PyDatagram import PyDatagram
 from direct.fsm.FSM import FSM
+from direct.task import Task
 
 
 from toontown.friends.OnlineToon import OnlineToon
@@ -76,6 +77,31 @@ class OnlinePlayerManagerUD(DistributedObjectGlobalUD):
         # Maps Toon IDs to OnlineToon struct.
         self._onlineToonCache: Dict[int, OnlineToon] = {}
 
+        # A toon is only told about the online toons that were declared to it, so it never sees one it can't talk to.
+        # Presence changes are sent once per frame, as one update per toon that has any.
+        # Maps Toon IDs to the toons they have to be told came online this frame, in the order they did,
+        # and the toons they have to be told went offline.
+        self._pendingPresence: Dict[int, Tuple[Dict[int, OnlineToon], Dict[int, None]]] = {}
+        # Toons that came online this frame, who get the whole list of toons declared to them instead.
+        self._pendingNewToons: Set[int] = set()
+
+        # Toons are only declared to the toons they have something to do with: their friends and the toons
+        # in the same Archipelago room as them right away, and the toons in the same district once they ask
+        # for their details. A district can hold any number of toons, and declaring all of them to each other
+        # would take a number of datagrams that grows with the square of its population.
+        self._toonFriends: Dict[int, Set[int]] = {}
+        # Maps Toon IDs to the online toons that have them on their friends list.
+        self._toonFriendedBy: Dict[int, Set[int]] = {}
+        # Maps Toon IDs to the (districtId, roomKey) they are in. 0 and '' when we don't know.
+        self._toonLocations: Dict[int, Tuple[int, str]] = {}
+        self._toonsByRoom: Dict[str, Set[int]] = {}
+        # Maps Toon IDs to the toons they were declared to, and the other way around.
+        self._declaredToons: Dict[int, Set[int]] = {}
+
+    def delete(self):
+        taskMgr.remove(self.uniqueName('flush-presence'))
+        DistributedObjectGlobalUD.delete(self)
+
     """
     Internal util to make management easier.
     """
@@ -155,52 +181,167 @@ class OnlinePlayerManagerUD(DistributedObjectGlobalUD):
         dg.addUint16(self.air.dclassesByName['DistributedToonUD'].getNumber())
         self.air.send(dg)
 
+        self._declaredToons.setdefault(avId, set()).add(otherAvId)
+        self._declaredToons.setdefault(otherAvId, set()).add(avId)
+
+        # Now they can talk to each other, they can know about each other.
+        self.__queueCameOnline(avId, otherAvId)
+        self.__queueCameOnline(otherAvId, avId)
+
     # Similarly to declaring existence above, we also need to do the opposite when a toon logs out.
     def __undeclareAvatarExistence(self, avId, otherAvId, accountId):
         # Undeclare to the friend.
         dg = PyDatagram()
-        dg.addServerHeader(self.GetPuppetConnectionChannel(avId), self.air.ourChannel, CLIENTAGENT_UNDECLARE_OBJECT)
-        dg.addUint32(otherAvId)
+        dg.addServerHeader(self.GetPuppetConnectionChannel(otherAvId), self.air.ourChannel, CLIENTAGENT_UNDECLARE_OBJECT)
+        dg.addUint32(avId)
         self.air.send(dg)
 
         # Undeclare to the now-offline avId.
         dg = PyDatagram()
         dg.addServerHeader(self.GetAccountConnectionChannel(accountId), self.air.ourChannel, CLIENTAGENT_UNDECLARE_OBJECT)
-        dg.addUint32(avId)
+        dg.addUint32(otherAvId)
         self.air.send(dg)
 
+    # Returns the online toons that are declared to the given toon right away.
+    def __getRelatedToons(self, avId) -> Set[int]:
+        _, roomKey = self._toonLocations.get(avId, (0, ''))
+        relatedToons = set(self._toonsByRoom.get(roomKey, ())) if roomKey else set()
+
+        for otherAvId in self._toonFriends.get(avId, ()):
+            if otherAvId in self._onlineToonCache:
+                relatedToons.add(otherAvId)
+
+        # Friend lists are not always mutual, so anyone who has us on theirs counts too.
+        relatedToons |= self._toonFriendedBy.get(avId, set())
+        relatedToons.discard(avId)
+        return relatedToons
+
+    # Declares the given toon to every online toon it is related to that it wasn't declared to yet.
+    def __declareRelatedToons(self, avId):
+        declaredToons = self._declaredToons.get(avId, set())
+        for otherAvId in sorted(self.__getRelatedToons(avId) - declaredToons):
+            self.__declareAvatarExistence(avId, otherAvId)
+
+    # Returns True if both toons are online and in the same district.
+    def __shareDistrict(self, avId, otherAvId) -> bool:
+        districtId, _ = self._toonLocations.get(avId, (0, ''))
+        otherDistrictId, _ = self._toonLocations.get(otherAvId, (0, ''))
+        return bool(districtId) and districtId == otherDistrictId
+
+    def __setToonFriends(self, avId, friendIds):
+        self.__removeToonFriends(avId)
+        self._toonFriends[avId] = set(friendIds)
+        for friendId in self._toonFriends[avId]:
+            self._toonFriendedBy.setdefault(friendId, set()).add(avId)
+
+    def __removeToonFriends(self, avId):
+        for friendId in self._toonFriends.pop(avId, ()):
+            friendedBy = self._toonFriendedBy[friendId]
+            friendedBy.discard(avId)
+            if not friendedBy:
+                del self._toonFriendedBy[friendId]
+
+    def __setToonLocation(self, avId, districtId, roomKey):
+        self.__removeToonLocation(avId)
+        self._toonLocations[avId] = (districtId, roomKey)
+        if roomKey:
+            self._toonsByRoom.setdefault(roomKey, set()).add(avId)
+
+    def __removeToonLocation(self, avId):
+        districtId, roomKey = self._toonLocations.pop(avId, (0, ''))
+        toons = self._toonsByRoom.get(roomKey)
+        if toons is not None:
+            toons.discard(avId)
+            if not toons:
+                del self._toonsByRoom[roomKey]
+
+    # Presence changes made during a frame are all sent together once it is over.
+    def __schedulePresenceUpdate(self):
+        taskName = self.uniqueName('flush-presence')
+        if not taskMgr.hasTaskNamed(taskName):
+            taskMgr.doMethodLater(0, self.__sendPresenceUpdates, taskName)
+
+    # Call to tell targetAvId that avId is online, once this frame is over.
+    def __queueCameOnline(self, targetAvId, avId):
+        # Toons that just came online get the whole list anyway.
+        if targetAvId in self._pendingNewToons:
+            return
+
+        self.__schedulePresenceUpdate()
+        cameOnline, wentOffline = self._pendingPresence.setdefault(targetAvId, ({}, {}))
+        cameOnline[avId] = self._onlineToonCache[avId]
+
+    # Call to tell targetAvId that avId went offline, once this frame is over.
+    def __queueWentOffline(self, targetAvId, avId):
+        if targetAvId in self._pendingNewToons:
+            return
+
+        self.__schedulePresenceUpdate()
+        cameOnline, wentOffline = self._pendingPresence.setdefault(targetAvId, ({}, {}))
+        if cameOnline.pop(avId, None) is None or avId in wentOffline:
+            # The target knew this toon was online, so it needs to be told it isn't anymore.
+            wentOffline[avId] = None
+
+    def __sendPresenceUpdates(self, task):
+        pendingPresence = self._pendingPresence
+        newToons = self._pendingNewToons
+        self._pendingPresence = {}
+        self._pendingNewToons = set()
+
+        # The toons that just came online get everything, everyone else gets what changed.
+        for avId in newToons:
+            self.d_setOnlineToons(avId)
+
+        for avId, (cameOnline, wentOffline) in pendingPresence.items():
+            if cameOnline or wentOffline:
+                self.d_updateOnlineToons(avId, [toon.struct() for toon in cameOnline.values()], list(wentOffline))
+
+        return Task.done
+
     """
     Util to be used throughout the codebase (mainly GameServicesManagerUD).
     """
 
     # Called from GameServicesManagerUD to inform us that a toon has just come online.
-    def comingOnline(self, avId, name, dnaString):
+    # friendIds and districtId are what the toon has stored in the database, the AI tells us where they actually
+    # are with setToonLocation once they get there.
+    def comingOnline(self, avId, name, dnaString, friendIds: Iterable[int] = (), districtId=0):
 
         # START AP CODE
         # Cache online toon then send an update to the client DOG
         onlineToon = OnlineToon(avId, name, dnaString)
 
-        # For every toon that is currently online, they need to be aware of the new toon.
-        # Our toon also needs to be aware of them.
-        for otherAvId in self._onlineToonCache.keys():
-            self.d_toonCameOnline(otherAvId, onlineToon)
-            self.__declareAvatarExistence(avId, otherAvId)
-
+        # Our toon needs a list of the toons declared to it at the end of this frame,
+        # and they need to be told about our toon.
+        self.__schedulePresenceUpdate()
+        self._pendingNewToons.add(avId)
         self.__cacheOnlineToon(onlineToon)
-        # We also need to send the person who came online a current list of everyone else online.
-        self.d_setOnlineToons(avId)
+
+        # Declare it to the toons it has something to do with, and them to it.
+        self.__setToonFriends(avId, friendIds)
+        self.__setToonLocation(avId, districtId, '')
+        self.__declareRelatedToons(avId)
 
     # Called from GameServicesManagerUD to inform us that a toon has just went offline.
     def goingOffline(self, avId, accountId):
 
         # START AP CODE
-        # Uncache the avatar and tell all other toons this toon went offline.
+        # Uncache the avatar and tell the toons it was declared to that this toon went offline.
+        if avId not in self._onlineToonCache:
+            return
+
         self.__decacheOfflineToon(avId)
+        self._pendingNewToons.discard(avId)
+        self._pendingPresence.pop(avId, None)
 
-        # Tell the other toons this toon went offline, also undeclare the existence for everyone.
-        for otherAvId in self._onlineToonCache.keys():
-            self.d_toonWentOffline(otherAvId, avId)
+        # Undeclare the existence for everyone it was declared to.
+        for otherAvId in sorted(self._declaredToons.pop(avId, ())):
+            self._declaredToons[otherAvId].discard(avId)
             self.__undeclareAvatarExistence(avId, otherAvId, accountId)
+            self.__queueWentOffline(otherAvId, avId)
+
+        self.__removeToonFriends(avId)
+        self.__removeToonLocation(avId)
 
     # Call to cancel and stop tracking of a specific operation in progress.
     def cancelOperation(self, avId):
@@ -229,6 +370,12 @@ class OnlinePlayerManagerUD(DistributedObjectGlobalUD):
         if not senderId:
             return
 
+        # Toons in the same district are declared to each other once one of them looks the other up,
+        # which is what the client does before it whispers them from their panel.
+        if avId != senderId and avId not in self._declaredToons.get(senderId, ()) and \
+                self.__shareDistrict(senderId, avId):
+            self.__declareAvatarExistence(senderId, avId)
+
         if senderId in self.operations:
             return
 
@@ -236,6 +383,27 @@ class OnlinePlayerManagerUD(DistributedObjectGlobalUD):
         newOperation.start()
         self.operations[senderId] = newOperation
 
+    """
+    Astron updates received from the AI.
+    """
+
+    # Called by the AI when a toon gets to a district, or connects to an Archipelago room.
+    # Toons are declared to the toons they now share a room with, and can look up the toons in their district.
+    def setToonLocation(self, avId, districtId, roomKey):
+        if avId not in self._onlineToonCache:
+            return
+
+        self.__setToonLocation(avId, districtId, roomKey)
+        self.__declareRelatedToons(avId)
+
+    # Called by the AI whenever a toon's friends list changes, so new friends are declared to each other.
+    def setToonFriends(self, avId, friendIds):
+        if avId not in self._onlineToonCache:
+            return
+
+        self.__setToonFriends(avId, friendIds)
+        self.__declareRelatedToons(avId)
+
     """
     Methods that invoke astron updates to clients.
     """
@@ -248,10 +416,15 @@ class OnlinePlayerManagerUD(DistributedObjectGlobalUD):
     def d_toonWentOffline(self, targetAvId: int, offlineAvId: int):
         self.sendUpdateToAvatarId(targetAvId, 'toonWentOffline', [offlineAvId])
 
-    # Call to tell a specific client all the toons we have stored on our cache of online toons.
+    # Call to tell a client every toon that came online and went offline since the last update.
+    def d_updateOnlineToons(self, targetAvId: int, cameOnline: List[List], wentOffline: List[int]):
+        self.sendUpdateToAvatarId(targetAvId, 'updateOnlineToons', [cameOnline, wentOffline])
+
+    # Call to tell a specific client every online toon that was declared to it, and itself.
     # Used for initial login to sync data for them.
     def d_setOnlineToons(self, avId: int):
-        onlineToons: List[OnlineToon] = [toon for toon in self._onlineToonCache.values()]
+        onlineToonIds = [avId] + sorted(self._declaredToons.get(avId, ()))
+        onlineToons: List[OnlineToon] = [self._onlineToonCache[toonId] for toonId in onlineToonIds]
         onlineToonsStructs: List[List] = [toon.struct() for toon in onlineToons]
         self.sendUpdateToAvatarId(avId, 'setOnlineToons', [onlineToonsStructs])
 
@@ -975,7 +975,8 @@ class DistributedGolfCourseAI(DistributedObjectAI.DistributedObjectAI, FSM):
                 strokes = scoreList[holeIndex]
                 if strokes == 1:
                     holeId = self.holeIds[holeIndex]
-                    self.air.writeServerEvent('golf_ace', avId, '%d|%d|%s' % (self.courseId, holeId, stillPlaying))
+                    self.air.logServerEvent('golf_ace', {'avId': avId, 'courseId': self.courseId, 'holeId': holeId,
+                                                         'stillPlaying': list(stillPlaying)})
 
     def recordCourseUnderPar(self):
         coursePar = self.calcCoursePar()
@@ -984,7 +985,8 @@ class DistributedGolfCourseAI(DistributedObjectAI.DistributedObjectAI, FSM):
             totalScore = self.getTotalScore(avId)
             netScore = totalScore - coursePar
             if netScore < 0:
-                self.air.writeServerEvent('golf_underPar', avId, '%d|%d|%s' % (self.courseId, netScore, stillPlaying))
+                self.air.logServerEvent('golf_underPar', {'avId': avId, 'courseId': self.courseId, 'netScore': netScore,
+                                                          'stillPlaying': list(stillPlaying)})
 
     def addAimTime(self, avId, aimTime):
         if avId in self.aimTimes:
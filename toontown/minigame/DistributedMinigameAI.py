@@ -205,7 +205,8 @@ class DistributedMinigameAI(DistributedObjectAI.DistributedObjectAI):
             return
         avId = self.air.getAvatarIdFromSender()
         self.notify.debug('BASE: setAvatarJoined: avatar id joined: ' + str(avId))
-        self.air.writeServerEvent('minigame_joined', avId, '%s|%s' % (self.minigameId, self.trolleyZone))
+        self.air.logServerEvent('minigame_joined', {'avId': avId, 'minigameId': self.minigameId,
+                                                    'trolleyZone': self.trolleyZone})
         self.stateDict[avId] = JOINED
         self.notify.debug('BASE: setAvatarJoined: new states: ' + str(self.stateDict))
         self.__barrier.clear(avId)
@@ -423,7 +424,8 @@ class DistributedMinigameAI(DistributedObjectAI.DistributedObjectAI):
         return MinigameGlobals.getSafezoneId(self.trolleyZone)
 
     def logPerfectGame(self, avId):
-        self.air.writeServerEvent('perfectMinigame', avId, '%s|%s|%s' % (self.minigameId, self.trolleyZone, self.avIdList))
+        self.air.logServerEvent('perfectMinigame', {'avId': avId, 'minigameId': self.minigameId,
+                                                    'trolleyZone': self.trolleyZone, 'avIds': list(self.avIdList)})
 
     def logAllPerfect(self):
         for avId in self.avIdList:
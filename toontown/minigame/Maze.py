@@ -3,9 +3,12 @@ from . import MazeData
 
 class Maze(MazeBase):
 
-    def __init__(self, mapName, mazeData = MazeData.mazeData, cellWidth = MazeData.CELL_WIDTH):
+    def __init__(self, mapName, mazeData = None, cellWidth = MazeData.CELL_WIDTH):
         model = loader.loadModel(mapName)
-        mData = mazeData[mapName]
+        if mazeData is None:
+            mData = MazeData.getMazeData(mapName)
+        else:
+            mData = mazeData[mapName]
         self.treasurePosList = mData['treasurePosList']
         self.numTreasures = len(self.treasurePosList)
         MazeBase.__init__(self, model, mData, cellWidth)
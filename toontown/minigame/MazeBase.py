@@ -2,6 +2,10 @@ from panda3d.core import VBase3
 from direct.showbase.RandomNumGen import RandomNumGen
 
 class MazeBase:
+    NEIGHBOUR_OFFSETS = ((0, 1),
+     (0, -1),
+     (-1, 0),
+     (1, 0))
 
     def __init__(self, model, mazeData, cellWidth, parent = None):
         if parent is None:
@@ -11,6 +15,7 @@ class MazeBase:
         self.originTX = mazeData['originX']
         self.originTY = mazeData['originY']
         self.collisionTable = mazeData['collisionTable']
+        self.__buildWalkableGrid()
         self._initialCellWidth = cellWidth
         self.cellWidth = self._initialCellWidth
         self.maze = model
@@ -33,10 +38,45 @@ class MazeBase:
         self.maze.setScale(VBase3(xy, xy, z))
         self.cellWidth = self._initialCellWidth * xy
 
+    def __buildWalkableGrid(self):
+        # A tile is walkable when the four collision cells around its corner are open.
+        # Precompute that once per maze, along with a mask of walkable neighbours for
+        # every tile, so suit thinking becomes a table lookup.
+        width = self.width
+        height = self.height
+        table = self.collisionTable
+        walkable = bytearray(width * height)
+        for tY in range(1, height):
+            row = table[tY]
+            prevRow = table[tY - 1]
+            for tX in range(1, width):
+                if not (row[tX] or prevRow[tX] or row[tX - 1] or prevRow[tX - 1]):
+                    walkable[tY * width + tX] = 1
+
+        neighbourMasks = bytearray(width * height)
+        for tY in range(height):
+            for tX in range(width):
+                mask = 0
+                for direction, (dX, dY) in enumerate(self.NEIGHBOUR_OFFSETS):
+                    nX = tX + dX
+                    nY = tY + dY
+                    if 0 <= nX < width and 0 <= nY < height and walkable[nY * width + nX]:
+                        mask |= 1 << direction
+
+                neighbourMasks[tY * width + tX] = mask
+
+        self._walkable = walkable
+        self._neighbourMasks = neighbourMasks
+
     def isWalkable(self, tX, tY, rejectList = ()):
         if tX <= 0 or tY <= 0 or tX >= self.width or tY >= self.height:
             return 0
-        return not self.collisionTable[tY][tX] and not self.collisionTable[tY - 1][tX] and not self.collisionTable[tY][tX - 1] and not self.collisionTable[tY - 1][tX - 1] and (tX, tY) not in rejectList
+        return self._walkable[tY * self.width + tX] and (tX, tY) not in rejectList
+
+    def getNeighbourMask(self, tX, tY):
+        if tX < 0 or tY < 0 or tX >= self.width or tY >= self.height:
+            return 0
+        return self._neighbourMasks[tY * self.width + tX]
 
     def tile2world(self, TX, TY):
         return [(TX - self.originTX) * self.cellWidth, (TY - self.originTY) * self.cellWidth]
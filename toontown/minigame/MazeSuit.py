@@ -1,5 +1,3 @@
-import functools
-
 from direct.showbase.DirectObject import DirectObject
 from direct.interval.MetaInterval import Parallel
 from direct.interval.LerpInterval import LerpPosInterval, LerpHprInterval
@@ -160,16 +158,20 @@ class MazeSuit(DirectObject):
             TX += 1
         return (TX, TY)
 
+    def __canWalk(self, dir, neighbourMask, unwalkables):
+        if not neighbourMask & 1 << dir:
+            return False
+        return self.__applyDirection(dir, self.TX, self.TY) not in unwalkables
+
     def __chooseNewWalkDirection(self, unwalkables):
+        neighbourMask = self.maze.getNeighbourMask(self.TX, self.TY)
         if not self.rng.randrange(self._walkSameDirectionProb):
-            newTX, newTY = self.__applyDirection(self.direction, self.TX, self.TY)
-            if self.maze.isWalkable(newTX, newTY, unwalkables):
+            if self.__canWalk(self.direction, neighbourMask, unwalkables):
                 return self.direction
         if self.difficulty >= 0.5:
             if not self.rng.randrange(self._walkTurnAroundProb):
                 oppositeDir = self.oppositeDirections[self.direction]
-                newTX, newTY = self.__applyDirection(oppositeDir, self.TX, self.TY)
-                if self.maze.isWalkable(newTX, newTY, unwalkables):
+                if self.__canWalk(oppositeDir, neighbourMask, unwalkables):
                     return oppositeDir
         candidateDirs = [self.DIR_UP,
          self.DIR_DOWN,
@@ -178,8 +180,7 @@ class MazeSuit(DirectObject):
         candidateDirs.remove(self.oppositeDirections[self.direction])
         while len(candidateDirs):
             dir = self.rng.choice(candidateDirs)
-            newTX, newTY = self.__applyDirection(dir, self.TX, self.TY)
-            if self.maze.isWalkable(newTX, newTY, unwalkables):
+            if self.__canWalk(dir, neighbourMask, unwalkables):
                 return dir
             candidateDirs.remove(dir)
 
@@ -235,7 +236,7 @@ class MazeSuit(DirectObject):
             updateTics = suitList[i].getThinkTimestampTics(curTic)
             suitUpdates.extend(list(zip(updateTics, [i] * len(updateTics))))
 
-        suitUpdates.sort(key=functools.cmp_to_key(lambda a, b: a[0] - b[0]))
+        suitUpdates.sort(key=lambda update: update[0])
         if len(suitUpdates) > 0:
             curTic = 0
             for i in range(len(suitUpdates)):
@@ -8,6 +8,7 @@ OurPetsMoodChangedKey = 'OurPetsMoodChanged'
 ThinkPeriod = 1.5
 MoodDriftPeriod = 300.0
 MovePeriod = 1.0 / 4
+LookPeriod = MovePeriod
 PosBroadcastPeriod = 1.0 / 5
 LonelinessUpdatePeriod = 100.0
 SubmergeDistance = 0.7
@@ -41,6 +41,9 @@ class PetLookerAI:
     def _isPet(self):
         return 0
 
+    def _isPetLookerGrounded(self):
+        return 0
+
     def enterPetLook(self):
         PetLookerAI.notify.debug('enterPetLook: %s' % self.doId)
         if self.__active:
@@ -59,7 +62,7 @@ class PetLookerAI:
             PetLookerAI.notify.warning('exitPetLook: %s not active!' % self.doId)
             return
         if len(self.others):
-            otherIds = self.others.keys()
+            otherIds = list(self.others.keys())
             PetLookerAI.notify.warning('%s: still in otherIds: %s' % (self.doId, otherIds))
             for otherId in otherIds:
                 self._handleLookingAtOtherStop(otherId)
@@ -95,9 +98,7 @@ class PetLookerAI:
         self._cHandler = CollisionHandlerEvent()
         self._cHandler.addInPattern(self._getLookingStartEvent())
         self._cHandler.addOutPattern(self._getLookingStopEvent())
-        collTrav = self.getCollTrav()
-        if collTrav:
-            collTrav.addCollider(self.lookSphereNodePath, self._cHandler)
+        self.getZoneData().addCollider(self.lookSphereNodePath, self._cHandler, PetConstants.LookPeriod, self._isPetLookerGrounded())
         self.accept(self._getLookingStartEvent(), self._handleLookingAtOtherStart)
         self.accept(self._getLookingStopEvent(), self._handleLookingAtOtherStop)
         if hasattr(self, 'eventProxy'):
@@ -107,9 +108,7 @@ class PetLookerAI:
             self.eventProxy.accept(self.getZoneChangeEvent(), self._handleZoneChange)
 
     def _destroyPetLookSphere(self):
-        collTrav = self.getCollTrav()
-        if collTrav:
-            collTrav.removeCollider(self.lookSphereNodePath)
+        self.getZoneData().removeCollider(self.lookSphereNodePath)
         del self._cHandler
         self.lookSphereNodePath.removeNode()
         del self.lookSphereNodePath
@@ -124,12 +123,11 @@ class PetLookerAI:
             PetLookerAI.notify.warning('%s: _handleZoneChange: not active!' % self.doId)
             return
         oldZoneData = AIZoneData(self.air, self.parentId, oldZoneId)
-        if oldZoneData.hasCollTrav():
-            oldZoneData.getCollTrav().removeCollider(self.lookSphereNodePath)
+        oldZoneData.removeCollider(self.lookSphereNodePath)
         oldZoneData.destroy()
         newZoneData = AIZoneData(self.air, self.parentId, newZoneId)
         if newZoneData.hasCollTrav():
-            newZoneData.getCollTrav().addCollider(self.lookSphereNodePath, self._cHandler)
+            newZoneData.addCollider(self.lookSphereNodePath, self._cHandler, PetConstants.LookPeriod, self._isPetLookerGrounded())
         newZoneData.destroy()
 
     def _getLookingStartEvent(self):
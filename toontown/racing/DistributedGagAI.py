@@ -11,7 +11,7 @@ class DistributedGagAI(DistributedObjectAI):
         self.ownerId = avId
         self.race = race
         self.pos = (x, y, z)
-        self.gagType = gagType
+        self.gagType = type
         self.initTime = globalClockDelta.getFrameNetworkTime()
         self.activateTime = 0
 
@@ -24,11 +24,13 @@ class DistributedLeaderBoardAI(DistributedObjectAI):
         return self.name
 
     def updateRaceRecord(self, record):
-        trackId, period = record
+        trackId, periods = record
         if trackId not in self.records:
             return
 
-        self.records[trackId][period] = [(x[0], x[3]) for x in self.air.raceMgr.getRecords(trackId, period)]
+        for period in periods:
+            if period in self.records[trackId]:
+                self.records[trackId][period] = [(x[0], x[3]) for x in self.air.raceMgr.getRecords(trackId, period)]
 
     def subscribeTo(self, subscription):
         self.records.setdefault(subscription[0], {})[subscription[1]] = [(x[0], x[3]) for x in
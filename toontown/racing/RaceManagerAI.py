@@ -1,13 +1,16 @@
 from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
 from . import DistributedRaceAI, RaceGlobals
+from .RaceRecordBoard import RaceRecordBoard
 from toontown.toonbase import ToontownGlobals, TTLocalizer
 from toontown.ai import HolidayBaseAI
 from direct.showbase import DirectObject
-import os, json
+import os, sys, json
 
 class RaceManagerAI(DirectObject.DirectObject):
     notify = DirectNotifyGlobal.directNotify.newCategory('RaceManagerAI')
     serverDataFolder = simbase.config.GetString('server-data-folder', '')
+    recordSaveDelay = simbase.config.GetFloat('race-record-save-delay', 30.0)
 
     def __init__(self, air):
         DirectObject.DirectObject.__init__(self)
@@ -15,6 +18,9 @@ class RaceManagerAI(DirectObject.DirectObject):
         self.races = []
         self.shard = str(air.districtId)
         self.filename = self.getFilename()
+        self.dirtyTracks = set()
+        self.saveTask = None
+        self.pendingLeaderboards = {}
         self.trackRecords = self.loadRecords()
 
     def getDoId(self):
@@ -71,7 +77,8 @@ class RaceManagerAI(DirectObject.DirectObject):
                 if trophies:
                     self.updateTrophiesFromList(playerInfo.avId, trophies)
             else:
-                self.air.writeServerEvent('kartingPlaced', playerInfo.avId, '%s|%s' % (place, race.toonCount))
+                self.air.logServerEvent('kartingPlaced', {'avId': playerInfo.avId, 'place': place,
+                                                          'toonCount': race.toonCount})
                 if race.raceType != RaceGlobals.Circuit:
                     entryFee = RaceGlobals.getEntryFee(race.trackId, race.raceType)
                     placeMultiplier = RaceGlobals.Winnings[place - 1 + (RaceGlobals.MaxRacers - race.toonCount)]
@@ -164,7 +171,7 @@ class RaceManagerAI(DirectObject.DirectObject):
                 self.notify.debug('isLastRace')
                 av = self.air.doId2do.get(avId)
                 if av and avId in race.playersFinished:
-                    self.air.writeServerEvent('kartingCircuitFinished', avId, '%s|%s' % (place, places))
+                    self.air.logServerEvent('kartingCircuitFinished', {'avId': avId, 'place': place, 'places': places})
                     print('kartingCircuitFinished', avId, '%s|%s' % (place, places))
                     entryFee = RaceGlobals.getEntryFee(race.trackId, race.raceType)
                     placeMultiplier = RaceGlobals.Winnings[place - 1 + (RaceGlobals.MaxRacers - places)]
@@ -580,39 +587,61 @@ class RaceManagerAI(DirectObject.DirectObject):
 
     def checkTimeRecord(self, trackId, time, raceType, numRacers, avId):
         bonus = 0
-        newRecord = 0
         for period in RaceGlobals.PeriodIds:
-            for record in range(0, RaceGlobals.NumRecordsPerPeriod):
-                recordTime = self.trackRecords[str(trackId)][str(period)][record][0]
-                if time < recordTime:
-                    newRecord = 1
-                    self.notify.debug('new %s record!' % TTLocalizer.RecordPeriodStrings[period])
-                    av = simbase.air.doId2do.get(avId)
-                    if av:
-                        name = av.name
-                        self.trackRecords[str(trackId)][str(period)].insert(record, (time, raceType, numRacers, name))
-                        self.trackRecords[str(trackId)][str(period)] = self.trackRecords[str(trackId)][str(period)][:RaceGlobals.NumRecordsPerPeriod]
-                        self.updateLeaderboards(trackId, period)
-                        bonus = RaceGlobals.PeriodDict[period]
-                        self.air.writeServerEvent('kartingRecord', avId, '%s|%s|%s' % (period, trackId, time))
-                    else:
-                        self.notify.warning('warning: av not logged in!')
-                    break
+            board = self.trackRecords[trackId][period]
+            rank = board.getRank(time)
+            if rank is None:
+                continue
+
+            self.notify.debug('new %s record!' % TTLocalizer.RecordPeriodStrings[period])
+            av = simbase.air.doId2do.get(avId)
+            if not av:
+                self.notify.warning('warning: av not logged in!')
+                continue
+
+            board.insert(rank, (time, raceType, numRacers, av.name))
+            self.markTrackDirty(trackId)
+            self.updateLeaderboards(trackId, period)
+            bonus = RaceGlobals.PeriodDict[period]
+            self.air.logServerEvent('kartingRecord', {'avId': avId, 'period': period, 'trackId': trackId, 'time': time})
 
-        if newRecord:
-            self.updateRecordFile()
         return bonus
 
+    def markTrackDirty(self, trackId):
+        # Records are written behind, at most once every recordSaveDelay seconds.
+        self.dirtyTracks.add(trackId)
+        if not self.saveTask:
+            self.saveTask = taskMgr.doMethodLater(self.recordSaveDelay, self.__saveRecordsTask, self.uniqueName('save-track-records'))
+
+    def uniqueName(self, name):
+        return '%s-%s' % (name, self.shard)
+
+    def __saveRecordsTask(self, task):
+        self.saveTask = None
+        self.updateRecordFile()
+        return Task.done
+
+    def flushRecordFile(self):
+        # Write any pending records right away. The AI repository calls this when it shuts down.
+        if self.saveTask:
+            taskMgr.remove(self.saveTask)
+            self.saveTask = None
+        if self.dirtyTracks:
+            self.updateRecordFile()
+
     def updateRecordFile(self):
+        # Every track lives in the same file, so one write covers all the tracks that changed since the last one.
+        self.dirtyTracks.clear()
+        records = {}
+        for trackId, boards in self.trackRecords.items():
+            records[str(trackId)] = {str(period): board.toJson() for period, board in boards.items()}
+
         try:
-            backup = self.filename + '.bu'
-            if os.path.exists(self.filename):
-                os.rename(self.filename, backup)
-            file = open(self.filename, 'w')
-            json.dump(self.trackRecords, file, indent=4)
-            file.close()
-            if os.path.exists(backup):
-                os.remove(backup)
+            # Write to a temporary file first so a crash can never leave a truncated record file behind.
+            tempFilename = self.filename + '.tmp'
+            with open(tempFilename, 'w') as file:
+                json.dump(records, file, separators=(',', ':'))
+            os.replace(tempFilename, self.filename)
         except EnvironmentError:
             self.notify.warning(str(sys.exc_info()[1]))
 
@@ -621,6 +650,7 @@ class RaceManagerAI(DirectObject.DirectObject):
 
     def loadRecords(self):
         try:
+            # Record files used to be renamed to a backup while they were being written
             file = open(self.filename + '.bu', 'r')
             if os.path.exists(self.filename):
                 os.remove(self.filename)
@@ -632,16 +662,15 @@ class RaceManagerAI(DirectObject.DirectObject):
 
         records = self.loadFrom(file)
         file.close()
+        trackRecords = self.getRecordTimes()
         for trackId in RaceGlobals.TrackIds:
-            if str(trackId) not in records:
-                records[str(trackId)] = {}
-                for i in RaceGlobals.PeriodIds:
-                    records[str(trackId)][str(i)] = []
-                    for j in range(0, RaceGlobals.NumRecordsPerPeriod):
-                        records[str(trackId)][str(i)].append(RaceGlobals.getDefaultRecord(trackId))
+            for period in RaceGlobals.PeriodIds:
+                savedRecords = records.get(str(trackId), {}).get(str(period))
+                if savedRecords:
+                    trackRecords[trackId][period].setRecords(savedRecords)
 
         self.resetLeaderboards()
-        return records
+        return trackRecords
 
     def loadFrom(self, file):
         records = {}
@@ -655,28 +684,34 @@ class RaceManagerAI(DirectObject.DirectObject):
     def getRecordTimes(self):
         records = {}
         for trackId in RaceGlobals.TrackIds:
-            records[str(trackId)] = {}
-            for i in RaceGlobals.PeriodIds:
-                records[str(trackId)][str(i)] = []
-                for j in range(0, RaceGlobals.NumRecordsPerPeriod):
-                    records[str(trackId)][str(i)].append(RaceGlobals.getDefaultRecord(trackId))
+            records[trackId] = {}
+            for period in RaceGlobals.PeriodIds:
+                records[trackId][period] = RaceRecordBoard(trackId)
 
         return records
 
     def resetRecordPeriod(self, period):
         for trackId in RaceGlobals.TrackIds:
-            for i in range(0, RaceGlobals.NumRecordsPerPeriod):
-                self.trackRecords[str(trackId)][str(period)][i] = RaceGlobals.getDefaultRecord(trackId)
-
+            self.trackRecords[trackId][period].reset()
+            self.markTrackDirty(trackId)
             self.updateLeaderboards(trackId, period)
 
-        self.updateRecordFile()
-
     def getRecords(self, trackId, period):
-        return self.trackRecords[str(trackId)][str(period)]
+        return self.trackRecords[trackId][period].getRecords()
 
     def updateLeaderboards(self, trackId, period):
-        messenger.send('UpdateRaceRecord', [(trackId, period)])
+        # Leaderboards are told about every period of a track that changed this frame at once.
+        if not self.pendingLeaderboards:
+            taskMgr.doMethodLater(0, self.__sendLeaderboardUpdates, self.uniqueName('update-leaderboards'))
+
+        self.pendingLeaderboards.setdefault(trackId, set()).add(period)
+
+    def __sendLeaderboardUpdates(self, task):
+        pendingLeaderboards, self.pendingLeaderboards = self.pendingLeaderboards, {}
+        for trackId, periods in pendingLeaderboards.items():
+            messenger.send('UpdateRaceRecord', [(trackId, sorted(periods))])
+
+        return Task.done
 
     def resetLeaderboards(self):
         for track in RaceGlobals.TrackIds:
@@ -0,0 +1,53 @@
+import bisect
+
+from toontown.racing import RaceGlobals
+
+
+class RaceRecordBoard:
+    """
+    The best times for a single track and record period, fastest first.
+    Each record is a (time, raceType, numRacers, name) tuple.
+    """
+
+    def __init__(self, trackId, records=None):
+        self.trackId = trackId
+        self.records = []
+        self.times = []
+        if records:
+            self.setRecords(records)
+        else:
+            self.reset()
+
+    def setRecords(self, records):
+        # Keep the board sorted so new times can be placed with a binary search.
+        # A stable sort keeps the order of records that share the same time.
+        records = sorted((tuple(record) for record in records), key=lambda record: record[0])
+        records = records[:RaceGlobals.NumRecordsPerPeriod]
+        while len(records) < RaceGlobals.NumRecordsPerPeriod:
+            records.append(RaceGlobals.getDefaultRecord(self.trackId))
+
+        self.records = records
+        self.times = [record[0] for record in records]
+
+    def reset(self):
+        self.setRecords([])
+
+    def getRank(self, time):
+        # A new record goes after every record that is at least as fast, returns None if it didn't place
+        rank = bisect.bisect_right(self.times, time)
+        if rank >= RaceGlobals.NumRecordsPerPeriod:
+            return None
+
+        return rank
+
+    def insert(self, rank, record):
+        self.records.insert(rank, record)
+        self.times.insert(rank, record[0])
+        del self.records[RaceGlobals.NumRecordsPerPeriod:]
+        del self.times[RaceGlobals.NumRecordsPerPeriod:]
+
+    def getRecords(self):
+        return self.records
+
+    def toJson(self):
+        return [list(record) for record in self.records]
@@ -0,0 +1,77 @@
+from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
+
+
+class HealTickerAI:
+    """
+    Passively heals every toon in one zone from a single task, once every healFrequency seconds.
+
+    The heal period is split into NumSlots slots, and the task ticks once per slot, healing
+    only the toons in that slot. A toon joins whichever of the next SlotWindow slots has the
+    fewest toons, so toons that arrive together are still healed in different frames. Its
+    first heal comes a full period after it joined, like it would with a timer of its own.
+
+    Toons that are already tooned up are skipped without sending anything.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('HealTickerAI')
+    NumSlots = 10
+    SlotWindow = 5
+
+    def __init__(self, healFrequency, taskName):
+        self.healFrequency = healFrequency
+        self.taskName = taskName
+        # Each slot maps avIds to [toon, number of the first tick that may heal it]
+        self.slots = [{} for i in range(self.NumSlots)]
+        self.toonSlots = {}
+        self.nextTick = 0
+        self.startTime = None
+        self.running = False
+
+    def destroy(self):
+        self.stop()
+        self.slots = [{} for i in range(self.NumSlots)]
+        self.toonSlots = {}
+
+    def getNumToons(self):
+        return len(self.toonSlots)
+
+    def addToon(self, toon):
+        self.removeToon(toon.doId)
+
+        # The next tick comes within a slot's time, so a toon's first heal must wait for the one after a full cycle
+        candidates = range(self.nextTick + self.NumSlots, self.nextTick + self.NumSlots + self.SlotWindow)
+        firstTick = min(candidates, key=lambda tick: len(self.slots[tick % self.NumSlots]))
+        slot = firstTick % self.NumSlots
+        self.slots[slot][toon.doId] = [toon, firstTick]
+        self.toonSlots[toon.doId] = slot
+        if not self.running:
+            self.start()
+
+    def removeToon(self, avId):
+        slot = self.toonSlots.pop(avId, None)
+        if slot is not None:
+            del self.slots[slot][avId]
+
+    def getTickTime(self, tick):
+        # Tick number 0 comes one slot after the ticker first started
+        return self.startTime + (tick + 1) * self.healFrequency / self.NumSlots
+
+    def start(self):
+        self.running = True
+        self.startTime = globalClock.getFrameTime() - self.nextTick * self.healFrequency / self.NumSlots
+        taskMgr.doMethodLater(self.getTickTime(self.nextTick) - globalClock.getFrameTime(), self.__tick, self.taskName)
+
+    def stop(self):
+        self.running = False
+        taskMgr.remove(self.taskName)
+
+    def __tick(self, task):
+        tick = self.nextTick
+        self.nextTick += 1
+        for toon, firstTick in list(self.slots[tick % self.NumSlots].values()):
+            if firstTick <= tick:
+                toon.passiveToonUp()
+
+        # Each tick is due at a fixed time, so that late frames don't push all the ticks after them back
+        task.delayTime = max(0.0, self.getTickTime(self.nextTick) - globalClock.getFrameTime())
+        return Task.again
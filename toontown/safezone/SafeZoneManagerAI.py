@@ -1,12 +1,28 @@
 from direct.directnotify import DirectNotifyGlobal
 from direct.distributed.DistributedObjectAI import DistributedObjectAI
 
+from toontown.safezone.HealTickerAI import HealTickerAI
 from toontown.toonbase import ToontownGlobals
 
 
 class SafeZoneManagerAI(DistributedObjectAI):
     notify = DirectNotifyGlobal.directNotify.newCategory('SafeZoneManagerAI')
 
+    def __init__(self, air):
+        DistributedObjectAI.__init__(self, air)
+        # Maps (zoneId, healFrequency) to the HealTickerAI healing the toons in that zone
+        self.healTickers = {}
+        # Maps avIds to the key of the heal ticker they are in
+        self.toonHealTickers = {}
+
+    def delete(self):
+        for healTicker in self.healTickers.values():
+            healTicker.destroy()
+
+        self.healTickers = {}
+        self.toonHealTickers = {}
+        DistributedObjectAI.delete(self)
+
     def enterSafeZone(self):
         avId = self.air.getAvatarIdFromSender()
         if not avId:
@@ -29,3 +45,25 @@ class SafeZoneManagerAI(DistributedObjectAI):
             return
 
         av.stopToonUp()
+
+    def startHealing(self, av, healFrequency):
+        self.stopHealing(av)
+        key = (av.zoneId, healFrequency)
+        healTicker = self.healTickers.get(key)
+        if healTicker is None:
+            healTicker = HealTickerAI(healFrequency, 'healTicker-%s-%s' % key)
+            self.healTickers[key] = healTicker
+
+        healTicker.addToon(av)
+        self.toonHealTickers[av.doId] = key
+
+    def stopHealing(self, av):
+        key = self.toonHealTickers.pop(av.doId, None)
+        if key is None:
+            return
+
+        healTicker = self.healTickers[key]
+        healTicker.removeToon(av.doId)
+        if not healTicker.getNumToons():
+            healTicker.destroy()
+            del self.healTickers[key]
@@ -75,20 +75,19 @@ class PurchaseManagerAI(DistributedObjectAI.DistributedObjectAI):
                     simbase.air.writeServerEvent('suspicious', avId, 'toon has invalid money %s, forcing to zero' % money)
                     self.playerMoney[avIndex] = 0
                 av.addMoney(self.minigamePoints[avIndex])
-                self.air.writeServerEvent('minigame', avId, '%s|%s|%s|%s' % (self.previousMinigameId,
-                 self.trolleyZone,
-                 self.playerIds,
-                 self.minigamePoints[avIndex]))
+                self.air.logServerEvent('minigame', {'avId': avId, 'minigameId': self.previousMinigameId,
+                                                     'trolleyZone': self.trolleyZone, 'playerIds': list(self.playerIds),
+                                                     'points': self.minigamePoints[avIndex]})
                 if self.metagameRound == TravelGameGlobals.FinalMetagameRoundIndex:
                     numPlayers = len(self.votesArray)
                     extraBeans = self.votesArray[avIndex] * TravelGameGlobals.PercentOfVotesConverted[numPlayers] / 100.0
                     if self.air.holidayManager.isHolidayRunning(ToontownGlobals.JELLYBEAN_TROLLEY_HOLIDAY) or self.air.holidayManager.isHolidayRunning(ToontownGlobals.JELLYBEAN_TROLLEY_HOLIDAY_MONTH):
                         extraBeans *= MinigameGlobals.JellybeanTrolleyHolidayScoreMultiplier
                     av.addMoney(extraBeans)
-                    self.air.writeServerEvent('minigame_extraBeans', avId, '%s|%s|%s|%s' % (self.previousMinigameId,
-                     self.trolleyZone,
-                     self.playerIds,
-                     extraBeans))
+                    self.air.logServerEvent('minigame_extraBeans', {'avId': avId, 'minigameId': self.previousMinigameId,
+                                                                    'trolleyZone': self.trolleyZone,
+                                                                    'playerIds': list(self.playerIds),
+                                                                    'extraBeans': extraBeans})
 
         self.receivingInventory = 1
         self.receivingButtons = 1
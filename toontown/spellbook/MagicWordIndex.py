@@ -17,6 +17,7 @@ from toontown.coghq.CraneLeagueHeatDisplay import CraneLeagueHeatDisplay
 from toontown.estate import GardenGlobals
 from toontown.fishing import FishGlobals
 from toontown.golf import GolfGlobals
+from toontown.hood import ZoneUtil
 from toontown.quest import Quests
 from toontown.racing.KartDNA import *
 from toontown.racing import RaceGlobals
@@ -44,9 +45,13 @@ DEBUG_LOG = None
 
 magicWordIndex = collections.OrderedDict()
 
+# Filled in once every Magic Word below has been defined.
+magicWordClasses = types.MappingProxyType({})
+magicWordDispatch = types.MappingProxyType({})
+
 
 def getMagicWord(name):
-    magicWord = globals().get(name)
+    magicWord = magicWordClasses.get(name)
     if not magicWord:
         magicWord = MagicWord()
     return magicWord
@@ -91,61 +96,67 @@ class MagicWord:
         self.targets = targets
         self.args = args
         self.posHprString = None
-        if self.__class__.__name__ != "MagicWord":  # If not the base class,
-            self.aliases = self.aliases if self.aliases is not None else []  # if we use [] by default, it might get overwritten
-            self.aliases.insert(0, self.__class__.__name__)  # add the class name to the alias list,
-            self.aliases = [x.lower() for x in self.aliases]  # make all the aliases lowercase,
-            self.arguments = self.arguments if self.arguments is not None else []
-
-            if len(self.arguments) > 0:
-                for arg in self.arguments:
-                    argInfo = ""
-                    if not arg[MagicWordConfig.ARGUMENT_REQUIRED]:
-                        argInfo += "(DF:{0})".format(arg[MagicWordConfig.ARGUMENT_DEFAULT])
-                    self.example += "[{0}{1}] ".format(arg[MagicWordConfig.ARGUMENT_NAME], argInfo)
-
-            self.__register()  # and register the magic word.
-
-    def __register(self):
 
-        for wordName in self.aliases:
+    @classmethod
+    def register(cls):
+        # Called once for every Magic Word when this module is loaded, see the bottom of this file.
+        cls.aliases = list(cls.aliases) if cls.aliases is not None else []  # if we use [] by default, it might get overwritten
+        cls.aliases.insert(0, cls.__name__)  # add the class name to the alias list,
+        cls.aliases = [x.lower() for x in cls.aliases]  # make all the aliases lowercase,
+        cls.arguments = cls.arguments if cls.arguments is not None else []
+
+        for arg in cls.arguments:
+            argInfo = ""
+            if not arg[MagicWordConfig.ARGUMENT_REQUIRED]:
+                argInfo += "(DF:{0})".format(arg[MagicWordConfig.ARGUMENT_DEFAULT])
+            cls.example += "[{0}{1}] ".format(arg[MagicWordConfig.ARGUMENT_NAME], argInfo)
+
+        for wordName in cls.aliases:
             magicWordIndex[wordName] = {
-                'classname': self.__class__.__name__,  # This class
-                'hidden': self.hidden,
-                'administrative': self.administrative,
-                'aliases': self.aliases,
-                'desc': self.desc,
-                'example': self.example,
-                'execLocation': self.execLocation,
-                'access': self.accessLevel,
-                'affectRange': self.affectRange,
-                'args': self.arguments
+                'classname': cls.__name__,  # This class
+                'hidden': cls.hidden,
+                'administrative': cls.administrative,
+                'aliases': cls.aliases,
+                'desc': cls.desc,
+                'example': cls.example,
+                'execLocation': cls.execLocation,
+                'access': cls.accessLevel,
+                'affectRange': cls.affectRange,
+                'args': cls.arguments
             }
 
     def executeWord(self):
         executedWord = None
         for avId in self.targets:
-            invoker = None
-            toon = None
-            if self.air:
-                invoker = self.air.doId2do.get(self.invokerId)
-                toon = self.air.doId2do.get(avId)
-            elif self.cr:
-                invoker = self.cr.doId2do.get(self.invokerId)
-                toon = self.cr.doId2do.get(avId)
-            if not self.validateTarget(toon):
-                if hasattr(toon, "getName"):
-                    return "{} is not a valid target!".format(toon.getName())
-                else:
-                    return "{} is not a valid target!".format(avId)
-
-            if self.execLocation == MagicWordConfig.EXEC_LOC_CLIENT:
-                self.args = json.loads(self.args)
-
-            executedWord = self.handleWord(invoker, avId, toon, *self.args)
+            valid, response = self.executeTarget(avId)
+            if not valid:
+                return response
+
+            executedWord = response
         if executedWord:
             return executedWord
 
+    def executeTarget(self, avId):
+        # Runs this word on a single target. Returns whether the target was valid, along with the word's response.
+        invoker = None
+        toon = None
+        if self.air:
+            invoker = self.air.doId2do.get(self.invokerId)
+            toon = self.air.doId2do.get(avId)
+        elif self.cr:
+            invoker = self.cr.doId2do.get(self.invokerId)
+            toon = self.cr.doId2do.get(avId)
+        if not self.validateTarget(toon):
+            if hasattr(toon, "getName"):
+                return False, "{} is not a valid target!".format(toon.getName())
+            else:
+                return False, "{} is not a valid target!".format(avId)
+
+        if self.execLocation == MagicWordConfig.EXEC_LOC_CLIENT:
+            self.args = json.loads(self.args)
+
+        return True, self.handleWord(invoker, avId, toon, *self.args)
+
     def validateTarget(self, target):
         if self.air:
             from toontown.toon.DistributedToonAI import DistributedToonAI
@@ -159,6 +170,56 @@ class MagicWord:
         raise NotImplemented("Please implement the handleWord method!")
 
 
+class MagicWordDispatch:
+    """
+    A Magic Word's class along with everything needed to parse its arguments,
+    worked out once when the index is built rather than every time it is used.
+    """
+
+    def __init__(self, wordClass):
+        self.wordClass = wordClass
+        self.converters = tuple(arg[MagicWordConfig.ARGUMENT_TYPE] for arg in wordClass.arguments)
+        self.maxArgs = len(wordClass.arguments)
+        self.minArgs = len([arg for arg in wordClass.arguments if arg[MagicWordConfig.ARGUMENT_REQUIRED]])
+
+        # The defaults that fill in the rest of the arguments, for each number of arguments that can be given.
+        # None if one of them can't be converted to its argument's type.
+        self.defaults = {}
+        for numArgs in range(self.minArgs, self.maxArgs + 1):
+            defaults = []
+            for x in range(self.minArgs, self.maxArgs):
+                if wordClass.arguments[x][MagicWordConfig.ARGUMENT_REQUIRED] or numArgs + len(defaults) >= x + 1:
+                    continue
+                defaults.append(wordClass.arguments[x][MagicWordConfig.ARGUMENT_DEFAULT])
+
+            try:
+                self.defaults[numArgs] = tuple(self.converters[numArgs + i](default) for i, default in enumerate(defaults))
+            except:
+                self.defaults[numArgs] = None
+
+    def parseArguments(self, args):
+        # Returns the parsed arguments, or None along with the response to send and its extra message data.
+        argList = args.split(None, self.maxArgs - 1)
+        if len(argList) < self.minArgs:
+            return None, "NotEnoughArgs", "{} argument{}".format(self.minArgs, "s" if self.minArgs != 1 else '')
+        elif len(argList) > self.maxArgs:
+            return None, "TooManyArgs", "{} argument{}".format(self.maxArgs, "s" if self.maxArgs != 1 else '')
+
+        defaults = self.defaults[len(argList)]
+        if defaults is None:
+            return None, "BadArgs", ''
+
+        parsedArgList = []
+        try:
+            for converter, arg in zip(self.converters, argList):
+                parsedArgList.append(converter(arg))
+        except:
+            return None, "BadArgs", ''
+
+        parsedArgList.extend(defaults)
+        return parsedArgList, None, ''
+
+
 # When creating new Magic Words, please try to use a consistent naming etiquette. Here are some rules we should follow:
 
 # Restock - If a word gives you an item that you can consistently obtain and use (for example, a cog summon), but you cannot specify the amount you recieve, we give this command the prefix of "Restock"
@@ -822,6 +883,39 @@ class GetAvId(MagicWord):
         return "%s has the avId of %d" % (toon.getName(), toon.getDoId())
 
 
+class Telemetry(MagicWord):
+    administrative = True
+    aliases = ["clientTelemetry"]
+    desc = "Shows the frame rates, memory use and hardware reported by clients in the target's hood or zone."
+    execLocation = MagicWordConfig.EXEC_LOC_SERVER
+    accessLevel = "MODERATOR"
+    arguments = [("scope", str, False, 'hood')]
+
+    def handleWord(self, invoker, avId, toon, *args):
+        scope = args[0].lower()
+        telemetry = self.air.timeManager.telemetry
+        if scope == 'zone':
+            where = "zone %d" % toon.zoneId
+            stats = telemetry.getZoneStats(toon.zoneId)
+        elif scope == 'hood':
+            hoodId = ZoneUtil.getCanonicalHoodId(toon.zoneId)
+            where = "hood %d" % hoodId
+            stats = telemetry.getHoodStats(hoodId)
+        else:
+            return f"Invalid scope: {scope}, must be hood or zone"
+
+        if not stats:
+            return f"No client telemetry for {where} since the last summary."
+
+        summary = stats.getSummary()
+        lines = [f"Client telemetry for {where} ({summary['samples']} samples):"]
+        for name in ('fps', 'memory', 'gpus', 'cpus'):
+            counts = ', '.join(f"{key}: {count}" for key, count in summary[name].items())
+            lines.append(f"{name}: {counts or 'none'}")
+        lines.append(f"garbage leaks: {summary['garbageLeaks']}")
+        return '\n'.join(lines)
+
+
 class SetGravity(MagicWord):
     aliases = ["gravity"]
     desc = "Set your gravity value."
@@ -938,7 +1032,7 @@ class InvasionStatus(MagicWord):
 
         invadingCog = invasionMgr.getInvadingCog()
         simbase.air.newsManager.sendUpdateToAvatarId(invoker.getDoId(), 'setInvasionStatus', [
-            ToontownGlobals.SuitInvasionUpdate, invadingCog[0], invasionMgr.numSuits, invadingCog[1]])
+            ToontownGlobals.SuitInvasionUpdate, invadingCog[0], invasionMgr.getNumRemaining(), invadingCog[1]])
 
 
 class RevealMap(MagicWord):
@@ -3461,8 +3555,14 @@ class Archipelago(MagicWord):
 #         return "Spawned a barrel"
 
 
-# Instantiate all classes defined here to register them.
-# A bit hacky, but better than the old system
+# Register all classes defined here, in the order they are defined.
+# Later words take over any aliases they share with earlier ones.
+__dispatchByClass = {}
 for item in list(globals().values()):
-    if isinstance(item, type) and issubclass(item, MagicWord):
-        i = item()
+    if isinstance(item, type) and issubclass(item, MagicWord) and item is not MagicWord:
+        item.register()
+        __dispatchByClass[item.__name__] = MagicWordDispatch(item)
+
+magicWordClasses = types.MappingProxyType({name: dispatch.wordClass for name, dispatch in __dispatchByClass.items()})
+magicWordDispatch = types.MappingProxyType({wordName: __dispatchByClass[info['classname']]
+                                           for wordName, info in magicWordIndex.items()})
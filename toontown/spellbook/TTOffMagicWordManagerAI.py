@@ -57,6 +57,16 @@ for word in spellbook['words']:
 class TTOffMagicWordManagerAI(DistributedObjectAI.DistributedObjectAI):
     notify = DirectNotifyGlobal.directNotify.newCategory('TTOffMagicWordManagerAI')
 
+    def __init__(self, air):
+        DistributedObjectAI.DistributedObjectAI.__init__(self, air)
+        # Words with more targets than this are spread out over several frames.
+        self.targetsPerFrame = max(1, simbase.config.GetInt('magic-word-targets-per-frame', 50))
+        self.nextBatchId = 0
+
+    def delete(self):
+        taskMgr.removeTasksMatching(self.uniqueName('executeMagicWord') + '-*')
+        DistributedObjectAI.DistributedObjectAI.delete(self)
+
     def requestExecuteMagicWord(self, affectRange, affectType, affectExtra, lastClickedAvId, magicWord):
         avId = self.air.getAvatarIdFromSender()
         toon = self.air.doId2do.get(avId)
@@ -97,25 +107,16 @@ class TTOffMagicWordManagerAI(DistributedObjectAI.DistributedObjectAI):
             self.generateResponse(avId=avId, responseType = "NoTarget")
             return
 
-        for targetId in targetIds:
-            if targetId == avId:
-                continue
-            targetToon = self.air.doId2do.get(targetId)
-            if not targetToon:
-                continue
-            # if targetToon.getAccessLevel() >= toon.getAccessLevel():
-            #     targetIds.remove(targetId)
-            #     continue
-
         if len(targetIds) == 0:
             self.generateResponse(avId=avId, responseType = "NoAccessToTarget")
 
         magicWord, args = (magicWord.split(' ', 1) + [''])[:2]
         magicWord = magicWord.lower()
         magicWordInfo = MagicWordIndex.get(magicWord)
-        
+        dispatch = magicWordDispatch.get(magicWord)
+
         # Is the client out of sync with the server?
-        if magicWordInfo is None:
+        if magicWordInfo is None or dispatch is None:
             self.generateResponse(avId=avId, responseType="BadWord")
             return
 
@@ -132,54 +133,59 @@ class TTOffMagicWordManagerAI(DistributedObjectAI.DistributedObjectAI):
                 self.generateResponse(avId=avId, responseType = "LegitServer")
                 return
         
-        commandArgs = magicWordInfo['args']
-        maxArgs = len(commandArgs)
-        minArgs = 0
-        argList = args.split(None, maxArgs-1)
-        for argSet in commandArgs:
-            isRequired = argSet[ARGUMENT_REQUIRED]
-            if isRequired:
-                minArgs += 1
-
-        if len(argList) < minArgs:
-            self.generateResponse(avId=avId, responseType = "NotEnoughArgs", extraMessageData = "{} argument{}".format(minArgs, "s" if minArgs != 1 else ''))
-            return
-        elif len(argList) > maxArgs:
-            self.generateResponse(avId=avId, responseType = "TooManyArgs", extraMessageData = "{} argument{}".format(maxArgs, "s" if maxArgs != 1 else ''))
+        parsedArgList, responseType, extraMessageData = dispatch.parseArguments(args)
+        if parsedArgList is None:
+            self.generateResponse(avId=avId, responseType=responseType, extraMessageData=extraMessageData)
             return
 
-        parsedArgList = []
-        
-        if len(argList) < maxArgs:
-            for x in range(minArgs,maxArgs):
-                if commandArgs[x][ARGUMENT_REQUIRED] or len(argList) >= x+1:
-                    continue
-                argList.append(commandArgs[x][ARGUMENT_DEFAULT])
-
-        for x in range(len(argList)):
-            arg = argList[x]
-            argType = commandArgs[x][ARGUMENT_TYPE]
-            try:
-                parsedArg = argType(arg)
-            except:
-                self.generateResponse(avId=avId, responseType = "BadArgs")
-                return
-
-            parsedArgList.append(parsedArg)
-
         if magicWordInfo['execLocation'] == EXEC_LOC_CLIENT:
             self.sendClientCommand(avId, magicWord, magicWordInfo['classname'], targetIds=targetIds, parsedArgList=parsedArgList, affectRange=affectRange,
                                          affectType=affectType, affectExtra=affectExtra, lastClickedAvId=lastClickedAvId)
+            return
+
+        command = dispatch.wordClass(self.air, None, avId, targetIds, parsedArgList)
+        responseArgs = (avId, magicWord, parsedArgList, affectRange, affectType, affectExtra, lastClickedAvId)
+        if len(targetIds) <= self.targetsPerFrame:
+            self.sendWordResponse(command.executeWord(), *responseArgs)
+            return
+
+        # Words used on a whole zone or the entire server are run on a few toons each frame.
+        taskName = '%s-%s' % (self.uniqueName('executeMagicWord'), self.nextBatchId)
+        self.nextBatchId += 1
+        task = taskMgr.add(self.__executeBatch, taskName)
+        task.command = command
+        task.targetIds = targetIds
+        task.index = 0
+        task.returnValue = None
+        task.responseArgs = responseArgs
+
+    def __executeBatch(self, task):
+        for targetId in task.targetIds[task.index:task.index + self.targetsPerFrame]:
+            # Toons that have left since the word was used are skipped.
+            if targetId not in self.air.doId2do:
+                continue
+
+            valid, response = task.command.executeTarget(targetId)
+            if not valid:
+                self.sendWordResponse(response, *task.responseArgs)
+                return task.done
+
+            task.returnValue = response
+
+        task.index += self.targetsPerFrame
+        if task.index < len(task.targetIds):
+            return task.cont
+
+        self.sendWordResponse(task.returnValue, *task.responseArgs)
+        return task.done
+
+    def sendWordResponse(self, returnValue, avId, magicWord, parsedArgList, affectRange, affectType, affectExtra, lastClickedAvId):
+        if returnValue:
+            self.generateResponse(avId=avId, responseType = "Success", returnValue=returnValue)
         else:
-            command = getMagicWord(magicWordInfo['classname'])
-            command = command(self.air, None, avId, targetIds, parsedArgList)
-            returnValue = command.executeWord()
-            if returnValue:
-                self.generateResponse(avId=avId, responseType = "Success", returnValue=returnValue)
-            else:
-                self.generateResponse(avId=avId, responseType = "SuccessNoResp", magicWord=magicWord, parsedArgList=parsedArgList,
-                                    affectRange=affectRange, affectType=affectType, affectExtra=affectExtra,
-                                    lastClickedAvId=lastClickedAvId)
+            self.generateResponse(avId=avId, responseType = "SuccessNoResp", magicWord=magicWord, parsedArgList=parsedArgList,
+                                affectRange=affectRange, affectType=affectType, affectExtra=affectExtra,
+                                lastClickedAvId=lastClickedAvId)
 
     def generateResponse(self, avId, responseType = "BadWord", magicWord='', parsedArgList=None, returnValue='', affectRange=0,
                          affectType=0, affectExtra=0, lastClickedAvId=0, extraMessageData=''):
@@ -41,6 +41,7 @@ class DistributedSuitAI(DistributedSuitBaseAI.DistributedSuitBaseAI):
         self.takeoverIsCogdo = False
         self.buildingDestination = None
         self.buildingDestinationIsCogdo = False
+        self.invasionId = 0
         return
 
     def stopTasks(self):
@@ -188,6 +188,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         taskMgr.remove(self.taskName('sptAdjustPopulation'))
         for suit in self.suitList:
             suit.stopTasks()
+            self.releaseInvasionSuit(suit)
             if suit.isGenerated():
                 self.zoneChange(suit, suit.zoneId)
                 suit.requestDelete()
@@ -408,7 +409,9 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
                     suitTrack = random.choice(['s', 'l'])
         if suitName == None:
             if not cogdoTakeover:
-                suitName, skelecog = self.air.suitInvasionManager.getInvadingCog()
+                suitName, skelecog = self.air.suitInvasionManager.requestInvasionSuit(self.zoneId)
+                if suitName != None:
+                    newSuit.invasionId = self.air.suitInvasionManager.getInvasionId()
             if suitName == None:
                 suitName = self.defaultSuitName
         if suitType == None and suitName != None:
@@ -425,6 +428,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         gotDestination = self.chooseDestination(newSuit, startTime, toonBlockTakeover=toonBlockTakeover, cogdoTakeover=cogdoTakeover, minPathLen=minPathLen, maxPathLen=maxPathLen)
         if not gotDestination:
             self.notify.debug("Couldn't get a destination in %d!" % self.zoneId)
+            self.releaseInvasionSuit(newSuit)
             newSuit.doNotDeallocateChannel = None
             newSuit.delete()
             return
@@ -450,14 +454,14 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
     def countNumNeededBuildings(self):
         if not self.buildingMgr:
             return 0
-        numSuitBuildings = len(self.buildingMgr.getSuitBlocks()) - len(self.buildingMgr.getCogdoBlocks())
+        numSuitBuildings = self.buildingMgr.getNumSuitBlocks() - self.buildingMgr.getNumCogdoBlocks()
         numNeeded = self.targetNumSuitBuildings - numSuitBuildings
         return numNeeded
 
     def countNumNeededCogdos(self):
         if not self.buildingMgr:
             return 0
-        numCogdos = len(self.buildingMgr.getCogdoBlocks())
+        numCogdos = self.buildingMgr.getNumCogdoBlocks()
         numNeeded = self.targetNumCogdos - numCogdos
         return numNeeded
 
@@ -580,6 +584,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         self.zoneChange(suit, suit.zoneId)
         if self.suitList.count(suit) > 0:
             self.suitList.remove(suit)
+            self.releaseInvasionSuit(suit)
             if suit.flyInSuit:
                 self.numFlyInSuits -= 1
             if suit.buildingSuit:
@@ -590,6 +595,18 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
                     self.numAttemptingCogdoTakeover -= 1
         suit.requestDelete()
 
+    def releaseInvasionSuit(self, suit):
+        # Tells the invasion manager that one of its cogs has left this street, and whether it was defeated
+        if suit.invasionId:
+            self.air.suitInvasionManager.invasionSuitGone(self.zoneId, suit.invasionId, suit.currHP <= 0)
+            suit.invasionId = 0
+
+    def getInvasionWeight(self):
+        # How big a share of an invasion's cogs this street gets
+        if self.currDesired == 0:
+            return 0
+        return self.SuitHoodInfo[self.hoodInfoIdx][self.SUIT_HOOD_INFO_MAX]
+
     def countTakeovers(self):
         count = 0
         for suit in self.suitList:
@@ -704,7 +721,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
 
     def recycleBuilding(self, isCogdo):
         bmin = self.SuitHoodInfo[self.hoodInfoIdx][self.SUIT_HOOD_INFO_BMIN]
-        current = len(self.buildingMgr.getSuitBlocks())
+        current = self.buildingMgr.getNumSuitBlocks()
         target = self.targetNumSuitBuildings + self.targetNumCogdos
         if target > bmin and current <= target:
             if isCogdo:
@@ -726,8 +743,8 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
             targetSuitBuildings += sp.targetNumSuitBuildings
             targetCogdos += sp.targetNumCogdos
             if sp.buildingMgr:
-                numCogdoBlocks = len(sp.buildingMgr.getCogdoBlocks())
-                actualSuitBuildings += len(sp.buildingMgr.getSuitBlocks()) - numCogdoBlocks
+                numCogdoBlocks = sp.buildingMgr.getNumCogdoBlocks()
+                actualSuitBuildings += sp.buildingMgr.getNumSuitBlocks() - numCogdoBlocks
                 actualCogdos += numCogdoBlocks
 
         wantedSuitBuildings = int(totalBuildings * self.TOTAL_SUIT_BUILDING_PCT / 100)
@@ -742,7 +759,7 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
             numReassigned = 0
             for sp in list(self.air.suitPlanners.values()):
                 if sp.buildingMgr:
-                    numBuildings = len(sp.buildingMgr.getSuitBlocks()) - len(sp.buildingMgr.getCogdoBlocks())
+                    numBuildings = sp.buildingMgr.getNumSuitBlocks() - sp.buildingMgr.getNumCogdoBlocks()
                 else:
                     numBuildings = 0
                 if numBuildings > sp.targetNumSuitBuildings:
@@ -1033,9 +1050,9 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
         for suit in self.suitList:
             suit.resync()
 
-    def flySuits(self):
+    def flySuits(self, keepInvasionId=None):
         for suit in self.suitList:
-            if suit.pathState == 1:
+            if suit.pathState == 1 and suit.invasionId != keepInvasionId:
                 suit.flyAwayNow()
 
     def requestBattle(self, zoneId, suit, toonId):
@@ -1206,8 +1223,8 @@ class DistributedSuitPlannerAI(DistributedObjectAI.DistributedObjectAI, SuitPlan
             targetBldgs = sp.targetNumSuitBuildings
             bm = simbase.air.buildingManagers.get(zoneId)
             if bm:
-                numCogdos = len(bm.getCogdoBlocks())
-                numBldgs = len(bm.getSuitBlocks()) - numCogdos
+                numCogdos = bm.getNumCogdoBlocks()
+                numBldgs = bm.getNumSuitBlocks() - numCogdos
                 s += '  %s: %2s/%2s buildings, %2s/%2s cogdos\n' % (zoneId, numBldgs, targetBldgs, numCogdos, targetCogdos)
                 totalBldgs += numBldgs
                 totalCogdos += numCogdos
@@ -1,36 +1,145 @@
 from direct.directnotify import DirectNotifyGlobal
+from direct.task import Task
 
 from toontown.toonbase import ToontownGlobals
 
 
+class InvasionStreet:
+    # How one suit planner is doing in the current invasion.
+
+    def __init__(self, quota):
+        # How many of the invasion's cogs this street may spawn, counting the ones that were defeated
+        self.quota = quota
+        self.numActive = 0
+        self.numSpawned = 0
+        self.numDefeated = 0
+
+    def getNumUnclaimed(self):
+        return self.quota - self.numActive - self.numDefeated
+
+
 class SuitInvasionManagerAI:
+    """
+    Runs cog invasions across every suit planner in the district.
+
+    When an invasion starts, its cogs are shared out between the suit planners by their
+    weight, and each planner requests invasion cogs from its own share as it spawns. A cog
+    that leaves the street without being defeated gives its place back. Once a planner has
+    used up its share, it may take cogs from the planner with the most of its share left, so
+    the invasion moves to where toons are fighting. The invasion ends when enough cogs have
+    been defeated, or when it times out.
+
+    Suits don't all fly away at once when an invasion starts or ends, the planners are rolled
+    over one at a time across invasion-rollover-time seconds.
+    """
     notify = DirectNotifyGlobal.directNotify.newCategory('SuitInvasionManagerAI')
 
     def __init__(self, air):
         self.air = air
         self.invadingCog = (None, 0)
         self.numSuits = 0
-        self.suits = 0
         self.invading = False
+        # Tells the cogs of one invasion apart from those of the ones before it
+        self.invasionId = 0
+        # Maps suit planner zoneIds to their InvasionStreet in the current invasion
+        self.streets = {}
+        self.numDefeated = 0
+        self.rolloverZoneIds = []
+        self.rolloverDelay = 0
+        self.rolloverTime = config.GetFloat('invasion-rollover-time', 60.0)
 
     def setInvadingCog(self, suitName, skeleton):
         self.invadingCog = (suitName, skeleton)
 
     def getInvadingCog(self):
-        self.suits += 1
-        self._checkInvasionStatus()
         return self.invadingCog
 
     def getInvading(self):
         return self.invading
 
-    def _spGetOut(self):
-        for suitPlanner in self.air.suitPlanners.values():
-            suitPlanner.flySuits()
+    def getInvasionId(self):
+        if not self.invading:
+            return 0
+
+        return self.invasionId
+
+    def getNumRemaining(self):
+        return max(0, self.numSuits - self.numDefeated)
+
+    def getStreetProgress(self):
+        # Maps every street's zoneId to (cogs spawned, cogs defeated) in the current invasion
+        return {zoneId: (street.numSpawned, street.numDefeated) for zoneId, street in self.streets.items()}
+
+    def _shareOutQuotas(self):
+        # Largest remainder, so that the quotas add up to exactly numSuits
+        weights = {zoneId: suitPlanner.getInvasionWeight() for zoneId, suitPlanner in self.air.suitPlanners.items()}
+        totalWeight = sum(weights.values())
+        self.streets = {}
+        if not totalWeight:
+            return
+
+        shares = {zoneId: self.numSuits * weight / totalWeight for zoneId, weight in weights.items()}
+        quotas = {zoneId: int(share) for zoneId, share in shares.items()}
+        leftover = self.numSuits - sum(quotas.values())
+        for zoneId in sorted(shares, key=lambda zoneId: quotas[zoneId] - shares[zoneId])[:leftover]:
+            quotas[zoneId] += 1
+
+        for zoneId, quota in quotas.items():
+            self.streets[zoneId] = InvasionStreet(quota)
+
+    def requestInvasionSuit(self, zoneId):
+        # A suit planner wants to spawn an invasion cog. Returns the invading cog, or (None, 0) when it may not.
+        if not self.invading:
+            return (None, 0)
+
+        street = self.streets.setdefault(zoneId, InvasionStreet(0))
+        if street.getNumUnclaimed() <= 0:
+            donor = max(self.streets.values(), key=InvasionStreet.getNumUnclaimed)
+            if donor.getNumUnclaimed() <= 0:
+                return (None, 0)
+
+            donor.quota -= 1
+            street.quota += 1
+
+        street.numActive += 1
+        street.numSpawned += 1
+        return self.invadingCog
+
+    def invasionSuitGone(self, zoneId, invasionId, defeated):
+        # An invasion cog a suit planner spawned has left its street, because it was defeated or otherwise
+        if not self.invading or invasionId != self.invasionId:
+            return
+
+        street = self.streets.get(zoneId)
+        if not street or street.numActive <= 0:
+            return
+
+        street.numActive -= 1
+        if defeated:
+            street.numDefeated += 1
+            self.numDefeated += 1
+            if self.numDefeated >= self.numSuits:
+                self.stopInvasion()
+
+    def _startRollover(self):
+        # Each suit planner flies away the cogs that don't belong, one planner at a time
+        taskMgr.remove('invasion-rollover')
+        self.rolloverZoneIds = sorted(self.air.suitPlanners)
+        if self.rolloverZoneIds:
+            self.rolloverDelay = self.rolloverTime / len(self.rolloverZoneIds)
+            taskMgr.doMethodLater(0, self._rolloverTask, 'invasion-rollover')
+
+    def _rolloverTask(self, task):
+        zoneId = self.rolloverZoneIds.pop(0)
+        suitPlanner = self.air.suitPlanners.get(zoneId)
+        if suitPlanner:
+            suitPlanner.flySuits(keepInvasionId=self.getInvasionId())
+
+        if not self.rolloverZoneIds:
+            return Task.done
 
-    def _checkInvasionStatus(self):
-        if self.suits >= self.numSuits:
-            self.stopInvasion()
+        task.delayTime = self.rolloverDelay
+        return Task.again
 
     def stopInvasion(self, task=None):
         if not self.getInvading():
@@ -45,20 +154,25 @@ class SuitInvasionManagerAI:
 
         self.setInvadingCog(None, 0)
         self.numSuits = 0
-        self.suits = 0
+        self.numDefeated = 0
+        self.streets = {}
         self.invading = False
-        self._spGetOut()
+        self._startRollover()
 
     def startInvasion(self, cogType, numCogs, skeleton):
         if self.getInvading():
             return False
 
         self.numSuits = numCogs
+        self.numDefeated = 0
+        self.invasionId += 1
         self.setInvadingCog(cogType, skeleton)
         self.invading = True
+        self._shareOutQuotas()
         self.air.newsManager.d_setInvasionStatus(ToontownGlobals.SuitInvasionBegin, self.invadingCog[0], self.numSuits,
                                                  self.invadingCog[1])
-        self._spGetOut()
-        timePerSuit = config.GetFloat('invasion-time-per-suit', 1.2)
-        taskMgr.doMethodLater(self.numSuits * timePerSuit, self.stopInvasion, 'invasion-timeout')
+        self._startRollover()
+        # Only once the rollover reached every street are the invasion's cogs out everywhere
+        timePerSuit = config.GetFloat('invasion-time-per-suit', 6.0)
+        taskMgr.doMethodLater(self.rolloverTime + self.numSuits * timePerSuit, self.stopInvasion, 'invasion-timeout')
         return True
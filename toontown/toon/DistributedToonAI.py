@@ -1,4 +1,5 @@
 import math
+from contextlib import contextmanager
 from typing import List, Tuple, Union
 
 from otp.ai.AIBaseGlobal import *
@@ -9,6 +10,7 @@ from . import InventoryBase
 from . import Experience
 from otp.avatar import DistributedAvatarAI
 from otp.avatar import DistributedPlayerAI
+from otp.distributed import OtpDoGlobals
 from direct.distributed import DistributedSmoothNodeAI
 from toontown.toonbase import ToontownGlobals
 from toontown.quest import Quests
@@ -17,6 +19,7 @@ from toontown.battle import SuitBattleGlobals
 from direct.task import Task
 from toontown.catalog import CatalogItemList
 from toontown.catalog import CatalogItem
+from toontown.catalog.DeliverySchedulerAI import DeliverySchedulerAI
 from direct.distributed.ClockDelta import *
 from toontown.fishing import FishCollection
 from toontown.fishing import FishTank
@@ -47,9 +50,11 @@ from ..archipelago.apclient.distributed_toon_reward_queue import DistributedToon
 from ..archipelago.definitions.death_reason import DeathReason
 from ..archipelago.definitions.rewards import EarnedAPReward
 from ..archipelago.definitions.util import get_zone_discovery_id
+from ..archipelago.definitions.win_conditions import win_conditions_satisfied
 from ..archipelago.util.location_scouts_cache import LocationScoutsCache
 from ..shtiker import CogPageGlobals
 from ..util.astron.AstronDict import AstronDict
+from ..util.astron.AstronFieldBatch import AstronFieldBatch
 
 if simbase.wantPets:
     from toontown.pets import PetLookerAI, PetObserve
@@ -232,6 +237,10 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         self.apMessageQueue: DistributedToonAPMessageQueue = DistributedToonAPMessageQueue(self)
         self.deathReason: DeathReason = DeathReason.UNKNOWN
         self.slotData = {}  # set in connected_packet.py
+        self._slotDataStruct = AstronDict().toStruct()  # slotData packed for astron, rebuilt only when it changes
+        self.bossesDefeated = 0  # How many of the cog bosses have been beaten, kept in sync with cogLevels
+        self._fieldBatch: AstronFieldBatch = None  # Set while a fieldBatch() is open
+        self._fieldBatchDepth = 0
 
     def generate(self):
         DistributedPlayerAI.DistributedPlayerAI.generate(self)
@@ -245,6 +254,7 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
             if self.WantOldGMNameBan:
                 self._checkOldGMName()
             messenger.send('avatarEntered', [self])
+            self.air.archipelagoManager.updateToonLocation(self.doId)
 
             # Set a default for slot data to override astron's empty byte tuple thing?
             # If we don't do this, self.slotData will be: (b'',)
@@ -347,14 +357,7 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
                 self.announceZoneChange(ToontownGlobals.QuietZone, self.zoneId)
         taskName = self.uniqueName('cheesy-expires')
         taskMgr.remove(taskName)
-        taskName = self.uniqueName('next-catalog')
-        taskMgr.remove(taskName)
-        taskName = self.uniqueName('next-delivery')
-        taskMgr.remove(taskName)
-        taskName = self.uniqueName('next-award-delivery')
-        taskMgr.remove(taskName)
-        taskName = 'next-bothDelivery-%s' % self.doId
-        taskMgr.remove(taskName)
+        self.air.deliveryScheduler.cancel(self.doId)
         self.stopToonUp()
         del self.dna
         if self.inventory:
@@ -679,6 +682,9 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
 
     def d_setFriendsList(self, friendsList):
         self.sendUpdate('setFriendsList', [friendsList])
+        # The OnlinePlayerManager declares toons to their friends, so it needs to know about new ones.
+        self.air.sendUpdateToDoId('OnlinePlayerManager', 'setToonFriends', OtpDoGlobals.OTP_DO_ID_ONLINE_PLAYER_MANAGER,
+                                  [self.doId, [friendId for friendId, _ in friendsList]])
         return None
 
     def setFriendsList(self, friendsList):
@@ -1353,9 +1359,11 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         if not levels:
             self.notify.warning('cogLevels set to bad value: %s. Resetting to [0,0,0,0]' % levels)
             self.cogLevels = [0, 0, 0, 0]
+            self.__updateBossesDefeated()
             return
 
         self.cogLevels = levels
+        self.__updateBossesDefeated()
 
     def d_setCogLevels(self, levels):
         self.sendUpdate('setCogLevels', [levels])
@@ -1363,6 +1371,13 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
     def getCogLevels(self):
         return self.cogLevels
 
+    # A cog level above 0 means the toon has beaten that department's boss
+    def __updateBossesDefeated(self):
+        self.bossesDefeated = sum(1 for level in self.cogLevels if level > 0)
+
+    def getBossesDefeated(self) -> int:
+        return self.bossesDefeated
+
     def incCogLevel(self, dept):
         newLevel = self.cogLevels[dept] + 1
         cogTypeStr = SuitDNA.suitHeadTypes[self.cogTypes[dept]]
@@ -1387,6 +1402,7 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
             #         maxHp = min(ToontownGlobals.MaxHpLimit, maxHp + 1)
             #         self.b_setMaxHp(maxHp)
             #         self.toonUp(maxHp)
+        self.__updateBossesDefeated()
         self.air.writeServerEvent('cogSuit', self.doId, '%s|%s|%s' % (dept, self.cogTypes[dept], self.cogLevels[dept]))
 
     def getNumPromotions(self, dept):
@@ -2140,17 +2156,15 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         self.catalogScheduleCurrentWeek = currentWeek
         self.catalogScheduleNextTime = nextTime
         if self.air.doLiveUpdates:
-            taskName = self.uniqueName('next-catalog')
-            taskMgr.remove(taskName)
-            duration = max(10.0, nextTime * 60 - time.time())
-            taskMgr.doMethodLater(duration, self.__deliverCatalog, taskName)
+            scheduler = self.air.deliveryScheduler
+            scheduler.schedule(self.doId, DeliverySchedulerAI.Catalog, max(scheduler.getTime() + 10.0, nextTime * 60),
+                               self.__deliverCatalog)
 
     def getCatalogSchedule(self):
         return (self.catalogScheduleCurrentWeek, self.catalogScheduleNextTime)
 
-    def __deliverCatalog(self, task):
+    def __deliverCatalog(self):
         self.air.catalogManager.deliverCatalogFor(self)
-        return Task.done
 
     def b_setCatalog(self, monthlyCatalog, weeklyCatalog, backCatalog):
         self.setCatalog(monthlyCatalog, weeklyCatalog, backCatalog)
@@ -2191,23 +2205,6 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
 
     def setDeliverySchedule(self, onOrder, doUpdateLater=True):
         self.setBothSchedules(onOrder, None)
-        return
-        self.onOrder = CatalogItemList.CatalogItemList(onOrder,
-                                                       store=CatalogItem.Customization | CatalogItem.DeliveryDate)
-        if hasattr(self, 'name'):
-            if doUpdateLater and self.air.doLiveUpdates and hasattr(self, 'air'):
-                taskName = self.uniqueName('next-delivery')
-                taskMgr.remove(taskName)
-                now = int(time.time() / 60 + 0.5)
-                nextItem = None
-                nextTime = self.onOrder.getNextDeliveryDate()
-                nextItem = self.onOrder.getNextDeliveryItem()
-                if nextItem != None:
-                    pass
-                if nextTime != None:
-                    duration = max(10.0, nextTime * 60 - time.time())
-                    taskMgr.doMethodLater(duration, self.__deliverPurchase, taskName)
-        return
 
     def getDeliverySchedule(self):
         return self.onOrder.getBlob(store=CatalogItem.Customization | CatalogItem.DeliveryDate)
@@ -2226,47 +2223,26 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         if not hasattr(self, 'air') or self.air == None:
             return
         if doUpdateLater and self.air.doLiveUpdates and hasattr(self, 'name'):
-            taskName = 'next-bothDelivery-%s' % self.doId
-            now = int(time.time() / 60 + 0.5)
-            nextItem = None
-            nextGiftItem = None
             nextTime = None
             nextGiftTime = None
             if self.onOrder:
                 nextTime = self.onOrder.getNextDeliveryDate()
-                nextItem = self.onOrder.getNextDeliveryItem()
             if self.onGiftOrder:
                 nextGiftTime = self.onGiftOrder.getNextDeliveryDate()
-                nextGiftItem = self.onGiftOrder.getNextDeliveryItem()
-            if nextItem:
-                pass
-            if nextGiftItem:
-                pass
             if nextTime == None:
                 nextTime = nextGiftTime
-            if nextGiftTime == None:
-                nextGiftTime = nextTime
             if nextGiftTime is not None and nextTime is not None and nextGiftTime < nextTime:
                 nextTime = nextGiftTime
-            existingDuration = None
-            checkTaskList = taskMgr.getTasksNamed(taskName)
-            if checkTaskList:
-                currentTime = globalClock.getFrameTime()
-                checkTask = checkTaskList[0]
-                existingDuration = checkTask.wakeTime - currentTime
             if nextTime:
-                newDuration = max(10.0, nextTime * 60 - time.time())
-                if existingDuration and existingDuration >= newDuration:
-                    taskMgr.remove(taskName)
-                    taskMgr.doMethodLater(newDuration, self.__deliverBothPurchases, taskName)
-                elif existingDuration and existingDuration < newDuration:
-                    pass
-                else:
-                    taskMgr.doMethodLater(newDuration, self.__deliverBothPurchases, taskName)
+                # Purchases and gifts are delivered together, at the earliest time either of them wants
+                scheduler = self.air.deliveryScheduler
+                scheduler.schedule(self.doId, DeliverySchedulerAI.Purchase,
+                                   max(scheduler.getTime() + 10.0, nextTime * 60), self.__deliverBothPurchases,
+                                   keepEarlier=True)
         return
 
-    def __deliverBothPurchases(self, task):
-        now = int(time.time() / 60 + 0.5)
+    def __deliverBothPurchases(self):
+        now = int(self.air.deliveryScheduler.getTime() / 60 + 0.5)
         delivered, remaining = self.onOrder.extractDeliveryItems(now)
         deliveredGifts, remainingGifts = self.onGiftOrder.extractDeliveryItems(now)
         simbase.air.deliveryManager.sendDeliverGifts(self.getDoId(), now)
@@ -2278,49 +2254,13 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         self.b_setMailboxContents(self.mailboxContents + delivered + deliveredGifts)
         self.b_setCatalogNotify(self.catalogNotify, ToontownGlobals.NewItems)
         self.b_setBothSchedules(remaining, remainingGifts)
-        return Task.done
 
     def setGiftSchedule(self, onGiftOrder, doUpdateLater=True):
         self.setBothSchedules(None, onGiftOrder)
-        return
-        self.onGiftOrder = CatalogItemList.CatalogItemList(onGiftOrder,
-                                                           store=CatalogItem.Customization | CatalogItem.DeliveryDate)
-        if doUpdateLater and self.air.doLiveUpdates and hasattr(self, 'air') and hasattr(self, 'name'):
-            taskName = self.uniqueName('next-gift')
-            taskMgr.remove(taskName)
-            now = int(time.time() / 60 + 0.5)
-            nextItem = None
-            nextTime = self.onGiftOrder.getNextDeliveryDate()
-            nextItem = self.onGiftOrder.getNextDeliveryItem()
-            if nextItem != None:
-                pass
-            if nextTime != None:
-                duration = max(10.0, nextTime * 60 - time.time())
-                duration += 30
-                taskMgr.doMethodLater(duration, self.__deliverGiftPurchase, taskName)
-        return
 
     def getGiftSchedule(self):
         return self.onGiftOrder.getBlob(store=CatalogItem.Customization | CatalogItem.DeliveryDate)
 
-    def __deliverGiftPurchase(self, task):
-        now = int(time.time() / 60 + 0.5)
-        delivered, remaining = self.onGiftOrder.extractDeliveryItems(now)
-        self.notify.info('Gift Delivery for %s: %s.' % (self.doId, delivered))
-        self.b_setMailboxContents(self.mailboxContents + delivered)
-        simbase.air.deliveryManager.sendDeliverGifts(self.getDoId(), now)
-        self.b_setCatalogNotify(self.catalogNotify, ToontownGlobals.NewItems)
-        return Task.done
-
-    def __deliverPurchase(self, task):
-        now = int(time.time() / 60 + 0.5)
-        delivered, remaining = self.onOrder.extractDeliveryItems(now)
-        self.notify.info('Delivery for %s: %s.' % (self.doId, delivered))
-        self.b_setMailboxContents(self.mailboxContents + delivered)
-        self.b_setDeliverySchedule(remaining)
-        self.b_setCatalogNotify(self.catalogNotify, ToontownGlobals.NewItems)
-        return Task.done
-
     def b_setMailboxContents(self, mailboxContents):
         self.setMailboxContents(mailboxContents)
         self.d_setMailboxContents(mailboxContents)
@@ -2539,24 +2479,23 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         self.sendUpdate('setTrophyScore', [score])
 
     def stopToonUp(self):
-        taskMgr.remove(self.uniqueName('safeZoneToonUp'))
+        self.air.safeZoneManager.stopHealing(self)
         self.ignore(self.air.getAvatarExitEvent(self.getDoId()))
 
     def startToonUp(self, healFrequency):
         self.stopToonUp()
         self.healFrequency = healFrequency
-        self.__waitForNextToonUp()
-
-    def __waitForNextToonUp(self):
-        taskMgr.doMethodLater(self.healFrequency, self.toonUpTask, self.uniqueName('safeZoneToonUp'))
+        self.air.safeZoneManager.startHealing(self, healFrequency)
 
     def __getPassiveToonupAmount(self):
         return math.ceil(self.getMaxHp() * ToontownGlobals.PassiveHealPercentage)
 
-    def toonUpTask(self, task):
+    def passiveToonUp(self):
+        # Called by our zone's HealTickerAI every healFrequency seconds
+        if self.isToonedUp():
+            return
+
         self.toonUp(self.__getPassiveToonupAmount())
-        self.__waitForNextToonUp()
-        return Task.done
 
     def toonUp(self, hpGained, quietly=0, sendTotal=1):
         if hpGained > self.maxHp:
@@ -3109,7 +3048,6 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
             collNode.setFromCollideMask(BitMask32.allOff())
             collNode.setIntoCollideMask(ToontownGlobals.WallBitmask)
             self.collNodePath = self.attachNewNode(collNode)
-            taskMgr.add(self._moveSphere, self._getMoveSphereTaskName(), priority=OTPGlobals.AICollMovePriority)
             self.inEstate = 1
             self.estateOwnerId = ownerId
             self.estateZones = simbase.air.estateMgr.getEstateZones(ownerId)
@@ -3119,12 +3057,9 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         def _getPetLookerBodyNode(self):
             return self.collNodePath
 
-        def _getMoveSphereTaskName(self):
-            return 'moveSphere-%s' % self.doId
-
-        def _moveSphere(self, task):
-            self.collNodePath.setZ(self.getRender(), 0)
-            return Task.cont
+        def _isPetLookerGrounded(self):
+            # Our look sphere stays on the ground while we jump around
+            return 1
 
         def isInEstate(self):
             return hasattr(self, 'inEstate') and self.inEstate
@@ -3133,7 +3068,6 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
             DistributedToonAI.notify.debug('exitEstate: %s %s %s' % (self.doId, ownerId, zoneId))
             DistributedToonAI.notify.debug('current zone: %s' % self.zoneId)
             self.exitPetLook()
-            taskMgr.remove(self._getMoveSphereTaskName())
             self.collNodePath.removeNode()
             del self.collNodePath
             del self.estateOwnerId
@@ -4102,28 +4036,23 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
                                                             store=CatalogItem.Customization | CatalogItem.DeliveryDate)
         if hasattr(self, 'name'):
             if doUpdateLater and self.air.doLiveUpdates and hasattr(self, 'air'):
-                taskName = self.uniqueName('next-award-delivery')
-                taskMgr.remove(taskName)
-                now = int(time.time() / 60 + 0.5)
-                nextItem = None
+                scheduler = self.air.deliveryScheduler
                 nextTime = self.onAwardOrder.getNextDeliveryDate()
-                nextItem = self.onAwardOrder.getNextDeliveryItem()
-                if nextItem != None:
-                    pass
                 if nextTime != None:
-                    duration = max(10.0, nextTime * 60 - time.time())
-                    taskMgr.doMethodLater(duration, self.__deliverAwardPurchase, taskName)
+                    scheduler.schedule(self.doId, DeliverySchedulerAI.Award,
+                                       max(scheduler.getTime() + 10.0, nextTime * 60), self.__deliverAwardPurchase)
+                else:
+                    scheduler.cancel(self.doId, DeliverySchedulerAI.Award)
         return
 
-    def __deliverAwardPurchase(self, task):
-        now = int(time.time() / 60 + 0.5)
+    def __deliverAwardPurchase(self):
+        now = int(self.air.deliveryScheduler.getTime() / 60 + 0.5)
         delivered, remaining = self.onAwardOrder.extractDeliveryItems(now)
         self.notify.info('Award Delivery for %s: %s.' % (self.doId, delivered))
         self.b_setAwardMailboxContents(self.awardMailboxContents + delivered)
         self.b_setAwardSchedule(remaining)
         if delivered:
             self.b_setAwardNotify(ToontownGlobals.NewItems)
-        return Task.done
 
     def b_setAwardNotify(self, awardMailboxNotify):
         self.setAwardNotify(awardMailboxNotify)
@@ -4424,12 +4353,18 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
 
         self.sendUpdate('updateLocationScoutsCache', [cache.struct()])
 
-    def queueArchipelagoMessage(self, message: str):
-        self.apMessageQueue.queue(message)
+    # Queue a message from the AP server (PrintJSON) to display on this toon's log
+    # Irrelevant messages (items and hints for other slots) are skipped if this toon filters them out
+    def queueArchipelagoMessage(self, message: str, relevant: bool = True):
+        self.apMessageQueue.queue(message, relevant=relevant)
 
     # Send this toon an archipelago message to display on their log
+    # This goes through the message queue too so it's batched with everything else sent this frame,
+    # but it is never filtered or dropped
     def d_sendArchipelagoMessage(self, message: str) -> None:
-        self.d_sendArchipelagoMessages([message])
+        if not self.isPlayerControlled():
+            return
+        self.apMessageQueue.queue(message, important=True)
 
     # Send multiple messages to a player to display on their log
     def d_sendArchipelagoMessages(self, messages: List[str]) -> None:
@@ -4449,34 +4384,29 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
 
     # Checks whether or not this toon has "beat" their archipelago goal
     # Default goal is to default all 4 bosses at least once
-    # todo add more win conditions, maybe even a field on toons that keeps track of flags from APReward 's that we get
+    # New goals can be added in archipelago/definitions/win_conditions.py
     def winConditionSatisfied(self):
-        # Determines how many bosses has been defeated (level > 0 => they have beaten it)
-        bosses_defeated = 0
-        for level in self.getCogLevels():
-            if level > 0:
-                bosses_defeated += 1
-
-        # Ensure they've defeated enough bosses.
-        if bosses_defeated < self.slotData.get('cog_bosses_required', 4):
-            return False
-
-        # Win condition is satisfied!
-        return True
+        return win_conditions_satisfied(self)
 
     def b_setSlotData(self, slotData: dict):
-        slotData = AstronDict.fromDict(slotData)
         self.setSlotData(slotData)
-        self.d_setSlotData(slotData)
+        self.d_setSlotData(self._slotDataStruct)
 
-    def setSlotData(self, slotData: dict):
+    def setSlotData(self, slotData):
+        # Astron hands us the packed struct, while the AI passes a plain dict
+        if isinstance(slotData, dict):
+            slotData = AstronDict.fromDict(slotData)
+        else:
+            slotData = AstronDict.fromStruct(slotData)
         self.slotData = slotData
+        self._slotDataStruct = slotData.toStruct()
 
     def getSlotData(self) -> list:
-        return AstronDict.fromDict(self.slotData).toStruct()
+        return self._slotDataStruct
 
-    def d_setSlotData(self, slotData: AstronDict):
-        self.sendUpdate('setSlotData', [slotData.toStruct()])
+    # Takes slotData already packed for astron, see getSlotData
+    def d_setSlotData(self, slotDataStruct: list):
+        self.sendUpdate('setSlotData', [slotDataStruct])
 
     def setArchipelagoAuto(self, slotName: str, serverAddr: str):
         if not self.archipelago_session:
@@ -4490,9 +4420,66 @@ class DistributedToonAI(DistributedPlayerAI.DistributedPlayerAI, DistributedSmoo
         if serverAddr and serverAddr != lastAddress:
             self.archipelago_session.handle_connect(serverAddr)
 
+    # Open a batch of field updates. Until the outermost batch is committed, updates to stored fields
+    # (required/ram/db) are collected and then sent as one SET_FIELDS message, which is one client update
+    # and one database write instead of one of each per field. Event fields still go out immediately,
+    # after flushing whatever was collected before them so the order clients see is unchanged.
+    def beginFieldBatch(self):
+        if self._fieldBatch is None:
+            self._fieldBatch = AstronFieldBatch(self)
+        self._fieldBatchDepth += 1
+
+    def commitFieldBatch(self):
+        if self._fieldBatchDepth <= 0:
+            self.notify.warning('commitFieldBatch called for %s with no batch open!' % self.doId)
+            return
+
+        self._fieldBatchDepth -= 1
+        if self._fieldBatchDepth > 0:
+            return
+
+        batch = self._fieldBatch
+        self._fieldBatch = None
+        self._fieldBatchDepth = 0
+        if batch is not None:
+            batch.flush()
+
+    # Usage: with av.fieldBatch(): av.b_setHp(...); av.b_setMoney(...)
+    # The batch is committed even if the body raises, since the AI side values have already changed.
+    @contextmanager
+    def fieldBatch(self):
+        self.beginFieldBatch()
+        try:
+            yield
+        finally:
+            self.commitFieldBatch()
+
+    def __flushFieldBatch(self):
+        if self._fieldBatch is not None:
+            self._fieldBatch.flush()
+
+    def sendUpdate(self, fieldName, args=[]):
+        if self._fieldBatch is not None:
+            field = self.dclass.getFieldByName(fieldName)
+            if AstronFieldBatch.isBatchable(field):
+                self._fieldBatch.add(field, args)
+                return
+
+            self.__flushFieldBatch()
+
+        DistributedPlayerAI.DistributedPlayerAI.sendUpdate(self, fieldName, args)
+
+    def sendUpdateToChannel(self, channelId, fieldName, args):
+        self.__flushFieldBatch()
+        DistributedPlayerAI.DistributedPlayerAI.sendUpdateToChannel(self, channelId, fieldName, args)
+
     # Sets this toons stats as if they were a freshly created toon
     # This should only be called when we detect an AP player connected for the very first time.
     def newToon(self):
+        with self.fieldBatch():
+            self.__resetToNewToon()
+
+    def __resetToNewToon(self):
 
         # First stat stuff
         self.b_setMaxHp(15)
@@ -0,0 +1,103 @@
+from direct.directnotify import DirectNotifyGlobal
+from direct.distributed.MsgTypes import CLIENT_OBJECT_SET_FIELD, STATESERVER_OBJECT_SET_FIELDS
+from direct.distributed.PyDatagram import PyDatagram
+from panda3d.direct import DCPacker
+
+
+class AstronFieldBatch:
+    """
+    Collects state field updates for a single distributed object and sends them as one
+    STATESERVER_OBJECT_SET_FIELDS message. The state server forwards that as a single
+    CLIENT_OBJECT_SET_FIELDS update to interested clients, and the database state server turns
+    it into a single write. Clients split it back up with splitClientUpdate.
+    """
+    notify = DirectNotifyGlobal.directNotify.newCategory('AstronFieldBatch')
+
+    def __init__(self, distObj):
+        self.distObj = distObj
+        self._updates = {}  # field number -> (DCField, args), in the order they were last set
+
+    @staticmethod
+    def isBatchable(field) -> bool:
+        # Only stored state can be merged. Everything else is an event that must be sent as-is.
+        if field is None or field.asMolecularField() is not None:
+            return False
+
+        return field.isRequired() or field.isRam() or field.isDb()
+
+    def add(self, field, args):
+        # The state server only keeps the latest value of a field, so a later set replaces an earlier one.
+        fieldId = field.getNumber()
+        self._updates.pop(fieldId, None)
+        self._updates[fieldId] = (field, args)
+
+    def isEmpty(self) -> bool:
+        return not self._updates
+
+    def flush(self):
+        if not self._updates:
+            return
+
+        updates = list(self._updates.values())
+        self._updates.clear()
+        air = self.distObj.air
+        if not air:
+            return
+
+        packed = []
+        for field, args in updates:
+            packer = DCPacker()
+            packer.rawPackUint16(field.getNumber())
+            packer.beginPack(field)
+            field.packArgs(packer, args)
+            if not packer.endPack():
+                self.notify.warning('Could not pack %s%s for %s, skipping it.' % (field.getName(), args, self.distObj.doId))
+                continue
+
+            packed.append(packer.getBytes())
+
+        if not packed:
+            return
+
+        dg = PyDatagram()
+        dg.addServerHeader(self.distObj.doId, air.ourChannel, STATESERVER_OBJECT_SET_FIELDS)
+        dg.addUint32(self.distObj.doId)
+        dg.addUint16(len(packed))
+        for data in packed:
+            dg.appendData(data)
+
+        air.send(dg)
+
+    @classmethod
+    def splitClientUpdate(cls, dcFile, di) -> list:
+        # Turns the rest of a CLIENT_OBJECT_SET_FIELDS message into one CLIENT_OBJECT_SET_FIELD datagram
+        # per field, in the order they were packed, so they can be handled like any other update.
+        doId = di.getUint32()
+        numFields = di.getUint16()
+        data = di.getRemainingBytes()
+        datagrams = []
+        offset = 0
+        for i in range(numFields):
+            packer = DCPacker()
+            packer.setUnpackData(data[offset:])
+            fieldId = packer.rawUnpackUint16()
+            field = dcFile.getFieldByIndex(fieldId)
+            if field is None:
+                cls.notify.warning('Got an update to unknown field %s for %s, dropping the rest of it.' % (fieldId, doId))
+                break
+
+            packer.beginUnpack(field)
+            packer.unpackSkip()
+            if not packer.endUnpack():
+                cls.notify.warning('Could not unpack %s for %s, dropping the rest of it.' % (field.getName(), doId))
+                break
+
+            length = packer.getNumUnpackedBytes()
+            dg = PyDatagram()
+            dg.addUint16(CLIENT_OBJECT_SET_FIELD)
+            dg.addUint32(doId)
+            dg.appendData(data[offset:offset + length])
+            datagrams.append(dg)
+            offset += length
+
+        return datagrams
@@ -0,0 +1,88 @@
+from direct.task import Task
+
+from otp.otpbase import OTPGlobals
+
+
+class AstronSendBuffer:
+    """
+    Holds every datagram the AI sends during a frame, and sends them all to the message
+    director at the end of it, in the order they were sent.
+
+    Stored (required or db) fields that are neither ram nor broadcast can be merged: when
+    one is updated again for the same object and channel before the frame ends, only the
+    latest update is sent, in the place of the latest one. Any other update of the same
+    object ends merging for that object, and any other datagram sent in between
+    (generates, deletes, SET_FIELDS, ...) ends merging for everything before it, so the
+    updates of each object always arrive in the order they were made.
+    """
+
+    def __init__(self, sendDatagram, merge=True):
+        self.sendDatagram = sendDatagram
+        self.merge = merge
+        self._datagrams = []  # Datagrams to send, or None for the ones that were merged away
+        self._mergeable = {}  # doId -> {(channelId, field number) -> index of its update in _datagrams}
+        self._taskName = None
+        self.numMerged = 0
+
+    def __len__(self):
+        return len(self._datagrams)
+
+    @staticmethod
+    def isMergeable(field) -> bool:
+        # Only stored state can be merged, events must all be sent. Clients also expect to see every
+        # value of a ram or broadcast field, since other objects react to them.
+        if field is None or field.asMolecularField() is not None:
+            return False
+
+        if field.isRam() or field.isBroadcast():
+            return False
+
+        return field.isRequired() or field.isDb()
+
+    def start(self, taskName='flushSendBuffer'):
+        self._taskName = taskName
+        taskMgr.add(self.__flushTask, taskName, priority=OTPGlobals.AISendBufferPriority)
+
+    def stop(self):
+        if self._taskName is not None:
+            taskMgr.remove(self._taskName)
+            self._taskName = None
+
+        self.flush()
+
+    def add(self, datagram):
+        # We don't know what is in here, so nothing sent before it may be merged with anything after it.
+        self._mergeable.clear()
+        self._datagrams.append(datagram)
+
+    def addUpdate(self, doId, channelId, field, datagram):
+        if not self.merge or not self.isMergeable(field):
+            # Its earlier updates can't be moved past this one anymore.
+            self._mergeable.pop(doId, None)
+            self._datagrams.append(datagram)
+            return
+
+        updates = self._mergeable.setdefault(doId, {})
+        key = (channelId, field.getNumber())
+        index = updates.get(key)
+        if index is not None:
+            self._datagrams[index] = None
+            self.numMerged += 1
+
+        updates[key] = len(self._datagrams)
+        self._datagrams.append(datagram)
+
+    def flush(self):
+        if not self._datagrams:
+            return
+
+        datagrams = self._datagrams
+        self._datagrams = []
+        self._mergeable.clear()
+        for datagram in datagrams:
+            if datagram is not None:
+                self.sendDatagram(datagram)
+
+    def __flushTask(self, task):
+        self.flush()
+        return Task.cont